@@ -593,6 +593,8 @@ from .db import (
     get_database,
     set_database,
     DatabaseError,
+    ConnectionRouter,
+    DatabaseRouter,
 )
 
 # ============================================================================
@@ -1064,6 +1066,8 @@ __all__ = [
     "get_database",
     "set_database",
     "DatabaseError",
+    "ConnectionRouter",
+    "DatabaseRouter",
     
     # Artifacts
     "Artifact",
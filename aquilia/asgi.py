@@ -22,6 +22,7 @@ from .response import Response
 from .middleware import MiddlewareStack, Handler
 from .controller.router import ControllerRouter
 from .controller.base import RequestCtx
+from .models.loader import enter_request, exit_request
 
 
 class ASGIAdapter:
@@ -34,7 +35,7 @@ class ASGIAdapter:
     __slots__ = (
         'controller_router', 'controller_engine', 'middleware_stack',
         'server', 'socket_runtime', 'logger',
-        '_cached_middleware_chain', '_default_container',
+        '_not_found_chain', '_chain_version', '_default_container',
         '_debug', '_has_routes_cache', '_server_runtime',
     )
 
@@ -52,7 +53,8 @@ class ASGIAdapter:
         self.server = server
         self.socket_runtime = socket_runtime
         self.logger = logging.getLogger("aquilia.asgi")
-        self._cached_middleware_chain: Optional[Handler] = None
+        self._not_found_chain: Optional[Handler] = None
+        self._chain_version = -1
         self._default_container = None
         self._debug: Optional[bool] = None
         self._has_routes_cache: Optional[bool] = None
@@ -117,66 +119,72 @@ class ASGIAdapter:
     # Middleware chain building (cached)
     # ------------------------------------------------------------------
 
-    def _build_cached_chain(self):
-        """Build the middleware chain once. The final handler dispatches
-        to the matched controller stored in request.state."""
-        if self._cached_middleware_chain is not None:
-            return
-
-        async def _final_handler(request: Request, ctx) -> Response:
-            """Final handler that dispatches to matched controller."""
-            controller_match = request.state.get("_controller_match")
-
-            if controller_match:
-                return await self.controller_engine.execute(
-                    controller_match.route,
-                    request,
-                    controller_match.params,
-                    ctx.container,
-                )
-
-            # No controller matched — 404
-            if self._is_debug():
-                accept = self._get_accept_from_request(request)
-                if "text/html" in accept:
-                    from .debug.pages import render_http_error_page, render_welcome_page
-                    version = self._get_version()
-                    path = request.path
-                    method = request.method
-                    if path == "/" and not self._has_routes():
-                        # Gather System Info
-                        system_info = {
-                            "python_version": platform.python_version(),
-                            "platform": sys.platform,
-                            "debug": self._is_debug(),
-                        }
-                        # Try to get config features if server is available
-                        if self.server and hasattr(self.server, 'config'):
-                            cfg = self.server.config
-                            system_info['auth'] = cfg.get_auth_config().get("enabled", False)
-                            system_info['sessions'] = cfg.get_session_config().get("enabled", False)
-                        
-                        html_body = render_welcome_page(aquilia_version=version, system_info=system_info)
-                        return Response(
-                            content=html_body.encode("utf-8"),
-                            status=200,
-                            headers={"content-type": "text/html; charset=utf-8"},
-                        )
-                    html_body = render_http_error_page(
-                        404, "Not Found",
-                        f"No route matches {method} {path}",
-                        request,
-                        aquilia_version=version,
-                    )
+    def _build_chains(self):
+        """
+        Compile the middleware chains for the current middleware stack.
+
+        Every compiled route gets its own chain holding only the middleware
+        whose scope applies to it, ending in a dispatcher bound to that
+        route; unmatched requests go through a separate 404 chain of global
+        middleware.  Chains are rebuilt by the router on ``initialize()``
+        and here whenever the middleware stack changes.
+        """
+        self._not_found_chain = self.middleware_stack.build_route_handler(
+            None, self._not_found_handler,
+        )
+        self.controller_router.chain_compiler = self._compile_route_chain
+        self.controller_router.compile_chains()
+        self._chain_version = self.middleware_stack.version
+
+    def _compile_route_chain(self, route) -> Handler:
+        invoker = self.controller_engine.invoker_for(route)
+
+        async def _dispatch(request: Request, ctx) -> Response:
+            return await invoker(request, request.state["path_params"], ctx.container)
+
+        return self.middleware_stack.build_route_handler(route, _dispatch)
+
+    async def _not_found_handler(self, request: Request, ctx) -> Response:
+        """No controller matched — 404 (or the debug welcome page)."""
+        if self._is_debug():
+            accept = self._get_accept_from_request(request)
+            if "text/html" in accept:
+                from .debug.pages import render_http_error_page, render_welcome_page
+                version = self._get_version()
+                path = request.path
+                method = request.method
+                if path == "/" and not self._has_routes():
+                    # Gather System Info
+                    system_info = {
+                        "python_version": platform.python_version(),
+                        "platform": sys.platform,
+                        "debug": self._is_debug(),
+                    }
+                    # Try to get config features if server is available
+                    if self.server and hasattr(self.server, 'config'):
+                        cfg = self.server.config
+                        system_info['auth'] = cfg.get_auth_config().get("enabled", False)
+                        system_info['sessions'] = cfg.get_session_config().get("enabled", False)
+                    
+                    html_body = render_welcome_page(aquilia_version=version, system_info=system_info)
                     return Response(
                         content=html_body.encode("utf-8"),
-                        status=404,
+                        status=200,
                         headers={"content-type": "text/html; charset=utf-8"},
                     )
+                html_body = render_http_error_page(
+                    404, "Not Found",
+                    f"No route matches {method} {path}",
+                    request,
+                    aquilia_version=version,
+                )
+                return Response(
+                    content=html_body.encode("utf-8"),
+                    status=404,
+                    headers={"content-type": "text/html; charset=utf-8"},
+                )
 
-            return Response.json({"error": "Not found"}, status=404)
-
-        self._cached_middleware_chain = self.middleware_stack.build_handler(_final_handler)
+        return Response.json({"error": "Not found"}, status=404)
 
     @staticmethod
     def _get_accept_from_request(request: Request) -> str:
@@ -208,9 +216,9 @@ class ASGIAdapter:
     async def handle_http(self, scope: dict, receive: Callable, send: Callable):
         """Handle HTTP request with optimized hot path."""
 
-        # ── Build middleware chain once (idempotent) ──
-        if self._cached_middleware_chain is None:
-            self._build_cached_chain()
+        # ── (Re)compile per-route chains when the middleware stack changed ──
+        if self._chain_version != self.middleware_stack.version:
+            self._build_chains()
 
         # ── Create lean Request object ──
         request = Request(scope, receive)
@@ -250,42 +258,52 @@ class ASGIAdapter:
             container=di_container,
         )
 
-        # Store controller match in request state for the final handler
+        # Pick the route's compiled chain (404 chain when unmatched)
         if controller_match:
-            request.state["_controller_match"] = controller_match
-            request.state["app_name"] = getattr(controller_match.route, 'app_name', None)
-            request.state["route_pattern"] = getattr(controller_match.route, 'full_path', None)
+            route = controller_match.route
+            chain = route.middleware_chain
+            if chain is None:
+                # Route added after the last compile; build it on first use
+                chain = route.middleware_chain = self._compile_route_chain(route)
+            request.state["app_name"] = route.app_name
+            request.state["route_pattern"] = route.full_path
             request.state["path_params"] = controller_match.params
         else:
             request.state["app_name"] = None
             request.state["route_pattern"] = None
             request.state["path_params"] = {}
+            chain = self._not_found_chain
 
-        # ── Execute cached middleware chain ──
+        # ── Execute the compiled middleware chain ──
+        # (related() batches and caches per request container)
+        loader_token = enter_request(di_container)
         try:
-            response = await self._cached_middleware_chain(request, ctx)
-        except Exception as e:
-            self.logger.error(f"Critical error in request pipeline: {e}", exc_info=True)
-            if self._is_debug():
-                accept = self._get_accept_from_request(request)
-                if "text/html" in accept:
-                    from .debug.pages import render_debug_exception_page
-                    html_body = render_debug_exception_page(
-                        e, request, aquilia_version=self._get_version(),
-                    )
-                    response = Response(
-                        content=html_body.encode("utf-8"),
-                        status=500,
-                        headers={"content-type": "text/html; charset=utf-8"},
-                    )
-                    await response.send_asgi(send)
-                    return
-            response = Response.json(
-                {"error": "Internal server error"},
-                status=500,
-            )
+            try:
+                response = await chain(request, ctx)
+            except Exception as e:
+                self.logger.error(f"Critical error in request pipeline: {e}", exc_info=True)
+                if self._is_debug():
+                    accept = self._get_accept_from_request(request)
+                    if "text/html" in accept:
+                        from .debug.pages import render_debug_exception_page
+                        html_body = render_debug_exception_page(
+                            e, request, aquilia_version=self._get_version(),
+                        )
+                        response = Response(
+                            content=html_body.encode("utf-8"),
+                            status=500,
+                            headers={"content-type": "text/html; charset=utf-8"},
+                        )
+                        await response.send_asgi(send)
+                        return
+                response = Response.json(
+                    {"error": "Internal server error"},
+                    status=500,
+                )
 
-        await response.send_asgi(send)
+            await response.send_asgi(send, request)
+        finally:
+            exit_request(loader_token)
 
     async def handle_websocket(self, scope: dict, receive: Callable, send: Callable):
         """Handle WebSocket connection."""
@@ -305,7 +323,7 @@ class ASGIAdapter:
                     if self.server:
                         await self.server.startup()
                         # Invalidate caches after startup
-                        self._cached_middleware_chain = None
+                        self._chain_version = -1
                         self._default_container = None
                         self._has_routes_cache = None
                         self._debug = None
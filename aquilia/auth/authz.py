@@ -7,9 +7,10 @@ Supports AquilaPolicy DSL for declarative access control.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, Callable, Hashable
 
 from .core import Identity
 from .faults import (
@@ -59,6 +60,23 @@ class AuthzResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+class _BoundedCache(dict):
+    """Decision cache: a dict that forgets its oldest entries when full."""
+
+    __slots__ = ("maxsize",)
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if len(self) >= self.maxsize:
+            # Drop the oldest eighth in one go (dicts keep insertion order)
+            for stale in list(self)[: max(1, self.maxsize // 8)]:
+                del self[stale]
+        self[key] = value
+
+
 # ============================================================================
 # RBAC (Role-Based Access Control)
 # ============================================================================
@@ -69,11 +87,20 @@ class RBACEngine:
     Role-Based Access Control engine.
 
     Defines roles and their permissions.
+
+    Permissions are interned to bit positions and every role's transitive
+    closure (own + inherited permissions) is kept as one integer bitmask,
+    updated when ``define_role``/``add_inheritance`` change the graph.  A
+    check is then a mask lookup and an AND; the combined mask of a role
+    set is memoized in a bounded cache.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096):
         self._roles: dict[str, set[str]] = {}  # role -> permissions
         self._role_hierarchy: dict[str, set[str]] = {}  # role -> parent roles
+        self._perm_bits: dict[str, int] = {}  # permission -> bit
+        self._closure: dict[str, int] = {}  # role -> transitive permission mask
+        self._role_set_masks = _BoundedCache(cache_size)  # tuple(roles) -> mask
 
     def define_role(
         self, role: str, permissions: list[str], inherits: list[str] | None = None
@@ -91,31 +118,77 @@ class RBACEngine:
         if inherits:
             self._role_hierarchy[role] = set(inherits)
 
+        self._refresh(role)
+
+    def add_inheritance(self, role: str, parent: str) -> None:
+        """
+        Make ``role`` inherit all permissions of ``parent``.
+
+        Args:
+            role: Inheriting role
+            parent: Role to inherit from
+        """
+        self._role_hierarchy.setdefault(role, set()).add(parent)
+        self._refresh(role)
+
+    def _bit(self, permission: str) -> int:
+        bit = self._perm_bits.get(permission)
+        if bit is None:
+            bit = self._perm_bits[permission] = 1 << len(self._perm_bits)
+        return bit
+
+    def _refresh(self, role: str) -> None:
+        """Recompute closures of ``role`` and every role inheriting it."""
+        affected = {role}
+        changed = True
+        while changed:
+            changed = False
+            for child, parents in self._role_hierarchy.items():
+                if child not in affected and parents & affected:
+                    affected.add(child)
+                    changed = True
+
+        for name in affected:
+            mask = 0
+            seen: set[str] = set()
+            stack = [name]
+            while stack:
+                current = stack.pop()
+                if current in seen:
+                    continue  # cycles contribute nothing new
+                seen.add(current)
+                for permission in self._roles.get(current, ()):
+                    mask |= self._bit(permission)
+                stack.extend(self._role_hierarchy.get(current, ()))
+            self._closure[name] = mask
+
+        self._role_set_masks.clear()
+
     def get_permissions(self, role: str, _visited: set[str] | None = None) -> set[str]:
         """
         Get all permissions for role (including inherited).
 
         Args:
             role: Role name
-            _visited: Internal set for cycle detection
+            _visited: Unused; kept for backwards compatibility
 
         Returns:
             Set of permissions
         """
-        if _visited is None:
-            _visited = set()
-        if role in _visited:
-            return set()  # break cycle
-        _visited.add(role)
-
-        permissions = set(self._roles.get(role, set()))
-
-        # Add inherited permissions
-        if role in self._role_hierarchy:
-            for parent_role in self._role_hierarchy[role]:
-                permissions.update(self.get_permissions(parent_role, _visited))
-
-        return permissions
+        mask = self._closure.get(role, 0)
+        return {perm for perm, bit in self._perm_bits.items() if mask & bit}
+
+    def roles_mask(self, roles: list[str] | tuple[str, ...]) -> int:
+        """Combined permission bitmask of a role set (memoized)."""
+        key = tuple(roles)
+        mask = self._role_set_masks.get(key)
+        if mask is None:
+            mask = 0
+            closure = self._closure
+            for role in key:
+                mask |= closure.get(role, 0)
+            self._role_set_masks.put(key, mask)
+        return mask
 
     def check_permission(
         self, roles: list[str], permission: str
@@ -130,11 +203,10 @@ class RBACEngine:
         Returns:
             True if any role has permission
         """
-        for role in roles:
-            if permission in self.get_permissions(role):
-                return True
-
-        return False
+        bit = self._perm_bits.get(permission)
+        if bit is None:
+            return False  # no role grants it
+        return bool(self.roles_mask(roles) & bit)
 
     def check(self, context: AuthzContext, permission: str) -> AuthzResult:
         """
@@ -171,13 +243,20 @@ class ABACEngine:
     Evaluates policies based on attributes (identity, resource, environment).
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096):
         self._policies: dict[str, Callable[[AuthzContext], AuthzResult]] = {}
+        # Pure policies: policy_id -> (ttl, key function)
+        self._pure: dict[str, tuple[float, Callable[[AuthzContext], Hashable]]] = {}
+        self._memo = _BoundedCache(cache_size)  # (policy_id, key) -> (expires, result)
 
     def register_policy(
         self,
         policy_id: str,
         policy_func: Callable[[AuthzContext], AuthzResult],
+        *,
+        pure: bool = False,
+        ttl: float = 60.0,
+        key: Callable[[AuthzContext], Hashable] | None = None,
     ) -> None:
         """
         Register attribute-based policy.
@@ -185,8 +264,19 @@ class ABACEngine:
         Args:
             policy_id: Policy identifier
             policy_func: Function that evaluates policy
+            pure: The decision depends only on the context (no clock,
+                no I/O), so it may be memoized for ``ttl`` seconds
+            ttl: Memoization lifetime for pure policies
+            key: Maps a context to the memo key (default: identity id,
+                status and attributes, resource, action, roles, scopes,
+                tenant and context attributes)
         """
         self._policies[policy_id] = policy_func
+        self._memo.clear()
+        if pure:
+            self._pure[policy_id] = (ttl, key or _context_key)
+        else:
+            self._pure.pop(policy_id, None)
 
     def evaluate(self, context: AuthzContext, policy_id: str) -> AuthzResult:
         """
@@ -199,13 +289,65 @@ class ABACEngine:
         Returns:
             Authorization result
         """
-        if policy_id not in self._policies:
+        policy = self._policies.get(policy_id)
+        if policy is None:
             return AuthzResult(
                 decision=Decision.ABSTAIN,
                 reason=f"Policy not found: {policy_id}",
             )
 
-        return self._policies[policy_id](context)
+        pure = self._pure.get(policy_id)
+        if pure is None:
+            return policy(context)
+
+        ttl, key_func = pure
+        try:
+            memo_key = (policy_id, key_func(context))
+            hash(memo_key)
+        except TypeError:
+            return policy(context)  # unhashable attributes: not memoizable
+
+        now = time.monotonic()
+        hit = self._memo.get(memo_key)
+        if hit is not None and hit[0] > now:
+            cached = hit[1]
+            return AuthzResult(cached.decision, cached.reason, cached.policy_id, dict(cached.metadata))
+
+        result = policy(context)
+        self._memo.put(memo_key, (now + ttl, result))
+        return AuthzResult(result.decision, result.reason, result.policy_id, dict(result.metadata))
+
+
+def _context_key(context: AuthzContext) -> Hashable:
+    """
+    Default memo key for pure ABAC policies.
+
+    Includes the identity's status and attributes, so a suspension or an
+    attribute change is not answered from an earlier decision.
+    """
+    identity = context.identity
+    return (
+        identity.id,
+        identity.status,
+        _freeze(identity.attributes),
+        context.resource,
+        context.action,
+        tuple(context.roles),
+        tuple(context.scopes),
+        context.tenant_id,
+        _freeze(context.attributes),
+    )
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable form of attribute values (dicts, lists and sets nest)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
 
 
 # ============================================================================
@@ -217,9 +359,12 @@ class ScopeChecker:
     """
     OAuth2-style scope checking.
 
-    Checks if identity has required scopes.
+    Checks if identity has required scopes.  Decisions are memoized per
+    (available, required) pair in a bounded cache.
     """
 
+    _decisions = _BoundedCache(4096)
+
     @staticmethod
     def check_scopes(
         available_scopes: list[str], required_scopes: list[str]
@@ -234,7 +379,12 @@ class ScopeChecker:
         Returns:
             True if all required scopes are available
         """
-        return set(required_scopes).issubset(set(available_scopes))
+        key = (tuple(available_scopes), tuple(required_scopes))
+        decision = ScopeChecker._decisions.get(key)
+        if decision is None:
+            decision = set(key[1]).issubset(key[0])
+            ScopeChecker._decisions.put(key, decision)
+        return decision
 
     @staticmethod
     def check(
@@ -13,8 +13,8 @@ Flow Pipeline Structure:
 
 Controller Pipeline:
   Controllers accept pipeline nodes as callables.
-  ControllerEngine._execute_pipeline_node inspects signature
-  and injects: request, ctx/context, controller.
+  RouteInvoker inspects each node's signature when the route is
+  compiled and injects: request, ctx/context, controller.
   Guards work in controllers via the .guard() class methods.
 """
 
@@ -542,7 +542,7 @@ class RequirePolicyGuard(FlowGuard):
 # Controller Pipeline Guards
 # ============================================================================
 # These adapt FlowGuards for use in Controller.pipeline lists.
-# ControllerEngine._execute_pipeline_node inspects signature and
+# RouteInvoker inspects the node signature at route compile time and
 # injects `ctx` (RequestCtx) or `request` (Request).
 # A guard returns False or a Response to short-circuit; None to continue.
 
@@ -12,6 +12,7 @@ Each sub-command generates a specific deployment artefact:
     aq deploy monitoring   — Prometheus + Grafana provisioning
     aq deploy env          — .env.example template
     aq deploy makefile     — Makefile with dev/build/deploy targets
+    aq deploy openapi      — Prebuilt OpenAPI spec (+ gzip/brotli variants)
     aq deploy all          — Generate everything at once
 
 All generators introspect the workspace (workspace.py, config/, modules/,
@@ -572,6 +573,126 @@ def deploy_env(ctx, output: str, force: bool, dry_run: bool):
         sys.exit(1)
 
 
+def _build_openapi_document(workspace_root: Path):
+    """
+    Compile every workspace controller and render the OpenAPI spec.
+
+    Mirrors ``AquiliaServer._load_controllers`` + ``_register_docs_routes``
+    without starting the server (no DB, cache or lifecycle hooks).
+    """
+    import importlib
+    from aquilia.config import ConfigLoader
+    from aquilia.controller.compiler import ControllerCompiler
+    from aquilia.controller.router import ControllerRouter
+    from aquilia.controller.openapi import (
+        OpenAPIConfig, OpenAPIDocument, OpenAPIGenerator,
+    )
+    from .inspect import _get_workspace_modules, _load_manifest_instance
+
+    config = ConfigLoader.load(paths=[str(workspace_root / "workspace.py")])
+    openapi_integration = config.get("integrations", {}).get("openapi", {})
+    if openapi_integration:
+        openapi_config = OpenAPIConfig.from_dict(openapi_integration)
+    else:
+        openapi_config = OpenAPIConfig(
+            title=config.get("api_title", "Aquilia API"),
+            version=config.get("api_version", "1.0.0"),
+        )
+
+    compiler = ControllerCompiler()
+    router = ControllerRouter()
+    for module_name in _get_workspace_modules(workspace_root):
+        manifest = _load_manifest_instance(workspace_root, module_name)
+        if manifest is None:
+            warning(f"  Module '{module_name}': manifest not loadable, skipped")
+            continue
+        route_prefix = getattr(manifest, "route_prefix", None)
+        for ref in getattr(manifest, "controllers", None) or []:
+            if isinstance(ref, str):
+                mod_path, _, cls_name = ref.rpartition(":" if ":" in ref else ".")
+                controller_class = getattr(importlib.import_module(mod_path), cls_name)
+            else:
+                controller_class = ref
+            compiled = compiler.compile_controller(controller_class, base_prefix=route_prefix)
+            for route in compiled.routes:
+                route.app_name = module_name
+            router.add_controller(compiled)
+    router.initialize()
+
+    spec = OpenAPIGenerator(config=openapi_config).generate(router)
+    return OpenAPIDocument.from_spec(spec), openapi_config
+
+
+def _write_openapi_artifact(
+    workspace_root: Path,
+    path: Path,
+    *,
+    verbose: bool,
+    force: bool,
+    dry_run: bool,
+) -> bool:
+    """Generate and write the spec (+ .gz/.br/.etag). Returns True if written."""
+    label = str(path)
+    if path.exists() and not force:
+        file_skipped(label, reason="exists, use --force")
+        return False
+    ws_abs = str(workspace_root.resolve())
+    if ws_abs not in sys.path:
+        sys.path.insert(0, ws_abs)
+    document, _ = _build_openapi_document(workspace_root)
+    if dry_run:
+        file_dry(label)
+        return True
+    for written in document.write(path):
+        file_written(written.name if written != path else label,
+                     verbose=verbose, path=str(written))
+    return True
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# aq deploy openapi
+# ═══════════════════════════════════════════════════════════════════════════
+
+@deploy_gen_group.command("openapi")
+@click.option("--output", "-o", type=click.Path(), default="build/openapi.json",
+              help="Spec file path (.gz/.br variants are written alongside)")
+@deploy_options
+@click.pass_context
+def deploy_openapi(ctx, output: str, force: bool, dry_run: bool):
+    """
+    Emit the OpenAPI spec as a build artefact.
+
+    Compiles all workspace controllers, renders the spec once and writes
+    compact JSON plus pre-compressed gzip/brotli variants. Point
+    ``Integration.openapi(prebuilt_path=...)`` at the file so production
+    servers serve it verbatim and never run the generator.
+
+    Examples:
+      aq deploy openapi
+      aq deploy openapi -o dist/openapi.json --force
+    """
+    workspace_root = Path.cwd()
+    out = Path(output)
+    verbose = ctx.obj.get("verbose", False)
+    force = force or ctx.obj.get("force", False)
+    dry_run = dry_run or ctx.obj.get("dry_run", False)
+
+    try:
+        action = "DRY RUN" if dry_run else "Generating"
+        section(f"{action}: OpenAPI spec")
+        _write_openapi_artifact(workspace_root, out, verbose=verbose,
+                                force=force, dry_run=dry_run)
+        click.echo()
+        next_steps([
+            f'Integration.openapi(prebuilt_path="{out}")',
+            "Ship the file (and its .gz/.br/.etag siblings) with the image",
+        ])
+
+    except Exception as e:
+        error(f"  {_CROSS} OpenAPI generation failed: {e}")
+        sys.exit(1)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # aq deploy all
 # ═══════════════════════════════════════════════════════════════════════════
@@ -588,8 +709,9 @@ def deploy_all(ctx, output: str, monitoring: bool, ci_provider: str, force: bool
     Generate ALL deployment files at once.
 
     Creates Dockerfile, docker-compose.yml, Kubernetes manifests,
-    Nginx config, CI/CD pipeline(s), Makefile, monitoring, and
-    .env template.  Respects --force and --dry-run flags.
+    Nginx config, CI/CD pipeline(s), Makefile, monitoring, .env
+    template and the prebuilt OpenAPI spec.  Respects --force and
+    --dry-run flags.
 
     Examples:
       aq deploy all
@@ -758,6 +880,17 @@ def deploy_all(ctx, output: str, monitoring: bool, ci_provider: str, force: bool
                        force=force, dry_run=dry_run):
             written += 1
 
+        # -- OpenAPI --
+        click.echo()
+        section("OpenAPI")
+        try:
+            if _write_openapi_artifact(workspace_root, out / "build" / "openapi.json",
+                                       verbose=verbose, force=force, dry_run=dry_run):
+                written += 1
+        except Exception as e:
+            # Controllers may need runtime services to import; not fatal here.
+            warning(f"  OpenAPI spec skipped: {e}")
+
         # -- Summary --
         click.echo()
         rule()
@@ -802,6 +935,7 @@ def deploy_all(ctx, output: str, monitoring: bool, ci_provider: str, force: bool
         structure += [
             (".env.example",           "Environment template"),
             ("Makefile",               "Dev/deploy task runner"),
+            ("build/openapi.json",     "Prebuilt OpenAPI spec (+ .gz/.br)"),
         ]
 
         table(
@@ -396,6 +396,9 @@ class Integration:
         echo: bool = False,
         model_paths: Optional[List[str]] = None,
         scan_dirs: Optional[List[str]] = None,
+        databases: Optional[Dict[str, Any]] = None,
+        routers: Optional[List[str]] = None,
+        sticky_ms: int = 0,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -411,6 +414,11 @@ class Integration:
             echo: Log SQL statements
             model_paths: Explicit .amdl file paths
             scan_dirs: Directories to scan for .amdl files
+            databases: Extra named databases, ``{alias: url}`` or
+                ``{alias: {"url": ..., "replica_of": "default", "weight": 2}}``
+            routers: ``DatabaseRouter`` import paths ("module:Class")
+            sticky_ms: Keep reads on the primary this long after a write
+                in the same request (read-your-writes)
             **kwargs: Additional database options
         
         Returns:
@@ -436,6 +444,9 @@ class Integration:
             "echo": echo,
             "model_paths": model_paths or [],
             "scan_dirs": scan_dirs or ["models"],
+            "databases": databases or {},
+            "routers": routers or [],
+            "sticky_ms": sticky_ms,
             **kwargs,
         }
     
@@ -832,6 +843,8 @@ class Integration:
         per_user: bool = False,
         burst: Optional[int] = None,
         exempt_paths: Optional[List[str]] = None,
+        shared: bool = False,
+        lease: int = 0,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -844,6 +857,11 @@ class Integration:
             per_user: Use user identity as key (requires auth).
             burst: Extra burst capacity (token_bucket only).
             exempt_paths: Paths to skip rate limiting.
+            shared: Enforce one limit across all workers using the cache
+                backend (GCRA; atomic Lua script on Redis).  Requires
+                ``Integration.cache()``.
+            lease: With ``shared``, tokens each worker claims per round
+                trip so most requests are decided locally.
 
         Returns:
             Rate limit configuration dictionary.
@@ -866,6 +884,8 @@ class Integration:
             "per_user": per_user,
             "burst": burst,
             "exempt_paths": exempt_paths or ["/health", "/healthz", "/ready"],
+            "shared": shared,
+            "lease": lease,
             **kwargs,
         }
 
@@ -893,6 +913,8 @@ class Integration:
         external_docs_description: str = "",
         swagger_ui_theme: str = "",
         swagger_ui_config: Optional[Dict[str, Any]] = None,
+        prebuilt_path: str = "",
+        precompute: bool = True,
         enabled: bool = True,
         **kwargs,
     ) -> Dict[str, Any]:
@@ -925,6 +947,9 @@ class Integration:
             external_docs_description: Description for external docs link.
             swagger_ui_theme: Swagger UI theme ("dark", "" for default).
             swagger_ui_config: Extra Swagger UI configuration overrides.
+            prebuilt_path: Spec file emitted by ``aq deploy openapi``. When it
+                exists the server serves it and never runs the generator.
+            precompute: Generate the spec at startup instead of on first request.
             enabled: Enable/disable OpenAPI routes entirely.
 
         Returns:
@@ -971,6 +996,8 @@ class Integration:
             "external_docs_description": external_docs_description,
             "swagger_ui_theme": swagger_ui_theme,
             "swagger_ui_config": swagger_ui_config or {},
+            "prebuilt_path": prebuilt_path,
+            "precompute": precompute,
             **kwargs,
         }
 
@@ -1073,6 +1100,9 @@ class Integration:
         log_response_body: bool = False,
         colorize: bool = True,
         enabled: bool = True,
+        async_: bool = False,
+        sample_rate: float = 1.0,
+        buffer_size: int = 8192,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -1093,6 +1123,12 @@ class Integration:
             log_response_body: Log response body (use with caution).
             colorize: Colorize log output (for development).
             enabled: Enable/disable request logging.
+            async_: Queue access records and format/write them in batches
+                off the event loop (``AccessLogPipeline``).
+            sample_rate: Fraction of fast 1xx-4xx requests kept in async
+                mode (errors and slow requests are always logged).
+            buffer_size: Async ring buffer size; records beyond it are
+                dropped and counted.
             **kwargs: Extra config passed through.
 
         Returns:
@@ -1121,6 +1157,9 @@ class Integration:
             "log_request_body": log_request_body,
             "log_response_body": log_response_body,
             "colorize": colorize,
+            "async": async_,
+            "sample_rate": sample_rate,
+            "buffer_size": buffer_size,
             **kwargs,
         }
 
@@ -1137,6 +1176,11 @@ class Integration:
         retry_base_delay: float = 1.0,
         rate_limit_global: int = 1000,
         rate_limit_per_domain: int = 100,
+        queue_enabled: bool = True,
+        queue_backend: str = "memory",
+        queue_db_url: str = "",
+        queue_concurrency: int = 2,
+        queue_batch_size: int = 50,
         dkim_enabled: bool = False,
         dkim_domain: Optional[str] = None,
         dkim_selector: str = "aquilia",
@@ -1162,6 +1206,12 @@ class Integration:
             retry_base_delay: Base delay (seconds) for exponential backoff.
             rate_limit_global: Global rate limit (messages/minute).
             rate_limit_per_domain: Per-domain rate limit (messages/minute).
+            queue_enabled: Enqueue mail and deliver from background workers
+                (False = send inline in the request).
+            queue_backend: Job store — ``"memory"`` or ``"sqlite"``.
+            queue_db_url: SQLite URL for the ``"sqlite"`` job store.
+            queue_concurrency: Dispatcher workers draining the mail queue.
+            queue_batch_size: Envelopes claimed per dispatcher batch.
             dkim_enabled: Enable DKIM signing.
             dkim_domain: DKIM signing domain.
             dkim_selector: DKIM selector.
@@ -1205,6 +1255,13 @@ class Integration:
                 "global_per_minute": rate_limit_global,
                 "per_domain_per_minute": rate_limit_per_domain,
             },
+            "queue": {
+                "enabled": queue_enabled,
+                "backend": queue_backend,
+                "db_url": queue_db_url,
+                "concurrency": queue_concurrency,
+                "batch_size": queue_batch_size,
+            },
             "security": {
                 "dkim_enabled": dkim_enabled,
                 "dkim_domain": dkim_domain,
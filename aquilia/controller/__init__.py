@@ -48,6 +48,7 @@ from .factory import (
     InstantiationMode,
 )
 from .engine import ControllerEngine
+from .invoker import RouteInvoker
 from .compiler import (
     ControllerCompiler,
     CompiledRoute,
@@ -57,6 +58,8 @@ from .router import ControllerRouter
 from .openapi import (
     OpenAPIGenerator,
     OpenAPIConfig,
+    OpenAPIDocument,
+    OpenAPIDocumentCache,
     generate_swagger_html,
     generate_redoc_html,
 )
@@ -113,6 +116,7 @@ __all__ = [
     
     # Engine
     "ControllerEngine",
+    "RouteInvoker",
     
     # Compilation
     "ControllerCompiler",
@@ -125,6 +129,8 @@ __all__ = [
     # OpenAPI
     "OpenAPIGenerator",
     "OpenAPIConfig",
+    "OpenAPIDocument",
+    "OpenAPIDocumentCache",
     "generate_swagger_html",
     "generate_redoc_html",
 
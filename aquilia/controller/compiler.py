@@ -7,8 +7,8 @@ Integrates with:
 - aquilia.router for route registration
 """
 
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Callable, List, Dict, Any, Optional
+from dataclasses import dataclass, field
 import inspect
 
 from .metadata import (
@@ -38,6 +38,10 @@ class CompiledRoute:
     http_method: str
     specificity: int
     app_name: Optional[str] = None
+    # Scoped middleware chain compiled by ControllerRouter.compile_chains()
+    middleware_chain: Optional[Callable] = field(default=None, repr=False, compare=False)
+    # Execution plan built by ControllerEngine.compile_route()
+    invoker: Optional[Callable] = field(default=None, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dict for caching."""
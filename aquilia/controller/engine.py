@@ -13,9 +13,10 @@ from typing import Any, Dict, Optional, List
 import inspect
 import logging
 
-from .base import Controller, RequestCtx
+from .base import RequestCtx
 from .factory import ControllerFactory, InstantiationMode
 from .compiler import CompiledRoute
+from .invoker import HandlerInvoker, RouteInvoker
 from ..request import Request
 from ..response import Response
 from ..di import Container
@@ -27,6 +28,7 @@ class ControllerEngine:
     Executes controller methods with complete integration.
     
     Responsibilities:
+    - Compile a per-route invoker (see ``aquilia.controller.invoker``)
     - Instantiate controllers via DI
     - Build RequestCtx with auth, session, state
     - Execute pipelines (class-level + method-level)
@@ -35,12 +37,6 @@ class ControllerEngine:
     - Lifecycle management
     """
     
-    # Class-level caches shared across instances
-    _signature_cache: Dict[Any, inspect.Signature] = {}
-    _pipeline_param_cache: Dict[int, set] = {}  # id(callable) -> set of param names
-    _has_lifecycle_hooks: Dict[type, tuple] = {}  # class -> (has_on_request, has_on_response)
-    _simple_route_cache: Dict[int, bool] = {}  # id(route) -> is_simple
-    
     def __init__(
         self,
         factory: ControllerFactory,
@@ -52,7 +48,26 @@ class ControllerEngine:
         self.fault_engine = fault_engine
         self.logger = logging.getLogger("aquilia.controller.engine")
         self._lifecycle_initialized: set[type] = set()
-    
+
+    def compile_route(self, route: CompiledRoute) -> Any:
+        """
+        Build the invoker for a route.
+
+        Routes with a directly assigned ``handler`` (OpenAPI docs, etc.)
+        get a pass-through invoker; controller routes get a
+        ``RouteInvoker`` holding their full execution plan.
+        """
+        if callable(getattr(route, "handler", None)):
+            return HandlerInvoker(self, route)
+        return RouteInvoker(self, route)
+
+    def invoker_for(self, route: CompiledRoute) -> Any:
+        """Return the route's invoker, compiling it on first use."""
+        invoker = route.invoker
+        if invoker is None or invoker.engine is not self:
+            invoker = route.invoker = self.compile_route(route)
+        return invoker
+
     async def execute(
         self,
         route: CompiledRoute,
@@ -63,235 +78,40 @@ class ControllerEngine:
         """
         Execute a controller route.
 
-        Performance (v2):
-        - Fast path for monkeypatched handlers (no lifecycle, no DI).
-        - Skip lifecycle init check for per-request controllers.
-        - Build RequestCtx inline without extra method call for simple cases.
-        - Cache inspect.signature results via _bind_parameters.
+        Delegates to the route's precompiled invoker (see
+        ``aquilia.controller.invoker``); the ASGI adapter binds invokers
+        into the per-route chains at startup and skips this lookup.
         """
-        controller_class = route.controller_class
-        route_metadata = route.route_metadata
-
-        # Fast path: monkeypatched handler (OpenAPI docs, etc.)
-        if hasattr(route, "handler") and callable(route.handler):
-            ctx = RequestCtx(
-                request=request,
-                identity=request.state.get("identity"),
-                session=request.state.get("session"),
-                container=container,
-            )
-            result = await route.handler(request, ctx)
-            return self._to_response(result)
-
-        # Build RequestCtx
-        ctx = RequestCtx(
-            request=request,
-            identity=request.state.get("identity"),
-            session=request.state.get("session"),
-            container=container,
-            state=request.state,
-        )
-
-        # Singleton lifecycle init (once per controller class)
-        is_singleton = getattr(controller_class, "instantiation_mode", "per_request") == "singleton"
-        if self.enable_lifecycle and is_singleton and controller_class not in self._lifecycle_initialized:
-            await self._init_controller_lifecycle(controller_class, container)
-            self._lifecycle_initialized.add(controller_class)
-
-        # Instantiate controller
-        controller = await self.factory.create(
-            controller_class,
-            mode=InstantiationMode.PER_REQUEST,
-            request_container=container,
-            ctx=ctx,
-        )
-
-        # Execute class-level pipeline
-        if route.controller_metadata.pipeline:
-            for pipeline_node in route.controller_metadata.pipeline:
-                result = await self._execute_pipeline_node(
-                    pipeline_node, request, ctx, controller,
-                )
-                if isinstance(result, Response):
-                    return result
-
-        # Execute method-level pipeline
-        if route_metadata.pipeline:
-            for pipeline_node in route_metadata.pipeline:
-                result = await self._execute_pipeline_node(
-                    pipeline_node, request, ctx, controller,
-                )
-                if isinstance(result, Response):
-                    return result
-
-        # Get handler method
-        handler_method = getattr(controller, route_metadata.handler_name)
-
-        # ── Fast path for simple handlers ──
-        # Handlers with no pipeline, no serializer, and only ctx/path params
-        # can skip the full _bind_parameters machinery.
-        route_id = id(route)
-        is_simple = ControllerEngine._simple_route_cache.get(route_id)
-        if is_simple is None:
-            params = route_metadata.parameters
-            _rm = getattr(route_metadata, '_raw_metadata', {}) or {}
-            has_serializer = (
-                getattr(route_metadata, 'request_serializer', None) or _rm.get('request_serializer')
-                or getattr(route_metadata, 'response_serializer', None) or _rm.get('response_serializer')
-            )
-            has_blueprint = (
-                getattr(route_metadata, 'request_blueprint', None) or _rm.get('request_blueprint')
-                or getattr(route_metadata, 'response_blueprint', None) or _rm.get('response_blueprint')
-            )
-            has_filters_or_pagination = (
-                getattr(route_metadata, 'filterset_class', None) or _rm.get('filterset_class')
-                or getattr(route_metadata, 'filterset_fields', None) or _rm.get('filterset_fields')
-                or getattr(route_metadata, 'search_fields', None) or _rm.get('search_fields')
-                or getattr(route_metadata, 'ordering_fields', None) or _rm.get('ordering_fields')
-                or getattr(route_metadata, 'pagination_class', None) or _rm.get('pagination_class')
-                or getattr(route_metadata, 'renderer_classes', None) or _rm.get('renderer_classes')
-            )
-            is_simple = (
-                not route.controller_metadata.pipeline
-                and not route_metadata.pipeline
-                and not has_serializer
-                and not has_blueprint
-                and not has_filters_or_pagination
-                and (not params or all(
-                    p.name == 'ctx' or p.source == 'path' for p in params
-                ))
-            )
-            ControllerEngine._simple_route_cache[route_id] = is_simple
-
-        if is_simple:
-            # Direct call — skip _bind_parameters, lifecycle hooks, serializer
-            try:
-                # Signature-aware call
-                sig = self._get_cached_signature(handler_method)
-                has_ctx = "ctx" in sig.parameters or "context" in sig.parameters
-                
-                final_kwargs = {**path_params}
-                if has_ctx:
-                    ctx_key = "ctx" if "ctx" in sig.parameters else "context"
-                    final_kwargs[ctx_key] = ctx
-                
-                result = await self._safe_call(handler_method, **final_kwargs)
-                return self._to_response(result)
-            except Exception as e:
-                self.logger.error(
-                    f"Error executing {controller_class.__name__}.{route_metadata.handler_name}: {e}",
-                    exc_info=True,
-                )
-                if self.fault_engine:
-                    try:
-                        app_name = getattr(route, 'app_name', None)
-                        rid = request.state.get('request_id') if isinstance(request.state, dict) else None
-                        await self.fault_engine.process(
-                            e, app=app_name, route=route.full_path, request_id=rid,
-                        )
-                    except Exception:
-                        pass
-                raise
-
-        # Bind parameters
-        kwargs, request_dag = await self._bind_parameters(
-            route_metadata, request, ctx, path_params, container,
-        )
-
-        # Execute handler
-        try:
-            # Check lifecycle hooks (cached per class)
-            # We check if the method is actually OVERRIDDEN from Controller base,
-            # since Controller defines on_request/on_response as no-ops.
-            hooks = ControllerEngine._has_lifecycle_hooks.get(controller_class)
-            if hooks is None:
-                has_on_request = (
-                    'on_request' in controller_class.__dict__
-                    or any('on_request' in B.__dict__ for B in controller_class.__mro__[1:]
-                           if B is not Controller and B is not object)
-                )
-                has_on_response = (
-                    'on_response' in controller_class.__dict__
-                    or any('on_response' in B.__dict__ for B in controller_class.__mro__[1:]
-                           if B is not Controller and B is not object)
-                )
-                hooks = (has_on_request, has_on_response)
-                ControllerEngine._has_lifecycle_hooks[controller_class] = hooks
-
-            has_on_request, has_on_response = hooks
-
-            if has_on_request:
-                await self._safe_call(controller.on_request, ctx)
-
-            # Signature-aware call
-            sig = self._get_cached_signature(handler_method)
-            has_ctx = "ctx" in sig.parameters or "context" in sig.parameters
-            if has_ctx:
-                ctx_key = "ctx" if "ctx" in sig.parameters else "context"
-                kwargs[ctx_key] = ctx
-
-            result = await self._safe_call(handler_method, **kwargs)
-            result = await self._apply_filters_and_pagination(result, route_metadata, request)
-            result = self._apply_response_serializer(result, route_metadata, ctx)
-            result = self._apply_response_blueprint(result, route_metadata, ctx)
-            response = self._apply_content_negotiation(result, route_metadata, request)
-            if response is None:
-                response = self._to_response(result)
-
-            if has_on_response:
-                await self._safe_call(controller.on_response, ctx, response)
-
-            return response
-
-        except Exception as e:
-            self.logger.error(
-                f"Error executing {controller_class.__name__}.{route_metadata.handler_name}: {e}",
-                exc_info=True,
-            )
-            if self.fault_engine:
-                try:
-                    app_name = getattr(route, 'app_name', None)
-                    rid = request.state.get('request_id') if isinstance(request.state, dict) else None
-                    await self.fault_engine.process(
-                        e, app=app_name, route=route.full_path, request_id=rid,
-                    )
-                except Exception:
-                    pass
-            raise
-        finally:
-            # Teardown generator deps from RequestDAG
-            if request_dag is not None:
-                await request_dag.teardown()
+        return await self.invoker_for(route)(request, path_params, container)
     
     async def _init_controller_lifecycle(
         self,
         controller_class: type,
         container: Container,
-    ):
-        """Initialize controller lifecycle hooks (startup)."""
-        # Create temporary instance for lifecycle
-        temp_instance = await self.factory.create(
+    ) -> Any:
+        """
+        Create the singleton instance, running ``on_startup`` once.
+
+        Returns:
+            The cached singleton controller.
+        """
+        # Build a minimal context for startup (no actual request yet)
+        from ..request import Request as RequestClass
+        dummy_request = RequestClass(
+            scope={"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": []},
+            receive=lambda: None,
+        )
+        ctx = RequestCtx(request=dummy_request, identity=None, session=None, container=container, state={})
+        instance = await self.factory.create(
             controller_class,
             mode=InstantiationMode.SINGLETON,
             request_container=container,
+            ctx=ctx,
         )
-        
-        if hasattr(temp_instance, "on_startup"):
-            try:
-                # Build a minimal context for startup (no actual request yet)
-                from ..request import Request as RequestClass
-                dummy_request = RequestClass(
-                    scope={"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": []},
-                    receive=lambda: None,
-                )
-                ctx = RequestCtx(request=dummy_request, identity=None, session=None, container=container, state={})
-                await self._safe_call(temp_instance.on_startup, ctx)
-                self.logger.info(f"Executed on_startup for {controller_class.__name__}")
-            except Exception as e:
-                self.logger.error(
-                    f"Error in on_startup for {controller_class.__name__}: {e}",
-                    exc_info=True,
-                )
+        if controller_class not in self._lifecycle_initialized:
+            self._lifecycle_initialized.add(controller_class)
+            self.logger.info(f"Executed on_startup for {controller_class.__name__}")
+        return instance
     
     async def shutdown_controller(self, controller_class: type, container: Container):
         """Execute controller shutdown hooks."""
@@ -316,411 +136,6 @@ class ControllerEngine:
         
         self._lifecycle_initialized.discard(controller_class)
     
-    async def _build_request_context(
-        self,
-        request: Request,
-        container: Container,
-    ) -> RequestCtx:
-        """Build RequestCtx with auth, session, and state."""
-        identity = request.state.get("identity")
-        session = request.state.get("session")
-
-        # Only do DI fallback if middleware didn't set identity/session
-        if identity is None:
-            try:
-                identity = await container.resolve_async("identity", optional=True)
-            except Exception:
-                pass
-
-        if session is None:
-            try:
-                session = await container.resolve_async("session", optional=True)
-            except Exception:
-                pass
-
-        return RequestCtx(
-            request=request,
-            identity=identity,
-            session=session,
-            container=container,
-            state=request.state,
-        )
-    
-    async def _execute_pipeline_node(
-        self,
-        pipeline_node: Any,
-        request: Request,
-        ctx: RequestCtx,
-        controller: Controller,
-    ) -> Optional[Response]:
-        """Execute a pipeline node (middleware/guard) with cached signatures."""
-        if not callable(pipeline_node):
-            return None
-
-        # Cache parameter names by id of callable
-        node_id = id(pipeline_node)
-        param_names = self._pipeline_param_cache.get(node_id)
-        if param_names is None:
-            sig = inspect.signature(pipeline_node)
-            param_names = set(sig.parameters.keys())
-            self._pipeline_param_cache[node_id] = param_names
-
-        kwargs = {}
-        if "request" in param_names or "req" in param_names:
-            key = "request" if "request" in param_names else "req"
-            kwargs[key] = request
-        if "ctx" in param_names or "context" in param_names:
-            key = "ctx" if "ctx" in param_names else "context"
-            kwargs[key] = ctx
-        if "controller" in param_names:
-            kwargs["controller"] = controller
-
-        result = await self._safe_call(pipeline_node, **kwargs)
-
-        if result is False:
-            return Response.json({"error": "Pipeline guard failed"}, status=403)
-        elif isinstance(result, Response):
-            return result
-
-        return None
-    
-    async def _bind_parameters(
-        self,
-        route_metadata,
-        request: Request,
-        ctx: RequestCtx,
-        path_params: Dict[str, Any],
-        container: Container,
-    ) -> tuple[Dict[str, Any], Any]:
-        """
-        Bind parameters from request to handler arguments.
-        
-        Returns:
-            Tuple of (kwargs dict, RequestDAG or None).
-            The DAG must be torndown after handler execution.
-        
-        Sources:
-        - Path parameters
-        - Query parameters
-        - Request body (JSON/form)
-        - DI container
-        - Dep() descriptors (resolved via RequestDAG)
-        - Special: ctx, request
-        - **Serializer subclasses**: Auto-parsed from request body (FastAPI-style)
-        - **Blueprint subclasses**: Auto-parsed, cast+sealed from request body
-
-        When a parameter is typed as a ``Serializer`` subclass, the engine
-        will:
-        1. Parse the request body (JSON or form)
-        2. Create the serializer with ``data=body, context={request, container}``
-        3. Call ``is_valid(raise_fault=True)``
-        4. Inject ``serializer.validated_data`` as the parameter value
-
-        If the parameter name is ``serializer`` or ends with ``_serializer``,
-        the full serializer instance is injected instead of just the
-        validated data.  This gives the handler access to ``.save()``,
-        ``.errors``, etc.
-
-        When a parameter is typed as a ``Blueprint`` subclass, the engine
-        will:
-        1. Parse the request body (JSON or form)
-        2. Create the Blueprint with ``data=body, context={request, container}``
-        3. Call ``is_sealed(raise_fault=True)``
-        4. Inject the Blueprint instance or ``.validated_data``
-
-        If the parameter name is ``blueprint`` or ends with ``_blueprint``
-        or ``_bp``, the full Blueprint instance is injected. Otherwise,
-        ``blueprint.validated_data`` is injected.
-
-        Similarly, if a ``request_serializer`` or ``request_blueprint``
-        is declared on the route decorator, it takes precedence and is
-        used for body parsing.
-        """
-        kwargs = {}
-        request_dag = None  # Lazy — created only if handler uses Dep()
-        
-        # Check for request_serializer from decorator metadata
-        decorator_request_serializer = getattr(route_metadata, 'request_serializer', None)
-        if decorator_request_serializer is None:
-            raw_meta = getattr(route_metadata, '_raw_metadata', None)
-            if raw_meta and isinstance(raw_meta, dict):
-                decorator_request_serializer = raw_meta.get('request_serializer')
-
-        # Check for request_blueprint from decorator metadata
-        decorator_request_blueprint = getattr(route_metadata, 'request_blueprint', None)
-        if decorator_request_blueprint is None:
-            raw_meta = getattr(route_metadata, '_raw_metadata', None)
-            if raw_meta and isinstance(raw_meta, dict):
-                decorator_request_blueprint = raw_meta.get('request_blueprint')
-        
-        # Track if body has been consumed by a serializer
-        _body_consumed = False
-        _body_cache = None
-        
-        async def _get_body():
-            nonlocal _body_cache
-            if _body_cache is not None:
-                return _body_cache
-            try:
-                _body_cache = await request.json()
-            except Exception:
-                try:
-                    _body_cache = await request.form()
-                except Exception:
-                    _body_cache = {}
-            return _body_cache
-        
-        for param in route_metadata.parameters:
-            param_name = param.name
-            
-            # Skip ctx/context (injected directly in execute)
-            if param_name in ("ctx", "context"):
-                continue
-            
-            # ── FastAPI-style Serializer injection ───────────────────────
-            # If the parameter type is a Serializer subclass, auto-parse
-            # the request body through it.
-            param_is_serializer = self._is_serializer_class(param.type)
-
-            # ── Blueprint injection ──────────────────────────────────────
-            # If the parameter type is a Blueprint subclass, auto-parse
-            # the request body through it.
-            param_is_blueprint = self._is_blueprint_class(param.type)
-            
-            # Also check for decorator-level request_serializer
-            use_serializer = None
-            use_blueprint = None
-
-            if param_is_serializer:
-                use_serializer = param.type
-            elif param_is_blueprint:
-                use_blueprint = param.type
-            elif (
-                decorator_request_blueprint
-                and self._is_blueprint_class(decorator_request_blueprint)
-                and param.source == 'body'
-                and not _body_consumed
-            ):
-                use_blueprint = decorator_request_blueprint
-            elif (
-                decorator_request_serializer
-                and self._is_serializer_class(decorator_request_serializer)
-                and param.source == 'body'
-                and not _body_consumed
-            ):
-                use_serializer = decorator_request_serializer
-
-            # ── Blueprint body binding ───────────────────────────────────
-            if use_blueprint is not None and not _body_consumed:
-                body = await _get_body()
-                _body_consumed = True
-
-                # Build context with request + container
-                bp_context = {"request": request}
-                if container:
-                    bp_context["container"] = container
-                if ctx.identity:
-                    bp_context["identity"] = ctx.identity
-
-                # Handle ProjectedRef (Blueprint["projection"])
-                projection = None
-                bp_cls = use_blueprint
-                try:
-                    from aquilia.blueprints.lenses import _ProjectedRef
-                    if isinstance(use_blueprint, _ProjectedRef):
-                        projection = use_blueprint.projection
-                        bp_cls = use_blueprint.blueprint_cls
-                except ImportError:
-                    pass
-
-                # Determine if PATCH → partial
-                is_partial = request.method == "PATCH"
-
-                bp_instance = bp_cls(
-                    data=body,
-                    partial=is_partial,
-                    projection=projection,
-                    context=bp_context,
-                )
-                bp_instance.is_sealed(raise_fault=True)
-
-                # If param name suggests they want the Blueprint instance,
-                # inject the full Blueprint. Otherwise inject validated_data.
-                inject_instance = (
-                    param_name == "blueprint"
-                    or param_name.endswith("_blueprint")
-                    or param_name.endswith("_bp")
-                )
-
-                if inject_instance:
-                    kwargs[param_name] = bp_instance
-                else:
-                    kwargs[param_name] = bp_instance.validated_data
-                continue
-            
-            if use_serializer is not None and not _body_consumed:
-                body = await _get_body()
-                _body_consumed = True
-                
-                # Build context with request + container for DI defaults
-                ser_context = {"request": request}
-                if container:
-                    ser_context["container"] = container
-                if ctx.identity:
-                    ser_context["identity"] = ctx.identity
-                
-                serializer = use_serializer(
-                    data=body,
-                    context=ser_context,
-                )
-                serializer.is_valid(raise_fault=True)
-                
-                # If param name suggests they want the serializer instance,
-                # inject the full serializer (access to .save(), .errors, etc.)
-                # Otherwise inject just the validated_data dict.
-                inject_instance = (
-                    param_name == "serializer"
-                    or param_name.endswith("_serializer")
-                    or param_name.endswith("_ser")
-                )
-                
-                if inject_instance:
-                    kwargs[param_name] = serializer
-                else:
-                    kwargs[param_name] = serializer.validated_data
-                continue
-            
-            # Path parameters
-            if param.source == "path":
-                if param_name in path_params:
-                    kwargs[param_name] = path_params[param_name]
-                elif not param.required and param.default is not inspect.Parameter.empty:
-                    kwargs[param_name] = param.default
-            
-            # Query parameters
-            elif param.source == "query":
-                value = request.query_param(param_name)
-                if value is not None:
-                    # Cast to expected type
-                    kwargs[param_name] = self._cast_value(value, param.type)
-                elif not param.required and param.default is not inspect.Parameter.empty:
-                    kwargs[param_name] = param.default
-            
-            # Body (for POST/PUT/PATCH)
-            elif param.source == "body":
-                if request.method in ("POST", "PUT", "PATCH"):
-                    try:
-                        body = await request.json()
-                        if param_name in body:
-                            kwargs[param_name] = body[param_name]
-                        elif not param.required and param.default is not inspect.Parameter.empty:
-                            kwargs[param_name] = param.default
-                    except:
-                        if not param.required and param.default is not inspect.Parameter.empty:
-                            kwargs[param_name] = param.default
-            
-            # Dep resolution (via RequestDAG)
-            elif param.source == "dep":
-                try:
-                    from aquilia.di.dep import _extract_dep_from_annotation
-                    from aquilia.di.request_dag import RequestDAG
-                    from typing import get_origin, get_args, Annotated
-
-                    dep_meta = _extract_dep_from_annotation(param.type)
-                    if dep_meta is not None:
-                        if request_dag is None:
-                            request_dag = RequestDAG(container, request)
-                        # Get base type from Annotated
-                        base_type = param.type
-                        if get_origin(param.type) is Annotated:
-                            base_type = get_args(param.type)[0]
-                        value = await request_dag.resolve(dep_meta, base_type)
-                        kwargs[param_name] = value
-                    else:
-                        # Fallback to container resolve if Dep not extractable
-                        resolve_token = param.type if param.type is not inspect.Parameter.empty else param_name
-                        value = await container.resolve_async(resolve_token, optional=not param.required)
-                        if value is not None:
-                            kwargs[param_name] = value
-                        elif not param.required and param.default is not inspect.Parameter.empty:
-                            kwargs[param_name] = param.default
-                except Exception as e:
-                    if not param.required and param.default is not inspect.Parameter.empty:
-                        kwargs[param_name] = param.default
-                    else:
-                        raise
-
-            # DI injection
-            elif param.source == "di":
-                try:
-                    # For Session and Identity, we use optional=True so we can raise our own Faults
-                    is_session_param = (
-                        param_name == "session" or
-                        (hasattr(param.type, "__name__") and param.type.__name__ == "Session")
-                    )
-                    
-                    is_identity_param = (
-                        param_name == "identity" or 
-                        (hasattr(param.type, "__name__") and param.type.__name__ == "Identity")
-                    )
-
-                    is_optional = not param.required or is_session_param or is_identity_param
-                    
-                    # Resolve by type if available, otherwise by name
-                    resolve_token = param.type if param.type is not inspect.Parameter.empty else param_name
-                    value = await container.resolve_async(resolve_token, optional=is_optional)
-                    
-                    if is_session_param and value is None:
-                        # Try to resolve session proactively
-                        try:
-                            from aquilia.sessions import SessionEngine
-                            engine = await container.resolve_async(SessionEngine)
-                            value = await engine.resolve(request)
-                            # Update context and request for downstream handlers/decorators
-                            ctx.session = value
-                            request.state['session'] = value
-                        except Exception:
-                            pass
-                    
-                    # ENFORCEMENT: If this is a Session, and it's None, but requested as required
-                    # then raise SessionRequiredFault.
-                    if value is None and param.required:
-                        if is_session_param:
-                            from aquilia.sessions.decorators import SessionRequiredFault
-                            raise SessionRequiredFault()
-                        elif is_identity_param:
-                            from aquilia.sessions.decorators import AuthenticationRequiredFault
-                            raise AuthenticationRequiredFault()
-                            
-                    if value is not None:
-                        kwargs[param_name] = value
-                    elif not param.required and param.default is not inspect.Parameter.empty:
-                        kwargs[param_name] = param.default
-                except Exception as e:
-                    # Reraise session/auth faults
-                    from aquilia.sessions.decorators import SessionRequiredFault, AuthenticationRequiredFault
-                    if isinstance(e, (SessionRequiredFault, AuthenticationRequiredFault)):
-                        raise
-                        
-                    if not param.required and param.default is not inspect.Parameter.empty:
-                        kwargs[param_name] = param.default
-                    else:
-                        # Re-raise original error if it's not handled
-                        raise
-        
-        return kwargs, request_dag
-    
-    def _cast_value(self, value: str, annotation: Any) -> Any:
-        """Cast string value to target type."""
-        if annotation is int or annotation == "int":
-            return int(value)
-        elif annotation is float or annotation == "float":
-            return float(value)
-        elif annotation is bool or annotation == "bool":
-            return value.lower() in ("true", "1", "yes")
-        else:
-            return value
-    
     _serializer_base_class = None  # Cached Serializer class
     _blueprint_base_class = None   # Cached Blueprint class
 
@@ -774,20 +189,10 @@ class ControllerEngine:
     def _apply_response_serializer(
         self,
         result: Any,
-        route_metadata: Any,
+        response_serializer: Any,
         ctx: RequestCtx,
     ) -> Any:
         """Auto-serialize handler return value via response_serializer."""
-        # Fast path: check direct attribute first (avoids dict lookups for common case)
-        response_serializer = getattr(route_metadata, 'response_serializer', None)
-        if response_serializer is None:
-            raw_meta = getattr(route_metadata, '_raw_metadata', None)
-            if raw_meta and isinstance(raw_meta, dict):
-                response_serializer = raw_meta.get('response_serializer')
-        
-        if response_serializer is None or not self._is_serializer_class(response_serializer):
-            return result
-        
         # Don't re-serialize Response objects
         if isinstance(result, Response):
             return result
@@ -812,20 +217,9 @@ class ControllerEngine:
     def _apply_response_blueprint(
         self,
         result: Any,
-        route_metadata: Any,
-        ctx: RequestCtx,
+        response_blueprint: Any,
     ) -> Any:
         """Auto-mold handler return value via response_blueprint."""
-        # Fast path: check direct attribute first
-        response_blueprint = getattr(route_metadata, 'response_blueprint', None)
-        if response_blueprint is None:
-            raw_meta = getattr(route_metadata, '_raw_metadata', None)
-            if raw_meta and isinstance(raw_meta, dict):
-                response_blueprint = raw_meta.get('response_blueprint')
-
-        if response_blueprint is None:
-            return result
-
         # Don't re-mold Response objects
         if isinstance(result, Response):
             return result
@@ -853,8 +247,12 @@ class ControllerEngine:
     async def _apply_filters_and_pagination(
         self,
         result: Any,
-        route_metadata: Any,
         request: Request,
+        filterset_class: Any = None,
+        filterset_fields: Any = None,
+        search_fields: Any = None,
+        ordering_fields: Any = None,
+        pagination_class: Any = None,
     ) -> Any:
         """
         Apply FilterSet / SearchFilter / OrderingFilter / Pagination
@@ -863,21 +261,6 @@ class ControllerEngine:
         Only activates when the route has filtering/pagination metadata
         AND the result is a list (or QuerySet-like object).
         """
-        # Resolve metadata attrs (direct or _raw_metadata fallback)
-        def _meta(key):
-            v = getattr(route_metadata, key, None)
-            if v is None:
-                raw = getattr(route_metadata, '_raw_metadata', None)
-                if raw and isinstance(raw, dict):
-                    v = raw.get(key)
-            return v
-
-        filterset_class = _meta('filterset_class')
-        filterset_fields = _meta('filterset_fields')
-        search_fields = _meta('search_fields')
-        ordering_fields = _meta('ordering_fields')
-        pagination_class = _meta('pagination_class')
-
         has_filters = any([
             filterset_class, filterset_fields, search_fields, ordering_fields,
         ])
@@ -956,45 +339,18 @@ class ControllerEngine:
     def _apply_content_negotiation(
         self,
         result: Any,
-        route_metadata: Any,
+        negotiator: Any,
         request: Request,
     ) -> Optional[Response]:
         """
         Select a renderer via content negotiation and build a Response.
 
-        Returns ``None`` if no renderer_classes are configured (default
-        path uses ``_to_response``), or a fully-rendered ``Response``.
+        ``negotiator`` is the route's prebuilt ``ContentNegotiator``.
         """
         # Already a Response — skip
         if isinstance(result, Response):
             return result
 
-        renderer_classes = getattr(route_metadata, 'renderer_classes', None)
-        if renderer_classes is None:
-            raw = getattr(route_metadata, '_raw_metadata', None)
-            if raw and isinstance(raw, dict):
-                renderer_classes = raw.get('renderer_classes')
-
-        if not renderer_classes:
-            return None  # caller falls through to _to_response
-
-        try:
-            from .renderers import ContentNegotiator, BaseRenderer
-        except ImportError:
-            return None
-
-        # Instantiate renderer classes if they are types
-        instances = []
-        for rc in renderer_classes:
-            if isinstance(rc, type) and issubclass(rc, BaseRenderer):
-                instances.append(rc())
-            elif isinstance(rc, BaseRenderer):
-                instances.append(rc)
-
-        if not instances:
-            return None
-
-        negotiator = ContentNegotiator(renderers=instances)
         renderer, media_type = negotiator.select_renderer(request)
 
         body = renderer.render(
@@ -1016,21 +372,6 @@ class ControllerEngine:
     # Cache for coroutine function checks
     _is_coro_cache: Dict[int, bool] = {}  # id(func) -> is_coroutine
     
-    def _get_cached_signature(self, func: Any) -> inspect.Signature:
-        """Get and cache function signature."""
-        # For bound methods, use the underlying function to get a stable ID
-        # and avoid "self" issues if any.
-        target = func
-        if hasattr(func, "__func__"):
-            target = func.__func__
-            
-        fid = id(target)
-        sig = ControllerEngine._signature_cache.get(fid)
-        if sig is None:
-            sig = inspect.signature(target)
-            ControllerEngine._signature_cache[fid] = sig
-        return sig
-
     async def _safe_call(self, func: Any, *args, **kwargs) -> Any:
         """Safely call function (sync or async)."""
         fid = id(func)
@@ -11,6 +11,8 @@ import asyncio
 import inspect
 import logging
 
+logger = logging.getLogger("aquilia.controller.factory")
+
 
 class InstantiationMode(str, Enum):
     """Controller instantiation modes."""
@@ -35,6 +37,7 @@ class ControllerFactory:
     def __init__(self, app_container: Optional[Any] = None):
         self.app_container = app_container
         self._singletons: Dict[Type, Any] = {}
+        self._singleton_locks: Dict[Type, asyncio.Lock] = {}
         self._startup_called: set = set()
     
     async def create(
@@ -73,30 +76,49 @@ class ControllerFactory:
         controller_class: Type,
         ctx: Optional[Any] = None,
     ) -> Any:
-        """Create or return singleton instance."""
-        if controller_class in self._singletons:
-            return self._singletons[controller_class]
-            
-        # Validate scope safety before instantiation
-        self.validate_scope(controller_class, InstantiationMode.SINGLETON)
-        
-        # Resolve constructor dependencies from app container
-        instance = await self._resolve_and_instantiate(
-            controller_class,
-            self.app_container,
-        )
-        
-        # Call on_startup hook once
-        if controller_class not in self._startup_called:
-            if hasattr(instance, 'on_startup'):
-                if inspect.iscoroutinefunction(instance.on_startup):
-                    await instance.on_startup(ctx)
-                else:
-                    instance.on_startup(ctx)
-            self._startup_called.add(controller_class)
-        
-        self._singletons[controller_class] = instance
-        return instance
+        """
+        Create or return singleton instance.
+
+        Concurrent first requests serialize on a per-class lock, so the
+        constructor and ``on_startup`` run exactly once.
+        """
+        instance = self._singletons.get(controller_class)
+        if instance is not None:
+            return instance
+
+        lock = self._singleton_locks.setdefault(controller_class, asyncio.Lock())
+        async with lock:
+            instance = self._singletons.get(controller_class)
+            if instance is not None:
+                return instance
+
+            # Validate scope safety before instantiation
+            self.validate_scope(controller_class, InstantiationMode.SINGLETON)
+
+            # Resolve constructor dependencies from app container
+            instance = await self._resolve_and_instantiate(
+                controller_class,
+                self.app_container,
+            )
+
+            # Call on_startup hook once; a failing hook is logged rather
+            # than surfacing as a 500 on the first request
+            if controller_class not in self._startup_called:
+                if hasattr(instance, 'on_startup'):
+                    try:
+                        if inspect.iscoroutinefunction(instance.on_startup):
+                            await instance.on_startup(ctx)
+                        else:
+                            instance.on_startup(ctx)
+                    except Exception as e:
+                        logger.error(
+                            f"Error in on_startup for {controller_class.__name__}: {e}",
+                            exc_info=True,
+                        )
+                self._startup_called.add(controller_class)
+
+            self._singletons[controller_class] = instance
+            return instance
     
     # Cache for controllers that don't have on_request hook
     _no_on_request: set = set()
@@ -151,41 +173,60 @@ class ControllerFactory:
         if container is None:
             # No DI - simple instantiation
             return controller_class()
-        
-        # Get cached constructor info (inspect.signature + get_type_hints are expensive)
-        ctor_info = ControllerFactory._ctor_info_cache.get(controller_class)
-        if ctor_info is None:
-            ctor_info = self._analyze_constructor(controller_class)
-            ControllerFactory._ctor_info_cache[controller_class] = ctor_info
-        
-        if not ctor_info:
+        return await self.instantiate(
+            controller_class, container, self.constructor_plan(controller_class),
+        )
+
+    def constructor_plan(self, controller_class: Type):
+        """
+        Return the cached constructor dependency plan for a class.
+
+        A list of ``(name, token, tag, dep, has_default, default)`` tuples
+        with ``Annotated[T, Inject(...)]`` / ``Annotated[T, Dep(...)]``
+        already unpacked, or ``None`` when the constructor can't be
+        inspected.
+        """
+        plan = ControllerFactory._ctor_info_cache.get(controller_class)
+        if plan is None and controller_class not in ControllerFactory._ctor_info_cache:
+            plan = self._analyze_constructor(controller_class)
+            ControllerFactory._ctor_info_cache[controller_class] = plan
+        return plan
+
+    async def instantiate(self, controller_class: Type, container: Any, plan) -> Any:
+        """Instantiate ``controller_class`` from a precomputed constructor plan."""
+        if container is None or not plan:
             # No injectable params — simple instantiation
             return controller_class()
 
         params = {}
         _EMPTY = inspect.Parameter.empty
-        
-        for param_name, param_type, has_default, default_val in ctor_info:
+
+        for param_name, token, tag, dep, has_default, default_val in plan:
             try:
-                if param_type is not _EMPTY:
-                    resolved = await self._resolve_parameter(
-                        param_type,
-                        container,
-                    )
-                    params[param_name] = resolved
-                elif has_default:
-                    params[param_name] = default_val
+                if token is _EMPTY:
+                    if has_default:
+                        params[param_name] = default_val
+                elif dep is not None:
+                    # Dep with callable → mini resolve
+                    from aquilia.di.request_dag import RequestDAG
+                    dag = RequestDAG(container)
+                    try:
+                        params[param_name] = await dag.resolve(dep, token)
+                    finally:
+                        await dag.teardown()
+                else:
+                    params[param_name] = await self._simple_resolve(token, container, tag=tag)
             except Exception:
                 if has_default:
                     params[param_name] = default_val
                 else:
                     raise
-        
+
         return controller_class(**params)
     
     @staticmethod
     def _analyze_constructor(controller_class: Type):
-        """Analyze constructor once and return a list of (name, type, has_default, default) tuples."""
+        """Analyze constructor once and build its dependency plan."""
         try:
             sig = inspect.signature(controller_class.__init__)
             
@@ -201,6 +242,8 @@ class ControllerFactory:
             for param_name, param in sig.parameters.items():
                 if param_name == 'self':
                     continue
+                if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                    continue
                 
                 param_type = type_hints.get(param_name, param.annotation)
                 
@@ -209,81 +252,48 @@ class ControllerFactory:
                     if isinstance(param.default, type):
                         param_type = param.default
                 
+                token, tag, dep = ControllerFactory._plan_parameter(param_type)
                 has_default = param.default is not _EMPTY
                 default_val = param.default if has_default else None
-                result.append((param_name, param_type, has_default, default_val))
+                result.append((param_name, token, tag, dep, has_default, default_val))
             
             return result
         except Exception:
             return None
-    
-    async def _resolve_parameter(
-        self,
-        param_type: Type,
-        container: Any,
-    ) -> Any:
+
+    @staticmethod
+    def _plan_parameter(param_type: Any):
         """
-        Resolve a single parameter from DI container.
-        
-        Handles Annotated[T, Inject(...)] and Annotated[T, Dep(...)] syntax.
+        Unpack ``Annotated[T, Inject(...)]`` / ``Annotated[T, Dep(...)]``
+        into ``(token, tag, dep)``; ``dep`` is only set for Dep descriptors
+        with a callable (container lookups resolve like Inject).
         """
-        try:
-            origin = get_origin(param_type)
-            if origin is not None:
-                try:
-                    from typing import Annotated
-                    if origin is Annotated:
-                        args = get_args(param_type)
-                        if args:
-                            actual_type = args[0]
-                            for arg in args[1:]:
-                                # Check for Dep descriptor
-                                try:
-                                    from aquilia.di.dep import Dep as DepCls
-                                    if isinstance(arg, DepCls):
-                                        if arg.is_container_lookup:
-                                            return await self._simple_resolve(
-                                                actual_type, container, tag=arg.tag
-                                            )
-                                        # Dep with callable → mini resolve
-                                        from aquilia.di.request_dag import RequestDAG
-                                        dag = RequestDAG(container)
-                                        try:
-                                            return await dag.resolve(arg, actual_type)
-                                        finally:
-                                            await dag.teardown()
-                                except ImportError:
-                                    pass
+        from typing import Annotated
 
-                                # Check for Inject marker (explicit isinstance)
-                                try:
-                                    from aquilia.di.decorators import Inject
-                                    if isinstance(arg, Inject):
-                                        tag = arg.tag
-                                        token = arg.token if arg.token else actual_type
-                                        return await self._simple_resolve(
-                                            token, container, tag=tag
-                                        )
-                                except ImportError:
-                                    pass
+        if get_origin(param_type) is not Annotated:
+            return param_type, None, None
+        args = get_args(param_type)
+        actual_type = args[0]
+        for arg in args[1:]:
+            try:
+                from aquilia.di.dep import Dep as DepCls
+                if isinstance(arg, DepCls):
+                    return actual_type, arg.tag, None if arg.is_container_lookup else arg
+            except ImportError:
+                pass
 
-                                # Fallback: duck-typing for backwards compat
-                                if hasattr(arg, '_inject_tag') or hasattr(arg, '_inject_token'):
-                                    tag = getattr(arg, 'tag', None)
-                                    token = getattr(arg, 'token', None)
-                                    resolve_key = token if token else actual_type
-                                    return await self._simple_resolve(
-                                        resolve_key, container, tag=tag
-                                    )
-                except ImportError:
-                    pass
-            
-            # Simple type resolution
-            return await self._simple_resolve(param_type, container)
-        
-        except Exception:
-            # If anything fails, try simple resolution
-            return await self._simple_resolve(param_type, container)
+            try:
+                from aquilia.di.decorators import Inject
+                if isinstance(arg, Inject):
+                    return arg.token if arg.token else actual_type, arg.tag, None
+            except ImportError:
+                pass
+
+            # Fallback: duck-typing for backwards compat
+            if hasattr(arg, '_inject_tag') or hasattr(arg, '_inject_token'):
+                token = getattr(arg, 'token', None)
+                return token if token else actual_type, getattr(arg, 'tag', None), None
+        return param_type, None, None
     
     async def _simple_resolve(self, param_type: Type, container: Any, tag: str = None) -> Any:
         """Simple resolution from container."""
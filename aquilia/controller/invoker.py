@@ -0,0 +1,582 @@
+"""
+Route Invokers - Per-route execution plans compiled once at startup.
+
+Everything ``ControllerEngine`` used to rediscover on every request
+(instantiation mode, constructor dependencies, handler signature,
+parameter sources, serializer / blueprint / filter / renderer metadata)
+is resolved when the route is compiled and frozen into a ``RouteInvoker``.
+The hot path is a single ``await invoker(request, path_params, container)``
+that walks prebuilt tuples without any ``inspect`` or ``getattr`` probing.
+
+Singleton controllers are instantiated once through the factory (with
+``on_startup`` run exactly once) and the instance is held by the invoker.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import inspect
+
+from .base import Controller, RequestCtx
+from .compiler import CompiledRoute
+from ..request import Request
+from ..response import Response
+
+
+_EMPTY = inspect.Parameter.empty
+_NO_DEFAULT = object()
+
+# Parameter binder step kinds
+_PATH = 0
+_QUERY = 1
+_BODY = 2
+_DEP = 3
+_DI = 4
+_SERIALIZER = 5
+_BLUEPRINT = 6
+
+
+def _meta(route_metadata: Any, key: str) -> Any:
+    """Read a decorator option (direct attribute or ``_raw_metadata``)."""
+    value = getattr(route_metadata, key, None)
+    if value is None:
+        raw = getattr(route_metadata, "_raw_metadata", None)
+        if raw and isinstance(raw, dict):
+            value = raw.get(key)
+    return value
+
+
+def _overrides(controller_class: type, hook: str) -> bool:
+    """True if ``hook`` is overridden from the ``Controller`` no-op."""
+    return any(
+        hook in klass.__dict__
+        for klass in controller_class.__mro__
+        if klass is not Controller and klass is not object
+    )
+
+
+def _is_coroutine(func: Any) -> bool:
+    return inspect.iscoroutinefunction(func)
+
+
+async def _call(func: Any, is_coro: bool, *args, **kwargs) -> Any:
+    if is_coro:
+        return await func(*args, **kwargs)
+    result = func(*args, **kwargs)
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+def _caster(annotation: Any):
+    if annotation is int or annotation == "int":
+        return int
+    if annotation is float or annotation == "float":
+        return float
+    if annotation is bool or annotation == "bool":
+        return lambda value: value.lower() in ("true", "1", "yes")
+    return None
+
+
+class HandlerInvoker:
+    """Invoker for a route whose ``handler`` was set directly (docs routes)."""
+
+    __slots__ = ("engine", "handler")
+
+    def __init__(self, engine: Any, route: CompiledRoute):
+        self.engine = engine
+        self.handler = route.handler
+
+    async def __call__(
+        self,
+        request: Request,
+        path_params: Dict[str, Any],
+        container: Any,
+    ) -> Response:
+        ctx = RequestCtx(
+            request=request,
+            identity=request.state.get("identity"),
+            session=request.state.get("session"),
+            container=container,
+        )
+        return self.engine._to_response(await self.handler(request, ctx))
+
+
+class RouteInvoker:
+    """
+    Precompiled execution plan for one controller route.
+
+    Holds:
+    - instantiation strategy (cached singleton, or per-request with a
+      constructor dependency plan)
+    - class + method pipeline nodes with their argument names
+    - parameter binder steps (path / query / body / Dep / DI / serializer /
+      blueprint)
+    - response pipeline (filters + pagination, response serializer,
+      response blueprint, content negotiation)
+    """
+
+    __slots__ = (
+        "engine", "route", "controller_class", "handler_name",
+        "singleton", "_instance", "_handler", "ctor_plan",
+        "handler_is_coro", "ctx_key",
+        "on_request", "on_request_is_coro", "on_response", "on_response_is_coro",
+        "pipeline", "steps", "path_only",
+        "filters", "response_serializer", "response_blueprint", "negotiator",
+        "_plain_response",
+    )
+
+    def __init__(self, engine: Any, route: CompiledRoute):
+        self.engine = engine
+        self.route = route
+        cls = self.controller_class = route.controller_class
+        route_metadata = route.route_metadata
+        self.handler_name = route_metadata.handler_name
+
+        # ── Instantiation strategy ──
+        self.singleton = getattr(cls, "instantiation_mode", "per_request") == "singleton"
+        self._instance = None
+        self._handler = None
+        self.ctor_plan = None if self.singleton else engine.factory.constructor_plan(cls)
+
+        # ── Handler ──
+        func = getattr(cls, self.handler_name)
+        self.handler_is_coro = _is_coroutine(func)
+        try:
+            names = inspect.signature(func).parameters
+        except (TypeError, ValueError):
+            names = {}
+        self.ctx_key = "ctx" if "ctx" in names else "context" if "context" in names else None
+
+        # ── Lifecycle hooks ──
+        self.on_request = _overrides(cls, "on_request")
+        self.on_request_is_coro = _is_coroutine(getattr(cls, "on_request", None))
+        self.on_response = _overrides(cls, "on_response")
+        self.on_response_is_coro = _is_coroutine(getattr(cls, "on_response", None))
+
+        # ── Pipeline ──
+        nodes: List[Any] = []
+        if route.controller_metadata is not None and route.controller_metadata.pipeline:
+            nodes.extend(route.controller_metadata.pipeline)
+        nodes.extend(route_metadata.pipeline or ())
+        self.pipeline = tuple(self._plan_node(node) for node in nodes if callable(node))
+
+        # ── Parameter binder ──
+        self.steps = self._plan_parameters(route_metadata)
+        self.path_only = all(step[0] == _PATH for step in self.steps)
+
+        # ── Response pipeline ──
+        filters = (
+            _meta(route_metadata, "filterset_class"),
+            _meta(route_metadata, "filterset_fields"),
+            _meta(route_metadata, "search_fields"),
+            _meta(route_metadata, "ordering_fields"),
+            _meta(route_metadata, "pagination_class"),
+        )
+        self.filters = filters if any(filters) else None
+        serializer = _meta(route_metadata, "response_serializer")
+        self.response_serializer = (
+            serializer if serializer is not None and engine._is_serializer_class(serializer) else None
+        )
+        self.response_blueprint = _meta(route_metadata, "response_blueprint")
+        self.negotiator = self._plan_negotiator(_meta(route_metadata, "renderer_classes"))
+        self._plain_response = (
+            self.filters is None
+            and self.response_serializer is None
+            and self.response_blueprint is None
+            and self.negotiator is None
+        )
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _plan_node(node: Any) -> Tuple[Any, bool, Optional[str], Optional[str], bool]:
+        try:
+            names = set(inspect.signature(node).parameters)
+        except (TypeError, ValueError):
+            names = set()
+        request_key = "request" if "request" in names else "req" if "req" in names else None
+        ctx_key = "ctx" if "ctx" in names else "context" if "context" in names else None
+        return node, _is_coroutine(node), request_key, ctx_key, "controller" in names
+
+    def _plan_parameters(self, route_metadata: Any) -> Tuple[tuple, ...]:
+        engine = self.engine
+        request_serializer = _meta(route_metadata, "request_serializer")
+        if request_serializer is not None and not engine._is_serializer_class(request_serializer):
+            request_serializer = None
+        request_blueprint = _meta(route_metadata, "request_blueprint")
+        if request_blueprint is not None and not engine._is_blueprint_class(request_blueprint):
+            request_blueprint = None
+
+        steps = []
+        body_consumed = False
+        for param in route_metadata.parameters:
+            name = param.name
+            if name in ("ctx", "context"):
+                continue
+
+            # The first Serializer / Blueprint parameter (by type, or a body
+            # parameter when the decorator declares one) consumes the body.
+            if not body_consumed:
+                body_cls = None
+                if engine._is_serializer_class(param.type):
+                    body_cls, kind = param.type, _SERIALIZER
+                elif engine._is_blueprint_class(param.type):
+                    body_cls, kind = param.type, _BLUEPRINT
+                elif request_blueprint is not None and param.source == "body":
+                    body_cls, kind = request_blueprint, _BLUEPRINT
+                elif request_serializer is not None and param.source == "body":
+                    body_cls, kind = request_serializer, _SERIALIZER
+                if body_cls is not None:
+                    body_consumed = True
+                    steps.append(self._plan_body_class(kind, name, body_cls))
+                    continue
+
+            step = self._plan_source(param)
+            if step is not None:
+                steps.append(step)
+        return tuple(steps)
+
+    @staticmethod
+    def _plan_body_class(kind: int, name: str, body_cls: Any) -> tuple:
+        if kind == _SERIALIZER:
+            inject_instance = (
+                name == "serializer" or name.endswith("_serializer") or name.endswith("_ser")
+            )
+            return (_SERIALIZER, name, body_cls, inject_instance)
+
+        # Handle ProjectedRef (Blueprint["projection"])
+        projection = None
+        try:
+            from aquilia.blueprints.lenses import _ProjectedRef
+            if isinstance(body_cls, _ProjectedRef):
+                projection = body_cls.projection
+                body_cls = body_cls.blueprint_cls
+        except ImportError:
+            pass
+        inject_instance = name == "blueprint" or name.endswith("_blueprint") or name.endswith("_bp")
+        return (_BLUEPRINT, name, body_cls, projection, inject_instance)
+
+    @staticmethod
+    def _plan_source(param: Any) -> Optional[tuple]:
+        name = param.name
+        default = (
+            param.default
+            if not param.required and param.default is not _EMPTY
+            else _NO_DEFAULT
+        )
+        source = param.source
+        if source == "path":
+            return (_PATH, name, default)
+        if source == "query":
+            return (_QUERY, name, default, _caster(param.type))
+        if source == "body":
+            return (_BODY, name, default)
+
+        token = param.type if param.type is not _EMPTY else name
+        if source == "dep":
+            from typing import Annotated, get_args, get_origin
+            from aquilia.di.dep import _extract_dep_from_annotation
+
+            dep_meta = _extract_dep_from_annotation(param.type)
+            base_type = param.type
+            if get_origin(param.type) is Annotated:
+                base_type = get_args(param.type)[0]
+            return (_DEP, name, default, dep_meta, base_type, token, param.required)
+        if source == "di":
+            type_name = getattr(param.type, "__name__", None)
+            is_session = name == "session" or type_name == "Session"
+            is_identity = name == "identity" or type_name == "Identity"
+            optional = not param.required or is_session or is_identity
+            return (_DI, name, default, token, optional, is_session, is_identity, param.required)
+        return None
+
+    def _plan_negotiator(self, renderer_classes: Any) -> Optional[Any]:
+        if not renderer_classes:
+            return None
+        try:
+            from .renderers import ContentNegotiator, BaseRenderer
+        except ImportError:
+            return None
+        instances = []
+        for rc in renderer_classes:
+            if isinstance(rc, type) and issubclass(rc, BaseRenderer):
+                instances.append(rc())
+            elif isinstance(rc, BaseRenderer):
+                instances.append(rc)
+        return ContentNegotiator(renderers=instances) if instances else None
+
+    # ------------------------------------------------------------------
+    # Hot path
+    # ------------------------------------------------------------------
+
+    async def __call__(
+        self,
+        request: Request,
+        path_params: Dict[str, Any],
+        container: Any,
+    ) -> Response:
+        engine = self.engine
+        state = request.state
+        ctx = RequestCtx(
+            request=request,
+            identity=state.get("identity"),
+            session=state.get("session"),
+            container=container,
+            state=state,
+        )
+
+        # Instantiate controller
+        if self.singleton:
+            controller = self._instance
+            if controller is None:
+                controller = await self._resolve_singleton(container)
+            handler = self._handler
+        else:
+            controller = await engine.factory.instantiate(
+                self.controller_class, container or engine.factory.app_container, self.ctor_plan,
+            )
+            handler = getattr(controller, self.handler_name)
+
+        if self.on_request:
+            await _call(controller.on_request, self.on_request_is_coro, ctx)
+
+        # Class-level + method-level pipeline
+        for node, is_coro, request_key, ctx_key, wants_controller in self.pipeline:
+            kwargs = {}
+            if request_key:
+                kwargs[request_key] = request
+            if ctx_key:
+                kwargs[ctx_key] = ctx
+            if wants_controller:
+                kwargs["controller"] = controller
+            result = await _call(node, is_coro, **kwargs)
+            if result is False:
+                return Response.json({"error": "Pipeline guard failed"}, status=403)
+            if isinstance(result, Response):
+                return result
+
+        # Bind parameters
+        request_dag = None
+        if self.path_only:
+            kwargs = dict(path_params)
+        else:
+            kwargs, request_dag = await self._bind(request, ctx, path_params, container)
+        if self.ctx_key:
+            kwargs[self.ctx_key] = ctx
+
+        try:
+            result = await _call(handler, self.handler_is_coro, **kwargs)
+            if self._plain_response:
+                response = engine._to_response(result)
+            else:
+                response = await self._render(result, request, ctx)
+
+            if self.on_response:
+                await _call(controller.on_response, self.on_response_is_coro, ctx, response)
+            return response
+
+        except Exception as e:
+            route = self.route
+            if not engine.fault_engine:
+                engine.logger.error(
+                    f"Error executing {self.controller_class.__name__}.{self.handler_name}: {e}",
+                    exc_info=True,
+                )
+            else:
+                # The fault engine logs the first occurrence with its
+                # traceback and aggregates repeats.
+                try:
+                    rid = state.get("request_id") if isinstance(state, dict) else None
+                    await engine.fault_engine.process(
+                        e, app=route.app_name, route=route.full_path, request_id=rid,
+                    )
+                except Exception:
+                    pass
+            raise
+        finally:
+            # Teardown generator deps from RequestDAG
+            if request_dag is not None:
+                await request_dag.teardown()
+
+    async def _resolve_singleton(self, container: Any) -> Any:
+        engine = self.engine
+        if engine.enable_lifecycle:
+            instance = await engine._init_controller_lifecycle(self.controller_class, container)
+        else:
+            from .factory import InstantiationMode
+            instance = await engine.factory.create(
+                self.controller_class, mode=InstantiationMode.SINGLETON,
+            )
+        self._handler = getattr(instance, self.handler_name)
+        self._instance = instance
+        return instance
+
+    async def _render(self, result: Any, request: Request, ctx: RequestCtx) -> Response:
+        engine = self.engine
+        if self.filters is not None:
+            result = await engine._apply_filters_and_pagination(result, request, *self.filters)
+        if self.response_serializer is not None:
+            result = engine._apply_response_serializer(result, self.response_serializer, ctx)
+        if self.response_blueprint is not None:
+            result = engine._apply_response_blueprint(result, self.response_blueprint)
+        if self.negotiator is not None:
+            response = engine._apply_content_negotiation(result, self.negotiator, request)
+            if response is not None:
+                return response
+        return engine._to_response(result)
+
+    async def _bind(
+        self,
+        request: Request,
+        ctx: RequestCtx,
+        path_params: Dict[str, Any],
+        container: Any,
+    ) -> Tuple[Dict[str, Any], Any]:
+        """
+        Run the binder steps.
+
+        Returns:
+            Tuple of (kwargs dict, RequestDAG or None).
+            The DAG must be torndown after handler execution.
+        """
+        kwargs: Dict[str, Any] = {}
+        request_dag = None
+
+        for step in self.steps:
+            kind = step[0]
+            name = step[1]
+
+            if kind == _PATH:
+                if name in path_params:
+                    kwargs[name] = path_params[name]
+                elif step[2] is not _NO_DEFAULT:
+                    kwargs[name] = step[2]
+
+            elif kind == _QUERY:
+                value = request.query_param(name)
+                if value is not None:
+                    cast = step[3]
+                    kwargs[name] = cast(value) if cast is not None else value
+                elif step[2] is not _NO_DEFAULT:
+                    kwargs[name] = step[2]
+
+            elif kind == _BODY:
+                if request.method in ("POST", "PUT", "PATCH"):
+                    try:
+                        body = await request.json()
+                        if name in body:
+                            kwargs[name] = body[name]
+                        elif step[2] is not _NO_DEFAULT:
+                            kwargs[name] = step[2]
+                    except Exception:
+                        if step[2] is not _NO_DEFAULT:
+                            kwargs[name] = step[2]
+
+            elif kind == _SERIALIZER:
+                serializer = step[2](
+                    data=await self._body(request),
+                    context=self._body_context(request, ctx, container),
+                )
+                serializer.is_valid(raise_fault=True)
+                kwargs[name] = serializer if step[3] else serializer.validated_data
+
+            elif kind == _BLUEPRINT:
+                bp_instance = step[2](
+                    data=await self._body(request),
+                    partial=request.method == "PATCH",
+                    projection=step[3],
+                    context=self._body_context(request, ctx, container),
+                )
+                bp_instance.is_sealed(raise_fault=True)
+                kwargs[name] = bp_instance if step[4] else bp_instance.validated_data
+
+            elif kind == _DEP:
+                _, _, default, dep_meta, base_type, token, required = step
+                try:
+                    if dep_meta is not None:
+                        if request_dag is None:
+                            from aquilia.di.request_dag import RequestDAG
+                            request_dag = RequestDAG(container, request)
+                        kwargs[name] = await request_dag.resolve(dep_meta, base_type)
+                    else:
+                        # Fallback to container resolve if Dep not extractable
+                        value = await container.resolve_async(token, optional=not required)
+                        if value is not None:
+                            kwargs[name] = value
+                        elif default is not _NO_DEFAULT:
+                            kwargs[name] = default
+                except Exception:
+                    if default is _NO_DEFAULT:
+                        raise
+                    kwargs[name] = default
+
+            elif kind == _DI:
+                await self._bind_di(step, kwargs, request, ctx, container)
+
+        return kwargs, request_dag
+
+    async def _bind_di(
+        self,
+        step: tuple,
+        kwargs: Dict[str, Any],
+        request: Request,
+        ctx: RequestCtx,
+        container: Any,
+    ) -> None:
+        _, name, default, token, optional, is_session, is_identity, required = step
+        try:
+            # For Session and Identity, we use optional=True so we can raise our own Faults
+            value = await container.resolve_async(token, optional=optional)
+
+            if is_session and value is None:
+                # Try to resolve session proactively
+                try:
+                    from aquilia.sessions import SessionEngine
+                    engine = await container.resolve_async(SessionEngine)
+                    value = await engine.resolve(request)
+                    # Update context and request for downstream handlers/decorators
+                    ctx.session = value
+                    request.state["session"] = value
+                except Exception:
+                    pass
+
+            if value is None and required:
+                if is_session:
+                    from aquilia.sessions.decorators import SessionRequiredFault
+                    raise SessionRequiredFault()
+                elif is_identity:
+                    from aquilia.sessions.decorators import AuthenticationRequiredFault
+                    raise AuthenticationRequiredFault()
+
+            if value is not None:
+                kwargs[name] = value
+            elif default is not _NO_DEFAULT:
+                kwargs[name] = default
+        except Exception as e:
+            # Reraise session/auth faults
+            from aquilia.sessions.decorators import SessionRequiredFault, AuthenticationRequiredFault
+            if isinstance(e, (SessionRequiredFault, AuthenticationRequiredFault)):
+                raise
+            if default is _NO_DEFAULT:
+                raise
+            kwargs[name] = default
+
+    @staticmethod
+    async def _body(request: Request) -> Any:
+        try:
+            return await request.json()
+        except Exception:
+            try:
+                return await request.form()
+            except Exception:
+                return {}
+
+    @staticmethod
+    def _body_context(request: Request, ctx: RequestCtx, container: Any) -> Dict[str, Any]:
+        context: Dict[str, Any] = {"request": request}
+        if container:
+            context["container"] = container
+        if ctx.identity:
+            context["identity"] = ctx.identity
+        return context
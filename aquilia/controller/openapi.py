@@ -14,11 +14,16 @@ Comprehensive spec generation with:
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import inspect
+import json
 import re
+from pathlib import Path
 from dataclasses import dataclass, field
 from typing import (
     Any,
+    Collection,
     Dict,
     List,
     Optional,
@@ -634,6 +639,14 @@ class OpenAPIConfig:
     swagger_ui_theme: str = ""  # "dark", "monokai", etc.
     swagger_ui_config: Dict[str, Any] = field(default_factory=dict)
 
+    # Serving
+    # Path to a spec emitted by ``aq deploy openapi``; when the file exists
+    # the server serves it verbatim and never runs the generator.
+    prebuilt_path: str = ""
+    # Generate the spec eagerly once controllers are loaded (otherwise on
+    # the first request).
+    precompute: bool = True
+
     # Enabled flag
     enabled: bool = True
 
@@ -976,6 +989,196 @@ class OpenAPIGenerator:
                 existing_names.add(param_meta.name)
 
 
+# ─── Precomputed Document ────────────────────────────────────────────────────
+
+class OpenAPIDocument:
+    """
+    An OpenAPI spec frozen into its wire representations.
+
+    Holds the compact JSON body, a strong ETag derived from it, and
+    pre-compressed gzip / brotli variants (brotli only when the optional
+    ``brotli`` package is installed), so serving the spec is a dict lookup
+    rather than a generate → encode → compress cycle per request.
+
+    Usage::
+
+        doc = OpenAPIDocument.from_spec(generator.generate(router))
+        doc.write("build/openapi.json")   # + .gz / .br / .etag siblings
+        doc = OpenAPIDocument.load("build/openapi.json")
+    """
+
+    __slots__ = ("body", "etag", "variants")
+
+    def __init__(self, body: bytes, variants: Optional[Dict[str, bytes]] = None):
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        self.variants: Dict[str, bytes] = variants if variants is not None else {}
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> "OpenAPIDocument":
+        body = json.dumps(
+            spec, separators=(",", ":"), ensure_ascii=False, default=str,
+        ).encode("utf-8")
+        return cls(body, cls._compress(body))
+
+    @staticmethod
+    def _compress(body: bytes, skip: Collection[str] = ()) -> Dict[str, bytes]:
+        variants = {}
+        if "gzip" not in skip:
+            # mtime=0 keeps the gzip bytes reproducible across builds
+            variants["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+        if "br" not in skip:
+            try:
+                import brotli
+                variants["br"] = brotli.compress(body)
+            except ImportError:
+                pass
+        return variants
+
+    @property
+    def spec(self) -> Dict[str, Any]:
+        return json.loads(self.body)
+
+    def write(self, path: Union[str, Path]) -> List[Path]:
+        """
+        Write ``path`` plus ``path.gz`` / ``path.br`` and the ``path.etag``
+        the variants were built for; return the written paths.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.body)
+        written = [path]
+        for encoding, data in self.variants.items():
+            suffix = ".br" if encoding == "br" else ".gz"
+            variant_path = path.with_name(path.name + suffix)
+            variant_path.write_bytes(data)
+            written.append(variant_path)
+        etag_path = path.with_name(path.name + ".etag")
+        etag_path.write_text(self.etag)
+        written.append(etag_path)
+        return written
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "OpenAPIDocument":
+        """
+        Load a document written by ``write()``.
+
+        The stored variants are reused when ``path.etag`` matches the body;
+        otherwise (edited body, missing ETag) they are rebuilt, as is any
+        single missing variant.
+        """
+        path = Path(path)
+        doc = cls(path.read_bytes())
+        etag_path = path.with_name(path.name + ".etag")
+        if etag_path.is_file() and etag_path.read_text().strip() == doc.etag:
+            for encoding, suffix in (("gzip", ".gz"), ("br", ".br")):
+                variant_path = path.with_name(path.name + suffix)
+                if variant_path.is_file():
+                    doc.variants[encoding] = variant_path.read_bytes()
+        doc.variants.update(cls._compress(doc.body, skip=doc.variants))
+        return doc
+
+    def _etag_matches(self, if_none_match: str) -> bool:
+        if if_none_match.strip() == "*":
+            return True
+        bare = self.etag.strip('"')
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            tag = tag.strip('"')
+            # Variant ETags ("<hash>-gzip") describe the same document
+            if tag == bare or tag.split("-", 1)[0] == bare:
+                return True
+        return False
+
+    def _select_encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted: Set[str] = set()
+        for token in accept_encoding.split(","):
+            name, _, params = token.partition(";")
+            params = params.strip().lower()
+            q = 1.0
+            if params.startswith("q="):
+                try:
+                    q = float(params[2:])
+                except ValueError:
+                    pass
+            if q > 0:
+                accepted.add(name.strip().lower())
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and (encoding in accepted or "*" in accepted):
+                return encoding
+        return None
+
+    def to_response(self, request: Any) -> Any:
+        """Build a 200 / 304 ``Response`` negotiated for ``request``."""
+        from ..response import Response
+
+        headers = {
+            "etag": self.etag,
+            "cache-control": "no-cache",
+            "vary": "Accept-Encoding",
+        }
+        if_none_match = request.header("if-none-match")
+        if if_none_match and self._etag_matches(if_none_match):
+            return Response(b"", status=304, headers=headers)
+
+        body = self.body
+        encoding = self._select_encoding(request.header("accept-encoding") or "")
+        if encoding is not None:
+            body = self.variants[encoding]
+            headers["content-encoding"] = encoding
+            headers["etag"] = self.etag[:-1] + "-" + encoding + '"'
+        return Response(
+            body,
+            status=200,
+            headers=headers,
+            media_type="application/json; charset=utf-8",
+        )
+
+
+class OpenAPIDocumentCache:
+    """
+    Generate-once holder for the served OpenAPI document.
+
+    The document is rebuilt only when ``router.version`` changes (a
+    controller was added or the route indexes were rebuilt). A document
+    loaded from ``OpenAPIConfig.prebuilt_path`` is served as-is and the
+    generator is never invoked.
+    """
+
+    def __init__(
+        self,
+        generator: OpenAPIGenerator,
+        router: ControllerRouter,
+        prebuilt: Optional[OpenAPIDocument] = None,
+    ):
+        self.generator = generator
+        self.router = router
+        self._prebuilt = prebuilt
+        self._document: Optional[OpenAPIDocument] = None
+        self._version: Optional[int] = None
+
+    @property
+    def is_prebuilt(self) -> bool:
+        return self._prebuilt is not None
+
+    def get(self) -> OpenAPIDocument:
+        if self._prebuilt is not None:
+            return self._prebuilt
+        version = self.router.version
+        if self._document is None or self._version != version:
+            self._document = OpenAPIDocument.from_spec(
+                self.generator.generate(self.router)
+            )
+            self._version = version
+        return self._document
+
+    def invalidate(self) -> None:
+        self._document = None
+        self._version = None
+
+
 # ─── Swagger UI HTML ─────────────────────────────────────────────────────────
 
 _SWAGGER_UI_VERSION = "5.18.2"
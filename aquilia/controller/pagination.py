@@ -9,6 +9,17 @@ Provides three pagination strategies out of the box:
 
 Each paginator works with both ORM QuerySets and plain lists.
 
+Large tables:
+
+- ``CursorPagination`` accepts multi-column orderings and always appends
+  the primary key as a tie-breaker, so repeated ordering values never
+  skip or duplicate rows across pages.
+- ``PageNumberPagination.count_mode`` can be ``"estimated"`` (planner
+  statistics) or ``"cached"`` (exact count memoised with a TTL) instead
+  of running ``COUNT(*)`` on every page.
+- ``PageNumberPagination.seek_threshold`` turns deep ``OFFSET`` scans
+  into keyset seeks when the client follows ``next``/``previous`` links.
+
 Usage (declarative on route)::
 
     from aquilia import Controller, GET
@@ -31,10 +42,13 @@ Usage (explicit in handler)::
 from __future__ import annotations
 
 import base64
+import functools
 import json
 import math
+import re
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 from urllib.parse import urlencode, urlparse, parse_qs, urlunparse
 
 
@@ -44,6 +58,8 @@ __all__ = [
     "LimitOffsetPagination",
     "CursorPagination",
     "NoPagination",
+    "estimate_count",
+    "clear_count_cache",
 ]
 
 
@@ -90,6 +106,284 @@ def _get_current_params(request: Any) -> Dict[str, str]:
     return {}
 
 
+def _encode_token(data: Dict[str, Any]) -> str:
+    """Encode a JSON-serialisable dict as an opaque URL-safe token."""
+    raw = json.dumps(data, default=str, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("utf-8").rstrip("=")
+
+
+def _decode_token(raw: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode a token produced by ``_encode_token`` (``None`` if invalid)."""
+    if not raw:
+        return None
+    try:
+        decoded = base64.urlsafe_b64decode(raw + "==").decode("utf-8")
+        data = json.loads(decoded)
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Keyset helpers
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Matches the clauses emitted by ``Q.order("field")`` / ``Q.order("-field")``.
+_ORDER_CLAUSE_RE = re.compile(r'^"([^"]+)" (ASC|DESC)$')
+
+
+def _parse_ordering(ordering: Union[str, Sequence[str]]) -> List[Tuple[str, bool]]:
+    """Normalise ``"-a"`` / ``("-a", "b")`` into ``[(field, descending), ...]``."""
+    if isinstance(ordering, str):
+        ordering = [o.strip() for o in ordering.split(",") if o.strip()]
+    return [(o.lstrip("-"), o.startswith("-")) for o in ordering]
+
+
+def _with_tiebreaker(
+    keys: List[Tuple[str, bool]],
+    unique_field: Optional[str],
+) -> List[Tuple[str, bool]]:
+    """Append the unique field (same direction as the last key) if missing."""
+    if not unique_field or any(name == unique_field for name, _ in keys):
+        return keys
+    desc = keys[-1][1] if keys else False
+    return keys + [(unique_field, desc)]
+
+
+def _keyset_clause(
+    keys: List[Tuple[str, bool]],
+    values: Sequence[Any],
+    forward: bool,
+) -> Tuple[str, List[Any]]:
+    """
+    Build the WHERE clause selecting rows strictly after (``forward``) or
+    before the keyset position ``values`` in ``keys`` ordering.
+
+    Uniform directions use a row-value comparison —
+    ``("a", "b") > (?, ?)`` — which PostgreSQL, MySQL and SQLite ≥ 3.15
+    can satisfy with a single index range scan. Mixed directions expand
+    to the equivalent ``a > ? OR (a = ? AND b < ?)`` chain.
+    """
+    ops = ["<" if desc == forward else ">" for _, desc in keys]
+    if len(keys) == 1:
+        return f'"{keys[0][0]}" {ops[0]} ?', [values[0]]
+
+    if len(set(ops)) == 1:
+        cols = ", ".join(f'"{name}"' for name, _ in keys)
+        marks = ", ".join("?" for _ in keys)
+        return f"({cols}) {ops[0]} ({marks})", list(values)
+
+    branches: List[str] = []
+    params: List[Any] = []
+    for i, (name, _) in enumerate(keys):
+        parts = [f'"{keys[j][0]}" = ?' for j in range(i)]
+        parts.append(f'"{name}" {ops[i]} ?')
+        params.extend(values[: i + 1])
+        branches.append("(" + " AND ".join(parts) + ")")
+    return " OR ".join(branches), params
+
+
+def _keyset_values(item: Any, keys: List[Tuple[str, bool]]) -> List[Any]:
+    # ORM keys are SQL column names; read them through the model attribute.
+    col_to_attr = getattr(type(item), "_col_to_attr", None) or {}
+    return [
+        _get_nested_value(item, col_to_attr[name][0] if name in col_to_attr else name)
+        for name, _ in keys
+    ]
+
+
+def _compare_keysets(
+    a: Sequence[Any],
+    b: Sequence[Any],
+    keys: List[Tuple[str, bool]],
+) -> int:
+    """Compare two keyset tuples in *ordering* terms (negative → ``a`` first)."""
+    for (_, desc), av, bv in zip(keys, a, b):
+        c = _compare_values(av, bv)
+        if c:
+            return -c if desc else c
+    return 0
+
+
+def _sort_by_keys(data: List[Any], keys: List[Tuple[str, bool]]) -> List[Any]:
+    """Stable multi-key sort honouring per-key direction."""
+    result = list(data)
+    for name, desc in reversed(keys):
+        result.sort(
+            key=functools.cmp_to_key(
+                lambda x, y, _n=name: _compare_values(
+                    _get_nested_value(x, _n), _get_nested_value(y, _n)
+                )
+            ),
+            reverse=desc,
+        )
+    return result
+
+
+def _queryset_keys(queryset: Any) -> Optional[List[Tuple[str, bool]]]:
+    """
+    Recover ``[(field, descending), ...]`` from a queryset's ORDER BY.
+
+    Falls back to ``Meta.ordering``. Returns ``None`` when any clause is
+    not a plain column ordering (expressions, RANDOM(), NULLS LAST ...),
+    in which case keyset seeking is not possible.
+    """
+    clauses = getattr(queryset, "_order_clauses", None)
+    if clauses:
+        keys = []
+        for clause in clauses:
+            m = _ORDER_CLAUSE_RE.match(clause)
+            if m is None:
+                return None
+            keys.append((m.group(1), m.group(2) == "DESC"))
+        return keys
+    model = getattr(queryset, "_model_cls", None)
+    meta_ordering = getattr(getattr(model, "_meta", None), "ordering", None) or []
+    return _parse_ordering(meta_ordering)
+
+
+def _queryset_pk(queryset: Any, default: str = "id") -> str:
+    model = getattr(queryset, "_model_cls", None)
+    return getattr(model, "_pk_name", None) or default
+
+
+def _serialize_items(items: List[Any]) -> List[Any]:
+    return [item.to_dict() if hasattr(item, "to_dict") else item for item in items]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Count estimation
+# ═══════════════════════════════════════════════════════════════════════════
+
+class _CountCache:
+    """
+    Process-local TTL cache of exact ``COUNT(*)`` results.
+
+    Keyed on the compiled count SQL + params, bounded to ``max_entries``
+    (oldest entry evicted first). Paginators are instantiated per request,
+    so the cache lives at module level.
+    """
+
+    __slots__ = ("_entries", "max_entries")
+
+    def __init__(self, max_entries: int = 1024):
+        self._entries: Dict[str, Tuple[float, int]] = {}
+        self.max_entries = max_entries
+
+    def get(self, key: str) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: int, ttl: float) -> None:
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_count_cache = _CountCache()
+
+
+def clear_count_cache() -> None:
+    """Drop every cached count used by ``count_mode="cached"``."""
+    _count_cache.clear()
+
+
+def _count_cache_key(queryset: Any) -> Optional[str]:
+    build = getattr(queryset, "_build_select", None)
+    if build is None:
+        return None
+    try:
+        sql, params = build(count=True)
+        return sql + "\x00" + json.dumps(list(params), default=str)
+    except Exception:
+        return None
+
+
+def _is_unfiltered(queryset: Any) -> bool:
+    return not (
+        getattr(queryset, "_wheres", None)
+        or getattr(queryset, "_group_by", None)
+        or getattr(queryset, "_distinct", False)
+        or getattr(queryset, "_set_operations", None)
+        or getattr(queryset, "_is_none", False)
+    )
+
+
+async def estimate_count(queryset: Any) -> Optional[int]:
+    """
+    Estimate the row count of a queryset from planner statistics.
+
+    - Unfiltered querysets read table statistics: ``pg_class.reltuples``
+      (PostgreSQL), ``sqlite_stat1`` (SQLite, populated by ``ANALYZE``) or
+      ``information_schema.TABLES.TABLE_ROWS`` (MySQL).
+    - Filtered querysets on PostgreSQL use the root ``Plan Rows`` of
+      ``EXPLAIN (FORMAT JSON)``.
+
+    Returns ``None`` when no estimate is available (statistics missing,
+    unsupported backend, or an error) — callers should fall back to an
+    exact count.
+    """
+    db = getattr(queryset, "_db", None)
+    table = getattr(queryset, "_table", None)
+    if db is None or table is None:
+        return None
+    try:
+        dialect = queryset._get_dialect()
+    except Exception:
+        return None
+
+    try:
+        if _is_unfiltered(queryset):
+            if dialect == "postgresql":
+                val = await db.fetch_val(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = ?",
+                    [table],
+                )
+            elif dialect == "sqlite":
+                stat = await db.fetch_val(
+                    "SELECT stat FROM sqlite_stat1 WHERE tbl = ? LIMIT 1",
+                    [table],
+                )
+                val = int(str(stat).split()[0]) if stat else None
+            elif dialect == "mysql":
+                val = await db.fetch_val(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = ?",
+                    [table],
+                )
+            else:
+                return None
+        elif dialect == "postgresql":
+            sql, params = queryset._build_select(count=True)
+            plan = await db.fetch_val(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            # COUNT(*) plans are Aggregate → child scan; the scan carries the estimate.
+            node = plan[0]["Plan"]
+            while node.get("Node Type") == "Aggregate" and node.get("Plans"):
+                node = node["Plans"][0]
+            val = node.get("Plan Rows")
+        else:
+            return None
+    except Exception:
+        return None
+
+    if val is None:
+        return None
+    val = int(val)
+    # reltuples is -1 for never-analysed tables on PostgreSQL ≥ 14
+    return val if val >= 0 else None
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 #  Base class
 # ═══════════════════════════════════════════════════════════════════════════
@@ -172,6 +466,31 @@ class PageNumberPagination(BasePagination):
         class LargePagePagination(PageNumberPagination):
             page_size = 100
             max_page_size = 500
+
+    Large tables (querysets only)::
+
+        class FeedPagination(PageNumberPagination):
+            count_mode = "estimated"   # planner stats instead of COUNT(*)
+            seek_threshold = 10        # keyset seeks from page 10 onwards
+
+    ``count_mode``:
+
+    - ``"exact"`` (default) — ``COUNT(*)`` on every page.
+    - ``"estimated"`` — see ``estimate_count()``. Estimates below
+      ``estimate_threshold`` are replaced by an exact count, since small
+      tables are cheap to count and stale stats are most visible there.
+    - ``"cached"`` — exact count, memoised per query for ``count_cache_ttl``
+      seconds.
+
+    With any non-exact mode the envelope gains ``"count_exact": bool``.
+
+    ``seek_threshold``: when set, ``next``/``previous`` links for pages at
+    or beyond this number carry a ``seek_param`` token holding the boundary
+    row's ordering key. A request presenting a token for the page it asks
+    for is served with ``WHERE (keys) > (...) LIMIT n`` instead of an
+    ``OFFSET`` scan. Direct jumps (no token) still use ``OFFSET``. The
+    queryset's ordering (or ``Meta.ordering``, or the primary key) plus a
+    primary-key tie-breaker defines the keyset.
     """
 
     page_size: int = 20
@@ -179,15 +498,33 @@ class PageNumberPagination(BasePagination):
     page_param: str = "page"
     page_size_param: str = "page_size"
 
+    count_mode: str = "exact"
+    count_cache_ttl: float = 30.0
+    estimate_threshold: int = 10_000
+
+    seek_threshold: Optional[int] = None
+    seek_param: str = "seek"
+
     def __init__(
         self,
         page_size: Optional[int] = None,
         max_page_size: Optional[int] = None,
+        count_mode: Optional[str] = None,
+        seek_threshold: Optional[int] = None,
     ):
         if page_size is not None:
             self.page_size = page_size
         if max_page_size is not None:
             self.max_page_size = max_page_size
+        if count_mode is not None:
+            self.count_mode = count_mode
+        if seek_threshold is not None:
+            self.seek_threshold = seek_threshold
+        if self.count_mode not in ("exact", "estimated", "cached"):
+            raise ValueError(
+                f"count_mode must be 'exact', 'estimated' or 'cached', "
+                f"got {self.count_mode!r}"
+            )
 
     def _parse_page(self, request: Any) -> tuple:
         """Return (page_number, page_size) from request params."""
@@ -241,6 +578,42 @@ class PageNumberPagination(BasePagination):
             "results": results,
         }
 
+    async def _count(self, queryset: Any) -> Tuple[int, bool]:
+        """Return ``(count, is_exact)`` according to ``count_mode``."""
+        if self.count_mode == "estimated":
+            estimate = await estimate_count(queryset)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate, False
+            return await queryset.count(), True
+
+        if self.count_mode == "cached":
+            key = _count_cache_key(queryset)
+            if key is not None:
+                cached = _count_cache.get(key)
+                if cached is not None:
+                    return cached, True
+            total = await queryset.count()
+            if key is not None:
+                _count_cache.set(key, total, self.count_cache_ttl)
+            return total, True
+
+        return await queryset.count(), True
+
+    def _seek_keys(self, queryset: Any) -> Optional[Tuple[Any, List[Tuple[str, bool]]]]:
+        """Return ``(ordered_queryset, keys)`` for seek mode, or ``None``."""
+        keys = _queryset_keys(queryset)
+        if keys is None:
+            return None
+        pk = _queryset_pk(queryset)
+        full = _with_tiebreaker(keys, pk)
+        ordered = queryset
+        if not getattr(queryset, "_order_clauses", None):
+            ordered = queryset.order(*(f"-{n}" if d else n for n, d in full))
+        elif len(full) > len(keys):
+            name, desc = full[-1]
+            ordered = queryset.order(f"-{name}" if desc else name)
+        return ordered, full
+
     async def paginate_queryset(
         self,
         queryset: Any,
@@ -248,13 +621,14 @@ class PageNumberPagination(BasePagination):
     ) -> Dict[str, Any]:
         """
         Optimised ORM pagination — uses .count() + .offset().limit()
-        instead of fetching all rows.
+        instead of fetching all rows (or a keyset seek, see class docs).
         """
         page, size = self._parse_page(request)
+        params = _get_current_params(request)
 
         # Count total
         try:
-            total = await queryset.count()
+            total, count_exact = await self._count(queryset)
         except Exception:
             # Fallback to list-based
             return await super().paginate_queryset(queryset, request)
@@ -262,30 +636,66 @@ class PageNumberPagination(BasePagination):
         total_pages = max(1, math.ceil(total / size))
         offset = (page - 1) * size
 
+        seek = self._seek_keys(queryset) if self.seek_threshold is not None else None
+
         try:
-            items = await queryset.offset(offset).limit(size).all()
-            results = [
-                item.to_dict() if hasattr(item, "to_dict") else item
-                for item in items
-            ]
+            items = None
+            if seek is not None:
+                ordered, keys = seek
+                token = _decode_token(params.get(self.seek_param))
+                if (
+                    token is not None
+                    and token.get("p") == page
+                    and isinstance(token.get("v"), list)
+                    and len(token["v"]) == len(keys)
+                ):
+                    forward = token.get("d", "next") == "next"
+                    clause, clause_params = _keyset_clause(keys, token["v"], forward)
+                    qs = ordered.where(clause, *clause_params)
+                    if not forward:
+                        qs = qs.reverse()
+                    items = await qs.limit(size).all()
+                    if not forward:
+                        items.reverse()
+                if items is None:
+                    items = await ordered.offset(offset).limit(size).all()
+            else:
+                items = await queryset.offset(offset).limit(size).all()
+            results = _serialize_items(items)
         except Exception:
             return await super().paginate_queryset(queryset, request)
 
-        base_params = _get_current_params(request)
+        base_params = dict(params)
         base_params.pop(self.page_param, None)
         base_params.pop(self.page_size_param, None)
+        base_params.pop(self.seek_param, None)
+
+        # With an estimated count the last page is a guess; trust a full page.
+        has_next = page < total_pages or (not count_exact and len(items) == size)
 
         next_url = None
-        if page < total_pages:
+        if has_next:
             next_params = {**base_params, self.page_param: page + 1, self.page_size_param: size}
+            if seek is not None and items and page + 1 >= self.seek_threshold:
+                next_params[self.seek_param] = _encode_token({
+                    "p": page + 1,
+                    "v": _keyset_values(items[-1], seek[1]),
+                    "d": "next",
+                })
             next_url = _build_url(request, next_params)
 
         prev_url = None
         if page > 1:
             prev_params = {**base_params, self.page_param: page - 1, self.page_size_param: size}
+            if seek is not None and items and page - 1 >= self.seek_threshold:
+                prev_params[self.seek_param] = _encode_token({
+                    "p": page - 1,
+                    "v": _keyset_values(items[0], seek[1]),
+                    "d": "prev",
+                })
             prev_url = _build_url(request, prev_params)
 
-        return {
+        envelope = {
             "count": total,
             "total_pages": total_pages,
             "page": page,
@@ -294,6 +704,9 @@ class PageNumberPagination(BasePagination):
             "previous": prev_url,
             "results": results,
         }
+        if self.count_mode != "exact":
+            envelope["count_exact"] = count_exact
+        return envelope
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -447,37 +860,39 @@ class CursorPagination(BasePagination):
             "results": [...]
         }
 
-    The ``ordering`` field determines the keyset column.
+    ``ordering`` is one field (``"-created_at"``) or several
+    (``("-score", "name")``). ``unique_field`` (default: the model's primary
+    key, or ``"id"`` for plain lists) is appended as a tie-breaker so the
+    keyset is total — rows sharing an ordering value are never skipped or
+    repeated. On querysets the seek is emitted as a row-value comparison,
+    e.g. ``("score", "id") < (?, ?)``.
     """
 
     page_size: int = 20
     max_page_size: int = 1000
     cursor_param: str = "cursor"
     page_size_param: str = "page_size"
-    ordering: str = "-id"  # Default ordering field
+    ordering: Union[str, Sequence[str]] = "-id"  # Default ordering field(s)
+    unique_field: Optional[str] = None
 
     def __init__(
         self,
         page_size: Optional[int] = None,
-        ordering: Optional[str] = None,
+        ordering: Optional[Union[str, Sequence[str]]] = None,
+        unique_field: Optional[str] = None,
     ):
         if page_size is not None:
             self.page_size = page_size
         if ordering is not None:
             self.ordering = ordering
+        if unique_field is not None:
+            self.unique_field = unique_field
 
     def _decode_cursor(self, raw: Optional[str]) -> Optional[Dict[str, Any]]:
-        if not raw:
-            return None
-        try:
-            decoded = base64.urlsafe_b64decode(raw + "==").decode("utf-8")
-            return json.loads(decoded)
-        except Exception:
-            return None
+        return _decode_token(raw)
 
     def _encode_cursor(self, data: Dict[str, Any]) -> str:
-        raw = json.dumps(data, default=str).encode("utf-8")
-        return base64.urlsafe_b64encode(raw).decode("utf-8").rstrip("=")
+        return _encode_token(data)
 
     def _get_page_size(self, request: Any) -> int:
         params = _get_current_params(request)
@@ -487,6 +902,62 @@ class CursorPagination(BasePagination):
         except (ValueError, TypeError):
             return self.page_size
 
+    def _get_keys(self, default_unique: str) -> List[Tuple[str, bool]]:
+        return _with_tiebreaker(
+            _parse_ordering(self.ordering),
+            self.unique_field or default_unique,
+        )
+
+    @staticmethod
+    def _cursor_position(
+        cursor_data: Dict[str, Any],
+        keys: List[Tuple[str, bool]],
+    ) -> Tuple[List[Tuple[str, bool]], List[Any]]:
+        """
+        Return the ``(keys, values)`` prefix a cursor pins down.
+
+        Cursors issued before tie-breakers existed carry a single scalar
+        ``v``; they are honoured against the leading key only.
+        """
+        values = cursor_data.get("v")
+        if not isinstance(values, list):
+            values = [values]
+        n = min(len(values), len(keys))
+        return keys[:n], values[:n]
+
+    def _envelope(
+        self,
+        request: Any,
+        page: List[Any],
+        keys: List[Tuple[str, bool]],
+        cursor_data: Optional[Dict[str, Any]],
+        has_more: bool,
+        results: Optional[List[Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build links from ``page`` (rows in display order)."""
+        backward = bool(cursor_data) and cursor_data.get("d") == "prev"
+        has_next = (has_more and not backward) or backward
+        has_prev = (has_more and backward) or (bool(cursor_data) and not backward)
+
+        base_params = _get_current_params(request)
+        base_params.pop(self.cursor_param, None)
+
+        next_url = None
+        if has_next and page:
+            cursor = self._encode_cursor({"v": _keyset_values(page[-1], keys), "d": "next"})
+            next_url = _build_url(request, {**base_params, self.cursor_param: cursor})
+
+        prev_url = None
+        if has_prev and page:
+            cursor = self._encode_cursor({"v": _keyset_values(page[0], keys), "d": "prev"})
+            prev_url = _build_url(request, {**base_params, self.cursor_param: cursor})
+
+        return {
+            "next": next_url,
+            "previous": prev_url,
+            "results": page if results is None else results,
+        }
+
     def paginate_list(
         self,
         data: List[Any],
@@ -495,82 +966,38 @@ class CursorPagination(BasePagination):
         params = _get_current_params(request)
         size = self._get_page_size(request)
         cursor_data = self._decode_cursor(params.get(self.cursor_param))
+        keys = self._get_keys("id")
 
-        desc = self.ordering.startswith("-")
-        field_name = self.ordering.lstrip("-")
-
-        # Sort data by the ordering field
-        sorted_data = sorted(
-            data,
-            key=lambda x: _get_nested_value(x, field_name),
-            reverse=desc,
-        )
+        sorted_data = _sort_by_keys(data, keys)
 
         # Apply cursor filter
         if cursor_data:
-            cursor_value = cursor_data.get("v")
-            cursor_direction = cursor_data.get("d", "next")
-
-            if cursor_direction == "next":
-                if desc:
-                    sorted_data = [
-                        item for item in sorted_data
-                        if _compare_values(
-                            _get_nested_value(item, field_name), cursor_value
-                        ) < 0
-                    ]
-                else:
-                    sorted_data = [
-                        item for item in sorted_data
-                        if _compare_values(
-                            _get_nested_value(item, field_name), cursor_value
-                        ) > 0
-                    ]
+            cursor_keys, cursor_values = self._cursor_position(cursor_data, keys)
+            if cursor_data.get("d", "next") == "next":
+                sorted_data = [
+                    item for item in sorted_data
+                    if _compare_keysets(
+                        _keyset_values(item, cursor_keys), cursor_values, cursor_keys
+                    ) > 0
+                ]
             else:  # previous
-                if desc:
-                    sorted_data = [
-                        item for item in sorted_data
-                        if _compare_values(
-                            _get_nested_value(item, field_name), cursor_value
-                        ) > 0
-                    ]
-                else:
-                    sorted_data = [
-                        item for item in sorted_data
-                        if _compare_values(
-                            _get_nested_value(item, field_name), cursor_value
-                        ) < 0
-                    ]
+                sorted_data = [
+                    item for item in sorted_data
+                    if _compare_keysets(
+                        _keyset_values(item, cursor_keys), cursor_values, cursor_keys
+                    ) < 0
+                ]
                 # Reverse so we paginate backwards correctly
                 sorted_data = list(reversed(sorted_data))
 
-        # Fetch one extra to detect has_next
+        # Fetch one extra to detect more rows in the direction of travel
         page = sorted_data[: size + 1]
-        has_next = len(page) > size
+        has_more = len(page) > size
         page = page[:size]
+        if cursor_data and cursor_data.get("d") == "prev":
+            page.reverse()
 
-        base_params = _get_current_params(request)
-        base_params.pop(self.cursor_param, None)
-
-        next_url = None
-        if has_next and page:
-            last_val = _get_nested_value(page[-1], field_name)
-            cursor = self._encode_cursor({"v": last_val, "d": "next"})
-            next_params = {**base_params, self.cursor_param: cursor}
-            next_url = _build_url(request, next_params)
-
-        prev_url = None
-        if cursor_data and page:
-            first_val = _get_nested_value(page[0], field_name)
-            cursor = self._encode_cursor({"v": first_val, "d": "prev"})
-            prev_params = {**base_params, self.cursor_param: cursor}
-            prev_url = _build_url(request, prev_params)
-
-        return {
-            "next": next_url,
-            "previous": prev_url,
-            "results": page,
-        }
+        return self._envelope(request, page, keys, cursor_data, has_more)
 
     async def paginate_queryset(
         self,
@@ -585,69 +1012,34 @@ class CursorPagination(BasePagination):
         params = _get_current_params(request)
         size = self._get_page_size(request)
         cursor_data = self._decode_cursor(params.get(self.cursor_param))
+        keys = self._get_keys(_queryset_pk(queryset))
 
-        desc = self.ordering.startswith("-")
-        field_name = self.ordering.lstrip("-")
-
-        qs = queryset.order(self.ordering)
+        qs = queryset.order(*(f"-{name}" if desc else name for name, desc in keys))
+        backward = False
 
         if cursor_data:
-            cursor_value = cursor_data.get("v")
-            cursor_direction = cursor_data.get("d", "next")
-
-            if cursor_direction == "next":
-                if desc:
-                    qs = qs.filter(**{f"{field_name}__lt": cursor_value})
-                else:
-                    qs = qs.filter(**{f"{field_name}__gt": cursor_value})
-            else:
-                if desc:
-                    qs = qs.filter(**{f"{field_name}__gt": cursor_value})
-                else:
-                    qs = qs.filter(**{f"{field_name}__lt": cursor_value})
-                # Reverse ordering for previous page
-                reverse_order = field_name if desc else f"-{field_name}"
-                qs = qs.order(reverse_order)
+            backward = cursor_data.get("d", "next") == "prev"
+            cursor_keys, cursor_values = self._cursor_position(cursor_data, keys)
+            clause, clause_params = _keyset_clause(cursor_keys, cursor_values, not backward)
+            qs = qs.where(clause, *clause_params)
+            if backward:
+                # Walk the index the other way, re-reversed below
+                qs = qs.reverse()
 
         try:
             items = await qs.limit(size + 1).all()
         except Exception:
             return await super().paginate_queryset(queryset, request)
 
-        results = [
-            item.to_dict() if hasattr(item, "to_dict") else item
-            for item in items
-        ]
-
-        # For "prev" direction, re-reverse to restore original order
-        if cursor_data and cursor_data.get("d") == "prev":
-            results = list(reversed(results))
-
-        has_next = len(results) > size
-        results = results[:size]
-
-        base_params = _get_current_params(request)
-        base_params.pop(self.cursor_param, None)
-
-        next_url = None
-        if has_next and results:
-            last_val = _get_nested_value(results[-1], field_name)
-            cursor = self._encode_cursor({"v": last_val, "d": "next"})
-            next_params = {**base_params, self.cursor_param: cursor}
-            next_url = _build_url(request, next_params)
+        has_more = len(items) > size
+        items = items[:size]
+        if backward:
+            items.reverse()
 
-        prev_url = None
-        if cursor_data and results:
-            first_val = _get_nested_value(results[0], field_name)
-            cursor = self._encode_cursor({"v": first_val, "d": "prev"})
-            prev_params = {**base_params, self.cursor_param: cursor}
-            prev_url = _build_url(request, prev_params)
-
-        return {
-            "next": next_url,
-            "previous": prev_url,
-            "results": results,
-        }
+        return self._envelope(
+            request, items, keys, cursor_data, has_more,
+            results=_serialize_items(items),
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════
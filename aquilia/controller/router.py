@@ -11,9 +11,11 @@ Performance (v2):
 - Dynamic routes use a prefix-tree (trie) for O(k) matching where k = segments.
 - match() is a sync method wrapped for async compat; the hot path is pure sync.
 - Compiled regex matching is used for parameterized routes.
+- Each route carries its own pre-built middleware chain (see
+  ``chain_compiler``), so dispatch needs no per-request scope filtering.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import asyncio
 import re
@@ -61,6 +63,8 @@ class ControllerRouter:
         self.routes_by_method: Dict[str, List[CompiledRoute]] = {}
         self.matcher = PatternMatcher()
         self._initialized = False
+        # Bumped whenever the route table changes (see ``version``)
+        self._version = 0
 
         # ── Fast-path indexes (built during initialize) ──
         # {method: {path: (route, empty_params, empty_query)}}
@@ -70,6 +74,10 @@ class ControllerRouter:
         # {method: _TrieNode}  — trie for segment-based matching
         self._tries: Dict[str, _TrieNode] = {}
 
+        # Builds ``route.middleware_chain`` for every route on initialize();
+        # installed by the ASGI adapter.
+        self.chain_compiler: Optional[Callable[[CompiledRoute], Any]] = None
+
     def add_controller(self, compiled_controller: CompiledController):
         """Add a compiled controller to the router."""
         self.compiled_controllers.append(compiled_controller)
@@ -81,12 +89,16 @@ class ControllerRouter:
             self.routes_by_method[method].append(route)
 
         self._initialized = False
+        self._version += 1
 
     def initialize(self):
         """Build fast-path lookup structures."""
         if self._initialized:
             return
 
+        # Routes may have been appended to routes_by_method directly
+        self._version += 1
+
         # Clear matcher
         self.matcher = PatternMatcher()
         self._static_routes.clear()
@@ -124,8 +136,27 @@ class ControllerRouter:
             self._static_routes[method] = static_map
             self._dynamic_routes[method] = dynamic_list
 
+        self.compile_chains()
         self._initialized = True
 
+    def compile_chains(self):
+        """(Re)build the per-route middleware chains with ``chain_compiler``."""
+        compiler = self.chain_compiler
+        for routes in self.routes_by_method.values():
+            for route in routes:
+                route.middleware_chain = compiler(route) if compiler is not None else None
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic route-table version.
+
+        Changes whenever a controller is added or the indexes are rebuilt,
+        so derived artefacts (e.g. the OpenAPI document) can be cached
+        against it.
+        """
+        return self._version
+
     def match_sync(
         self,
         path: str,
@@ -6,6 +6,7 @@ Provides:
 - SQLite driver (default), Postgres/MySQL adapters
 - Pluggable backend adapters (DatabaseAdapter)
 - Module-level accessors for DI integration
+- Read-replica / multi-database routing (ConnectionRouter, DatabaseRouter)
 - Structured faults via AquilaFaults (DatabaseConnectionFault, QueryFault, SchemaFault)
 """
 
@@ -15,6 +16,13 @@ from .engine import (
     get_database,
     configure_database,
     set_database,
+    get_all_databases,
+)
+from .routing import (
+    ConnectionRouter,
+    DatabaseRouter,
+    get_router,
+    set_router,
 )
 
 # Backend adapters
@@ -42,6 +50,12 @@ __all__ = [
     "get_database",
     "configure_database",
     "set_database",
+    "get_all_databases",
+    # Routing
+    "ConnectionRouter",
+    "DatabaseRouter",
+    "get_router",
+    "set_router",
     # Backends
     "DatabaseAdapter",
     "AdapterCapabilities",
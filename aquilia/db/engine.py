@@ -248,6 +248,26 @@ class AquiliaDatabase:
         finally:
             self._in_transaction = False
 
+    async def begin(self) -> None:
+        """Start a transaction on the adapter (see ``transaction()``)."""
+        await self.ensure_connected()
+        await self._adapter.begin()
+        self._in_transaction = True
+
+    async def commit(self) -> None:
+        """Commit the transaction started with ``begin()``."""
+        try:
+            await self._adapter.commit()
+        finally:
+            self._in_transaction = False
+
+    async def rollback(self) -> None:
+        """Roll back the transaction started with ``begin()``."""
+        try:
+            await self._adapter.rollback()
+        finally:
+            self._in_transaction = False
+
     async def savepoint(self, name: str) -> None:
         """Create a named savepoint within a transaction."""
         name = _sanitize_savepoint(name)
@@ -0,0 +1,442 @@
+"""
+Aquilia Database Routing — read replicas and multi-database support.
+
+Routing happens in two steps:
+
+1. **Which database** — pluggable ``DatabaseRouter`` objects map a model
+   and operation to a database alias (``db_for_read`` / ``db_for_write``).
+   The first router returning a non-``None`` alias wins; ``Q.using()``
+   overrides them, and the default database is the fallback.
+2. **Which copy** — if the chosen alias has replicas configured, reads
+   are load-balanced across the healthy replicas by weight.  A replica
+   whose connection fails is ejected for ``eject_seconds`` and the read is
+   retried on the primary.
+
+Reads stay on the primary (read-your-writes) while inside ``atomic()``
+and for ``sticky_ms`` after a write in the same request (tracked with a
+context variable, so it never leaks across concurrent requests).
+
+Usage:
+    from aquilia.db import configure_database
+    from aquilia.db.routing import ConnectionRouter, set_router
+
+    configure_database("sqlite:///primary.db")
+    configure_database("sqlite:///replica1.db", alias="replica1")
+    configure_database("sqlite:///replica2.db", alias="replica2")
+
+    set_router(ConnectionRouter(
+        replicas={"default": {"replica1": 2, "replica2": 1}},
+        sticky_ms=500,
+    ))
+
+    users = await User.objects.filter(active=True).all()   # → a replica
+    await User.create(name="Ada")                         # → primary
+    await User.objects.get(name="Ada")                     # → primary (sticky)
+
+Without a router every query uses the model's database, exactly as
+before; ``Q.using(alias)`` still resolves the alias from the registry.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import logging
+import random
+import time
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from ..faults.domains import DatabaseConnectionFault
+
+if TYPE_CHECKING:
+    from .engine import AquiliaDatabase
+
+logger = logging.getLogger("aquilia.db.routing")
+
+__all__ = [
+    "DatabaseRouter",
+    "ConnectionRouter",
+    "get_router",
+    "set_router",
+    "db_for_read",
+    "db_for_write",
+    "route_read",
+]
+
+DEFAULT_ALIAS = "default"
+
+# Monotonic time of the last write routed in this context (request task).
+_last_write: contextvars.ContextVar[float] = contextvars.ContextVar(
+    "aquilia_db_last_write", default=0.0,
+)
+# Depth of atomic() blocks open in this context.
+_atomic_depth: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "aquilia_db_atomic_depth", default=0,
+)
+
+
+class DatabaseRouter:
+    """
+    Base class for pluggable routers.
+
+    Override either method to return a database alias for a model, or
+    ``None`` to defer to the next router (and finally the default).
+
+    Example:
+        class AnalyticsRouter(DatabaseRouter):
+            def db_for_read(self, model, **hints):
+                if model._meta.app_label == "analytics":
+                    return "analytics"
+                return None
+
+            db_for_write = db_for_read
+    """
+
+    def db_for_read(self, model: Any, **hints: Any) -> Optional[str]:
+        return None
+
+    def db_for_write(self, model: Any, **hints: Any) -> Optional[str]:
+        return None
+
+
+class _ReplicaGroup:
+    """Replicas of one primary alias with precomputed cumulative weights."""
+
+    __slots__ = ("aliases", "weights", "cumulative", "total")
+
+    def __init__(self, replicas: Mapping[str, float]):
+        self.aliases: List[str] = [a for a, w in replicas.items() if w > 0]
+        self.weights: List[float] = [float(replicas[a]) for a in self.aliases]
+        self.cumulative: List[float] = list(accumulate(self.weights))
+        self.total: float = self.cumulative[-1] if self.cumulative else 0.0
+
+
+class ConnectionRouter:
+    """
+    Resolves a model + operation to an ``AquiliaDatabase``.
+
+    Args:
+        routers: ``DatabaseRouter`` instances (or classes), consulted in
+            order.
+        replicas: ``{primary_alias: {replica_alias: weight}}`` (a list of
+            aliases means equal weights).
+        sticky_ms: Keep reads on the primary for this long after a write
+            in the same request.  ``0`` disables the window (reads inside
+            ``atomic()`` still stay on the primary).
+        eject_seconds: How long a replica that failed to connect is kept
+            out of rotation.
+        databases: Alias → database mapping; defaults to the
+            ``configure_database()`` registry.
+    """
+
+    def __init__(
+        self,
+        routers: Optional[Sequence[Union[DatabaseRouter, type]]] = None,
+        *,
+        replicas: Optional[Mapping[str, Union[Mapping[str, float], Sequence[str]]]] = None,
+        sticky_ms: float = 0.0,
+        eject_seconds: float = 30.0,
+        databases: Optional[Mapping[str, AquiliaDatabase]] = None,
+    ):
+        self.routers: List[DatabaseRouter] = [
+            r() if isinstance(r, type) else r for r in (routers or ())
+        ]
+        self._groups: Dict[str, _ReplicaGroup] = {}
+        for primary, group in (replicas or {}).items():
+            if not isinstance(group, Mapping):
+                group = {alias: 1.0 for alias in group}
+            replica_group = _ReplicaGroup(group)
+            if replica_group.aliases:
+                self._groups[primary] = replica_group
+        self._replica_of: Dict[str, str] = {
+            replica: primary
+            for primary, group in self._groups.items()
+            for replica in group.aliases
+        }
+        self.sticky_s = sticky_ms / 1000.0
+        self.eject_seconds = eject_seconds
+        self._databases = databases
+        self._ejected: Dict[str, float] = {}
+        self._random = random.random
+
+    # ── Database lookup ──────────────────────────────────────────────
+
+    def database(self, alias: Optional[str], default: Optional[AquiliaDatabase] = None) -> AquiliaDatabase:
+        """Return the database for ``alias`` (``None``/"default" → ``default``)."""
+        if alias is None or alias == DEFAULT_ALIAS:
+            if default is not None:
+                return default
+            alias = DEFAULT_ALIAS
+        if self._databases is not None:
+            db = self._databases.get(alias)
+            if db is None:
+                raise DatabaseConnectionFault(
+                    url=f"<alias:{alias}>",
+                    reason=f"No database configured with alias '{alias}'. "
+                           f"Available: {list(self._databases)}",
+                )
+            return db
+        from .engine import get_database
+        return get_database(alias)
+
+    # ── Health ───────────────────────────────────────────────────────
+
+    def eject(self, alias: str) -> None:
+        """Take a replica out of rotation for ``eject_seconds``."""
+        self._ejected[alias] = time.monotonic() + self.eject_seconds
+        logger.warning(f"Replica '{alias}' ejected for {self.eject_seconds:.0f}s")
+
+    def readmit(self, alias: str) -> None:
+        """Put an ejected replica back into rotation."""
+        if self._ejected.pop(alias, None) is not None:
+            logger.info(f"Replica '{alias}' readmitted")
+
+    def is_healthy(self, alias: str) -> bool:
+        until = self._ejected.get(alias)
+        if until is None:
+            return True
+        if until <= time.monotonic():
+            del self._ejected[alias]
+            return True
+        return False
+
+    async def check_replicas(self) -> Dict[str, bool]:
+        """
+        Ping every replica (``SELECT 1``); eject the ones that fail and
+        readmit ejected ones that answer.  Suitable for a periodic task.
+        """
+        status: Dict[str, bool] = {}
+        for alias in self._replica_of:
+            try:
+                await self.database(alias).fetch_val("SELECT 1")
+                self.readmit(alias)
+                status[alias] = True
+            except Exception:
+                if self.is_healthy(alias):
+                    self.eject(alias)
+                status[alias] = False
+        return status
+
+    # ── Routing decisions ────────────────────────────────────────────
+
+    def write_alias(self, model: Any, **hints: Any) -> Optional[str]:
+        for router in self.routers:
+            alias = router.db_for_write(model, **hints)
+            if alias is not None:
+                return alias
+        return None
+
+    def read_alias(self, model: Any, **hints: Any) -> Optional[str]:
+        """
+        Alias a read should go to: the primary while pinned (atomic block
+        or sticky window), otherwise the router's choice, then a replica
+        of it.
+        """
+        if self.is_pinned():
+            return self.write_alias(model, **hints)
+        alias = None
+        for router in self.routers:
+            alias = router.db_for_read(model, **hints)
+            if alias is not None:
+                break
+        group = self._groups.get(alias or DEFAULT_ALIAS)
+        if group is None:
+            return alias
+        return self._pick_replica(group) or alias
+
+    def _pick_replica(self, group: _ReplicaGroup) -> Optional[str]:
+        if not self._ejected:
+            index = bisect.bisect_right(group.cumulative, self._random() * group.total)
+            return group.aliases[min(index, len(group.aliases) - 1)]
+        healthy = [
+            (alias, weight)
+            for alias, weight in zip(group.aliases, group.weights)
+            if self.is_healthy(alias)
+        ]
+        if not healthy:
+            return None
+        point = self._random() * sum(w for _, w in healthy)
+        for alias, weight in healthy:
+            point -= weight
+            if point < 0:
+                return alias
+        return healthy[-1][0]
+
+    def is_pinned(self) -> bool:
+        """True when reads in this context must see this context's writes."""
+        if _atomic_depth.get():
+            return True
+        if self.sticky_s:
+            last = _last_write.get()
+            return bool(last) and time.monotonic() - last < self.sticky_s
+        return False
+
+    # ── Public entry points ──────────────────────────────────────────
+
+    def db_for_write(
+        self,
+        model: Any,
+        alias: Optional[str] = None,
+        default: Optional[AquiliaDatabase] = None,
+    ) -> AquiliaDatabase:
+        """Database for a write; starts the read-your-writes window."""
+        if self.sticky_s:
+            _last_write.set(time.monotonic())
+        if alias is None:
+            alias = self.write_alias(model)
+        return self.database(alias, default)
+
+    def db_for_read(
+        self,
+        model: Any,
+        alias: Optional[str] = None,
+        default: Optional[AquiliaDatabase] = None,
+    ) -> AquiliaDatabase:
+        if alias is None:
+            alias = self.read_alias(model)
+        return self.database(alias, default)
+
+    async def read(
+        self,
+        model: Any,
+        method: str,
+        sql: str,
+        params: Sequence[Any],
+        alias: Optional[str] = None,
+        default: Optional[AquiliaDatabase] = None,
+    ) -> Any:
+        """
+        Run a read query (``fetch_all`` / ``fetch_one`` / ``fetch_val``).
+
+        A replica that fails to connect is ejected and the query is
+        retried on its primary.
+        """
+        chosen = alias if alias is not None else self.read_alias(model)
+        db = self.database(chosen, default)
+        try:
+            return await getattr(db, method)(sql, params)
+        except (DatabaseConnectionFault, ConnectionError, OSError):
+            primary = self._replica_of.get(chosen) if alias is None else None
+            if primary is None:
+                raise
+            self.eject(chosen)
+            return await getattr(self.database(primary, default), method)(sql, params)
+
+
+# ── Module-level router ──────────────────────────────────────────────────────
+
+_router: Optional[ConnectionRouter] = None
+
+
+def get_router() -> Optional[ConnectionRouter]:
+    """Return the active router, or ``None`` when routing is off."""
+    return _router
+
+
+def set_router(router: Optional[ConnectionRouter]) -> None:
+    """Install (or with ``None``, remove) the active router."""
+    global _router
+    _router = router
+
+
+def db_for_write(
+    model: Any,
+    alias: Optional[str] = None,
+    default: Optional[AquiliaDatabase] = None,
+) -> AquiliaDatabase:
+    """Database a write on ``model`` should use."""
+    if _router is not None:
+        return _router.db_for_write(model, alias, default)
+    if alias is None or (alias == DEFAULT_ALIAS and default is not None):
+        return default
+    from .engine import get_database
+    return get_database(alias)
+
+
+def db_for_read(
+    model: Any,
+    alias: Optional[str] = None,
+    default: Optional[AquiliaDatabase] = None,
+) -> AquiliaDatabase:
+    """Database a read on ``model`` should use (no failover)."""
+    if _router is not None:
+        return _router.db_for_read(model, alias, default)
+    if alias is None or (alias == DEFAULT_ALIAS and default is not None):
+        return default
+    from .engine import get_database
+    return get_database(alias)
+
+
+async def route_read(
+    model: Any,
+    method: str,
+    sql: str,
+    params: Sequence[Any],
+    alias: Optional[str] = None,
+    default: Optional[AquiliaDatabase] = None,
+) -> Any:
+    """Run a read query on the database chosen for ``model``."""
+    if _router is not None:
+        return await _router.read(model, method, sql, params, alias, default)
+    return await getattr(db_for_read(model, alias, default), method)(sql, params)
+
+
+def enter_atomic() -> contextvars.Token:
+    """Pin reads to the primary until the matching ``exit_atomic``."""
+    return _atomic_depth.set(_atomic_depth.get() + 1)
+
+
+def exit_atomic(token: contextvars.Token) -> None:
+    _atomic_depth.reset(token)
+
+
+def build_router(config: Mapping[str, Any]) -> Optional[ConnectionRouter]:
+    """
+    Build a router from the ``database`` config section.
+
+    Recognized keys::
+
+        databases: {alias: url | {"url": ..., "replica_of": "default", "weight": 2}}
+        routers: ["myapp.routing:AnalyticsRouter", ...]
+        sticky_ms: 500
+        replica_eject_seconds: 30
+
+    Returns ``None`` when neither replicas nor routers are configured.
+    """
+    replicas: Dict[str, Dict[str, float]] = {}
+    for alias, spec in (config.get("databases") or {}).items():
+        if isinstance(spec, Mapping) and spec.get("replica_of"):
+            replicas.setdefault(spec["replica_of"], {})[alias] = float(spec.get("weight", 1))
+
+    routers: List[Any] = []
+    for ref in config.get("routers") or ():
+        if isinstance(ref, str):
+            import importlib
+            module_path, _, attr = ref.partition(":")
+            ref = getattr(importlib.import_module(module_path), attr)
+        routers.append(ref)
+
+    if not replicas and not routers:
+        return None
+    return ConnectionRouter(
+        routers,
+        replicas=replicas,
+        sticky_ms=float(config.get("sticky_ms", 0) or 0),
+        eject_seconds=float(config.get("replica_eject_seconds", 30.0)),
+    )
+
+
+def database_specs(config: Mapping[str, Any]) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """``(alias, url, options)`` for each extra entry under ``databases``."""
+    specs = []
+    for alias, spec in (config.get("databases") or {}).items():
+        if isinstance(spec, str):
+            specs.append((alias, spec, {}))
+        else:
+            options = {
+                k: v for k, v in spec.items()
+                if k not in ("url", "replica_of", "weight")
+            }
+            specs.append((alias, spec["url"], options))
+    return specs
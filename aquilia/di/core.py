@@ -32,6 +32,10 @@ _type_key_cache: Dict[type, str] = {}
 # Scopes that should cache instances (frozen for O(1) lookup)
 _CACHEABLE_SCOPES = frozenset(("singleton", "app", "request"))
 
+# Cache keys under construction in the current task (and in tasks it
+# gathers), used to tell a dependency cycle from a concurrent resolve
+_resolving: ContextVar[tuple] = ContextVar("aquilia_di_resolving", default=())
+
 
 T = TypeVar("T")
 
@@ -149,6 +153,7 @@ class Container:
         "_resolve_plans",
         "_diagnostics",
         "_lifecycle",
+        "_inflight",
     )
     
     def __init__(
@@ -168,6 +173,7 @@ class Container:
         self._resolve_plans: Dict[str, List[str]] = {}  # Precomputed dependency lists
         self._diagnostics = diagnostics or DIDiagnostics()
         self._lifecycle = Lifecycle()
+        self._inflight: Dict[str, asyncio.Future] = {}  # {cache_key: pending instance}
     
     def register(self, provider: Provider, tag: Optional[str] = None):
         """
@@ -380,23 +386,73 @@ class Container:
         if self._parent and provider.meta.scope in ("singleton", "app"):
             return await self._parent.resolve_async(token, tag=tag, optional=optional)
         
+        if provider.meta.scope in _CACHEABLE_SCOPES:
+            return await self._resolve_once(provider, cache_key)
+        
         # Create resolution context
         ctx = ResolveCtx(container=self)
         ctx.push(cache_key)
         
+        try:
+            return await provider.instantiate(ctx)
+        finally:
+            ctx.pop()
+
+    async def _resolve_once(self, provider: Provider, cache_key: str) -> Any:
+        """
+        Single-flight construction of a cacheable instance.
+
+        The first caller builds the instance; concurrent callers for the
+        same key await that construction instead of building (and
+        leaking) copies of their own.  If the builder is cancelled, a
+        waiter takes over.
+        """
+        while True:
+            flight = self._inflight.get(cache_key)
+            if flight is None:
+                break
+            chain = _resolving.get()
+            if cache_key in chain:
+                from .errors import DependencyCycleError
+                raise DependencyCycleError(cycle=[*chain[chain.index(cache_key):], cache_key])
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise  # this caller was cancelled, not the builder
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        flight = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = flight
+        reset = _resolving.set(_resolving.get() + (cache_key,))
+        ctx = ResolveCtx(container=self)
+        ctx.push(cache_key)
         try:
             instance = await provider.instantiate(ctx)
-            
-            # Cache if appropriate for scope
-            if provider.meta.scope in _CACHEABLE_SCOPES:
-                self._cache[cache_key] = instance
-                await self._check_lifecycle_hooks(instance, provider.meta.name)
-                if hasattr(instance, "__aexit__") or hasattr(instance, "shutdown"):
-                    self._register_finalizer(instance)
-            
+            self._cache[cache_key] = instance
+            await self._check_lifecycle_hooks(instance, provider.meta.name)
+            if hasattr(instance, "__aexit__") or hasattr(instance, "shutdown"):
+                self._register_finalizer(instance)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # waiters re-raise it; don't warn if there are none
+            raise
+        else:
+            flight.set_result(instance)
             return instance
         finally:
             ctx.pop()
+            _resolving.reset(reset)
+            del self._inflight[cache_key]
+
+    def _cached_instance(self, token: Type | str, tag: Optional[str] = None) -> Any:
+        """Instance already cached in this container, else None (no resolution)."""
+        return self._cache.get(self._make_cache_key(self._token_to_key(token), tag))
 
     async def _check_lifecycle_hooks(self, instance: Any, name: str) -> None:
         """Check and register lifecycle hooks for an instance."""
@@ -414,14 +470,64 @@ class Container:
                 name=f"{name}.on_shutdown"
             )
 
-    async def startup(self) -> None:
+    async def startup(self, prewarm: bool = False) -> None:
         """
         Run startup hooks for all registered providers.
+
+        Args:
+            prewarm: Instantiate all singletons first (see ``prewarm()``)
         """
         from .diagnostics import DIEventType
         self._diagnostics.emit(DIEventType.LIFECYCLE_STARTUP, metadata={"scope": self._scope})
+        if prewarm:
+            await self.prewarm()
         await self._lifecycle.run_startup_hooks()
 
+    async def prewarm(self) -> List[List[str]]:
+        """
+        Instantiate every singleton/app provider before serving traffic.
+
+        Providers are grouped into topological waves — each wave depends
+        only on earlier ones — and every wave is resolved concurrently.
+        Providers depending on request-scoped or unregistered tokens are
+        left to resolve lazily.
+
+        Returns:
+            The waves instantiated, as lists of cache keys
+        """
+        from .graph import DependencyGraph
+
+        eager = {
+            key: provider for key, provider in self._providers.items()
+            if provider.meta.scope in ("singleton", "app")
+        }
+        edges: Dict[str, List[str]] = {}
+        for key, provider in eager.items():
+            deps = []
+            for info in getattr(provider, "_dependencies", {}).values():
+                dep_key = self._make_cache_key(self._token_to_key(info["token"]), info.get("tag"))
+                if dep_key in self._providers or not info.get("optional", False):
+                    deps.append(dep_key)
+            edges[key] = deps
+
+        # Drop providers that (transitively) need something not eager
+        changed = True
+        while changed:
+            changed = False
+            for key in list(eager):
+                if any(dep not in eager for dep in edges[key]):
+                    del eager[key]
+                    changed = True
+
+        graph = DependencyGraph()
+        for key, provider in eager.items():
+            graph.add_provider(provider, edges[key], key=key)
+        waves = graph.get_waves()
+
+        for wave in waves:
+            await asyncio.gather(*(self.resolve_async(key) for key in wave))
+        return waves
+
     
     def is_registered(self, token: Type[T] | str, tag: Optional[str] = None) -> bool:
         """Check if a provider is registered for the token."""
@@ -446,6 +552,7 @@ class Container:
         child._resolve_plans = self._resolve_plans  # Read-only, share by ref
         child._diagnostics = self._diagnostics  # Share parent diagnostics
         child._lifecycle = _NullLifecycle  # Singleton no-op lifecycle
+        child._inflight = {}
         return child
     
     async def shutdown(self) -> None:
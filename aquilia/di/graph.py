@@ -26,15 +26,21 @@ class DependencyGraph:
         self._on_stack: Set[str] = set()
         self._sccs: List[List[str]] = []  # Strongly connected components
     
-    def add_provider(self, provider: Provider, dependencies: List[str]) -> None:
+    def add_provider(
+        self,
+        provider: Provider,
+        dependencies: List[str],
+        key: Optional[str] = None,
+    ) -> None:
         """
         Add provider to graph.
         
         Args:
             provider: Provider instance
             dependencies: List of dependency tokens
+            key: Node key (defaults to the provider token)
         """
-        token = provider.meta.token
+        token = key or provider.meta.token
         self.providers[token] = provider
         self.adj_list[token] = dependencies
     
@@ -138,6 +144,36 @@ class DependencyGraph:
         
         return result
     
+    def get_waves(self) -> List[List[str]]:
+        """
+        Group providers into dependency levels.
+        
+        Wave 0 has no (registered) dependencies; every provider in wave N
+        depends only on providers in earlier waves, so the members of a
+        wave can be instantiated concurrently.
+        
+        Raises:
+            DependencyCycleError: If cycle detected
+        """
+        remaining = {
+            token: {dep for dep in self.adj_list.get(token, []) if dep in self.providers}
+            for token in self.providers
+        }
+        waves: List[List[str]] = []
+        
+        while remaining:
+            ready = [token for token, deps in remaining.items() if not deps]
+            if not ready:
+                cycles = self.detect_cycles()
+                self._raise_cycle_error(cycles[0] if cycles else list(remaining))
+            for token in ready:
+                del remaining[token]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+            waves.append(ready)
+        
+        return waves
+    
     def _raise_cycle_error(self, cycle: List[str]) -> None:
         """Raise DependencyCycleError with diagnostics."""
         # Collect location information
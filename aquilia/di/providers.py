@@ -14,6 +14,47 @@ from .errors import DIError
 T = TypeVar("T")
 
 
+async def _resolve_dependencies(
+    container: Any,
+    dependencies: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Resolve constructor/factory parameters.
+
+    Dependencies already cached in the container are taken directly;
+    when two or more still have to be built they are resolved
+    concurrently, like independent branches in ``RequestDAG``.
+    """
+    resolved: Dict[str, Any] = {}
+    pending = []
+    for dep_name, dep_info in dependencies.items():
+        instance = container._cached_instance(dep_info["token"], dep_info.get("tag"))
+        if instance is not None:
+            resolved[dep_name] = instance
+        else:
+            pending.append((dep_name, dep_info))
+
+    if len(pending) == 1:
+        dep_name, dep_info = pending[0]
+        resolved[dep_name] = await container.resolve_async(
+            dep_info["token"],
+            tag=dep_info.get("tag"),
+            optional=dep_info.get("optional", False),
+        )
+    elif pending:
+        results = await asyncio.gather(*(
+            container.resolve_async(
+                dep_info["token"],
+                tag=dep_info.get("tag"),
+                optional=dep_info.get("optional", False),
+            )
+            for _, dep_info in pending
+        ))
+        for (dep_name, _), result in zip(pending, results):
+            resolved[dep_name] = result
+    return resolved
+
+
 class ClassProvider:
     """
     Provider that instantiates a class by resolving constructor dependencies.
@@ -64,18 +105,7 @@ class ClassProvider:
     
     async def instantiate(self, ctx: ResolveCtx) -> Any:
         """Instantiate class by resolving dependencies."""
-        # Resolve dependencies
-        resolved_deps = {}
-        for dep_name, dep_info in self._dependencies.items():
-            dep_token = dep_info["token"]
-            dep_tag = dep_info.get("tag")
-            
-            resolved = await ctx.container.resolve_async(
-                dep_token,
-                tag=dep_tag,
-                optional=dep_info.get("optional", False),
-            )
-            resolved_deps[dep_name] = resolved
+        resolved_deps = await _resolve_dependencies(ctx.container, self._dependencies)
         
         # Instantiate
         instance = self._cls(**resolved_deps)
@@ -231,15 +261,7 @@ class FactoryProvider:
     
     async def instantiate(self, ctx: ResolveCtx) -> Any:
         """Call factory with resolved dependencies."""
-        # Resolve dependencies
-        resolved_deps = {}
-        for dep_name, dep_info in self._dependencies.items():
-            resolved = await ctx.container.resolve_async(
-                dep_info["token"],
-                tag=dep_info.get("tag"),
-                optional=dep_info.get("optional", False),
-            )
-            resolved_deps[dep_name] = resolved
+        resolved_deps = await _resolve_dependencies(ctx.container, self._dependencies)
         
         # Call factory
         if self._is_async:
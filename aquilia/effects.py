@@ -227,6 +227,71 @@ class CacheHandle:
         self._cache.pop(self._key(key), None)
 
 
+class QueueProvider(EffectProvider):
+    """
+    Queue effect provider backed by :class:`~aquilia.jobs.JobQueue`.
+
+    If no queue is supplied an in-process queue (memory backend) is created.
+    ``acquire(topic)`` returns a :class:`QueueHandle` bound to that topic.
+    """
+
+    def __init__(self, job_queue: Any = None):
+        if job_queue is None:
+            from .jobs import JobQueue
+            job_queue = JobQueue()
+        self.queue = job_queue
+
+    async def initialize(self):
+        """Start the worker pool (idempotent)."""
+        await self.queue.start()
+
+    async def acquire(self, mode: Optional[str] = None):
+        """
+        Get a publish handle for a topic.
+
+        Without a topic, jobs go to ``"default"`` if it has a handler,
+        else to the queue's only topic.
+
+        Raises:
+            ValueError: If no topic is given and none can be chosen
+        """
+        if mode is None:
+            topics = self.queue.topics
+            if "default" in topics:
+                mode = "default"
+            elif len(topics) == 1:
+                mode = topics[0]
+            else:
+                raise ValueError(
+                    f"QueueEffect needs a topic when the queue has "
+                    f"{'no' if not topics else len(topics)} handled topics "
+                    f"{sorted(topics)}; use QueueEffect('<topic>')"
+                )
+        return QueueHandle(self.queue, mode)
+
+    async def release(self, resource: Any, success: bool = True):
+        """Nothing to release; enqueued jobs are already durable in the backend."""
+        pass
+
+    async def finalize(self):
+        """Drain due jobs and stop workers."""
+        await self.queue.stop(drain=True)
+
+
+class QueueHandle:
+    """Handle for publishing jobs to a topic."""
+
+    __slots__ = ("_queue", "_topic")
+
+    def __init__(self, queue: Any, topic: str):
+        self._queue = queue
+        self._topic = topic
+
+    async def publish(self, payload: Any = None, **options: Any):
+        """Enqueue a job on this handle's topic; returns the Job."""
+        return await self._queue.enqueue(self._topic, payload, **options)
+
+
 class EffectRegistry:
     """
     Registry for effect providers.
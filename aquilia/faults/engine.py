@@ -9,12 +9,21 @@ The FaultEngine is the runtime fault processor that:
 5. Emits fault events for observability
 
 The engine is async-safe and cancellation-aware.
+
+Emission is built for error storms: repeats of a fault (same code,
+domain, app, route and cause type) within ``aggregation_window`` seconds are counted
+rather than logged, and a single summary line reports the count when the
+window closes.  Listeners run from a bounded queue on a background task,
+so a slow metrics exporter never delays the request that faulted.
 """
 
 from __future__ import annotations
 
 import logging
 import asyncio
+import inspect
+import random
+import time
 from collections import deque
 from typing import Any, Optional, Callable
 from contextvars import ContextVar
@@ -76,6 +85,9 @@ class FaultEngine:
         *,
         logger: Optional[logging.Logger] = None,
         debug: bool = False,
+        aggregation_window: float = 60.0,
+        sample_rates: Optional[dict[FaultDomain | str, float]] = None,
+        listener_queue_size: int = 1024,
     ):
         """
         Initialize fault engine.
@@ -83,6 +95,13 @@ class FaultEngine:
         Args:
             logger: Logger for fault events (creates default if None)
             debug: Enable debug mode (verbose logging, history retention)
+            aggregation_window: Seconds during which repeats of a fault
+                fingerprint are counted instead of logged (0 logs every one)
+            sample_rates: Fraction of repeat faults per domain delivered to
+                listeners (e.g. ``{"db": 0.1}``); the first occurrence in a
+                window and FATAL faults are always delivered
+            listener_queue_size: Pending listener events before new ones
+                are dropped
         """
         self.logger = logger or logging.getLogger("aquilia.faults")
         self.debug = debug
@@ -91,7 +110,31 @@ class FaultEngine:
         self.registry = ScopedHandlerRegistry()
         
         # Event listeners
-        self._event_listeners: list[Callable[[FaultContext], None]] = []
+        self._event_listeners: list[Callable[[FaultContext], Any]] = []
+        self._listener_queue: deque[FaultContext] = deque()
+        self._listener_queue_size = listener_queue_size
+        self._listener_wakeup: Optional[asyncio.Event] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        
+        # Aggregation: (code, domain, app, route, cause type) → [window_start, repeats, first ctx]
+        self.aggregation_window = aggregation_window
+        self._windows: dict[tuple, list] = {}
+        self._next_sweep = 0.0
+        self._sample_rates = {
+            (k.value if isinstance(k, FaultDomain) else k): v
+            for k, v in (sample_rates or {}).items()
+        }
+        
+        self._counters = {
+            "faults": 0,
+            "logged": 0,
+            "suppressed": 0,
+            "summaries": 0,
+            "sampled_out": 0,
+            "listener_dropped": 0,
+            "listener_errors": 0,
+        }
+        self.last_trace_id: Optional[str] = None
         
         # Fault history (debug only)
         self._max_history = 100
@@ -121,12 +164,13 @@ class FaultEngine:
         self.registry.register_route(route, handler)
         self.logger.debug(f"Registered route handler for '{route}': {handler.__class__.__name__}")
     
-    def on_fault(self, listener: Callable[[FaultContext], None]):
+    def on_fault(self, listener: Callable[[FaultContext], Any]):
         """
         Register fault event listener.
         
-        Listeners are called after fault is captured but before processing.
-        Useful for logging, metrics, tracing.
+        Listeners are called from a background task shortly after the
+        fault is captured (sync or async callables).  Useful for logging,
+        metrics, tracing.
         
         Args:
             listener: Callback receiving FaultContext
@@ -178,6 +222,12 @@ class FaultEngine:
         
         # Phase 5: Emission (before processing for observability)
         self._emit(ctx)
+        if ctx.cause is not None:
+            # Lets outer layers (ExceptionMiddleware) skip re-logging it
+            try:
+                ctx.cause._aquilia_fault_trace_id = ctx.trace_id
+            except AttributeError:
+                pass
         
         # Phase 3 & 4: Propagation & Resolution
         result = await self._propagate(ctx)
@@ -320,37 +370,168 @@ class FaultEngine:
         self.logger.debug(f"No handler resolved fault {ctx.fault.code}, escalating")
         return Escalate()
     
+    _LOG_LEVELS = {
+        Severity.INFO: logging.INFO,
+        Severity.WARN: logging.WARNING,
+        Severity.ERROR: logging.ERROR,
+        Severity.FATAL: logging.CRITICAL,
+    }
+    
     def _emit(self, ctx: FaultContext):
         """
         Phase 5: Emission - Log and emit fault event.
         
+        The first occurrence of a fingerprint in a window is logged in
+        full (with the traceback of its cause); repeats are only counted
+        until the window closes and a summary is logged.
+        
         Args:
             ctx: FaultContext to emit
         """
-        # Log based on severity
-        log_level = {
-            Severity.INFO: logging.INFO,
-            Severity.WARN: logging.WARNING,
-            Severity.ERROR: logging.ERROR,
-            Severity.FATAL: logging.CRITICAL,
-        }[ctx.fault.severity]
-        
+        counters = self._counters
+        counters["faults"] += 1
+        self.last_trace_id = ctx.trace_id
+        fault = ctx.fault
+        now = time.monotonic()
+        
+        if now >= self._next_sweep:
+            self.flush_summaries(now)
+        
+        first = True
+        window = self.aggregation_window
+        if window > 0 and fault.severity is not Severity.FATAL:
+            # Wrapped exceptions share UNHANDLED_EXCEPTION; keep types apart
+            key = (fault.code, fault.domain.value, ctx.app, ctx.route, type(ctx.cause))
+            entry = self._windows.get(key)
+            if entry is not None and now - entry[0] < window:
+                entry[1] += 1
+                first = False
+            else:
+                if entry is not None:
+                    self._summarize(entry, now)
+                self._windows[key] = [now, 0, ctx]
+        
+        if first:
+            counters["logged"] += 1
+            cause = ctx.cause
+            self.logger.log(
+                self._LOG_LEVELS[fault.severity],
+                f"[{fault.domain.value.upper()}] {fault.code}: {fault.message}",
+                exc_info=(type(cause), cause, cause.__traceback__) if cause is not None else None,
+                extra={
+                    "fault_context": ctx.to_dict(),
+                    "trace_id": ctx.trace_id,
+                    "fingerprint": ctx.fingerprint(),
+                },
+            )
+        else:
+            counters["suppressed"] += 1
+            rate = self._sample_rates.get(fault.domain.value)
+            if rate is not None and random.random() >= rate:
+                counters["sampled_out"] += 1
+                return
+        
+        if self._event_listeners:
+            self._dispatch(ctx)
+    
+    def _summarize(self, entry: list, now: float):
+        """Log how often a fingerprint repeated in its closed window."""
+        repeats = entry[1]
+        if not repeats:
+            return
+        ctx = entry[2]
+        fault = ctx.fault
+        self._counters["summaries"] += 1
         self.logger.log(
-            log_level,
-            f"[{ctx.fault.domain.value.upper()}] {ctx.fault.code}: {ctx.fault.message}",
+            self._LOG_LEVELS[fault.severity],
+            f"[{fault.domain.value.upper()}] {fault.code}: repeated {repeats} more "
+            f"time(s) in {now - entry[0]:.0f}s",
             extra={
-                "fault_context": ctx.to_dict(),
-                "trace_id": ctx.trace_id,
                 "fingerprint": ctx.fingerprint(),
+                "first_trace_id": ctx.trace_id,
+                "repeats": repeats,
             },
         )
+    
+    def flush_summaries(self, now: Optional[float] = None):
+        """
+        Close expired aggregation windows, logging their repeat counts.
         
-        # Notify listeners
+        Runs at most once a second from ``_emit``; ``drain()`` closes
+        every open window on shutdown.
+        """
+        now = time.monotonic() if now is None else now
+        self._next_sweep = now + 1.0
+        window = self.aggregation_window
+        expired = [k for k, e in self._windows.items() if now - e[0] >= window]
+        for key in expired:
+            entry = self._windows.pop(key)
+            self._summarize(entry, min(now, entry[0] + window))
+    
+    def _dispatch(self, ctx: FaultContext):
+        """Queue ``ctx`` for the listener task (never blocks the caller)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._notify(ctx)
+            return
+        if len(self._listener_queue) >= self._listener_queue_size:
+            self._counters["listener_dropped"] += 1
+            return
+        self._listener_queue.append(ctx)
+        task = self._listener_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._listener_wakeup = asyncio.Event()
+            self._listener_task = loop.create_task(self._run_listeners())
+        else:
+            self._listener_wakeup.set()
+    
+    async def _run_listeners(self):
+        queue = self._listener_queue
+        while True:
+            while queue:
+                result = self._notify(queue.popleft())
+                if result is not None:
+                    await result
+            self._listener_wakeup.clear()
+            await self._listener_wakeup.wait()
+    
+    def _notify(self, ctx: FaultContext):
+        """Call listeners; returns an awaitable if any of them is async."""
+        pending = []
         for listener in self._event_listeners:
             try:
-                listener(ctx)
+                result = listener(ctx)
+                if inspect.isawaitable(result):
+                    pending.append(result)
             except Exception as e:
+                self._counters["listener_errors"] += 1
                 self.logger.error(f"Fault listener raised exception: {e}")
+        if pending:
+            return self._await_listeners(pending)
+        return None
+    
+    async def _await_listeners(self, pending: list):
+        for result in pending:
+            try:
+                await result
+            except Exception as e:
+                self._counters["listener_errors"] += 1
+                self.logger.error(f"Fault listener raised exception: {e}")
+    
+    async def drain(self):
+        """Deliver queued listener events and report open windows (shutdown)."""
+        queue = self._listener_queue
+        while queue:
+            result = self._notify(queue.popleft())
+            if result is not None:
+                await result
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            self._listener_task = None
+        self.flush_summaries(float("inf"))
+        # The forced flush pushed the sweep to infinity; keep sweeping after reuse
+        self._next_sweep = time.monotonic() + 1.0
     
     # ========================================================================
     # Context Management
@@ -421,6 +602,12 @@ class FaultEngine:
             "listeners": len(self._event_listeners),
             "history_size": len(self._history),
             "debug": self.debug,
+            "emission": {
+                **self._counters,
+                "open_windows": len(self._windows),
+                "listener_queue": len(self._listener_queue),
+            },
+            "last_trace_id": self.last_trace_id,
         }
 
 
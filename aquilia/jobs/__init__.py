@@ -0,0 +1,57 @@
+"""
+AquilaJobs — Background job queue for Aquilia.
+
+Provides:
+- **Backends**: in-process (``MemoryJobBackend``) and SQLite-persisted
+  (``SQLiteJobBackend``) job stores with crash recovery
+- **Worker pool**: per-topic concurrency limits, per-job or batch handlers
+- **Reliability**: retries with exponential backoff + jitter, dead-letter store
+- **Effect system**: ``QueueProvider`` backs ``QueueEffect`` with a JobQueue
+
+Usage::
+
+    from aquilia.jobs import JobQueue, SQLiteJobBackend
+
+    queue = JobQueue(SQLiteJobBackend("sqlite:///jobs.sqlite3"))
+
+    @queue.handler("reports", concurrency=2)
+    async def build_report(job):
+        ...
+
+    await queue.start()
+    await queue.enqueue("reports", {"month": "2024-01"})
+"""
+
+from .job import Job, JobStatus, RetryPolicy
+from .backends import JobBackend, MemoryJobBackend, SQLiteJobBackend
+from .queue import JobQueue, TopicSpec
+from .faults import (
+    JobFault,
+    JobBackendFault,
+    JobRetryFault,
+)
+
+
+def create_backend(kind: str = "memory", url: str = "") -> JobBackend:
+    """Build a backend from config values (``"memory"`` or ``"sqlite"``)."""
+    if kind == "memory":
+        return MemoryJobBackend()
+    if kind == "sqlite":
+        return SQLiteJobBackend(url or "sqlite:///aquilia_jobs.sqlite3")
+    raise JobBackendFault(f"Unknown job backend {kind!r}", backend=kind)
+
+
+__all__ = [
+    "Job",
+    "JobStatus",
+    "RetryPolicy",
+    "JobBackend",
+    "MemoryJobBackend",
+    "SQLiteJobBackend",
+    "JobQueue",
+    "TopicSpec",
+    "create_backend",
+    "JobFault",
+    "JobBackendFault",
+    "JobRetryFault",
+]
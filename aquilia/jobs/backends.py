@@ -0,0 +1,346 @@
+"""
+AquilaJobs Backends — storage for queued, running and dead-lettered jobs.
+
+- :class:`MemoryJobBackend` — in-process heaps; fast, lost on restart.
+- :class:`SQLiteJobBackend` — persisted through :class:`AquiliaDatabase`;
+  jobs left ``running`` by a crashed process are recovered on startup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from .faults import JobBackendFault
+from .job import Job, JobStatus
+
+
+class JobBackend(ABC):
+    """Abstract job store used by :class:`~aquilia.jobs.queue.JobQueue`."""
+
+    name: str = "base"
+
+    async def initialize(self) -> None:
+        """Open connections / create schema (idempotent)."""
+
+    async def close(self) -> None:
+        """Release connections."""
+
+    @abstractmethod
+    async def push(self, job: Job) -> None:
+        """Store a new pending job."""
+
+    @abstractmethod
+    async def claim(self, topic: str, limit: int, now: Optional[float] = None) -> List[Job]:
+        """
+        Atomically take up to ``limit`` due jobs for ``topic``.
+
+        Claimed jobs are marked ``RUNNING`` and their ``attempts`` counter
+        is incremented.
+        """
+
+    @abstractmethod
+    async def ack(self, jobs: List[Job]) -> None:
+        """Remove successfully processed jobs."""
+
+    @abstractmethod
+    async def retry(self, job: Job, run_at: float, error: str) -> None:
+        """Return a claimed job to the pending set, due at ``run_at``."""
+
+    @abstractmethod
+    async def bury(self, job: Job, error: str) -> None:
+        """Move a job to the dead-letter store."""
+
+    @abstractmethod
+    async def dead_letters(self, topic: Optional[str] = None, limit: int = 100) -> List[Job]:
+        """List dead-lettered jobs, oldest first."""
+
+    @abstractmethod
+    async def replay(self, job_id: str) -> bool:
+        """Move a dead-lettered job back to pending with a fresh attempt budget."""
+
+    @abstractmethod
+    async def pending_count(self, topic: Optional[str] = None) -> int:
+        """Number of pending (not yet claimed) jobs."""
+
+    @abstractmethod
+    async def next_run_at(self, topic: str) -> Optional[float]:
+        """Earliest ``run_at`` among pending jobs for ``topic``, or None."""
+
+
+class MemoryJobBackend(JobBackend):
+    """
+    In-process job store.
+
+    Pending jobs wait in a per-topic heap ordered by ``run_at``; a claim
+    moves the due ones to a ready heap ordered by ``(priority, run_at)``
+    and takes from there, so due work is claimed lowest priority value
+    first, the same order as :class:`SQLiteJobBackend`.  Claiming is
+    ``O(k log n)`` and never awaits, which makes it atomic with respect to
+    other workers on the same event loop.
+    """
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, List[Tuple[float, int, Job]]] = {}
+        self._ready: Dict[str, List[Tuple[int, float, int, Job]]] = {}
+        self._running: Dict[str, Job] = {}
+        self._dead: Dict[str, Job] = {}
+        self._seq = itertools.count()
+
+    async def push(self, job: Job) -> None:
+        job.status = JobStatus.PENDING
+        heapq.heappush(
+            self._pending.setdefault(job.topic, []),
+            (job.run_at, next(self._seq), job),
+        )
+
+    async def claim(self, topic: str, limit: int, now: Optional[float] = None) -> List[Job]:
+        pending = self._pending.get(topic)
+        ready = self._ready.setdefault(topic, [])
+        now = time.time() if now is None else now
+        while pending and pending[0][0] <= now:
+            run_at, seq, job = heapq.heappop(pending)
+            heapq.heappush(ready, (job.priority, run_at, seq, job))
+        claimed: List[Job] = []
+        while ready and len(claimed) < limit:
+            job = heapq.heappop(ready)[3]
+            job.status = JobStatus.RUNNING
+            job.attempts += 1
+            self._running[job.id] = job
+            claimed.append(job)
+        return claimed
+
+    async def ack(self, jobs: List[Job]) -> None:
+        for job in jobs:
+            job.status = JobStatus.DONE
+            self._running.pop(job.id, None)
+
+    async def retry(self, job: Job, run_at: float, error: str) -> None:
+        self._running.pop(job.id, None)
+        job.run_at = run_at
+        job.last_error = error
+        await self.push(job)
+
+    async def bury(self, job: Job, error: str) -> None:
+        self._running.pop(job.id, None)
+        job.status = JobStatus.DEAD
+        job.last_error = error
+        self._dead[job.id] = job
+
+    async def dead_letters(self, topic: Optional[str] = None, limit: int = 100) -> List[Job]:
+        jobs = [j for j in self._dead.values() if topic is None or j.topic == topic]
+        return jobs[:limit]
+
+    async def replay(self, job_id: str) -> bool:
+        job = self._dead.pop(job_id, None)
+        if job is None:
+            return False
+        job.attempts = 0
+        job.run_at = time.time()
+        await self.push(job)
+        return True
+
+    async def pending_count(self, topic: Optional[str] = None) -> int:
+        if topic is not None:
+            return len(self._pending.get(topic, ())) + len(self._ready.get(topic, ()))
+        return (
+            sum(len(h) for h in self._pending.values())
+            + sum(len(h) for h in self._ready.values())
+        )
+
+    async def next_run_at(self, topic: str) -> Optional[float]:
+        times = []
+        ready = self._ready.get(topic)
+        if ready:
+            # Ready jobs are already due
+            times.append(ready[0][1])
+        pending = self._pending.get(topic)
+        if pending:
+            times.append(pending[0][0])
+        return min(times) if times else None
+
+
+class SQLiteJobBackend(JobBackend):
+    """
+    SQLite-persisted job store.
+
+    Jobs and dead letters share one table, distinguished by ``status``.
+    Claims are serialized by an asyncio lock, so one process should own the
+    workers for a given database file; any number of processes may enqueue.
+    """
+
+    name = "sqlite"
+
+    _SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS "{table}" ('
+        '"id" TEXT PRIMARY KEY, '
+        '"topic" TEXT NOT NULL, '
+        '"payload" TEXT, '
+        '"status" TEXT NOT NULL, '
+        '"attempts" INTEGER NOT NULL DEFAULT 0, '
+        '"max_attempts" INTEGER NOT NULL DEFAULT 5, '
+        '"priority" INTEGER NOT NULL DEFAULT 50, '
+        '"run_at" REAL NOT NULL, '
+        '"created_at" REAL NOT NULL, '
+        '"last_error" TEXT)'
+    )
+    _INDEX = (
+        'CREATE INDEX IF NOT EXISTS "{table}_due" '
+        'ON "{table}" ("topic", "status", "run_at")'
+    )
+
+    def __init__(self, url: str = "sqlite:///aquilia_jobs.sqlite3", *, table: str = "aq_jobs"):
+        self.url = url
+        self.table = table
+        self._db = None
+        self._lock = asyncio.Lock()
+
+    async def initialize(self) -> None:
+        if self._db is not None:
+            return
+        from ..db.engine import AquiliaDatabase
+
+        db = AquiliaDatabase(self.url)
+        try:
+            await db.connect()
+            await db.execute(self._SCHEMA.format(table=self.table))
+            await db.execute(self._INDEX.format(table=self.table))
+            # Crash recovery: a job still RUNNING belongs to a dead worker.
+            await db.execute(
+                f'UPDATE "{self.table}" SET "status" = ? WHERE "status" = ?',
+                [JobStatus.PENDING.value, JobStatus.RUNNING.value],
+            )
+        except Exception as exc:
+            raise JobBackendFault(
+                f"Failed to open job store {self.url!r}: {exc}", backend=self.name,
+            ) from exc
+        self._db = db
+
+    async def close(self) -> None:
+        if self._db is not None:
+            await self._db.disconnect()
+            self._db = None
+
+    def _conn(self):
+        if self._db is None:
+            raise JobBackendFault("SQLite job backend is not initialized", backend=self.name)
+        return self._db
+
+    def _row_to_job(self, row: dict) -> Job:
+        payload = row.get("payload")
+        return Job(
+            id=row["id"],
+            topic=row["topic"],
+            payload=json.loads(payload) if payload is not None else None,
+            status=JobStatus(row["status"]),
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            priority=row["priority"],
+            run_at=row["run_at"],
+            created_at=row["created_at"],
+            last_error=row.get("last_error"),
+        )
+
+    async def push(self, job: Job) -> None:
+        job.status = JobStatus.PENDING
+        await self._conn().execute(
+            f'INSERT INTO "{self.table}" ("id", "topic", "payload", "status", "attempts", '
+            '"max_attempts", "priority", "run_at", "created_at", "last_error") '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [
+                job.id, job.topic, json.dumps(job.payload), job.status.value,
+                job.attempts, job.max_attempts, job.priority, job.run_at,
+                job.created_at, job.last_error,
+            ],
+        )
+
+    async def claim(self, topic: str, limit: int, now: Optional[float] = None) -> List[Job]:
+        db = self._conn()
+        now = time.time() if now is None else now
+        async with self._lock:
+            rows = await db.fetch_all(
+                f'SELECT * FROM "{self.table}" WHERE "topic" = ? AND "status" = ? '
+                'AND "run_at" <= ? ORDER BY "priority", "run_at" LIMIT ?',
+                [topic, JobStatus.PENDING.value, now, limit],
+            )
+            if not rows:
+                return []
+            jobs = [self._row_to_job(r) for r in rows]
+            placeholders = ", ".join("?" for _ in jobs)
+            await db.execute(
+                f'UPDATE "{self.table}" SET "status" = ?, "attempts" = "attempts" + 1 '
+                f'WHERE "id" IN ({placeholders})',
+                [JobStatus.RUNNING.value, *(j.id for j in jobs)],
+            )
+        for job in jobs:
+            job.status = JobStatus.RUNNING
+            job.attempts += 1
+        return jobs
+
+    async def ack(self, jobs: List[Job]) -> None:
+        if not jobs:
+            return
+        placeholders = ", ".join("?" for _ in jobs)
+        await self._conn().execute(
+            f'DELETE FROM "{self.table}" WHERE "id" IN ({placeholders})',
+            [j.id for j in jobs],
+        )
+        for job in jobs:
+            job.status = JobStatus.DONE
+
+    async def retry(self, job: Job, run_at: float, error: str) -> None:
+        job.status = JobStatus.PENDING
+        job.run_at = run_at
+        job.last_error = error
+        await self._conn().execute(
+            f'UPDATE "{self.table}" SET "status" = ?, "run_at" = ?, "last_error" = ? '
+            'WHERE "id" = ?',
+            [job.status.value, run_at, error, job.id],
+        )
+
+    async def bury(self, job: Job, error: str) -> None:
+        job.status = JobStatus.DEAD
+        job.last_error = error
+        await self._conn().execute(
+            f'UPDATE "{self.table}" SET "status" = ?, "last_error" = ? WHERE "id" = ?',
+            [job.status.value, error, job.id],
+        )
+
+    async def dead_letters(self, topic: Optional[str] = None, limit: int = 100) -> List[Job]:
+        sql = f'SELECT * FROM "{self.table}" WHERE "status" = ?'
+        params: list = [JobStatus.DEAD.value]
+        if topic is not None:
+            sql += ' AND "topic" = ?'
+            params.append(topic)
+        sql += ' ORDER BY "created_at" LIMIT ?'
+        params.append(limit)
+        return [self._row_to_job(r) for r in await self._conn().fetch_all(sql, params)]
+
+    async def replay(self, job_id: str) -> bool:
+        cursor = await self._conn().execute(
+            f'UPDATE "{self.table}" SET "status" = ?, "attempts" = 0, "run_at" = ? '
+            'WHERE "id" = ? AND "status" = ?',
+            [JobStatus.PENDING.value, time.time(), job_id, JobStatus.DEAD.value],
+        )
+        return bool(getattr(cursor, "rowcount", 0))
+
+    async def pending_count(self, topic: Optional[str] = None) -> int:
+        sql = f'SELECT COUNT(*) FROM "{self.table}" WHERE "status" = ?'
+        params: list = [JobStatus.PENDING.value]
+        if topic is not None:
+            sql += ' AND "topic" = ?'
+            params.append(topic)
+        return int(await self._conn().fetch_val(sql, params) or 0)
+
+    async def next_run_at(self, topic: str) -> Optional[float]:
+        return await self._conn().fetch_val(
+            f'SELECT MIN("run_at") FROM "{self.table}" WHERE "topic" = ? AND "status" = ?',
+            [topic, JobStatus.PENDING.value],
+        )
@@ -0,0 +1,88 @@
+"""
+AquilaJobs Faults — Typed fault definitions for the background job queue.
+
+Jobs that exhaust their retries (or fail with a non-retryable fault) are
+moved to the dead-letter store; these faults describe why.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from ..faults.core import Fault, FaultDomain, Severity
+
+
+# ── Jobs Fault Domain ───────────────────────────────────────────────
+FaultDomain.JOBS = FaultDomain("jobs", "Background job queue and worker faults")
+
+
+class JobFault(Fault):
+    """Base class for all job-queue faults."""
+
+    domain = FaultDomain.JOBS
+    severity = Severity.ERROR
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        code: str = "JOB_ERROR",
+        severity: Severity = Severity.ERROR,
+        details: Optional[dict[str, Any]] = None,
+        retryable: bool = False,
+        job_id: Optional[str] = None,
+    ):
+        self.job_id = job_id
+        metadata = {**(details or {}), "job_id": job_id} if job_id else (details or {})
+        super().__init__(
+            message=message,
+            code=code,
+            domain=FaultDomain.JOBS,
+            severity=severity,
+            retryable=retryable,
+            metadata=metadata,
+        )
+
+
+class JobBackendFault(JobFault):
+    """Storage backend failure (connection, schema, serialization)."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        backend: str = "unknown",
+        details: Optional[dict[str, Any]] = None,
+    ):
+        self.backend = backend
+        super().__init__(
+            message=message,
+            code="JOB_BACKEND_ERROR",
+            severity=Severity.FATAL,
+            details={**(details or {}), "backend": backend},
+        )
+
+
+class JobRetryFault(JobFault):
+    """
+    Raise (or return from a batch handler) to request a retry.
+
+    ``retry_after`` overrides the retry policy's computed backoff, e.g. when
+    a downstream service reports its own rate-limit window.
+    """
+
+    def __init__(
+        self,
+        message: str = "Job requested retry",
+        *,
+        retry_after: Optional[float] = None,
+        details: Optional[dict[str, Any]] = None,
+    ):
+        self.retry_after = retry_after
+        super().__init__(
+            message=message,
+            code="JOB_RETRY",
+            severity=Severity.WARN,
+            details={**(details or {}), "retry_after": retry_after},
+            retryable=True,
+        )
@@ -0,0 +1,107 @@
+"""
+AquilaJobs Job — the unit of work stored by a JobBackend.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class JobStatus(str, Enum):
+    """Lifecycle state of a job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    DEAD = "dead"
+
+
+@dataclass
+class Job:
+    """
+    A queued job.
+
+    ``payload`` must be JSON-serializable when a persistent backend is used.
+    ``run_at`` is a wall-clock timestamp (``time.time()``) so it survives
+    process restarts.
+    """
+
+    topic: str
+    payload: Any = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = 0
+    max_attempts: int = 5
+    priority: int = 50
+    run_at: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=time.time)
+    last_error: Optional[str] = None
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the job has used all of its attempts."""
+        return self.attempts >= self.max_attempts
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "topic": self.topic,
+            "payload": self.payload,
+            "status": self.status.value,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "priority": self.priority,
+            "run_at": self.run_at,
+            "created_at": self.created_at,
+            "last_error": self.last_error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        return cls(
+            id=data["id"],
+            topic=data["topic"],
+            payload=data.get("payload"),
+            status=JobStatus(data.get("status", "pending")),
+            attempts=data.get("attempts", 0),
+            max_attempts=data.get("max_attempts", 5),
+            priority=data.get("priority", 50),
+            run_at=data.get("run_at", time.time()),
+            created_at=data.get("created_at", time.time()),
+            last_error=data.get("last_error"),
+        )
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Exponential backoff: ``base_delay * 2 ** (attempt - 1)`` capped at
+    ``max_delay``.  With ``jitter`` the delay is drawn uniformly from
+    ``[delay / 2, delay]`` so retries of a failed batch do not stampede.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 3600.0
+    jitter: bool = True
+
+    def delay(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** max(attempt - 1, 0)))
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        return delay
+
+    @classmethod
+    def from_config(cls, config: Any) -> "RetryPolicy":
+        """Build from a mail ``RetryConfig`` (or any object with the same attributes)."""
+        return cls(
+            max_attempts=getattr(config, "max_attempts", 5),
+            base_delay=getattr(config, "base_delay", 1.0),
+            max_delay=getattr(config, "max_delay", 3600.0),
+            jitter=getattr(config, "jitter", True),
+        )
@@ -0,0 +1,367 @@
+"""
+AquilaJobs Queue — topic-routed job queue with a concurrency-limited worker pool.
+
+Each registered topic gets ``concurrency`` worker tasks.  A worker claims up
+to ``batch_size`` due jobs at a time and hands them either one by one to a
+job handler (run concurrently) or all at once to a batch handler.  Failures
+are retried with exponential backoff until the job's attempts are exhausted,
+then moved to the backend's dead-letter store.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from ..faults.core import Fault
+from .backends import JobBackend, MemoryJobBackend
+from .faults import JobRetryFault
+from .job import Job, RetryPolicy
+
+logger = logging.getLogger("aquilia.jobs")
+
+JobHandler = Callable[[Job], Awaitable[Any]]
+BatchHandler = Callable[[List[Job]], Awaitable[Optional[Sequence[Optional[BaseException]]]]]
+
+
+@dataclass
+class TopicSpec:
+    """Handler registration for one topic."""
+
+    handler: Callable[..., Awaitable[Any]]
+    batch: bool = False
+    batch_size: int = 1
+    concurrency: int = 1
+    retry: Optional[RetryPolicy] = None
+
+
+def _batch_outcomes(
+    jobs: List[Job],
+    result: Optional[Sequence[Optional[BaseException]]],
+) -> List[Optional[BaseException]]:
+    """Align a batch handler's result with ``jobs``; unreported jobs are retried."""
+    if result is None:
+        return [None] * len(jobs)
+    outcomes = list(result)[: len(jobs)]
+    if len(outcomes) < len(jobs):
+        logger.warning(
+            f"Batch handler returned {len(outcomes)} outcome(s) for {len(jobs)} job(s); "
+            f"retrying the rest"
+        )
+        outcomes.extend(
+            JobRetryFault(
+                "Batch handler returned no outcome for this job",
+                details={"job_id": job.id},
+            )
+            for job in jobs[len(outcomes):]
+        )
+    return outcomes
+
+
+class JobQueue:
+    """
+    Background job queue.
+
+    Usage::
+
+        queue = JobQueue(MemoryJobBackend())
+
+        @queue.handler("thumbnails", concurrency=4)
+        async def make_thumbnail(job):
+            await render(job.payload["path"])
+
+        await queue.start()
+        await queue.enqueue("thumbnails", {"path": "a.png"})
+
+    A batch handler (``batch=True``) receives a list of jobs and may return a
+    list aligned with it: ``None`` for success or an exception for failure.
+    Returning ``None`` marks the whole batch successful; raising fails every
+    job in the batch.
+
+    An exception that is a :class:`Fault` with ``retryable=False`` skips the
+    remaining attempts and goes straight to the dead-letter store.  An
+    exception exposing ``retry_after`` (seconds) overrides the backoff.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[JobBackend] = None,
+        *,
+        retry: Optional[RetryPolicy] = None,
+        poll_interval: float = 1.0,
+    ):
+        self.backend = backend or MemoryJobBackend()
+        self.retry = retry or RetryPolicy()
+        self.poll_interval = poll_interval
+        self._topics: Dict[str, TopicSpec] = {}
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._workers: List[asyncio.Task] = []
+        self._running = False
+        self._initialized = False
+        self._in_flight = 0
+        self._stats = {
+            "enqueued": 0,
+            "succeeded": 0,
+            "retried": 0,
+            "dead_lettered": 0,
+            "batches": 0,
+        }
+
+    # ── Registration ────────────────────────────────────────────────
+
+    def register(
+        self,
+        topic: str,
+        handler: Callable[..., Awaitable[Any]],
+        *,
+        batch: bool = False,
+        batch_size: int = 1,
+        concurrency: int = 1,
+        retry: Optional[RetryPolicy] = None,
+    ) -> None:
+        """
+        Register the handler for ``topic``.
+
+        On a running queue the topic's workers start immediately; a topic
+        can only be re-registered while the queue is stopped.
+        """
+        if self._running and topic in self._topics:
+            raise RuntimeError(
+                f"Job topic {topic!r} already has running workers; stop the queue to replace it"
+            )
+        spec = TopicSpec(
+            handler=handler,
+            batch=batch,
+            batch_size=max(1, batch_size),
+            concurrency=max(1, concurrency),
+            retry=retry,
+        )
+        self._topics[topic] = spec
+        if self._running:
+            self._spawn_workers(topic, spec)
+
+    def handler(self, topic: str, **options: Any) -> Callable:
+        """Decorator form of :meth:`register`."""
+        def decorator(fn):
+            self.register(topic, fn, **options)
+            return fn
+        return decorator
+
+    # ── Producer API ────────────────────────────────────────────────
+
+    async def enqueue(
+        self,
+        topic: str,
+        payload: Any = None,
+        *,
+        delay: float = 0.0,
+        priority: int = 50,
+        max_attempts: Optional[int] = None,
+    ) -> Job:
+        """Store a job and wake the topic's workers.  Returns immediately."""
+        if not self._initialized:
+            await self.backend.initialize()
+            self._initialized = True
+        if max_attempts is None:
+            spec = self._topics.get(topic)
+            max_attempts = (spec.retry if spec and spec.retry else self.retry).max_attempts
+        job = Job(
+            topic=topic,
+            payload=payload,
+            priority=priority,
+            max_attempts=max_attempts,
+            run_at=time.time() + delay,
+        )
+        await self.backend.push(job)
+        self._stats["enqueued"] += 1
+        wake = self._wakeups.get(topic)
+        if wake is not None:
+            wake.set()
+        return job
+
+    # ── Lifecycle ───────────────────────────────────────────────────
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def topics(self) -> List[str]:
+        """Topics that have a registered handler."""
+        return list(self._topics)
+
+    async def start(self) -> None:
+        """Initialize the backend and spawn the worker pool (idempotent)."""
+        if self._running:
+            return
+        if not self._initialized:
+            await self.backend.initialize()
+            self._initialized = True
+        self._running = True
+        for topic, spec in self._topics.items():
+            self._spawn_workers(topic, spec)
+        logger.debug(
+            f"JobQueue started ({self.backend.name}, {len(self._workers)} worker(s))"
+        )
+
+    def _spawn_workers(self, topic: str, spec: TopicSpec) -> None:
+        self._wakeups.setdefault(topic, asyncio.Event())
+        for i in range(spec.concurrency):
+            self._workers.append(asyncio.create_task(
+                self._worker(topic, spec), name=f"aquilia-job:{topic}:{i}",
+            ))
+
+    async def stop(self, *, drain: bool = False, timeout: float = 10.0) -> None:
+        """
+        Stop the worker pool.
+
+        With ``drain`` the queue first waits (up to ``timeout``) for due jobs
+        to be processed.  Workers finish their current batch before exiting;
+        any still running after ``timeout`` are cancelled.
+        """
+        if not self._running:
+            await self._close_backend()
+            return
+        if drain:
+            await self.join(timeout=timeout)
+        self._running = False
+        for wake in self._wakeups.values():
+            wake.set()
+        workers, self._workers = self._workers, []
+        if workers:
+            _, still_running = await asyncio.wait(workers, timeout=timeout)
+            for task in still_running:
+                task.cancel()
+            if still_running:
+                await asyncio.gather(*still_running, return_exceptions=True)
+        await self._close_backend()
+
+    async def _close_backend(self) -> None:
+        if self._initialized:
+            await self.backend.close()
+            self._initialized = False
+
+    async def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no job is due or in flight.  Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._in_flight or await self._has_due_work():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.01)
+        return True
+
+    async def _has_due_work(self) -> bool:
+        # Delayed retries are pending but not due; they don't block a drain.
+        now = time.time()
+        for topic in self._topics:
+            run_at = await self.backend.next_run_at(topic)
+            if run_at is not None and run_at <= now:
+                return True
+        return False
+
+    # ── Workers ─────────────────────────────────────────────────────
+
+    async def _worker(self, topic: str, spec: TopicSpec) -> None:
+        wake = self._wakeups[topic]
+        while self._running:
+            # Clear *before* claiming so an enqueue racing the claim is not lost.
+            wake.clear()
+            try:
+                jobs = await self.backend.claim(topic, spec.batch_size)
+            except Exception as exc:
+                logger.error(f"Job claim failed for {topic!r}: {exc}")
+                jobs = []
+            if not jobs:
+                try:
+                    await asyncio.wait_for(wake.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            self._in_flight += len(jobs)
+            try:
+                await self._process(spec, jobs)
+            except Exception as exc:
+                # _process settles its own failures; never let a bug kill the worker
+                logger.error(f"Job processing failed for {topic!r}: {exc}")
+            finally:
+                self._in_flight -= len(jobs)
+
+    async def _process(self, spec: TopicSpec, jobs: List[Job]) -> None:
+        self._stats["batches"] += 1
+        outcomes: List[Optional[BaseException]]
+        try:
+            if spec.batch:
+                outcomes = _batch_outcomes(jobs, await spec.handler(jobs))
+            elif len(jobs) == 1:
+                outcomes = [await self._call(spec.handler, jobs[0])]
+            else:
+                outcomes = list(await asyncio.gather(*(self._call(spec.handler, j) for j in jobs)))
+        except Exception as exc:
+            outcomes = [exc] * len(jobs)
+
+        succeeded = [job for job, err in zip(jobs, outcomes) if err is None]
+        if succeeded:
+            try:
+                await self.backend.ack(succeeded)
+                self._stats["succeeded"] += len(succeeded)
+            except Exception as exc:
+                # Unacknowledged work goes back through retry / dead-letter
+                outcomes = [exc if err is None else err for err in outcomes]
+        policy = spec.retry or self.retry
+        for job, err in zip(jobs, outcomes):
+            if err is not None:
+                try:
+                    await self._fail(job, err, policy)
+                except Exception as exc:
+                    logger.error(f"Could not reschedule job {job.id} ({job.topic}): {exc}")
+
+    @staticmethod
+    async def _call(handler: JobHandler, job: Job) -> Optional[BaseException]:
+        try:
+            await handler(job)
+        except Exception as exc:
+            return exc
+        return None
+
+    async def _fail(self, job: Job, err: BaseException, policy: RetryPolicy) -> None:
+        error = f"{type(err).__name__}: {err}"
+        retryable = err.retryable if isinstance(err, Fault) else True
+        if not retryable or job.exhausted:
+            await self.backend.bury(job, error)
+            self._stats["dead_lettered"] += 1
+            logger.warning(
+                f"Job {job.id} ({job.topic}) dead-lettered after "
+                f"{job.attempts} attempt(s): {error}"
+            )
+            return
+        delay = getattr(err, "retry_after", None)
+        if delay is None:
+            delay = policy.delay(job.attempts)
+        await self.backend.retry(job, time.time() + delay, error)
+        self._stats["retried"] += 1
+
+    # ── Introspection ───────────────────────────────────────────────
+
+    async def dead_letters(self, topic: Optional[str] = None, limit: int = 100) -> List[Job]:
+        return await self.backend.dead_letters(topic, limit)
+
+    async def replay(self, job_id: str) -> bool:
+        """Re-enqueue a dead-lettered job."""
+        replayed = await self.backend.replay(job_id)
+        if replayed:
+            for wake in self._wakeups.values():
+                wake.set()
+        return replayed
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "backend": self.backend.name,
+            "running": self._running,
+            "workers": len(self._workers),
+            "in_flight": self._in_flight,
+            "topics": sorted(self._topics),
+        }
@@ -85,6 +85,12 @@ class LifecycleCoordinator:
             except Exception as e:
                 self.logger.error(f"Event handler error: {e}")
     
+    def _prewarm_di(self) -> bool:
+        """``di.prewarm`` config flag."""
+        if self.config is None or not hasattr(self.config, "get"):
+            return False
+        return bool(self.config.get("di.prewarm", False))
+
     async def startup(self):
         """
         Execute startup hooks for all apps in dependency order.
@@ -150,9 +156,13 @@ class LifecycleCoordinator:
             # Get DI container for this app
             di_container = self.runtime.di_containers.get(app_name)
             
-            # Start DI container (runs provider startup hooks)
+            # Start DI container (runs provider startup hooks), optionally
+            # instantiating every singleton before traffic arrives
             if di_container and hasattr(di_container, "startup"):
-                await di_container.startup()
+                if self._prewarm_di():
+                    await di_container.startup(prewarm=True)
+                else:
+                    await di_container.startup()
             
             # Call startup hook
             hook = ctx.on_startup
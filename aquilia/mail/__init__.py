@@ -82,6 +82,9 @@ from .providers import (
     SMTPProvider,
 )
 
+# ── Queue dispatch ─────────────────────────────────────────────────
+from .dispatcher import MailDispatcher, MAIL_TOPIC
+
 # ── DI providers ───────────────────────────────────────────────────
 from .di_providers import (
     MailConfigProvider,
@@ -139,6 +142,9 @@ __all__ = [
     "SendGridProvider",
     "SESProvider",
     "SMTPProvider",
+    # Queue dispatch
+    "MailDispatcher",
+    "MAIL_TOPIC",
     # DI
     "MailConfigProvider",
     "MailServiceProvider",
@@ -59,7 +59,11 @@ class ProviderConfigSerializer(Serializer):
     enabled = BooleanField(default=True, required=False)
     rate_limit_per_min = IntegerField(
         min_value=0, default=600, required=False,
-        help_text="Max messages per minute for this provider",
+        help_text="Max messages per minute for this provider (0 = unlimited)",
+    )
+    max_concurrency = IntegerField(
+        min_value=1, max_value=256, default=4, required=False,
+        help_text="Max batches sent to this provider in parallel",
     )
     config = DictField(default=dict, required=False, help_text="Extra provider-specific options")
 
@@ -151,7 +155,22 @@ class TemplateConfigSerializer(Serializer):
 class QueueConfigSerializer(Serializer):
     """Serializer for queue / storage settings."""
 
-    db_url = CharField(default="", required=False, help_text="Empty = use app main database")
+    enabled = BooleanField(
+        default=True, required=False,
+        help_text="Enqueue envelopes and deliver from background workers",
+    )
+    backend = ChoiceField(
+        choices=("memory", "sqlite"), default="memory", required=False,
+        help_text="Job store: in-process or SQLite-persisted",
+    )
+    concurrency = IntegerField(
+        min_value=1, max_value=256, default=2, required=False,
+        help_text="Dispatcher workers draining the mail queue",
+    )
+    db_url = CharField(
+        default="", required=False, allow_blank=True,
+        help_text="SQLite job store URL (empty = aquilia_mail_queue.sqlite3)",
+    )
     batch_size = IntegerField(min_value=1, max_value=10000, default=50, required=False)
     poll_interval = FloatField(min_value=0.1, max_value=60.0, default=1.0, required=False)
     dedupe_window_seconds = IntegerField(min_value=0, default=3600, required=False)
@@ -0,0 +1,304 @@
+"""
+AquilaMail Dispatcher — drains queued envelopes in provider batches.
+
+MailService enqueues each envelope as a ``mail.send`` job and returns
+immediately.  The dispatcher is registered as the batch handler for that
+topic: every worker claim is grouped by recipient domain and sent with
+``send_batch`` (chunked by ``max_batch_size``), with chunks running in
+parallel up to the provider's ``max_concurrency``.  Token buckets enforce
+the provider's ``rate_limit_per_min`` and the global / per-domain limits
+from ``MailConfig.rate_limit``; envelopes over the limit are reported as
+rate-limited so they fall through to the next provider or are retried
+once the bucket refills.
+
+Per-envelope results map back onto job outcomes:
+
+- success → job acknowledged
+- transient / rate-limited on every provider → retried with backoff
+  (``retry_after`` from the provider wins over the computed delay)
+- permanent failure → dead-lettered without further attempts
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from .envelope import EnvelopeStatus, MailEnvelope
+from .faults import MailSendFault
+from .providers import ProviderResult, ProviderResultStatus
+
+logger = logging.getLogger("aquilia.mail.dispatcher")
+
+MAIL_TOPIC = "mail.send"
+
+_DEFAULT_PROVIDER_CONCURRENCY = 4
+
+
+def encode_envelope(envelope: MailEnvelope, blobs: Optional[Dict[str, bytes]] = None) -> dict:
+    """Serialize an envelope and its attachment blobs into a JSON-safe job payload."""
+    return {
+        "envelope": envelope.to_dict(),
+        "blobs": {
+            digest: base64.b64encode(content).decode("ascii")
+            for digest, content in (blobs or {}).items()
+        },
+    }
+
+
+def decode_envelope(payload: dict) -> MailEnvelope:
+    """Rebuild an envelope from a job payload, restoring blobs for the provider."""
+    envelope = MailEnvelope.from_dict(payload["envelope"])
+    for digest, encoded in payload.get("blobs", {}).items():
+        envelope.metadata[f"blob:{digest}"] = base64.b64decode(encoded)
+    return envelope
+
+
+class _TokenBucket:
+    """Per-minute token bucket; capacity equals one minute of tokens."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, per_minute: int):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available(self) -> int:
+        self._refill()
+        return int(self.tokens)
+
+    def take(self, n: int) -> None:
+        self.tokens -= n
+
+    def wait_time(self) -> float:
+        """Seconds until one token is available."""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate) if self.rate else 60.0
+
+
+def _bucket(per_minute: Optional[int]) -> Optional[_TokenBucket]:
+    return _TokenBucket(per_minute) if per_minute else None
+
+
+def _unhandled_fault(envelope: MailEnvelope) -> MailSendFault:
+    """Transient outcome for an envelope no provider has handled (yet)."""
+    return MailSendFault(
+        "No mail provider handled the envelope",
+        transient=True,
+        envelope_id=envelope.id,
+    )
+
+
+def _primary_domain(envelope: MailEnvelope) -> str:
+    for addr in envelope.all_recipients():
+        if "@" in addr:
+            return addr.rsplit("@", 1)[1].strip(" >").lower()
+    return ""
+
+
+class MailDispatcher:
+    """
+    Batch handler for the ``mail.send`` topic.
+
+    Providers are tried in priority order; envelopes that fail transiently
+    (or are rate-limited) on one provider fall through to the next within
+    the same batch.
+    """
+
+    def __init__(self, service: Any):
+        self.service = service
+        rl = service.config.rate_limit
+        self._global_bucket = _bucket(rl.global_per_minute)
+        self._domain_limit = rl.per_domain_per_minute
+        self._domain_buckets: Dict[str, _TokenBucket] = {}
+        self._provider_buckets: Dict[str, Optional[_TokenBucket]] = {}
+        self._provider_slots: Dict[str, asyncio.Semaphore] = {}
+        self._stats = {
+            "batches": 0, "sent": 0, "transient": 0, "permanent": 0, "rate_limited": 0,
+        }
+
+    def register(self, queue: Any) -> None:
+        """Register as the ``mail.send`` batch handler on a JobQueue."""
+        from ..jobs import RetryPolicy
+
+        config = self.service.config
+        queue.register(
+            MAIL_TOPIC,
+            self.dispatch_batch,
+            batch=True,
+            batch_size=config.queue.batch_size,
+            concurrency=config.queue.concurrency,
+            retry=RetryPolicy.from_config(config.retry),
+        )
+
+    async def dispatch_batch(self, jobs: List[Any]) -> List[Optional[BaseException]]:
+        self._stats["batches"] += 1
+        envelopes = []
+        for job in jobs:
+            envelope = decode_envelope(job.payload)
+            envelope.attempts = job.attempts
+            envelopes.append(envelope)
+
+        providers = self.service.ordered_providers()
+        if not providers:
+            logger.error("No mail providers configured; scheduling retry for the batch")
+        # Every envelope counts as failed until a provider reports success.
+        outcomes: List[Optional[BaseException]] = [
+            _unhandled_fault(envelope) for envelope in envelopes
+        ]
+        pending = list(range(len(jobs)))
+        for provider in providers:
+            if not pending:
+                break
+            results = await self._send_via(provider, [envelopes[i] for i in pending])
+            retry_next: List[int] = []
+            for i, result in zip(pending, results):
+                envelope = envelopes[i]
+                envelope.provider_name = provider.name
+                if result.is_success:
+                    envelope.status = EnvelopeStatus.SENT
+                    envelope.provider_message_id = result.provider_message_id
+                    outcomes[i] = None
+                    self._stats["sent"] += 1
+                elif result.should_retry:
+                    fault = MailSendFault(
+                        f"Transient failure via {provider.name}: {result.error_message}",
+                        provider=provider.name,
+                        transient=True,
+                        envelope_id=envelope.id,
+                    )
+                    fault.retry_after = result.retry_after
+                    outcomes[i] = fault
+                    retry_next.append(i)
+                else:
+                    envelope.status = EnvelopeStatus.FAILED
+                    envelope.error_message = result.error_message
+                    outcomes[i] = MailSendFault(
+                        f"Permanent send failure via {provider.name}: "
+                        f"{result.error_message}",
+                        provider=provider.name,
+                        transient=False,
+                        envelope_id=envelope.id,
+                    )
+                    self._stats["permanent"] += 1
+            pending = retry_next
+
+        self._stats["transient"] += len(pending)
+        if pending:
+            logger.warning(
+                f"{len(pending)}/{len(jobs)} envelope(s) failed on every provider; "
+                f"scheduling retry"
+            )
+        return outcomes
+
+    async def _send_via(self, provider: Any, envelopes: List[MailEnvelope]) -> Sequence[ProviderResult]:
+        results: List[Optional[ProviderResult]] = [None] * len(envelopes)
+        by_domain: Dict[str, List[int]] = {}
+        for i, envelope in enumerate(envelopes):
+            by_domain.setdefault(_primary_domain(envelope), []).append(i)
+
+        batching = getattr(provider, "supports_batching", False)
+        size = max(1, getattr(provider, "max_batch_size", 0) or 1) if batching else 1
+        chunks: List[List[int]] = []
+        for domain, idxs in by_domain.items():
+            admitted, wait = self._admit(provider.name, domain, len(idxs))
+            for i in idxs[admitted:]:
+                results[i] = ProviderResult(
+                    status=ProviderResultStatus.RATE_LIMITED,
+                    error_message=f"Rate limit reached for {provider.name}/{domain}",
+                    retry_after=wait,
+                )
+            self._stats["rate_limited"] += len(idxs) - admitted
+            idxs = idxs[:admitted]
+            chunks.extend(idxs[start:start + size] for start in range(0, len(idxs), size))
+
+        slots = self._slots(provider.name)
+
+        async def _send_chunk(idxs: List[int]) -> None:
+            chunk = [envelopes[i] for i in idxs]
+            for envelope in chunk:
+                envelope.status = EnvelopeStatus.SENDING
+            async with slots:
+                try:
+                    if batching:
+                        outcome = await provider.send_batch(chunk)
+                    else:
+                        outcome = [await provider.send(chunk[0])]
+                except Exception as exc:
+                    outcome = [_transient(exc) for _ in chunk]
+            outcome = list(outcome)
+            if len(outcome) < len(chunk):
+                # A provider returning too few results must not leave holes
+                missing = RuntimeError(
+                    f"{provider.name} returned {len(outcome)} result(s) "
+                    f"for {len(chunk)} envelope(s)"
+                )
+                outcome.extend(_transient(missing) for _ in chunk[len(outcome):])
+            for i, result in zip(idxs, outcome):
+                results[i] = result
+
+        await asyncio.gather(*(_send_chunk(c) for c in chunks))
+        return results  # type: ignore[return-value]
+
+    def _admit(self, provider_name: str, domain: str, wanted: int) -> tuple:
+        """
+        Take up to ``wanted`` tokens from the global, domain and provider
+        buckets.  Returns ``(admitted, retry_after)``.
+        """
+        if provider_name not in self._provider_buckets:
+            self._provider_buckets[provider_name] = _bucket(self._provider_rate(provider_name))
+        buckets = [self._global_bucket, self._provider_buckets[provider_name]]
+        if self._domain_limit and domain:
+            if domain not in self._domain_buckets:
+                self._domain_buckets[domain] = _TokenBucket(self._domain_limit)
+            buckets.append(self._domain_buckets[domain])
+        buckets = [b for b in buckets if b is not None]
+        if not buckets:
+            return wanted, None
+        admitted = min(wanted, *(b.available() for b in buckets))
+        for b in buckets:
+            b.take(admitted)
+        wait = max(b.wait_time() for b in buckets) if admitted < wanted else None
+        return admitted, wait
+
+    def _provider_config(self, provider_name: str) -> Any:
+        for pc in self.service.config.providers:
+            if pc.name == provider_name:
+                return pc
+        return None
+
+    def _provider_rate(self, provider_name: str) -> Optional[int]:
+        override = self.service.config.rate_limit.per_provider_per_minute
+        if override is not None:
+            return override
+        pc = self._provider_config(provider_name)
+        return getattr(pc, "rate_limit_per_min", None) if pc is not None else None
+
+    def _slots(self, provider_name: str) -> asyncio.Semaphore:
+        slots = self._provider_slots.get(provider_name)
+        if slots is None:
+            pc = self._provider_config(provider_name)
+            limit = getattr(pc, "max_concurrency", None) if pc is not None else None
+            slots = asyncio.Semaphore(limit or _DEFAULT_PROVIDER_CONCURRENCY)
+            self._provider_slots[provider_name] = slots
+        return slots
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+
+def _transient(exc: Exception) -> ProviderResult:
+    return ProviderResult(
+        status=ProviderResultStatus.TRANSIENT_FAILURE,
+        error_message=str(exc),
+    )
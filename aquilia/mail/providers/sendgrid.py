@@ -10,7 +10,7 @@ Features:
 - Template ID support (SendGrid dynamic templates)
 - Proper error classification (rate-limit, invalid, auth)
 - Health-check via scopes endpoint
-- Batch sending via personalizations
+- Batch sending via personalizations (one request per shared content)
 - Sandbox mode for testing
 - Detailed structured logging
 
@@ -30,6 +30,7 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 from typing import Any, Dict, List, Optional, Sequence
@@ -75,6 +76,7 @@ class SendGridProvider:
         # Connection
         api_base_url: str = _SENDGRID_API_BASE,
         timeout: float = 30.0,
+        max_concurrency: int = 10,
         priority: int = 10,
     ):
         self.name = name
@@ -88,6 +90,7 @@ class SendGridProvider:
         self.template_id = template_id
         self.api_base_url = api_base_url.rstrip("/")
         self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
         self.priority = priority
 
         # HTTP client
@@ -383,17 +386,93 @@ class SendGridProvider:
         self, envelopes: Sequence[MailEnvelope],
     ) -> List[ProviderResult]:
         """
-        Send batch of envelopes.
+        Send a batch of envelopes.
 
-        SendGrid supports multiple personalizations in a single API call,
-        but only when the body content is identical. For safety, we send
-        each envelope individually.
+        SendGrid accepts up to 1000 personalizations per request as long as
+        the content is shared, so envelopes with identical sender, subject,
+        body and attachments go out in one API call; each personalization
+        keeps its own recipients, headers and envelope ID.  Requests run
+        concurrently, up to ``max_concurrency`` at a time.
         """
-        results: list[ProviderResult] = []
+        groups: Dict[tuple, List[int]] = {}
+        for i, envelope in enumerate(envelopes):
+            groups.setdefault(self._content_key(envelope), []).append(i)
+
+        results: List[Optional[ProviderResult]] = [None] * len(envelopes)
+        limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def _post(idxs: List[int]) -> None:
+            async with limit:
+                batch = [envelopes[i] for i in idxs]
+                if len(batch) == 1:
+                    outcome = [await self.send(batch[0])]
+                else:
+                    outcome = await self._send_personalized(batch)
+                for i, result in zip(idxs, outcome):
+                    results[i] = result
+
+        tasks = []
+        for idxs in groups.values():
+            for start in range(0, len(idxs), self.max_batch_size):
+                tasks.append(_post(idxs[start:start + self.max_batch_size]))
+        await asyncio.gather(*tasks)
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def _content_key(envelope: MailEnvelope) -> tuple:
+        return (
+            envelope.from_email,
+            envelope.reply_to,
+            envelope.subject,
+            envelope.body_text,
+            envelope.body_html,
+            envelope.tenant_id,
+            tuple(a.digest for a in envelope.attachments),
+        )
+
+    async def _send_personalized(self, envelopes: List[MailEnvelope]) -> List[ProviderResult]:
+        """One Mail Send request with a personalization per envelope."""
+        payload = self._build_payload(envelopes[0])
+        personalizations = []
         for envelope in envelopes:
-            result = await self.send(envelope)
-            results.append(result)
-        return results
+            personalization = self._build_payload(envelope)["personalizations"][0]
+            personalization["custom_args"] = {"aquilia_envelope_id": envelope.id}
+            personalizations.append(personalization)
+        payload["personalizations"] = personalizations
+        payload["custom_args"].pop("aquilia_envelope_id", None)
+
+        try:
+            response = await self._client.post(_SEND_ENDPOINT, json=payload)
+        except Exception as e:
+            self._total_errors += len(envelopes)
+            status, retry_after = self._classify_exception(e)
+            logger.warning(
+                f"SendGrid batch error via {self.name}: {e} (status={status.value})"
+            )
+            return [
+                ProviderResult(status=status, error_message=str(e), retry_after=retry_after)
+                for _ in envelopes
+            ]
+
+        if response.status_code not in (200, 201, 202):
+            result = self._handle_error_response(response, envelopes[0])
+            self._total_errors += len(envelopes) - 1
+            return [result for _ in envelopes]
+
+        message_id = response.headers.get("X-Message-Id", "")
+        self._total_sent += len(envelopes)
+        logger.info(
+            f"SendGrid sent via {self.name}: {len(envelopes)} envelope(s) "
+            f"in one request (sg_msg_id={message_id})"
+        )
+        return [
+            ProviderResult(
+                status=ProviderResultStatus.SUCCESS,
+                provider_message_id=message_id or f"sg-{envelope.id}",
+                raw_response={"status_code": response.status_code},
+            )
+            for envelope in envelopes
+        ]
 
     async def health_check(self) -> bool:
         """Check SendGrid API access via scopes endpoint."""
@@ -8,7 +8,8 @@ Features:
 - Configurable region, configuration-set, source-ARN
 - Proper error classification (throttle, bounce, permanent)
 - Health-check via SES GetAccount
-- Batch send with SES SendBulkEmail
+- Batch send with SES SendBulkEmail (identical content) and bounded
+  concurrent single sends for the rest
 - Detailed structured logging
 - Automatic MIME construction from MailEnvelope
 - Support for SES tags, configuration sets, feedback headers
@@ -32,6 +33,7 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 from email import encoders
 from email.mime.base import MIMEBase
@@ -54,6 +56,13 @@ _THROTTLE_CODES = frozenset({
     "MaxSendingRateExceeded",
 })
 
+# SendBulkEmail per-entry statuses that are worth retrying
+_BULK_RETRY_STATUSES = frozenset({
+    "ACCOUNT_THROTTLED",
+    "ACCOUNT_DAILY_QUOTA_EXCEEDED",
+    "TRANSIENT_FAILURE",
+})
+
 _PERMANENT_CODES = frozenset({
     "MessageRejected",
     "MailFromDomainNotVerifiedException",
@@ -92,6 +101,9 @@ class SESProvider:
         tags: Optional[Dict[str, str]] = None,
         # Sending mode
         use_raw: bool = True,
+        # Batching
+        use_bulk: bool = True,
+        max_concurrency: int = 10,
         # Connection
         endpoint_url: Optional[str] = None,
         priority: int = 10,
@@ -106,6 +118,8 @@ class SESProvider:
         self.return_path = return_path
         self.tags = tags or {}
         self.use_raw = use_raw
+        self.use_bulk = use_bulk
+        self.max_concurrency = max(1, max_concurrency)
         self.endpoint_url = endpoint_url
         self.priority = priority
 
@@ -409,11 +423,146 @@ class SESProvider:
     async def send_batch(
         self, envelopes: Sequence[MailEnvelope],
     ) -> List[ProviderResult]:
-        """Send batch via SES (falls back to sequential for raw mode)."""
-        results: list[ProviderResult] = []
+        """
+        Send a batch via SES.
+
+        Envelopes that share sender, subject and body (and carry no
+        attachments or custom headers) are sent with one ``SendBulkEmail``
+        call per 50 destinations, using inline template content.  Everything
+        else is sent individually, up to ``max_concurrency`` at a time.
+        """
+        results: List[Optional[ProviderResult]] = [None] * len(envelopes)
+        groups: Dict[tuple, List[int]] = {}
+        singles: List[int] = []
+        for i, envelope in enumerate(envelopes):
+            key = self._bulk_key(envelope) if self.use_bulk else None
+            if key is None:
+                singles.append(i)
+            else:
+                groups.setdefault(key, []).append(i)
+        for key, idxs in list(groups.items()):
+            if len(idxs) == 1:
+                singles.extend(groups.pop(key))
+
+        limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def _single(i: int) -> None:
+            async with limit:
+                results[i] = await self.send(envelopes[i])
+
+        async def _bulk(idxs: List[int]) -> None:
+            async with limit:
+                batch = [envelopes[i] for i in idxs]
+                for i, result in zip(idxs, await self._send_bulk(batch)):
+                    results[i] = result
+
+        tasks = [_single(i) for i in singles]
+        for idxs in groups.values():
+            for start in range(0, len(idxs), self.max_batch_size):
+                tasks.append(_bulk(idxs[start:start + self.max_batch_size]))
+        await asyncio.gather(*tasks)
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def _bulk_key(envelope: MailEnvelope) -> Optional[tuple]:
+        """Grouping key for SendBulkEmail, or None if the envelope can't be bulked."""
+        if envelope.attachments or envelope.headers:
+            return None
+        content = (envelope.subject, envelope.body_text, envelope.body_html or "")
+        # Inline template content is rendered by SES; braces would be
+        # interpreted as placeholders.
+        if any("{{" in part for part in content):
+            return None
+        return (envelope.from_email, envelope.reply_to, envelope.tenant_id, *content)
+
+    async def _send_bulk(self, envelopes: List[MailEnvelope]) -> List[ProviderResult]:
+        """Send envelopes with identical content via SES v2 SendBulkEmail."""
+        first = envelopes[0]
+        template: dict[str, Any] = {"Subject": first.subject}
+        if first.body_text:
+            template["Text"] = first.body_text
+        if first.body_html:
+            template["Html"] = first.body_html
+
+        entries = []
         for envelope in envelopes:
-            result = await self.send(envelope)
-            results.append(result)
+            destination: dict[str, Any] = {"ToAddresses": envelope.to}
+            if envelope.cc:
+                destination["CcAddresses"] = envelope.cc
+            if envelope.bcc:
+                destination["BccAddresses"] = envelope.bcc
+            entries.append({
+                "Destination": destination,
+                "ReplacementTags": [
+                    {"Name": "aquilia_envelope_id", "Value": envelope.id},
+                ],
+            })
+
+        kwargs: dict[str, Any] = {
+            "FromEmailAddress": first.from_email,
+            "DefaultContent": {
+                "Template": {
+                    "TemplateContent": template,
+                    "TemplateData": json.dumps({}),
+                },
+            },
+            "BulkEmailEntries": entries,
+        }
+        if first.reply_to:
+            kwargs["ReplyToAddresses"] = [first.reply_to]
+        if self.configuration_set:
+            kwargs["ConfigurationSetName"] = self.configuration_set
+        if self.source_arn:
+            kwargs["FromEmailAddressIdentityArn"] = self.source_arn
+        default_tags = [{"Name": k, "Value": v} for k, v in self.tags.items()]
+        if first.tenant_id:
+            default_tags.append({"Name": "aquilia_tenant_id", "Value": first.tenant_id})
+        if default_tags:
+            kwargs["DefaultEmailTags"] = default_tags
+
+        try:
+            response = await self._call_ses("send_bulk_email", **kwargs)
+        except Exception as e:
+            self._total_errors += len(envelopes)
+            status, retry_after = self._classify_error(e)
+            logger.warning(
+                f"SES bulk send error via {self.name}: {e} (status={status.value})"
+            )
+            return [
+                ProviderResult(status=status, error_message=str(e), retry_after=retry_after)
+                for _ in envelopes
+            ]
+
+        entry_results = response.get("BulkEmailEntryResults", [])
+        results: list[ProviderResult] = []
+        for i, envelope in enumerate(envelopes):
+            entry = entry_results[i] if i < len(entry_results) else {}
+            code = entry.get("Status", "FAILED")
+            if code == "SUCCESS":
+                self._total_sent += 1
+                results.append(ProviderResult(
+                    status=ProviderResultStatus.SUCCESS,
+                    provider_message_id=entry.get("MessageId", ""),
+                    raw_response=entry,
+                ))
+                continue
+            self._total_errors += 1
+            if code == "ACCOUNT_THROTTLED":
+                status, retry_after = ProviderResultStatus.RATE_LIMITED, 60.0
+            elif code in _BULK_RETRY_STATUSES:
+                status, retry_after = ProviderResultStatus.TRANSIENT_FAILURE, 30.0
+            else:
+                status, retry_after = ProviderResultStatus.PERMANENT_FAILURE, None
+            results.append(ProviderResult(
+                status=status,
+                error_message=f"{code}: {entry.get('Error', '')}".rstrip(": "),
+                retry_after=retry_after,
+                raw_response=entry,
+            ))
+        logger.info(
+            f"SES bulk sent via {self.name}: "
+            f"{sum(r.is_success for r in results)}/{len(envelopes)} accepted"
+        )
         return results
 
     async def health_check(self) -> bool:
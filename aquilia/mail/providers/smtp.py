@@ -9,7 +9,7 @@ Features:
 - TLS certificate validation (customisable)
 - Health-check via NOOP / EHLO
 - Proper multipart MIME with inline images (Content-ID)
-- Batch send with connection reuse
+- Batch send spread across pooled connections in parallel
 - Detailed structured logging and metrics
 - Graceful shutdown with connection draining
 
@@ -120,9 +120,10 @@ class SMTPProvider:
         self.pool_recycle = pool_recycle
         self.priority = priority
 
-        # Connection pool state
+        # Connection pool state; ``_slots`` caps connections checked out at once
         self._pool: list[Any] = []
         self._pool_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max(1, pool_size))
         self._pool_created: Dict[int, float] = {}  # id(conn) → timestamp
         self._initialized = False
 
@@ -214,7 +215,21 @@ class SMTPProvider:
         return smtp
 
     async def _acquire_connection(self) -> Any:
-        """Acquire a connection from the pool (or create a new one)."""
+        """
+        Acquire a connection from the pool (or create a new one).
+
+        Blocks while ``pool_size`` connections are already checked out;
+        every successful acquire must be paired with
+        :meth:`_release_connection` or :meth:`_discard_connection`.
+        """
+        await self._slots.acquire()
+        try:
+            return await self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _checkout(self) -> Any:
         async with self._pool_lock:
             now = time.monotonic()
             # Try to find a non-expired connection
@@ -240,12 +255,23 @@ class SMTPProvider:
 
     async def _release_connection(self, conn: Any) -> None:
         """Return a connection to the pool."""
-        async with self._pool_lock:
-            if len(self._pool) < self.pool_size:
-                self._pool.append(conn)
-                self._pool_created[id(conn)] = time.monotonic()
-            else:
-                await self._close_connection(conn)
+        try:
+            async with self._pool_lock:
+                if len(self._pool) < self.pool_size:
+                    self._pool.append(conn)
+                    self._pool_created[id(conn)] = time.monotonic()
+                else:
+                    await self._close_connection(conn)
+        finally:
+            self._slots.release()
+
+    async def _discard_connection(self, conn: Any) -> None:
+        """Close a broken connection instead of returning it to the pool."""
+        self._pool_created.pop(id(conn), None)
+        try:
+            await self._close_connection(conn)
+        finally:
+            self._slots.release()
 
     async def _close_connection(self, conn: Any) -> None:
         """Safely close an SMTP connection."""
@@ -401,12 +427,31 @@ class SMTPProvider:
         self, envelopes: Sequence[MailEnvelope],
     ) -> List[ProviderResult]:
         """
-        Send a batch of envelopes, reusing a single connection.
+        Send a batch of envelopes across up to ``pool_size`` connections.
 
-        Falls back to individual sends on connection error.
+        The batch is split into contiguous lanes (preserving any grouping by
+        recipient domain done by the dispatcher); each lane reuses one
+        pooled connection and the lanes run in parallel.  Results keep the
+        input order.
         """
+        envelopes = list(envelopes)
+        if not envelopes:
+            return []
+        lanes = min(self.pool_size, len(envelopes)) or 1
+        size = -(-len(envelopes) // lanes)
+        chunks = [envelopes[i:i + size] for i in range(0, len(envelopes), size)]
+        if len(chunks) == 1:
+            return await self._send_lane(chunks[0])
+        lane_results = await asyncio.gather(*(self._send_lane(c) for c in chunks))
+        return [result for lane in lane_results for result in lane]
+
+    async def _send_lane(
+        self, envelopes: Sequence[MailEnvelope],
+    ) -> List[ProviderResult]:
+        """Send envelopes sequentially over a single pooled connection."""
         results: list[ProviderResult] = []
         conn = None
+        broken = False
         try:
             conn = await self._acquire_connection()
             for envelope in envelopes:
@@ -431,10 +476,10 @@ class SMTPProvider:
                         error_message=str(e),
                         retry_after=retry_after,
                     ))
-                    # If connection-level error, break out of batch
+                    # If connection-level error, abort the rest of this lane
                     if self._is_connection_error(e):
-                        conn = None
-                        for remaining in envelopes[len(results):]:
+                        broken = True
+                        for _ in envelopes[len(results):]:
                             results.append(ProviderResult(
                                 status=ProviderResultStatus.TRANSIENT_FAILURE,
                                 error_message="Batch aborted due to connection error",
@@ -450,7 +495,10 @@ class SMTPProvider:
         finally:
             if conn is not None:
                 try:
-                    await self._release_connection(conn)
+                    if broken:
+                        await self._discard_connection(conn)
+                    else:
+                        await self._release_connection(conn)
                 except Exception:
                     pass
 
@@ -460,10 +508,15 @@ class SMTPProvider:
         """Check SMTP connectivity via NOOP."""
         try:
             conn = await self._acquire_connection()
+        except Exception as e:
+            logger.debug(f"SMTP health check failed: {e}")
+            return False
+        try:
             await conn.noop()
             await self._release_connection(conn)
             return True
         except Exception as e:
+            await self._discard_connection(conn)
             logger.debug(f"SMTP health check failed: {e}")
             return False
 
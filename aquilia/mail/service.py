@@ -132,25 +132,29 @@ class MailService:
 
     Lifecycle:
         AquiliaServer.__init__  →  MailService created, registered in DI
-        AquiliaServer.startup   →  MailService.on_startup (connect providers)
+        AquiliaServer.startup   →  MailService.on_startup (connect providers,
+                                   start the mail job queue)
         AquiliaServer.shutdown  →  MailService.on_shutdown (flush + disconnect)
 
     Responsibilities:
         - Accept EmailMessage / TemplateMessage objects
-        - Build envelopes, store in queue, dispatch
+        - Build envelopes, enqueue them as ``mail.send`` jobs; the
+          MailDispatcher drains the queue in provider batches
         - Manage providers, rate limits, retries
         - Expose metrics and trace spans
     """
 
-    def __init__(self, config: Optional[MailConfig] = None):
+    def __init__(self, config: Optional[MailConfig] = None, job_queue: Any = None):
         self.config = config or MailConfig()
         self._providers: Dict[str, Any] = {}  # name → IMailProvider
+        self._ordered_providers: List[Any] = []  # sorted by priority
         self._started = False
         self.logger = logger
 
         # Sub-components (initialized lazily or at startup)
         self._store = None  # EnvelopeStore
-        self._dispatcher = None  # Dispatcher
+        self._queue = job_queue  # JobQueue (created at startup if None)
+        self._dispatcher = None  # MailDispatcher
         self._template_renderer = None  # ATS renderer
 
     # ── Lifecycle ───────────────────────────────────────────────────
@@ -182,6 +186,12 @@ class MailService:
             self._providers["console"] = cp
             self.logger.info("  ✓ Console provider (dev mode)")
 
+        self._sort_providers()
+
+        # Background delivery: handlers enqueue, the dispatcher drains
+        if self.config.queue.enabled and not self.config.preview_mode:
+            await self._start_queue()
+
         self._started = True
         self.logger.info(
             f"📧 MailService ready ({len(self._providers)} provider(s))"
@@ -192,15 +202,61 @@ class MailService:
         if not self._started:
             return
         self.logger.info("📧 MailService shutting down...")
+        if self._queue is not None and self._dispatcher is not None:
+            try:
+                await self._queue.stop(drain=True)
+            except Exception as e:
+                self.logger.warning(f"  Mail queue shutdown error: {e}")
         for name, provider in self._providers.items():
             try:
                 await provider.shutdown()
             except Exception as e:
                 self.logger.warning(f"  Provider '{name}' shutdown error: {e}")
         self._providers.clear()
+        self._ordered_providers = []
         self._started = False
         self.logger.info("📧 MailService stopped")
 
+    async def _start_queue(self) -> None:
+        """Create (if needed) and start the job queue with the mail dispatcher."""
+        from ..jobs import JobQueue, RetryPolicy, create_backend
+        from .dispatcher import MailDispatcher
+
+        qc = self.config.queue
+        if self._queue is None:
+            self._queue = JobQueue(
+                create_backend(
+                    qc.backend,
+                    qc.db_url or "sqlite:///aquilia_mail_queue.sqlite3",
+                ),
+                retry=RetryPolicy.from_config(self.config.retry),
+                poll_interval=qc.poll_interval,
+            )
+        self._dispatcher = MailDispatcher(self)
+        self._dispatcher.register(self._queue)
+        await self._queue.start()
+        self.logger.info(
+            f"  ✓ Mail queue ({qc.backend}, concurrency={qc.concurrency}, "
+            f"batch_size={qc.batch_size})"
+        )
+
+    def _sort_providers(self) -> None:
+        self._ordered_providers = sorted(
+            self._providers.values(),
+            key=lambda p: getattr(p, "priority", 50),
+        )
+
+    def ordered_providers(self) -> List[Any]:
+        """Providers in preference order (lower priority value first)."""
+        if len(self._ordered_providers) != len(self._providers):
+            self._sort_providers()
+        return self._ordered_providers
+
+    @property
+    def job_queue(self) -> Any:
+        """The JobQueue backing mail delivery (None when sending directly)."""
+        return self._queue
+
     # ── Provider factory ────────────────────────────────────────────
 
     def _create_provider(self, pc: Any) -> Any:
@@ -223,6 +279,7 @@ class MailService:
                 use_tls=pc.use_tls,
                 use_ssl=pc.use_ssl,
                 timeout=pc.timeout,
+                pool_size=pc.config.get("pool_size", 3),
             )
         elif pc.type == "ses":
             from .providers.ses import SESProvider
@@ -277,12 +334,12 @@ class MailService:
         Accept an EmailMessage, build envelope, dispatch.
 
         This is the main entry point used by message.send() / .asend().
+        When the mail queue is running the envelope is enqueued and this
+        returns immediately; delivery happens in the MailDispatcher.
 
         Returns:
             envelope_id
         """
-        from .message import EmailMessage
-
         envelope, blobs = message.build_envelope(
             default_from=self.config.default_from,
         )
@@ -302,8 +359,19 @@ class MailService:
             envelope.status = EnvelopeStatus.SENT
             return envelope.id
 
-        # Direct dispatch (synchronous send for now; PR5 adds queue + dispatcher)
-        result = await self._dispatch_direct(envelope)
+        if self._queue is not None and self._queue.running and self._dispatcher is not None:
+            from .dispatcher import MAIL_TOPIC, encode_envelope
+            await self._queue.enqueue(
+                MAIL_TOPIC,
+                encode_envelope(envelope, blobs),
+                priority=envelope.priority,
+            )
+            return envelope.id
+
+        # No running queue (not started, or queue disabled): send inline
+        for digest, content in blobs.items():
+            envelope.metadata[f"blob:{digest}"] = content
+        await self._dispatch_direct(envelope)
         return envelope.id
 
     async def _dispatch_direct(self, envelope: MailEnvelope) -> None:
@@ -325,14 +393,8 @@ class MailService:
                     config_key="mail.providers",
                 )
 
-        # Sort providers by priority (lower = preferred)
-        sorted_providers = sorted(
-            self._providers.values(),
-            key=lambda p: getattr(p, "priority", 50),
-        )
-
         last_error: Optional[Exception] = None
-        for provider in sorted_providers:
+        for provider in self.ordered_providers():
             try:
                 envelope.status = EnvelopeStatus.SENDING
                 envelope.provider_name = provider.name
@@ -389,6 +451,15 @@ class MailService:
         """Return names of registered providers."""
         return list(self._providers.keys())
 
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """Job-queue and dispatcher counters (empty when sending directly)."""
+        if self._queue is None:
+            return {}
+        stats = self._queue.get_stats()
+        if self._dispatcher is not None:
+            stats["dispatcher"] = self._dispatcher.get_stats()
+        return stats
+
     def is_healthy(self) -> bool:
         """Quick health check."""
         return self._started and len(self._providers) > 0
@@ -36,11 +36,25 @@ class MiddlewareStack:
     """
     Manages middleware stack with deterministic ordering.
     Order: Global < App < Controller < Route, then by priority.
+
+    Scopes decide where a middleware runs:
+
+    - ``global``               every request, including unmatched ones
+    - ``app:<name>``           routes whose ``app_name`` is ``name``
+    - ``controller:<name>``    routes of the controller class ``name``
+                               (class name or ``module:Class`` path)
+    - ``route:<pattern>``      the route whose full path is ``pattern``
+                               (optionally prefixed ``"GET /path"``)
+
+    ``build_route_handler`` compiles a chain holding only the middleware
+    that applies to one route; ``build_handler`` keeps the legacy
+    behaviour of wrapping everything.
     """
     
     def __init__(self):
         self.middlewares: List[MiddlewareDescriptor] = []
         self._sorted = True  # Track if sorting is needed
+        self._version = 0
     
     def add(
         self,
@@ -62,6 +76,12 @@ class MiddlewareStack:
         
         self.middlewares.append(descriptor)
         self._sorted = False  # Defer sorting until build_handler()
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Bumped on every ``add()`` so compiled chains know they are stale."""
+        return self._version
     
     def _sort_middlewares(self):
         """Sort middlewares by scope and priority."""
@@ -73,26 +93,73 @@ class MiddlewareStack:
             return (scope_rank, desc.priority)
         
         self.middlewares.sort(key=sort_key)
+
+    def _ensure_sorted(self):
+        if not self._sorted:
+            self._sort_middlewares()
+            self._sorted = True
+
+    @staticmethod
+    def scope_applies(scope: str, route: Any) -> bool:
+        """
+        Whether a middleware registered with ``scope`` runs for ``route``.
+
+        ``route`` is a ``CompiledRoute`` or ``None`` for requests that
+        matched no route, which only see global middleware.  Unknown scope
+        kinds are treated as global so third-party scopes keep running.
+        """
+        kind, _, target = scope.partition(":")
+        if kind == "global":
+            return True
+        if kind not in ("app", "controller", "route"):
+            return True
+        if route is None:
+            return False
+        if kind == "app":
+            return getattr(route, "app_name", None) == target
+        if kind == "controller":
+            cls = route.controller_class
+            return target in (cls.__name__, f"{cls.__module__}:{cls.__name__}")
+        method, _, path = target.rpartition(" ")
+        if method and method.upper() != route.http_method:
+            return False
+        return path == route.full_path or path.rstrip("/") == route.full_path.rstrip("/")
+
+    def descriptors_for(self, route: Any) -> List[MiddlewareDescriptor]:
+        """Sorted descriptors whose scope applies to ``route`` (None = unmatched)."""
+        self._ensure_sorted()
+        return [d for d in self.middlewares if self.scope_applies(d.scope, route)]
     
     def build_handler(self, final_handler: Handler) -> Handler:
         """Build middleware chain wrapping the final handler."""
         # Sort only if needed (deferred from add())
-        if not self._sorted:
-            self._sort_middlewares()
-            self._sorted = True
-        
+        self._ensure_sorted()
+        return self._compose(self.middlewares, final_handler)
+
+    def build_route_handler(self, route: Any, final_handler: Handler) -> Handler:
+        """
+        Build the chain for a single route, containing only the middleware
+        whose scope applies to it.  Pass ``route=None`` for the 404 chain.
+        """
+        return self._compose(self.descriptors_for(route), final_handler)
+
+    def _compose(self, descriptors: List[MiddlewareDescriptor], final_handler: Handler) -> Handler:
         handler = final_handler
-        
         # Wrap in reverse order so first middleware is outermost
-        for desc in reversed(self.middlewares):
+        for desc in reversed(descriptors):
             handler = self._wrap_middleware(desc.middleware, handler)
-        
         return handler
     
     def _wrap_middleware(self, middleware: Middleware, next_handler: Handler) -> Handler:
-        """Wrap a handler with middleware."""
-        async def wrapped(request: Request, ctx: RequestCtx) -> Response:
-            return await middleware(request, ctx, next_handler)
+        """
+        Wrap a handler with middleware.
+
+        The link is a plain function returning the middleware's awaitable
+        rather than an ``async def`` awaiting it, so each level costs one
+        coroutine (the middleware's own) instead of two.
+        """
+        def wrapped(request: Request, ctx: RequestCtx) -> Awaitable[Response]:
+            return middleware(request, ctx, next_handler)
         
         return wrapped
 
@@ -295,8 +362,13 @@ class ExceptionMiddleware:
             )
         
         except Exception as e:
-            # Internal error — 500
-            self.logger.error(f"Unhandled exception: {e}", exc_info=True)
+            # Internal error — 500 (already logged/aggregated if the
+            # FaultEngine processed it)
+            trace_id = getattr(e, "_aquilia_fault_trace_id", None)
+            if trace_id is None:
+                self.logger.error(f"Unhandled exception: {e}", exc_info=True)
+            else:
+                self.logger.debug(f"Unhandled exception: {e} (fault {trace_id})")
 
             if self.debug and self._wants_html(request):
                 return self._render_debug_exception(e, request)
@@ -317,11 +389,18 @@ class LoggingMiddleware:
     - Checks logger.isEnabledFor(INFO) once; skips all work if disabled.
     - Only formats strings when actually logging.
     - Skips per-request 'extra' dict allocation when not needed.
+    - With a ``pipeline`` (``aquilia.middleware_ext.access_log``), only a
+      record is queued; formatting and handler I/O happen off the loop.
     """
 
-    def __init__(self):
+    def __init__(self, pipeline: Optional[Any] = None):
         self.logger = logging.getLogger("aquilia.requests")
         self._log_enabled: bool = True  # Updated lazily
+        self.pipeline = pipeline
+        if pipeline is not None:
+            from .middleware_ext.access_log import AccessRecord
+
+            self._record = AccessRecord
 
     async def __call__(self, request: Request, ctx: RequestCtx, next: Handler) -> Response:
         if not self.logger.isEnabledFor(logging.INFO):
@@ -331,6 +410,14 @@ class LoggingMiddleware:
         response = await next(request, ctx)
         elapsed_ms = (time.monotonic() - start) * 1000.0
 
+        if self.pipeline is not None:
+            slow = elapsed_ms > 1000
+            self.pipeline.record(self._record(
+                request.method, request.path, response.status, elapsed_ms,
+                level=logging.WARNING if slow else logging.INFO, slow=slow,
+            ))
+            return response
+
         self.logger.info(
             "%s %s - %d (%.1fms)",
             request.method, request.path, response.status, elapsed_ms,
@@ -441,9 +528,11 @@ class CompressionMiddleware:
         if "gzip" not in accept_encoding.lower():
             return response
         
-        # Don't compress streaming responses
+        # Don't compress streaming or already-encoded responses
         if hasattr(response._content, "__aiter__"):
             return response
+        if "content-encoding" in response.headers:
+            return response
         
         # Get body
         body = response._encode_body(response._content)
@@ -45,6 +45,10 @@ from .security import (
 from .rate_limit import (
     RateLimitMiddleware,
     RateLimitRule,
+    GCRAStore,
+    MemoryGCRAStore,
+    RedisGCRAStore,
+    LeasedGCRAStore,
     ip_key_extractor,
     api_key_extractor,
     user_key_extractor,
@@ -56,6 +60,15 @@ from .logging import (
     StructuredLogFormatter,
     DevLogFormatter,
 )
+from .access_log import (
+    AccessLogPipeline,
+    AccessRecord,
+    AccessLogSink,
+    LoggerSink,
+    StreamSink,
+    FileSink,
+    RequestLineFormatter,
+)
 
 __all__ = [
     # Core
@@ -77,6 +90,10 @@ __all__ = [
     # Rate Limiting
     "RateLimitMiddleware",
     "RateLimitRule",
+    "GCRAStore",
+    "MemoryGCRAStore",
+    "RedisGCRAStore",
+    "LeasedGCRAStore",
     "ip_key_extractor",
     "api_key_extractor",
     "user_key_extractor",
@@ -87,4 +104,11 @@ __all__ = [
     "CombinedLogFormatter",
     "StructuredLogFormatter",
     "DevLogFormatter",
+    "AccessLogPipeline",
+    "AccessRecord",
+    "AccessLogSink",
+    "LoggerSink",
+    "StreamSink",
+    "FileSink",
+    "RequestLineFormatter",
 ]
@@ -0,0 +1,298 @@
+"""
+Access Log Pipeline - Off-loop, batched access logging.
+
+The request coroutine only records a compact slotted ``AccessRecord``
+into a fixed-size ring buffer (no formatting, no I/O, no locks — the
+ring is only touched from the event loop).  A background task drains
+the ring in batches and hands each batch to a single worker thread that
+formats the lines (orjson for structured output when installed) and
+writes them to the sinks, so a slow file, pipe or syslog handler never
+stalls the loop.
+
+Backpressure: when sinks fall behind the ring fills up and new records
+are dropped and counted instead of queueing without bound.  Successful
+fast requests can be sampled (``sample_rate``); errors and slow
+requests are always kept.
+
+Usage:
+    pipeline = AccessLogPipeline(StructuredLogFormatter(), [StreamSink(sys.stdout)])
+    app.middleware_stack.add(LoggingMiddleware(pipeline=pipeline), ...)
+    pipeline.stats()   # {"recorded": ..., "dropped": ..., "sampled_out": ..., ...}
+    await pipeline.aclose()   # drain on shutdown
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, IO, List, Optional, Sequence, Tuple
+
+__all__ = [
+    "AccessRecord",
+    "AccessLogPipeline",
+    "AccessLogSink",
+    "LoggerSink",
+    "StreamSink",
+    "FileSink",
+    "RequestLineFormatter",
+]
+
+_logger = logging.getLogger("aquilia.access_log")
+
+
+class AccessRecord:
+    """One request, as captured on the hot path (formatted later)."""
+
+    __slots__ = (
+        "timestamp", "method", "path", "status", "duration_ms",
+        "content_length", "client_ip", "user_agent", "referer",
+        "request_id", "extras", "level", "slow",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        status: int,
+        duration_ms: float,
+        content_length: int = 0,
+        client_ip: str = "-",
+        user_agent: str = "-",
+        referer: str = "-",
+        request_id: str = "-",
+        extras: Optional[Dict[str, Any]] = None,
+        level: int = logging.INFO,
+        slow: bool = False,
+    ):
+        self.timestamp = time.time()
+        self.method = method
+        self.path = path
+        self.status = status
+        self.duration_ms = duration_ms
+        self.content_length = content_length
+        self.client_ip = client_ip
+        self.user_agent = user_agent
+        self.referer = referer
+        self.request_id = request_id
+        self.extras = extras
+        self.level = level
+        self.slow = slow
+
+
+class RequestLineFormatter:
+    """The core ``LoggingMiddleware`` line: ``GET /path - 200 (1.2ms)``."""
+
+    def format_record(self, record: AccessRecord) -> str:
+        line = f"{record.method} {record.path} - {record.status} ({record.duration_ms:.1f}ms)"
+        return f"{line} SLOW" if record.slow else line
+
+
+# ─── Sinks ────────────────────────────────────────────────────────────────────
+
+class AccessLogSink:
+    """Destination for formatted lines; ``write`` runs on the worker thread."""
+
+    def write(self, lines: Sequence[Tuple[int, str]]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class LoggerSink(AccessLogSink):
+    """Emit each line through a stdlib logger at the record's level."""
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+
+    def write(self, lines: Sequence[Tuple[int, str]]) -> None:
+        log = self.logger.log
+        for level, line in lines:
+            log(level, line)
+
+
+class StreamSink(AccessLogSink):
+    """Write a whole batch to a text stream with one ``write`` call."""
+
+    def __init__(self, stream: Optional[IO[str]] = None):
+        self.stream = stream or sys.stdout
+
+    def write(self, lines: Sequence[Tuple[int, str]]) -> None:
+        self.stream.write("".join(line + "\n" for _, line in lines))
+        self.stream.flush()
+
+
+class FileSink(StreamSink):
+    """Append to a file (opened once, line-buffered by batches)."""
+
+    def __init__(self, path: str):
+        super().__init__(open(path, "a", encoding="utf-8"))
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+# ─── Pipeline ─────────────────────────────────────────────────────────────────
+
+class AccessLogPipeline:
+    """
+    Ring buffer + background flusher for access records.
+
+    Args:
+        formatter: Object with ``format_record(record) -> str``.
+        sinks: Where formatted lines go.
+        capacity: Ring size; records beyond it are dropped and counted.
+        batch_size: Records per formatting/flush batch.
+        flush_interval: Max seconds a record waits before being flushed.
+        sample_rate: Fraction of 1xx-4xx, non-slow requests kept.
+    """
+
+    def __init__(
+        self,
+        formatter: Any,
+        sinks: Sequence[AccessLogSink],
+        *,
+        capacity: int = 8192,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        sample_rate: float = 1.0,
+    ):
+        self.formatter = formatter
+        self.sinks = list(sinks)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sample_rate = sample_rate
+
+        self._ring: List[Optional[AccessRecord]] = [None] * capacity
+        self._capacity = capacity
+        self._head = 0  # next slot to read
+        self._tail = 0  # next slot to write
+        self._size = 0
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.recorded = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.written = 0
+        self.sink_errors = 0
+
+    # ── Hot path (event loop) ────────────────────────────────────────
+
+    def record(self, record: AccessRecord) -> None:
+        """Queue a record; never blocks and never formats."""
+        if (
+            self.sample_rate < 1.0
+            and record.status < 500
+            and not record.slow
+            and random.random() >= self.sample_rate
+        ):
+            self.sampled_out += 1
+            return
+        if self._size >= self._capacity:
+            self.dropped += 1
+            return
+
+        self._ring[self._tail] = record
+        self._tail = (self._tail + 1) % self._capacity
+        self._size += 1
+        self.recorded += 1
+
+        if self._task is None or self._task.done() or self._loop is not asyncio.get_running_loop():
+            self._start()
+        elif self._size == self.batch_size:
+            self._wakeup.set()
+
+    def _start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aquilia-access-log")
+        self._task = self._loop.create_task(self._run())
+
+    def _take(self, limit: int) -> List[AccessRecord]:
+        n = min(limit, self._size)
+        ring, head, cap = self._ring, self._head, self._capacity
+        batch = []
+        for _ in range(n):
+            batch.append(ring[head])
+            ring[head] = None
+            head = (head + 1) % cap
+        self._head = head
+        self._size -= n
+        return batch
+
+    # ── Background side ──────────────────────────────────────────────
+
+    async def _run(self) -> None:
+        while True:
+            if self._size < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+            if not self._size:
+                continue
+            await self._flush_batch(self._take(self.batch_size))
+
+    async def _flush_batch(self, batch: List[AccessRecord]) -> None:
+        # Waiting for the worker is the backpressure: while it writes,
+        # new records pile up in the ring (and drop once it is full).
+        await self._loop.run_in_executor(self._executor, self._write, batch)
+
+    def _write(self, batch: List[AccessRecord]) -> None:
+        fmt = self.formatter.format_record
+        lines = []
+        for record in batch:
+            try:
+                lines.append((record.level, fmt(record)))
+            except Exception as exc:
+                _logger.debug(f"Access log formatting failed: {exc}")
+        for sink in self.sinks:
+            try:
+                sink.write(lines)
+            except Exception as exc:
+                self.sink_errors += 1
+                _logger.warning(f"Access log sink {type(sink).__name__} failed: {exc}")
+        self.written += len(lines)
+
+    async def flush(self) -> None:
+        """Write out everything currently queued."""
+        while self._size:
+            if self._loop is None:
+                self._start()
+            await self._flush_batch(self._take(self.batch_size))
+
+    async def aclose(self) -> None:
+        """Drain, stop the flusher and release the worker thread and sinks."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for sink in self.sinks:
+            sink.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "written": self.written,
+            "queued": self._size,
+            "sink_errors": self.sink_errors,
+        }
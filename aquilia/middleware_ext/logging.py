@@ -11,6 +11,7 @@ Features:
 - User agent and referer logging
 - Color-coded terminal output (dev mode)
 - Log filtering by path pattern (skip health checks)
+- Optional off-loop, batched output via ``AccessLogPipeline``
 
 Follows the Aquilia async middleware signature:
     async def __call__(self, request, ctx, next) -> Response
@@ -35,6 +36,19 @@ from typing import (
 from aquilia.request import Request
 from aquilia.response import Response
 
+from .access_log import AccessLogPipeline, AccessRecord
+
+try:
+    import orjson
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:  # pragma: no cover
+    import json
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return json.dumps(obj, default=str)
+
 if TYPE_CHECKING:
     from aquilia.controller.base import RequestCtx
 
@@ -99,15 +113,41 @@ class _LogFormatter:
         referer: str,
         request_id: str,
         extras: Dict[str, Any],
+        timestamp: Optional[float] = None,
     ) -> str:
         raise NotImplementedError
 
+    def format_record(self, record: AccessRecord) -> str:
+        """Format a queued ``AccessRecord`` (pipeline worker thread)."""
+        line = self.format_request(
+            method=record.method,
+            path=record.path,
+            status=record.status,
+            duration_ms=record.duration_ms,
+            content_length=record.content_length,
+            client_ip=record.client_ip,
+            user_agent=record.user_agent,
+            referer=record.referer,
+            request_id=record.request_id,
+            extras=record.extras or {},
+            timestamp=record.timestamp,
+        )
+        if record.slow and record.status < 500:
+            return f"SLOW {line}"
+        return line
+
+
+def _utc(timestamp: Optional[float]) -> datetime:
+    if timestamp is None:
+        return datetime.now(timezone.utc)
+    return datetime.fromtimestamp(timestamp, timezone.utc)
+
 
 class CombinedLogFormatter(_LogFormatter):
     """Apache Combined Log Format."""
 
     def format_request(self, **kwargs: Any) -> str:
-        now = datetime.now(timezone.utc).strftime("%d/%b/%Y:%H:%M:%S %z")
+        now = _utc(kwargs.get("timestamp")).strftime("%d/%b/%Y:%H:%M:%S %z")
         return (
             f'{kwargs["client_ip"]} - - [{now}] '
             f'"{kwargs["method"]} {kwargs["path"]} HTTP/1.1" '
@@ -118,13 +158,11 @@ class CombinedLogFormatter(_LogFormatter):
 
 
 class StructuredLogFormatter(_LogFormatter):
-    """JSON-structured log output."""
+    """JSON-structured log output (orjson when installed)."""
 
     def format_request(self, **kwargs: Any) -> str:
-        import json
-
         record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc(kwargs.get("timestamp")).isoformat(),
             "method": kwargs["method"],
             "path": kwargs["path"],
             "status": kwargs["status"],
@@ -138,7 +176,7 @@ class StructuredLogFormatter(_LogFormatter):
         if kwargs["referer"]:
             record["referer"] = kwargs["referer"]
         record.update(kwargs.get("extras", {}))
-        return json.dumps(record, default=str)
+        return _dumps(record)
 
 
 class DevLogFormatter(_LogFormatter):
@@ -181,6 +219,9 @@ class LoggingMiddleware:
         skip_paths: Paths to skip logging (e.g. health checks).
         log_request_body: Log request body size.
         include_headers: List of request headers to include in log.
+        pipeline: Optional ``AccessLogPipeline``; when given, requests are
+            only recorded here and formatted/written in batches off the
+            event loop (its formatter is used instead of ``format``).
     """
 
     def __init__(
@@ -193,6 +234,7 @@ class LoggingMiddleware:
         skip_paths: Optional[Set[str]] = None,
         log_request_body: bool = False,
         include_headers: Optional[List[str]] = None,
+        pipeline: Optional[AccessLogPipeline] = None,
     ):
         self.logger = logging.getLogger(logger_name)
         self._level = level
@@ -211,6 +253,7 @@ class LoggingMiddleware:
             }.get(format, DevLogFormatter)()
         else:
             self._formatter = format
+        self.pipeline = pipeline
 
     async def __call__(
         self,
@@ -258,6 +301,25 @@ class LoggingMiddleware:
         except (ValueError, TypeError):
             pass
 
+        status = response.status
+        slow = duration_ms > self._slow_threshold
+        if self.pipeline is not None:
+            self.pipeline.record(AccessRecord(
+                request.method,
+                request.path,
+                status,
+                duration_ms,
+                content_length,
+                client_ip,
+                request.header("user-agent") or "-",
+                request.header("referer") or "-",
+                getattr(ctx, "request_id", "-"),
+                extras,
+                self._error_level if status >= 500 else logging.WARNING if slow else self._level,
+                slow,
+            ))
+            return response
+
         log_line = self._formatter.format_request(
             method=request.method,
             path=request.path,
@@ -272,9 +334,9 @@ class LoggingMiddleware:
         )
 
         # Choose log level
-        if response.status >= 500:
+        if status >= 500:
             self.logger.log(self._error_level, log_line)
-        elif duration_ms > self._slow_threshold:
+        elif slow:
             self.logger.warning(f"SLOW {log_line}")
         else:
             self.logger.log(self._level, log_line)
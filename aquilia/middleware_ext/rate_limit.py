@@ -11,8 +11,12 @@ Features:
 - Multiple limit tiers (global, per-route, per-user)
 - Retry-After header computation
 - Configurable response format (JSON / plain)
-- Memory-efficient storage with automatic expiration (O(1) amortized)
+- Memory-efficient storage with timing-wheel expiration (no full scans)
 - Thread-safe via dict-level atomicity in CPython
+- Shared mode: GCRA over a cache backend (atomic Lua script on Redis),
+  so N workers enforce one limit instead of N× the limit
+- Token leasing: each worker claims a small batch of tokens per round
+  trip to the shared store and serves most requests locally
 
 All middleware follow the Aquilia async signature:
     async def __call__(self, request, ctx, next) -> Response
@@ -20,6 +24,8 @@ All middleware follow the Aquilia async signature:
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import math
 import time
 from collections import defaultdict
@@ -43,6 +49,8 @@ if TYPE_CHECKING:
 
 Handler = Callable[[Request, "RequestCtx"], Awaitable[Response]]
 
+logger = logging.getLogger("aquilia.middleware.rate_limit")
+
 
 # ─── Key extractors ──────────────────────────────────────────────────────────
 
@@ -212,48 +220,306 @@ class _SlidingWindowCounter:
         return self._curr_start + self.window_size
 
 
+# ─── Timing wheel ─────────────────────────────────────────────────────────────
+
+class _TimingWheel:
+    """
+    Expires idle keys without scanning the whole store.
+
+    Each key sits in the slot of its deadline.  ``touch()`` only moves the
+    deadline; when a slot comes due, ``advance()`` evicts the keys whose
+    deadline has passed and re-files the ones touched since, so every key
+    is looked at about once per idle period.
+    """
+
+    __slots__ = ("_tick", "_slots", "_deadlines", "_cursor", "_on_expire")
+
+    def __init__(self, span: float, on_expire: Callable[[str], Any], tick: float = 1.0):
+        self._tick = tick
+        self._slots: List[set] = [set() for _ in range(int(math.ceil(span / tick)) + 2)]
+        self._deadlines: Dict[str, float] = {}
+        self._cursor = int(time.monotonic() / tick)
+        self._on_expire = on_expire
+
+    def touch(self, key: str, deadline: float) -> None:
+        if key not in self._deadlines:
+            self._slots[int(deadline / self._tick) % len(self._slots)].add(key)
+        self._deadlines[key] = deadline
+
+    def discard(self, key: str) -> None:
+        self._deadlines.pop(key, None)
+
+    def advance(self, now: float) -> None:
+        target = int(now / self._tick)
+        if target <= self._cursor:
+            return
+        slots = self._slots
+        n = len(slots)
+        deadlines = self._deadlines
+        # A jump of more than one lap only needs to visit each slot once
+        for t in range(max(self._cursor + 1, target - n + 1), target + 1):
+            due = slots[t % n]
+            if not due:
+                continue
+            slots[t % n] = set()
+            for key in due:
+                deadline = deadlines.get(key)
+                if deadline is None:
+                    continue
+                if deadline <= now:
+                    del deadlines[key]
+                    self._on_expire(key)
+                else:
+                    slots[int(deadline / self._tick) % n].add(key)
+        self._cursor = target
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+
 # ─── Expiry-aware bucket store ────────────────────────────────────────────────
 
 class _BucketStore:
     """
-    In-memory store for rate-limit buckets with periodic cleanup.
+    In-memory store for rate-limit buckets with timing-wheel expiry.
 
-    Entries that haven't been accessed for > 2×window_size are evicted
-    on a lazy schedule to bound memory growth.
+    Entries idle for longer than ``max(5 × cleanup_interval, 300s)`` are
+    evicted as their wheel slot comes due, bounding memory growth without
+    a stop-the-world scan over every key.
     """
 
     def __init__(self, cleanup_interval: float = 60.0):
         self._buckets: Dict[str, Any] = {}
-        self._last_access: Dict[str, float] = {}
-        self._cleanup_interval = cleanup_interval
-        self._last_cleanup = time.monotonic()
+        self._idle_ttl = max(cleanup_interval * 5, 300)
+        self._wheel = _TimingWheel(
+            self._idle_ttl,
+            lambda key: self._buckets.pop(key, None),
+            tick=max(1.0, self._idle_ttl / 64),
+        )
 
     def get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
         now = time.monotonic()
-        self._last_access[key] = now
+        self._wheel.advance(now)
+        self._wheel.touch(key, now + self._idle_ttl)
 
         bucket = self._buckets.get(key)
         if bucket is None:
             bucket = factory()
             self._buckets[key] = bucket
+        return bucket
 
-        # Lazy cleanup
-        if now - self._last_cleanup > self._cleanup_interval:
-            self._cleanup(now)
 
-        return bucket
+# ─── Shared GCRA state ────────────────────────────────────────────────────────
+
+class RateLimitDecision:
+    """Outcome of a shared-store check (quacks like a local bucket)."""
 
-    def _cleanup(self, now: float) -> None:
-        self._last_cleanup = now
-        # Default 5 minute TTL for idle buckets
-        ttl = max(self._cleanup_interval * 5, 300)
-        expired = [
-            k for k, t in self._last_access.items()
-            if now - t > ttl
-        ]
-        for k in expired:
-            self._buckets.pop(k, None)
-            self._last_access.pop(k, None)
+    __slots__ = ("allowed", "retry_after", "remaining", "reset_after", "_at")
+
+    def __init__(self, allowed: bool, retry_after: float, remaining: int, reset_after: float):
+        self.allowed = allowed
+        self.retry_after = retry_after
+        self.remaining = remaining
+        self.reset_after = reset_after
+        self._at = time.monotonic()
+
+    @property
+    def reset_time(self) -> float:
+        return self._at + self.reset_after
+
+
+def _gcra(tat: int, now: int, interval: int, tolerance: int, want: int):
+    """
+    Generic Cell Rate Algorithm step, in integer microseconds.
+
+    ``tat`` is the stored theoretical arrival time, ``interval`` the
+    emission interval (window / limit) and ``tolerance`` the burst
+    allowance (interval × burst).  Grants up to ``want`` cells.  Float
+    seconds would lose a cell of burst to rounding for many limits.
+
+    Returns ``(granted, new_tat, retry_after, remaining, reset_after)``.
+    """
+    if tat < now:
+        tat = now
+    granted = min(want, (now + tolerance - tat) // interval)
+    if granted < 1:
+        return 0, tat, tat + interval - tolerance - now, 0, tat - now
+    new_tat = tat + granted * interval
+    remaining = (now + tolerance - new_tat) // interval
+    return granted, new_tat, 0, remaining, new_tat - now
+
+
+def _gcra_us(interval: float, tolerance: float) -> Tuple[int, int]:
+    """``gcra_params()`` in microseconds: ``tolerance // interval`` keeps the burst."""
+    return max(1, int(interval * 1e6)), round(tolerance * 1e6)
+
+
+class GCRAStore:
+    """
+    Rate-limit state shared by every worker using the same backend.
+
+    ``acquire`` claims up to ``want`` cells for ``key`` and reports how
+    many were granted; it is atomic with respect to other workers.
+    """
+
+    async def acquire(
+        self, key: str, interval: float, tolerance: float, want: int = 1,
+    ) -> Tuple[int, RateLimitDecision]:
+        raise NotImplementedError
+
+
+class MemoryGCRAStore(GCRAStore):
+    """
+    In-process GCRA store — the reference implementation of the Redis
+    script, used with the memory cache backend and in tests.
+    """
+
+    def __init__(self) -> None:
+        self._tats: Dict[str, int] = {}
+        self._wheel = _TimingWheel(600.0, lambda key: self._tats.pop(key, None), tick=2.0)
+
+    async def acquire(
+        self, key: str, interval: float, tolerance: float, want: int = 1,
+    ) -> Tuple[int, RateLimitDecision]:
+        now = time.monotonic()
+        self._wheel.advance(now)
+        now_us = int(now * 1e6)
+        granted, tat, retry_us, remaining, reset_us = _gcra(
+            self._tats.get(key, now_us), now_us, *_gcra_us(interval, tolerance), want,
+        )
+        if granted:
+            self._tats[key] = tat
+            self._wheel.touch(key, tat / 1e6)
+        return granted, RateLimitDecision(bool(granted), retry_us / 1e6, remaining, reset_us / 1e6)
+
+
+# Same arithmetic as ``_gcra`` in integer microseconds, on Redis' clock so
+# workers on different hosts agree.  The key expires when its TAT passes.
+_GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local want = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then tat = now end
+local granted = math.min(want, math.floor((now + tolerance - tat) / interval))
+if granted < 1 then
+  return {0, 0, tat + interval - tolerance - now, tat - now}
+end
+local new_tat = tat + granted * interval
+redis.call('SET', KEYS[1], string.format('%d', new_tat), 'PX', math.max(1, math.ceil((new_tat - now) / 1000)))
+return {granted, math.floor((now + tolerance - new_tat) / interval), 0, new_tat - now}
+"""
+
+
+class RedisGCRAStore(GCRAStore):
+    """
+    GCRA over a ``RedisBackend``: one atomic Lua script call per check.
+
+    Fails open (allows the request) when Redis is unreachable, so a cache
+    outage degrades to no limiting rather than to an outage.
+    """
+
+    def __init__(self, backend: Any, prefix: str = "rl:"):
+        self._backend = backend
+        self._prefix = prefix
+        self._script = None
+
+    async def acquire(
+        self, key: str, interval: float, tolerance: float, want: int = 1,
+    ) -> Tuple[int, RateLimitDecision]:
+        redis = self._backend._redis
+        try:
+            if self._script is None:
+                self._script = redis.register_script(_GCRA_LUA)
+            granted, remaining, retry_us, reset_us = await self._script(
+                keys=[self._backend._full_key(self._prefix + key)],
+                args=[*_gcra_us(interval, tolerance), want],
+            )
+        except Exception as e:
+            logger.warning(f"Shared rate limit check failed, allowing request: {e}")
+            return want, RateLimitDecision(True, 0.0, 0, 0.0)
+        granted = int(granted)
+        return granted, RateLimitDecision(
+            bool(granted), int(retry_us) / 1e6, int(remaining), int(reset_us) / 1e6,
+        )
+
+
+class LeasedGCRAStore(GCRAStore):
+    """
+    Claims ``lease`` cells per round trip to ``store`` and hands them out
+    locally, so most requests never leave the worker.
+
+    A lease lasts at most ``lease_ttl`` seconds; cells not used by then
+    are forfeited, which can only make the limit stricter.  Concurrent
+    requests that find the lease empty share one refill.
+    """
+
+    def __init__(self, store: GCRAStore, lease: int = 10, lease_ttl: float = 1.0):
+        self._store = store
+        self._lease = lease
+        self._lease_ttl = lease_ttl
+        # key → [cells left, expires at, last remaining reported by the store]
+        self._leases: Dict[str, List[Any]] = {}
+        self._refills: Dict[str, asyncio.Future] = {}
+        self._wheel = _TimingWheel(lease_ttl, lambda key: self._leases.pop(key, None), tick=0.25)
+
+    async def acquire(
+        self, key: str, interval: float, tolerance: float, want: int = 1,
+    ) -> Tuple[int, RateLimitDecision]:
+        while True:
+            now = time.monotonic()
+            lease = self._leases.get(key)
+            if lease is not None and lease[0] >= want and lease[1] > now:
+                lease[0] -= want
+                return want, RateLimitDecision(True, 0.0, lease[0] + lease[2], lease[1] - now)
+
+            pending = self._refills.get(key)
+            if pending is None:
+                break
+            await asyncio.shield(pending)
+
+        loop = asyncio.get_running_loop()
+        pending = self._refills[key] = loop.create_future()
+        try:
+            granted, decision = await self._store.acquire(
+                key, interval, tolerance, max(want, self._lease),
+            )
+            if granted < want:
+                return 0, decision
+            now = time.monotonic()
+            self._wheel.advance(now)
+            expires = now + min(self._lease_ttl, granted * interval)
+            self._leases[key] = [granted - want, expires, decision.remaining]
+            self._wheel.touch(key, expires)
+            decision.remaining += granted - want
+            return want, decision
+        finally:
+            del self._refills[key]
+            pending.set_result(None)
+
+
+def gcra_store_for(backend: Any) -> GCRAStore:
+    """
+    The shared store matching a cache backend (Redis → Lua script).
+
+    A composite backend is enforced on its distributed L2 tier.
+    """
+    from aquilia.cache.backends.composite import CompositeBackend
+    from aquilia.cache.backends.redis import RedisBackend
+
+    while isinstance(backend, CompositeBackend):
+        backend = backend._l2
+    if isinstance(backend, RedisBackend):
+        return RedisGCRAStore(backend)
+    if getattr(backend, "is_distributed", False):
+        logger.warning(
+            f"No shared rate-limit store for cache backend "
+            f"{getattr(backend, 'name', type(backend).__name__)!r}; "
+            f"falling back to per-process limits"
+        )
+    return MemoryGCRAStore()
 
 
 # ─── Rate Limit Configuration ────────────────────────────────────────────────
@@ -298,6 +564,12 @@ class RateLimitRule:
         self.scope = scope
         self.methods = methods or []
 
+    def gcra_params(self) -> Tuple[float, float]:
+        """(emission interval, burst tolerance) for shared GCRA mode."""
+        interval = self.window / self.limit
+        burst = self.burst if self.burst is not None else self.limit
+        return interval, interval * burst
+
     def matches(self, request: Request) -> bool:
         """Check if this rule applies to the given request."""
         if self.methods and request.method not in self.methods:
@@ -330,6 +602,12 @@ class RateLimitMiddleware:
         response_format: "json" or "plain" for 429 body.
         include_headers: Include rate-limit headers on all responses.
         exempt_paths: Paths to skip rate limiting (e.g. health checks).
+        backend: A cache backend (or ``GCRAStore``) to share limits across
+            workers.  Every rule is then enforced with GCRA, allowing
+            ``burst`` (default ``limit``) requests at once and ``limit``
+            per ``window`` sustained.
+        lease: In shared mode, cells each worker claims per round trip
+            (0 or 1 = check the shared store on every request).
     """
 
     def __init__(
@@ -340,6 +618,8 @@ class RateLimitMiddleware:
         response_format: str = "json",
         include_headers: bool = True,
         exempt_paths: Optional[List[str]] = None,
+        backend: Optional[Any] = None,
+        lease: int = 0,
     ):
         if rules:
             self._rules = rules
@@ -353,6 +633,11 @@ class RateLimitMiddleware:
         self._exempt_paths: set = set(exempt_paths or ["/health", "/healthz", "/ready"])
         self._store = _BucketStore()
 
+        self._shared: Optional[GCRAStore] = None
+        if backend is not None:
+            store = backend if isinstance(backend, GCRAStore) else gcra_store_for(backend)
+            self._shared = LeasedGCRAStore(store, lease) if lease > 1 else store
+
     async def __call__(
         self,
         request: Request,
@@ -379,13 +664,15 @@ class RateLimitMiddleware:
             # Scope the key to the rule
             bucket_key = f"{rule.scope}:{key}"
 
-            # Get or create bucket
-            bucket = self._store.get_or_create(
-                bucket_key,
-                lambda: self._create_bucket(rule),
-            )
-
-            allowed, retry_after = bucket.consume()
+            if self._shared is not None:
+                _, bucket = await self._shared.acquire(bucket_key, *rule.gcra_params())
+                allowed, retry_after = bucket.allowed, bucket.retry_after
+            else:
+                bucket = self._store.get_or_create(
+                    bucket_key,
+                    lambda: self._create_bucket(rule),
+                )
+                allowed, retry_after = bucket.consume()
 
             if not allowed:
                 return self._rate_limited_response(
@@ -477,6 +764,12 @@ class RateLimitMiddleware:
 __all__ = [
     "RateLimitMiddleware",
     "RateLimitRule",
+    "RateLimitDecision",
+    "GCRAStore",
+    "MemoryGCRAStore",
+    "RedisGCRAStore",
+    "LeasedGCRAStore",
+    "gcra_store_for",
     "ip_key_extractor",
     "api_key_extractor",
     "user_key_extractor",
@@ -1,42 +1,114 @@
 """
 ONNX Runtime adapter — high-performance inference via onnxruntime.
 
+Inference runs on a dedicated thread pool, never on the event loop: a
+30 ms model would otherwise stall every coroutine in the process
+(health checks, unrelated routes) for each batch.  The pool holds one
+``InferenceSession`` per worker thread, sized so that
+``workers * intra_op_num_threads`` does not oversubscribe the CPUs.
+Input/output metadata is read once at load, and with ``io_binding``
+outputs of fully static shape are written into pre-allocated buffers.
+
 Requires ``onnxruntime`` or ``onnxruntime-gpu`` (optional dependency).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 
-from .._types import BatchRequest, InferenceResult, ModelpackManifest
+from .._types import BatchRequest, InferenceRequest, InferenceResult, ModelpackManifest
 from .base import BaseRuntime
 
 logger = logging.getLogger("aquilia.mlops.runtime.onnx")
 
+# ONNX tensor type → numpy dtype for feeding plain Python inputs
+_ONNX_DTYPES: Dict[str, Any] = {
+    "tensor(float)": np.float32,
+    "tensor(double)": np.float64,
+    "tensor(float16)": np.float16,
+    "tensor(int64)": np.int64,
+    "tensor(int32)": np.int32,
+    "tensor(int16)": np.int16,
+    "tensor(int8)": np.int8,
+    "tensor(uint8)": np.uint8,
+    "tensor(bool)": np.bool_,
+}
+
+
+class _SessionSlot:
+    """One pooled session plus its IO binding and output buffers."""
+
+    __slots__ = ("session", "binding", "buffers")
+
+    def __init__(self, session: Any, binding: Any = None):
+        self.session = session
+        self.binding = binding
+        # Bound output memory; must outlive the binding
+        self.buffers: Dict[str, np.ndarray] = {}
+
 
 class ONNXRuntimeAdapter(BaseRuntime):
     """
     ONNX Runtime inference adapter.
 
-    Uses ``onnxruntime.InferenceSession`` for high-performance CPU/GPU inference.
+    Uses ``onnxruntime.InferenceSession`` for high-performance CPU/GPU
+    inference, executed off the event loop.
+
+    Args:
+        providers: Execution providers (default: all available)
+        session_options: ``onnxruntime.SessionOptions`` to load with
+        pool_size: Sessions / worker threads (default: CPU count divided
+            by ``intra_op_num_threads``, at least 1)
+        intra_op_num_threads: Threads each session may use per operator
+        max_pending: Batches allowed to wait for a worker before
+            ``infer`` callers queue on the event loop (default
+            ``4 * pool_size``)
+        io_binding: Bind inputs/outputs explicitly, writing static-shape
+            outputs into pre-allocated buffers
     """
 
     def __init__(
         self,
         providers: Optional[List[str]] = None,
         session_options: Optional[Any] = None,
+        *,
+        pool_size: Optional[int] = None,
+        intra_op_num_threads: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        io_binding: bool = False,
     ):
         super().__init__()
         self._session: Any = None
         self._providers = providers
         self._session_options = session_options
+        self._pool_size = pool_size
+        self._intra_op_threads = intra_op_num_threads
+        self._max_pending = max_pending
+        self._io_binding = io_binding
+
+        self._pool: "queue.SimpleQueue[_SessionSlot]" = queue.SimpleQueue()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: asyncio.Semaphore | None = None
+        self._input_names: List[str] = []
+        self._input_dtypes: Dict[str, Any] = {}
+        self._output_names: List[str] = []
+
         self._inference_count: int = 0
         self._total_latency_ms: float = 0.0
+        self._batch_count: int = 0
+        self._pending: int = 0
+        self._total_queue_wait_ms: float = 0.0
+        self._max_queue_wait_ms: float = 0.0
+        self._total_compute_ms: float = 0.0
 
     async def prepare(self, manifest: ModelpackManifest, model_dir: str) -> None:
         self._manifest = manifest
@@ -65,65 +137,151 @@ class ONNXRuntimeAdapter(BaseRuntime):
 
         providers = self._providers or ort.get_available_providers()
         sess_opts = self._session_options or ort.SessionOptions()
+        if self._intra_op_threads:
+            sess_opts.intra_op_num_threads = self._intra_op_threads
 
-        self._session = ort.InferenceSession(
-            str(model_path), sess_options=sess_opts, providers=providers
-        )
+        size = self._resolve_pool_size(sess_opts.intra_op_num_threads)
+        loop = asyncio.get_running_loop()
+        # Session construction parses and optimizes the graph: keep it
+        # off the loop too.
+        sessions = await loop.run_in_executor(None, lambda: [
+            ort.InferenceSession(str(model_path), sess_options=sess_opts, providers=providers)
+            for _ in range(size)
+        ])
+        self._init_pool(sessions)
 
         self._loaded = True
         self._load_time_ms = (time.monotonic() - start) * 1000
         logger.info(
-            "ONNX model loaded in %.1fms (providers=%s)",
-            self._load_time_ms, providers,
+            "ONNX model loaded in %.1fms (providers=%s, sessions=%d)",
+            self._load_time_ms, providers, size,
         )
 
+    def _resolve_pool_size(self, intra_op_threads: int) -> int:
+        if self._pool_size:
+            return self._pool_size
+        cpus = os.cpu_count() or 1
+        if intra_op_threads and intra_op_threads > 0:
+            return max(1, cpus // intra_op_threads)
+        # ORT defaults to one intra-op thread per core: one session suffices
+        return 1
+
+    def _init_pool(self, sessions: Sequence[Any]) -> None:
+        """Cache IO metadata and start the worker pool for ``sessions``."""
+        first = sessions[0]
+        self._session = first
+        self._input_names = [inp.name for inp in first.get_inputs()]
+        self._input_dtypes = {
+            inp.name: _ONNX_DTYPES.get(getattr(inp, "type", ""))
+            for inp in first.get_inputs()
+        }
+        outputs = first.get_outputs()
+        self._output_names = [out.name for out in outputs]
+
+        for session in sessions:
+            slot = _SessionSlot(session)
+            if self._io_binding:
+                binding = slot.binding = session.io_binding()
+                for out in outputs:
+                    dtype = _ONNX_DTYPES.get(getattr(out, "type", ""))
+                    shape = getattr(out, "shape", None)
+                    if dtype is not None and shape and all(isinstance(d, int) for d in shape):
+                        buf = np.empty(shape, dtype=dtype)
+                        binding.bind_output(out.name, "cpu", 0, buf.dtype, list(buf.shape), buf.ctypes.data)
+                        slot.buffers[out.name] = buf
+                    else:
+                        binding.bind_output(out.name, "cpu")
+            self._pool.put(slot)
+
+        size = len(sessions)
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="aquilia-onnx")
+        self._slots = asyncio.Semaphore(self._max_pending or 4 * size)
+
     async def infer(self, batch: BatchRequest) -> List[InferenceResult]:
         if not self._session:
             raise RuntimeError("Model not loaded")
 
-        results: List[InferenceResult] = []
-        input_names = [inp.name for inp in self._session.get_inputs()]
-        output_names = [out.name for out in self._session.get_outputs()]
-
-        for req in batch.requests:
-            start = time.monotonic()
-
-            # Build feed dict
-            feed: Dict[str, Any] = {}
-            for name in input_names:
-                if name in req.inputs:
-                    val = req.inputs[name]
-                    if not isinstance(val, np.ndarray):
-                        val = np.array(val)
-                    feed[name] = val
-
-            raw_outputs = self._session.run(output_names, feed)
-            outputs = {
-                name: out.tolist() if isinstance(out, np.ndarray) else out
-                for name, out in zip(output_names, raw_outputs)
-            }
-
-            latency = (time.monotonic() - start) * 1000
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        self._pending += 1
+        try:
+            async with self._slots:
+                results, started, finished = await loop.run_in_executor(
+                    self._executor, self._run_batch, batch.requests,
+                )
+        finally:
+            self._pending -= 1
+
+        wait_ms = (started - submitted) * 1000
+        self._batch_count += 1
+        self._total_queue_wait_ms += wait_ms
+        self._total_compute_ms += (finished - started) * 1000
+        if wait_ms > self._max_queue_wait_ms:
+            self._max_queue_wait_ms = wait_ms
+        for result in results:
             self._inference_count += 1
-            self._total_latency_ms += latency
+            self._total_latency_ms += result.latency_ms
+        return results
+
+    def _run_batch(self, requests: List[InferenceRequest]):
+        """Runs on a pool thread with exclusive use of one session."""
+        started = time.perf_counter()
+        slot = self._pool.get()
+        try:
+            results = [self._run_one(slot, req) for req in requests]
+        finally:
+            self._pool.put(slot)
+        return results, started, time.perf_counter()
 
-            results.append(InferenceResult(
-                request_id=req.request_id,
-                outputs=outputs,
-                latency_ms=latency,
-            ))
+    def _run_one(self, slot: _SessionSlot, req: InferenceRequest) -> InferenceResult:
+        start = time.monotonic()
 
-        return results
+        feed: Dict[str, Any] = {}
+        for name in self._input_names:
+            if name in req.inputs:
+                val = req.inputs[name]
+                if not isinstance(val, np.ndarray):
+                    val = np.asarray(val, dtype=self._input_dtypes.get(name))
+                feed[name] = val
+
+        output_names = self._output_names
+        binding = slot.binding
+        if binding is not None:
+            for name, val in feed.items():
+                binding.bind_cpu_input(name, val)
+            slot.session.run_with_iobinding(binding)
+            raw_outputs = binding.copy_outputs_to_cpu()
+        else:
+            raw_outputs = slot.session.run(output_names, feed)
+
+        outputs = {
+            name: out.tolist() if isinstance(out, np.ndarray) else out
+            for name, out in zip(output_names, raw_outputs)
+        }
+        return InferenceResult(
+            request_id=req.request_id,
+            outputs=outputs,
+            latency_ms=(time.monotonic() - start) * 1000,
+        )
 
     async def metrics(self) -> Dict[str, float]:
         base = await super().metrics()
         avg = self._total_latency_ms / max(self._inference_count, 1)
+        batches = max(self._batch_count, 1)
         base.update({
             "inference_count": float(self._inference_count),
             "avg_latency_ms": avg,
+            "pending_batches": float(self._pending),
+            "avg_queue_wait_ms": self._total_queue_wait_ms / batches,
+            "max_queue_wait_ms": self._max_queue_wait_ms,
+            "avg_compute_ms": self._total_compute_ms / batches,
         })
         return base
 
     async def unload(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pool = queue.SimpleQueue()
         self._session = None
         await super().unload()
@@ -8,16 +8,19 @@ Supports:
 - Standard SLM batching (size / time / hybrid triggers)
 - Continuous batching for LLM serving (token-budget-aware draining)
 - Priority-based request ordering (higher priority first)
-- Adaptive batch sizing based on latency feedback
+- Adaptive batch sizing based on latency and queue-depth feedback
+- Pipelined dispatch: up to ``max_in_flight`` batches execute while the
+  next one is being collected
 
 Algorithm::
 
     loop:
-        collect requests from queue
-        if len(batch) >= max_batch_size OR elapsed >= max_latency_ms:
-            yield batch
-        else:
-            wait(remaining time)
+        wait for a free in-flight slot          (backpressure)
+        wait for the first request
+        drain the queue up to the batch size
+        if not full: wait once until full or max_latency_ms after the
+                     first request arrived, then drain again
+        launch batch (releases its slot when done)
 
 For continuous batching::
 
@@ -96,6 +99,11 @@ class DynamicBatcher:
         strategy: Batching strategy (size, time, or hybrid).
         token_budget: Max total tokens per batch (0 = unlimited, for continuous batching).
         continuous: Enable continuous batching mode (priority queue + token budget).
+        max_in_flight: Batches allowed to execute concurrently.  While all
+            slots are busy the collector stops draining, so requests pile
+            up into the next (larger) batch.
+        max_queue_size: Bound on queued requests (0 = unbounded); when
+            full, ``submit`` waits for space.
     """
 
     def __init__(
@@ -106,6 +114,8 @@ class DynamicBatcher:
         strategy: BatchingStrategy = BatchingStrategy.HYBRID,
         token_budget: int = 0,
         continuous: bool = False,
+        max_in_flight: int = 2,
+        max_queue_size: int = 0,
     ):
         self._infer_fn = infer_fn
         self.max_batch_size = max_batch_size
@@ -114,12 +124,20 @@ class DynamicBatcher:
         self._token_budget = token_budget
         self._continuous = continuous
 
-        self._queue: asyncio.Queue[_PendingRequest] = asyncio.Queue()
+        self._queue: asyncio.Queue[_PendingRequest] = asyncio.Queue(max_queue_size)
         # Priority heap for continuous batching
         self._priority_heap: List[_PendingRequest] = []
         self._task: Optional[asyncio.Task] = None
         self._running = False
 
+        # Pipelining: one slot per concurrently executing batch
+        self.max_in_flight = max(1, max_in_flight)
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._in_flight: set[asyncio.Task] = set()
+        # Woken by submit() once a partial batch has filled up
+        self._wake: Optional[asyncio.Future] = None
+        self._wake_at = 0
+
         # Adaptive sizing: track recent batch latencies for feedback
         self._recent_latencies: List[float] = []
         self._adaptive_max: int = max_batch_size
@@ -130,6 +148,7 @@ class DynamicBatcher:
         self._total_wait_ms = 0.0
         self._total_tokens_processed = 0
         self._priority_dispatches = 0
+        self._backpressure_waits = 0
 
     async def start(self) -> None:
         """Start the background batcher coroutine."""
@@ -148,7 +167,7 @@ class DynamicBatcher:
         )
 
     async def stop(self) -> None:
-        """Stop the batcher and drain remaining requests."""
+        """Stop the batcher, finish in-flight batches and fail queued ones."""
         self._running = False
         if self._task:
             self._task.cancel()
@@ -157,6 +176,8 @@ class DynamicBatcher:
             except asyncio.CancelledError:
                 pass
             self._task = None
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
         # Fail remaining queued requests
         while not self._queue.empty():
             try:
@@ -179,6 +200,9 @@ class DynamicBatcher:
         """
         pending = _PendingRequest(request)
         await self._queue.put(pending)
+        wake = self._wake
+        if wake is not None and self._queue.qsize() >= self._wake_at and not wake.done():
+            wake.set_result(None)
         return await pending.future
 
     def metrics(self) -> Dict[str, float]:
@@ -203,6 +227,9 @@ class DynamicBatcher:
             "priority_dispatches": float(self._priority_dispatches),
             "adaptive_max_batch": float(self._adaptive_max),
             "continuous_mode": float(self._continuous),
+            "in_flight": float(len(self._in_flight)),
+            "max_in_flight": float(self.max_in_flight),
+            "backpressure_waits": float(self._backpressure_waits),
         }
 
     # ── Internal: Standard batching ──────────────────────────────────
@@ -210,40 +237,64 @@ class DynamicBatcher:
     async def _batch_loop(self) -> None:
         """Main batching loop (standard mode)."""
         while self._running:
-            batch: List[_PendingRequest] = []
-            deadline = time.monotonic() + (self.max_latency_ms / 1000.0)
-
+            await self._acquire_slot()
             try:
-                first = await asyncio.wait_for(
-                    self._queue.get(),
-                    timeout=1.0,
-                )
-                batch.append(first)
-            except (asyncio.TimeoutError, asyncio.CancelledError):
-                continue
-
-            # Collect more requests up to adaptive batch size or deadline
-            effective_max = self._adaptive_max
-            while len(batch) < effective_max:
-                remaining = deadline - time.monotonic()
-                if remaining <= 0:
-                    break
-
-                try:
-                    item = await asyncio.wait_for(
-                        self._queue.get(),
-                        timeout=remaining,
-                    )
-                    batch.append(item)
-                except asyncio.TimeoutError:
-                    break
-                except asyncio.CancelledError:
-                    break
-
-            if not batch:
-                continue
+                batch = await self._collect()
+            except BaseException:
+                self._slots.release()
+                raise
+            self._launch(batch)
 
-            await self._dispatch(batch)
+    async def _collect(self) -> List[_PendingRequest]:
+        """
+        Build one batch: block for the first request, drain the rest in
+        bulk, and wait at most once (one timer) for the batch to fill.
+        """
+        queue = self._queue
+        batch = [await queue.get()]
+        limit = self._adaptive_max
+        self._drain_into(batch, limit)
+
+        deadline = batch[0].enqueue_time + self.max_latency_ms / 1000.0
+        remaining = deadline - time.monotonic()
+        if len(batch) < limit and remaining > 0:
+            loop = asyncio.get_running_loop()
+            wake = self._wake = loop.create_future()
+            self._wake_at = limit - len(batch)
+            timer = loop.call_later(remaining, _resolve, wake)
+            try:
+                await wake
+            except asyncio.CancelledError:
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(RuntimeError("Batcher stopped"))
+                raise
+            finally:
+                timer.cancel()
+                self._wake = None
+            self._drain_into(batch, limit)
+        return batch
+
+    def _drain_into(self, batch: List[_PendingRequest], limit: int) -> None:
+        queue = self._queue
+        while len(batch) < limit and not queue.empty():
+            batch.append(queue.get_nowait())
+
+    async def _acquire_slot(self) -> None:
+        """Wait for an in-flight slot; requests keep queueing meanwhile."""
+        if self._slots.locked():
+            self._backpressure_waits += 1
+        await self._slots.acquire()
+
+    def _launch(self, batch: List[_PendingRequest]) -> None:
+        """Run a batch concurrently with collection of the next one."""
+        task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._batch_done)
+
+    def _batch_done(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        self._slots.release()
 
     # ── Internal: Continuous batching ────────────────────────────────
 
@@ -256,16 +307,18 @@ class DynamicBatcher:
         head-of-line blocking.
         """
         while self._running:
-            # Move all queued requests into the priority heap
-            await self._drain_queue_to_heap()
-
-            if not self._priority_heap:
-                # Wait for at least one request
-                try:
-                    first = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                    heapq.heappush(self._priority_heap, first)
-                except (asyncio.TimeoutError, asyncio.CancelledError):
-                    continue
+            await self._acquire_slot()
+            try:
+                # Move all queued requests into the priority heap
+                await self._drain_queue_to_heap()
+
+                if not self._priority_heap:
+                    # Wait for at least one request
+                    heapq.heappush(self._priority_heap, await self._queue.get())
+                    await self._drain_queue_to_heap()
+            except BaseException:
+                self._slots.release()
+                raise
 
             # Build batch from heap respecting token budget
             batch: List[_PendingRequest] = []
@@ -276,7 +329,8 @@ class DynamicBatcher:
                 candidate = heapq.heappop(self._priority_heap)
                 candidate_tokens = candidate.estimated_tokens
 
-                if self._token_budget > 0 and tokens_in_batch + candidate_tokens > self._token_budget:
+                # An oversized request still gets a batch of its own
+                if batch and self._token_budget > 0 and tokens_in_batch + candidate_tokens > self._token_budget:
                     # Over budget — push back
                     remaining_heap.append(candidate)
                     continue
@@ -291,7 +345,9 @@ class DynamicBatcher:
             if batch:
                 self._total_tokens_processed += tokens_in_batch
                 self._priority_dispatches += 1
-                await self._dispatch(batch)
+                self._launch(batch)
+            else:
+                self._slots.release()
 
     async def _drain_queue_to_heap(self) -> None:
         """Move all queued requests into the priority heap."""
@@ -333,7 +389,7 @@ class DynamicBatcher:
 
             # Adaptive sizing: if latency is low, try larger batches; if high, shrink
             dispatch_ms = (time.monotonic() - dispatch_start) * 1000
-            self._adapt_batch_size(dispatch_ms)
+            self._adapt_batch_size(dispatch_ms, self._queue.qsize() + len(self._priority_heap))
 
         except Exception as e:
             logger.error("Batch inference failed: %s", e)
@@ -343,8 +399,11 @@ class DynamicBatcher:
 
     # ── Internal: Adaptive sizing ────────────────────────────────────
 
-    def _adapt_batch_size(self, latency_ms: float) -> None:
-        """Adjust max batch size based on recent dispatch latencies."""
+    def _adapt_batch_size(self, latency_ms: float, queue_depth: int = 0) -> None:
+        """
+        Adjust max batch size from recent dispatch latencies and the
+        backlog left waiting when a batch completes.
+        """
         self._recent_latencies.append(latency_ms)
         # Keep a window of last 20 batches
         if len(self._recent_latencies) > 20:
@@ -355,9 +414,18 @@ class DynamicBatcher:
 
         avg = sum(self._recent_latencies) / len(self._recent_latencies)
 
-        # If avg latency < 60% of budget, try larger batches
-        if avg < self.max_latency_ms * 0.6:
-            self._adaptive_max = min(self._adaptive_max + 1, self.max_batch_size * 2)
         # If avg latency > 90% of budget, shrink
-        elif avg > self.max_latency_ms * 0.9:
+        if avg > self.max_latency_ms * 0.9:
             self._adaptive_max = max(self._adaptive_max - 1, 1)
+        # A full batch's worth still queued: the model is the bottleneck,
+        # bigger batches amortize per-call overhead
+        elif queue_depth >= self._adaptive_max:
+            self._adaptive_max = min(self._adaptive_max * 2, self.max_batch_size * 2)
+        # If avg latency < 60% of budget, try larger batches
+        elif avg < self.max_latency_ms * 0.6:
+            self._adaptive_max = min(self._adaptive_max + 1, self.max_batch_size * 2)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
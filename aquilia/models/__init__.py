@@ -204,6 +204,14 @@ from .signals import (
 
 from .transactions import atomic, Atomic, TransactionManager
 
+# ── Per-request relation loading ─────────────────────────────────────────────
+
+from .loader import RelatedLoader
+
+# ── Query result cache ───────────────────────────────────────────────────────
+
+from .query_cache import invalidate_tables, query_cache_stats, reset_query_cache_stats
+
 # ── Deletion constants ───────────────────────────────────────────────────────
 
 from .deletion import (
@@ -307,6 +315,9 @@ from .migration_dsl import (
     RunPython as DSLRunPython,
     AddConstraint as DSLAddConstraint,
     RemoveConstraint as DSLRemoveConstraint,
+    ValidateConstraint as DSLValidateConstraint,
+    AddNotNull as DSLAddNotNull,
+    Backfill as DSLBackfill,
     ColumnDef,
     columns,
     C,
@@ -496,6 +507,10 @@ __all__ = [
     # Transactions
     "atomic",
     "Atomic",
+    "RelatedLoader",
+    "invalidate_tables",
+    "query_cache_stats",
+    "reset_query_cache_stats",
     "TransactionManager",
     # Deletion
     "CASCADE",
@@ -570,6 +585,9 @@ __all__ = [
     "DSLRunPython",
     "DSLAddConstraint",
     "DSLRemoveConstraint",
+    "DSLValidateConstraint",
+    "DSLAddNotNull",
+    "DSLBackfill",
     "ColumnDef",
     "columns",
     "C",
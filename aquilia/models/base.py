@@ -167,6 +167,10 @@ class ModelRegistry(metaclass=_ModelRegistryMeta):
     def all_models(cls) -> Dict[str, Type[Model]]:
         return _CanonicalRegistry.all_models()
 
+    @classmethod
+    def reverse_relation(cls, model_name: str, related_name: str) -> Optional[Tuple[Type[Model], str]]:
+        return _CanonicalRegistry.reverse_relation(model_name, related_name)
+
     @classmethod
     def set_database(cls, db: AquiliaDatabase) -> None:
         _CanonicalRegistry.set_database(db)
@@ -219,6 +223,9 @@ from .metaclass import ModelMeta
 # The canonical Q class lives in query.py. Import it here for backward compat.
 
 from .query import Q
+from ..db.routing import db_for_write, route_read
+from .loader import current_loader, peek_loader
+from .query_cache import invalidate_model, invalidate_tables
 
 
 # ── Model Base Class ─────────────────────────────────────────────────────────
@@ -337,6 +344,19 @@ class Model(metaclass=ModelMeta):
             db = get_database()
         return db
 
+    @classmethod
+    def _db_for_write(cls, alias: Optional[str] = None) -> AquiliaDatabase:
+        """Database for a write, as chosen by the active ``ConnectionRouter``."""
+        loader = peek_loader()
+        if loader is not None:
+            loader.forget(cls)
+        return db_for_write(cls, alias, cls._get_db())
+
+    @classmethod
+    async def _read(cls, method: str, sql: str, params: List[Any]) -> Any:
+        """Run a read query on the routed database (replica-aware)."""
+        return await route_read(cls, method, sql, params, None, cls._get_db())
+
     # ── CRUD API ─────────────────────────────────────────────────────
 
     @classmethod
@@ -347,7 +367,7 @@ class Model(metaclass=ModelMeta):
         Usage:
             user = await User.create(name="Alice", email="alice@test.com")
         """
-        db = cls._get_db()
+        db = cls._db_for_write()
         instance = cls(**data)
 
         # Signal: pre_save (created=True)
@@ -417,15 +437,13 @@ class Model(metaclass=ModelMeta):
             user = await User.get(pk=1)
             user = await User.get(email="alice@test.com")
         """
-        db = cls._get_db()
-
         if pk is not None:
             sql = f'SELECT * FROM "{cls._table_name}" WHERE "{cls._pk_name}" = ?'
-            row = await db.fetch_one(sql, [pk])
+            row = await cls._read("fetch_one", sql, [pk])
         elif filters:
             wheres = [f'"{k}" = ?' for k in filters]
             sql = f'SELECT * FROM "{cls._table_name}" WHERE ' + " AND ".join(wheres)
-            row = await db.fetch_one(sql, list(filters.values()))
+            row = await cls._read("fetch_one", sql, list(filters.values()))
         else:
             from ..faults.domains import QueryFault
             raise QueryFault(
@@ -508,7 +526,7 @@ class Model(metaclass=ModelMeta):
         if not instances:
             return []
 
-        db = cls._get_db()
+        db = cls._db_for_write()
         results: List[Model] = []
 
         # Process in batches
@@ -544,6 +562,7 @@ class Model(metaclass=ModelMeta):
                         setattr(obj, cls._pk_attr, cursor.lastrowid)
                 results.append(obj)
 
+        await invalidate_model(cls)
         return results
 
     @classmethod
@@ -578,7 +597,7 @@ class Model(metaclass=ModelMeta):
         if not instances or not fields:
             return 0
 
-        db = cls._get_db()
+        db = cls._db_for_write()
         total_updated = 0
         effective_batch = batch_size or len(instances)
 
@@ -605,6 +624,7 @@ class Model(metaclass=ModelMeta):
                     cursor = await db.execute(sql, params)
                     total_updated += cursor.rowcount
 
+        await invalidate_model(cls)
         return total_updated
 
     @classmethod
@@ -688,8 +708,7 @@ class Model(metaclass=ModelMeta):
 
         ⚠️ Use parameterized queries to prevent SQL injection.
         """
-        db = cls._get_db()
-        rows = await db.fetch_all(sql, params or [])
+        rows = await cls._read("fetch_all", sql, params or [])
         return [cls.from_row(row) for row in rows]
 
     @classmethod
@@ -700,8 +719,6 @@ class Model(metaclass=ModelMeta):
         Usage:
             users = await User.using("replica").filter(active=True).all()
         """
-        # For now, returns a standard query. Multi-DB routing support
-        # will resolve the alias to an actual connection.
         qs = cls.query()
         qs._db_alias = db_alias
         return qs
@@ -741,7 +758,7 @@ class Model(metaclass=ModelMeta):
         if force_update and pk_val is None:
             raise ValueError("Cannot force_update on unsaved instance (no PK)")
 
-        db = self._get_db()
+        db = self._db_for_write(self._using_db)
         is_create = pk_val is None or force_insert
 
         # Optional validation
@@ -860,7 +877,7 @@ class Model(metaclass=ModelMeta):
         # Signal: pre_delete
         await pre_delete.send(sender=self.__class__, instance=self)
 
-        db = self._get_db()
+        db = self._db_for_write(self._using_db)
 
         # Handle on_delete for models that FK to us (cached lookup)
         for model_cls, col_name, on_delete_action in self._get_reverse_fk_refs():
@@ -959,13 +976,12 @@ class Model(metaclass=ModelMeta):
             posts = await user.related("posts")        # FK reverse (via related_name)
             tags = await post.related("tags")           # M2M
         """
+        loader = current_loader()
+
         # Check forward FK
         field = self._fields.get(name)
         if isinstance(field, ForeignKey):
-            fk_value = getattr(self, name, None)
-            if fk_value is None:
-                # Try the _id column
-                fk_value = getattr(self, field.column_name, None)
+            fk_value = self._fk_value(name, field)
             if fk_value is None:
                 return None
             target = field.related_model
@@ -973,7 +989,12 @@ class Model(metaclass=ModelMeta):
                 target = ModelRegistry.get(field.to if isinstance(field.to, str) else field.to.__name__)
             if target is None:
                 return None
-            return await target.get(pk=fk_value)
+            if loader is None:
+                return await target.get(pk=fk_value)
+            return await loader.load(
+                ("pk", target), fk_value,
+                [s._fk_value(name, field) for s in loader.siblings(self)],
+            )
 
         # Check M2M
         if name in self._m2m_fields:
@@ -987,30 +1008,43 @@ class Model(metaclass=ModelMeta):
             jt = m2m.junction_table_name(self.__class__)
             src_col, tgt_col = m2m.junction_columns(self.__class__)
             pk_val = getattr(self, self._pk_attr)
+            if loader is not None:
+                return await loader.load(
+                    ("m2m", target, jt, src_col, tgt_col), pk_val,
+                    [s.pk for s in loader.siblings(self)],
+                )
             target_pk = getattr(target, '_pk_name', 'id')
 
-            db = self._get_db()
             sql = (
                 f'SELECT t.* FROM "{target._table_name}" t '
                 f'INNER JOIN "{jt}" j ON t."{target_pk}" = j."{tgt_col}" '
                 f'WHERE j."{src_col}" = ?'
             )
-            rows = await db.fetch_all(sql, [pk_val])
+            rows = await self._read("fetch_all", sql, [pk_val])
             return [target.from_row(r) for r in rows]
 
-        # Check reverse FK (search other models for FK pointing to us)
-        for model_cls in ModelRegistry.all_models().values():
-            for fname, f in model_cls._fields.items():
-                if isinstance(f, ForeignKey) and f.related_name == name:
-                    target_model_name = f.to if isinstance(f.to, str) else f.to.__name__
-                    if target_model_name == self.__class__.__name__:
-                        pk_val = getattr(self, self._pk_attr)
-                        return await model_cls.query().where(
-                            f'"{f.column_name}" = ?', pk_val
-                        ).all()
+        # Check reverse FK (indexed by related_name at registration)
+        reverse = _CanonicalRegistry.reverse_relation(self.__class__.__name__, name)
+        if reverse is not None:
+            model_cls, attr_name = reverse
+            column = model_cls._fields[attr_name].column_name
+            pk_val = getattr(self, self._pk_attr)
+            if loader is not None:
+                return await loader.load(
+                    ("fk", model_cls, attr_name, column), pk_val,
+                    [s.pk for s in loader.siblings(self)],
+                )
+            return await model_cls.query().where(f'"{column}" = ?', pk_val).all()
 
         raise AttributeError(f"No relation '{name}' on {self.__class__.__name__}")
 
+    def _fk_value(self, name: str, field: ForeignKey) -> Any:
+        value = getattr(self, name, None)
+        if value is None:
+            # Try the _id column
+            value = getattr(self, field.column_name, None)
+        return value
+
     async def attach(self, name: str, *targets: Any) -> None:
         """
         Attach records to a M2M relationship.
@@ -1025,7 +1059,7 @@ class Model(metaclass=ModelMeta):
         jt = m2m.junction_table_name(self.__class__)
         src_col, tgt_col = m2m.junction_columns(self.__class__)
         pk_val = getattr(self, self._pk_attr)
-        db = self._get_db()
+        db = self._db_for_write(self._using_db)
 
         for target in targets:
             target_pk = target if isinstance(target, (int, str)) else getattr(target, target._pk_attr)
@@ -1034,6 +1068,11 @@ class Model(metaclass=ModelMeta):
                 [pk_val, target_pk],
             )
 
+        await invalidate_tables((jt,))
+        loader = peek_loader()
+        if loader is not None:
+            loader.forget_table(jt)
+
         # Signal: m2m_changed
         await m2m_changed.send(
             sender=self.__class__,
@@ -1057,7 +1096,7 @@ class Model(metaclass=ModelMeta):
         jt = m2m.junction_table_name(self.__class__)
         src_col, tgt_col = m2m.junction_columns(self.__class__)
         pk_val = getattr(self, self._pk_attr)
-        db = self._get_db()
+        db = self._db_for_write(self._using_db)
 
         for target in targets:
             target_pk = target if isinstance(target, (int, str)) else getattr(target, target._pk_attr)
@@ -1066,6 +1105,11 @@ class Model(metaclass=ModelMeta):
                 [pk_val, target_pk],
             )
 
+        await invalidate_tables((jt,))
+        loader = peek_loader()
+        if loader is not None:
+            loader.forget_table(jt)
+
         # Signal: m2m_changed
         await m2m_changed.send(
             sender=self.__class__,
@@ -127,16 +127,14 @@ class OnDeleteHandler:
             builder = DeleteBuilder(table)
             builder.where(f'"{target_field_name}" = ?', pk_value)
             sql, params = builder.build()
-            cursor = await db.execute(sql, params)
-            return cursor.rowcount
+            return await self._write_children(db, source_model, sql, params)
 
         elif self.action == SET_NULL:
             builder = UpdateBuilder(table)
             builder.set_dict({target_field_name: None})
             builder.where(f'"{target_field_name}" = ?', pk_value)
             sql, params = builder.build()
-            cursor = await db.execute(sql, params)
-            return cursor.rowcount
+            return await self._write_children(db, source_model, sql, params)
 
         elif self.action == SET_DEFAULT:
             default_val = self.value
@@ -144,8 +142,7 @@ class OnDeleteHandler:
             builder.set_dict({target_field_name: default_val})
             builder.where(f'"{target_field_name}" = ?', pk_value)
             sql, params = builder.build()
-            cursor = await db.execute(sql, params)
-            return cursor.rowcount
+            return await self._write_children(db, source_model, sql, params)
 
         elif self.action == "_SET_CALLABLE":
             # SET(value) or SET(callable)
@@ -154,8 +151,7 @@ class OnDeleteHandler:
             builder.set_dict({target_field_name: set_value})
             builder.where(f'"{target_field_name}" = ?', pk_value)
             sql, params = builder.build()
-            cursor = await db.execute(sql, params)
-            return cursor.rowcount
+            return await self._write_children(db, source_model, sql, params)
 
         elif self.action == PROTECT:
             # Check if there are referencing rows
@@ -194,6 +190,20 @@ class OnDeleteHandler:
             # DO_NOTHING or unrecognized — no application-level action
             return 0
 
+    @staticmethod
+    async def _write_children(db, source_model, sql: str, params: list) -> int:
+        """Run a child-table write and drop cached reads of that table."""
+        from .loader import peek_loader
+        from .query_cache import invalidate_model
+
+        cursor = await db.execute(sql, params)
+        if cursor.rowcount != 0:
+            loader = peek_loader()
+            if loader is not None:
+                loader.forget(source_model)
+            await invalidate_model(source_model)
+        return cursor.rowcount
+
     @classmethod
     def for_action(cls, action: Any) -> OnDeleteHandler:
         """
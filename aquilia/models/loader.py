@@ -0,0 +1,258 @@
+"""
+Aquilia Related Loader — request-scoped batching for ``Model.related()``.
+
+While a request is being handled, ``related()`` goes through a
+``RelatedLoader`` stored in the DI request container:
+
+- lookups issued in the same event-loop tick are coalesced into one
+  ``WHERE column IN (...)`` query per relation;
+- instances returned by the same query are loaded together, so awaiting
+  ``post.related("author")`` for 100 posts one after another still costs a
+  single query for all authors;
+- results are kept in an identity map, so repeat lookups in the request
+  are served from memory.  ORM writes drop the entries of the model
+  written to.
+
+Outside a request (scripts, shell, tests without a scope) nothing is
+active and ``related()`` issues one query per call as before.
+
+Usage:
+    loader = RelatedLoader.for_container(ctx.container)
+    loader.queries          # SQL statements issued so far
+    loader.clear()          # forget everything loaded in this request
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+__all__ = [
+    "RelatedLoader",
+    "current_loader",
+    "enter_request",
+    "exit_request",
+]
+
+# Max keys per IN (...) query; SQLite's default variable limit is 999.
+BATCH_SIZE = 500
+
+_scope: contextvars.ContextVar[Optional[Any]] = contextvars.ContextVar(
+    "aquilia_related_loader_scope", default=None,
+)
+
+
+class RelatedLoader:
+    """
+    Batches and caches relation lookups for one request.
+
+    A relation lookup is identified by a *spec* tuple:
+
+    - ``("pk", Target)``                          forward FK → instance
+    - ``("fk", Child, attr, column)``             reverse FK → list
+    - ``("m2m", Target, table, src, tgt)``        M2M → list
+    """
+
+    __slots__ = ("_results", "_pending", "_siblings", "_tasks", "_scheduled", "queries")
+
+    def __init__(self) -> None:
+        self._results: Dict[tuple, Dict[Any, Any]] = {}
+        self._pending: Dict[tuple, Dict[Any, List[asyncio.Future]]] = {}
+        self._siblings: Dict[int, List[Any]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._scheduled = False
+        self.queries = 0
+
+    @classmethod
+    def for_container(cls, container: Any) -> "RelatedLoader":
+        """The loader of a request container, created on first use.
+
+        It is stored under the class's DI token, so
+        ``await container.resolve_async(RelatedLoader)`` returns it too.
+        """
+        cache = container._cache
+        loader = cache.get(_CACHE_KEY)
+        if loader is None:
+            loader = cache[_CACHE_KEY] = cls()
+        return loader
+
+    # ── Sibling tracking ─────────────────────────────────────────────
+
+    def track(self, instances: List[Any]) -> None:
+        """Remember that ``instances`` came from the same query."""
+        siblings = self._siblings
+        for instance in instances:
+            siblings[id(instance)] = instances
+
+    def siblings(self, instance: Any) -> List[Any]:
+        """Instances loaded by the same query as ``instance`` (itself included)."""
+        return self._siblings.get(id(instance), ())
+
+    # ── Loading ──────────────────────────────────────────────────────
+
+    async def load(self, spec: tuple, key: Any, also: Iterable[Any] = ()) -> Any:
+        """
+        Resolve ``key`` for ``spec``, batching it with every other key
+        requested before the loop gets to run the query.
+
+        ``also`` lists keys worth fetching in the same query (the same
+        relation on sibling instances); nothing waits on them.
+        """
+        results = self._results.get(spec)
+        if results is not None and key in results:
+            return results[key]
+
+        pending = self._pending.get(spec)
+        if pending is None:
+            pending = self._pending[spec] = {}
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiters = pending.get(key)
+        if waiters is None:
+            pending[key] = [future]
+            for other in also:
+                if other is not None and other not in pending and (
+                    results is None or other not in results
+                ):
+                    pending[other] = []
+        else:
+            waiters.append(future)
+
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        return await future
+
+    def _dispatch(self) -> None:
+        self._scheduled = False
+        batches, self._pending = self._pending, {}
+        for spec, waiters in batches.items():
+            task = asyncio.ensure_future(self._run(spec, waiters))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, spec: tuple, waiters: Dict[Any, List[asyncio.Future]]) -> None:
+        try:
+            found = await self._fetch(spec, list(waiters))
+        except BaseException as exc:
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        results = self._results.get(spec)
+        if results is None:
+            results = self._results[spec] = {}
+        many = spec[0] != "pk"
+        for key, futures in waiters.items():
+            value = found.get(key, [] if many else None)
+            results[key] = value
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
+
+    async def _fetch(self, spec: tuple, keys: List[Any]) -> Dict[Any, Any]:
+        kind, model_cls = spec[0], spec[1]
+        found: Dict[Any, Any] = {}
+        for start in range(0, len(keys), BATCH_SIZE):
+            chunk = keys[start:start + BATCH_SIZE]
+            marks = ", ".join("?" * len(chunk))
+            self.queries += 1
+
+            if kind == "pk":
+                rows = await model_cls._read(
+                    "fetch_all",
+                    f'SELECT * FROM "{model_cls._table_name}" '
+                    f'WHERE "{model_cls._pk_name}" IN ({marks})',
+                    chunk,
+                )
+                for row in rows:
+                    instance = self._remember(model_cls, model_cls.from_row(row))
+                    found[instance.pk] = instance
+
+            elif kind == "fk":
+                attr, column = spec[2], spec[3]
+                children = await model_cls.query().where(
+                    f'"{column}" IN ({marks})', *chunk
+                ).all()
+                for child in children:
+                    child = self._remember(model_cls, child)
+                    found.setdefault(getattr(child, attr, None), []).append(child)
+
+            else:  # m2m
+                table, src_col, tgt_col = spec[2], spec[3], spec[4]
+                rows = await model_cls._read(
+                    "fetch_all",
+                    f'SELECT t.*, j."{src_col}" AS "__aquilia_src" '
+                    f'FROM "{model_cls._table_name}" t '
+                    f'INNER JOIN "{table}" j ON t."{model_cls._pk_name}" = j."{tgt_col}" '
+                    f'WHERE j."{src_col}" IN ({marks})',
+                    chunk,
+                )
+                for row in rows:
+                    instance = self._remember(model_cls, model_cls.from_row(row))
+                    found.setdefault(row.get("__aquilia_src"), []).append(instance)
+
+        if kind == "pk" and len(found) > 1:
+            self.track(list(found.values()))
+        return found
+
+    def _remember(self, model_cls: Any, instance: Any) -> Any:
+        """Identity map: one instance per (model, pk) within the request."""
+        by_pk = self._results.get(("pk", model_cls))
+        if by_pk is None:
+            by_pk = self._results[("pk", model_cls)] = {}
+        pk = instance.pk
+        existing = by_pk.get(pk)
+        if existing is not None:
+            return existing
+        by_pk[pk] = instance
+        return instance
+
+    # ── Invalidation ─────────────────────────────────────────────────
+
+    def forget(self, model_cls: Any) -> None:
+        """Drop every cached lookup that returns or joins ``model_cls``."""
+        for spec in [s for s in self._results if model_cls in s]:
+            del self._results[spec]
+
+    def forget_table(self, table: str) -> None:
+        """Drop every cached lookup that reads through junction ``table``."""
+        for spec in [s for s in self._results if s[0] == "m2m" and s[2] == table]:
+            del self._results[spec]
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._siblings.clear()
+
+
+_CACHE_KEY = f"{RelatedLoader.__module__}.{RelatedLoader.__qualname__}"
+
+
+def enter_request(container: Any) -> contextvars.Token:
+    """Make ``container`` the scope of ``current_loader()``."""
+    return _scope.set(container)
+
+
+def exit_request(token: contextvars.Token) -> None:
+    _scope.reset(token)
+
+
+def current_loader() -> Optional[RelatedLoader]:
+    """The active request's loader, or None outside a request."""
+    container = _scope.get()
+    if container is None:
+        return None
+    return RelatedLoader.for_container(container)
+
+
+def peek_loader() -> Optional[RelatedLoader]:
+    """Like ``current_loader()`` but never creates one."""
+    container = _scope.get()
+    if container is None:
+        return None
+    return container._cache.get(_CACHE_KEY)
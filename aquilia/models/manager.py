@@ -199,6 +199,10 @@ class BaseManager:
         """Target a specific database."""
         return self.get_queryset().using(db_alias)
 
+    def cache(self, ttl: int = 300) -> Q:
+        """Cache results, invalidated on writes to the tables read."""
+        return self.get_queryset().cache(ttl)
+
     def none(self) -> Q:
         """Return an empty queryset."""
         return self.get_queryset().none()
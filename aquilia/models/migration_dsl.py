@@ -17,9 +17,20 @@ DSL Primitives:
     DropIndex        — Drop an index
     AddConstraint    — Add a constraint
     RemoveConstraint — Drop a constraint
+    ValidateConstraint — Validate a NOT VALID constraint (PostgreSQL)
+    AddNotNull       — Add NOT NULL without a long table lock
+    Backfill         — Chunked, throttled, resumable UPDATE
     RunSQL           — Execute raw SQL (forward + reverse)
     RunPython        — Execute a Python callable
 
+Online operations:
+    Operations with ``atomic = False`` (``Backfill``, ``AddNotNull``,
+    ``CreateIndex(concurrently=True)``...) are run by the migration
+    runner outside the migration transaction, one step at a time, with
+    completed steps recorded so an interrupted migration resumes where
+    it stopped.  On SQLite, ``AlterField`` and ``AddNotNull`` are
+    executed as a copy-and-swap table rebuild.
+
 Usage in migration files:
 
     from aquilia.models.migration_dsl import (
@@ -318,11 +329,16 @@ class Operation:
     """Base class for all migration operations."""
 
     reversible: bool = True
+    atomic: bool = True  # False: run outside the migration transaction
 
     def to_sql(self, dialect: str = "sqlite") -> List[str]:
         """Compile this operation to SQL statement(s)."""
         raise NotImplementedError
 
+    def is_atomic(self, dialect: str = "sqlite") -> bool:
+        """Whether this operation may share the migration transaction."""
+        return self.atomic
+
     def reverse_sql(self, dialect: str = "sqlite") -> List[str]:
         """Compile the reverse of this operation to SQL."""
         raise NotImplementedError(f"{type(self).__name__} is not reversible")
@@ -463,8 +479,10 @@ class AlterField(Operation):
     """
     Alter a column's type, constraints, or default.
 
-    Note: SQLite < 3.35 does not support ALTER COLUMN. For SQLite,
-    this generates a comment indicating a table rebuild is needed.
+    Note: SQLite does not support ALTER COLUMN. For SQLite, the
+    migration runner performs a copy-and-swap table rebuild (see
+    ``MigrationRunner._sqlite_rebuild``); ``to_sql`` only emits a
+    comment describing it.
     """
 
     model_name: str
@@ -480,7 +498,7 @@ class AlterField(Operation):
         if dialect == "sqlite":
             stmts.append(
                 f'-- SQLite: ALTER COLUMN not supported for '
-                f'"{self.table}"."{self.column_name}". Requires table rebuild.'
+                f'"{self.table}"."{self.column_name}". Runs as a table rebuild.'
             )
             return stmts
 
@@ -513,6 +531,11 @@ class AlterField(Operation):
                 )
         return stmts
 
+    def is_atomic(self, dialect: str = "sqlite") -> bool:
+        # The SQLite rebuild toggles foreign keys, which is a no-op
+        # inside a transaction.
+        return dialect != "sqlite"
+
     def describe(self) -> str:
         return f"AlterField({self.model_name}.{self.column_name})"
 
@@ -550,24 +573,39 @@ class RenameField(Operation):
 
 @dataclass
 class CreateIndex(Operation):
-    """Create a database index."""
+    """
+    Create a database index.
+
+    ``concurrently=True`` builds the index without blocking writes
+    (``CREATE INDEX CONCURRENTLY`` on PostgreSQL).  Such an index cannot
+    be built inside a transaction, so the operation runs as its own
+    migration step.  If the build is interrupted, PostgreSQL leaves an
+    INVALID index behind that must be dropped before retrying.
+    """
 
     name: str
     table: str
     columns: List[str] = field(default_factory=list)
     unique: bool = False
     condition: Optional[str] = None  # Partial index WHERE clause
+    concurrently: bool = False
+
+    @property
+    def atomic(self) -> bool:  # type: ignore[override]
+        return not self.concurrently
 
     def to_sql(self, dialect: str = "sqlite") -> List[str]:
         u = "UNIQUE " if self.unique else ""
+        conc = "CONCURRENTLY " if self.concurrently and dialect == "postgresql" else ""
         cols = ", ".join(f'"{c}"' for c in self.columns)
-        sql = f'CREATE {u}INDEX IF NOT EXISTS "{self.name}" ON "{self.table}" ({cols})'
+        sql = f'CREATE {u}INDEX {conc}IF NOT EXISTS "{self.name}" ON "{self.table}" ({cols})'
         if self.condition and dialect != "mysql":
             sql += f" WHERE ({self.condition})"
         return [sql + ";"]
 
     def reverse_sql(self, dialect: str = "sqlite") -> List[str]:
-        return [f'DROP INDEX IF EXISTS "{self.name}";']
+        conc = "CONCURRENTLY " if self.concurrently and dialect == "postgresql" else ""
+        return [f'DROP INDEX {conc}IF EXISTS "{self.name}";']
 
     def describe(self) -> str:
         return f"CreateIndex({self.name}, {self.table}, {self.columns})"
@@ -582,11 +620,17 @@ class DropIndex(Operation):
 
     name: str
     table: Optional[str] = None  # Required for MySQL
+    concurrently: bool = False
+
+    @property
+    def atomic(self) -> bool:  # type: ignore[override]
+        return not self.concurrently
 
     def to_sql(self, dialect: str = "sqlite") -> List[str]:
         if dialect == "mysql" and self.table:
             return [f'DROP INDEX "{self.name}" ON "{self.table}";']
-        return [f'DROP INDEX IF EXISTS "{self.name}";']
+        conc = "CONCURRENTLY " if self.concurrently and dialect == "postgresql" else ""
+        return [f'DROP INDEX {conc}IF EXISTS "{self.name}";']
 
     def describe(self) -> str:
         return f"DropIndex({self.name})"
@@ -597,13 +641,21 @@ class DropIndex(Operation):
 
 @dataclass
 class AddConstraint(Operation):
-    """Add a constraint to a table."""
+    """
+    Add a constraint to a table.
+
+    ``not_valid=True`` adds a CHECK or FOREIGN KEY constraint on
+    PostgreSQL without scanning existing rows; follow it with
+    ``ValidateConstraint`` to check them without blocking writes.
+    """
 
     table: str
     constraint_sql: str
+    not_valid: bool = False
 
     def to_sql(self, dialect: str = "sqlite") -> List[str]:
-        return [f'ALTER TABLE "{self.table}" ADD {self.constraint_sql};']
+        suffix = " NOT VALID" if self.not_valid and dialect == "postgresql" else ""
+        return [f'ALTER TABLE "{self.table}" ADD {self.constraint_sql}{suffix};']
 
     def describe(self) -> str:
         return f"AddConstraint({self.table})"
@@ -628,6 +680,140 @@ class RemoveConstraint(Operation):
         return f"RemoveConstraint({self.table}.{self.name})"
 
 
+# ── ValidateConstraint ──────────────────────────────────────────────────────
+
+
+@dataclass
+class ValidateConstraint(Operation):
+    """
+    Validate a constraint added with ``AddConstraint(not_valid=True)``.
+
+    PostgreSQL scans the table holding only a SHARE UPDATE EXCLUSIVE
+    lock, so reads and writes continue.  A no-op on other backends.
+    """
+
+    table: str
+    name: str
+
+    atomic = False
+
+    def to_sql(self, dialect: str = "sqlite") -> List[str]:
+        if dialect != "postgresql":
+            return [f'-- {dialect}: constraint "{self.name}" is validated when added;']
+        return [f'ALTER TABLE "{self.table}" VALIDATE CONSTRAINT "{self.name}";']
+
+    def reverse_sql(self, dialect: str = "sqlite") -> List[str]:
+        return []
+
+    def describe(self) -> str:
+        return f"ValidateConstraint({self.table}.{self.name})"
+
+
+# ── AddNotNull ──────────────────────────────────────────────────────────────
+
+
+@dataclass
+class AddNotNull(Operation):
+    """
+    Make a column NOT NULL without holding a long exclusive lock.
+
+    On PostgreSQL this adds ``CHECK (col IS NOT NULL) NOT VALID``,
+    validates it (no write lock), then ``SET NOT NULL`` — which uses the
+    validated check instead of a full scan — and drops the check.  Each
+    statement is its own migration step.  On SQLite the runner rebuilds
+    the table; on MySQL use ``AlterField`` with the full column type.
+
+    Backfill existing NULLs first (see ``Backfill``).
+    """
+
+    model_name: str
+    table: str
+    column_name: str
+    constraint_name: Optional[str] = None
+
+    atomic = False
+
+    @property
+    def check_name(self) -> str:
+        return self.constraint_name or f"{self.table}_{self.column_name}_not_null"
+
+    def to_sql(self, dialect: str = "sqlite") -> List[str]:
+        col = f'"{self.column_name}"'
+        if dialect == "postgresql":
+            t = f'ALTER TABLE "{self.table}"'
+            return [
+                f'{t} ADD CONSTRAINT "{self.check_name}" CHECK ({col} IS NOT NULL) NOT VALID;',
+                f'{t} VALIDATE CONSTRAINT "{self.check_name}";',
+                f'{t} ALTER COLUMN {col} SET NOT NULL;',
+                f'{t} DROP CONSTRAINT "{self.check_name}";',
+            ]
+        if dialect == "sqlite":
+            return [f'-- SQLite: "{self.table}".{col} SET NOT NULL runs as a table rebuild.']
+        return [f'-- {dialect}: AddNotNull needs the column type; use AlterField for "{self.table}".{col}.']
+
+    def reverse_sql(self, dialect: str = "sqlite") -> List[str]:
+        if dialect == "postgresql":
+            return [f'ALTER TABLE "{self.table}" ALTER COLUMN "{self.column_name}" DROP NOT NULL;']
+        return [f'-- {dialect}: AddNotNull on "{self.table}"."{self.column_name}" is not auto-reversible']
+
+    def describe(self) -> str:
+        return f"AddNotNull({self.model_name}.{self.column_name})"
+
+
+# ── Backfill ────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class Backfill(Operation):
+    """
+    Update existing rows in key-ordered chunks, each in its own transaction.
+
+    ``values`` maps column names to SQL expressions.  The runner walks
+    ``key`` (a unique, indexed column) in ranges of ``batch_size`` rows,
+    sleeps ``throttle`` seconds between chunks, and records the last
+    committed key so an interrupted backfill resumes where it stopped.
+
+    Usage:
+        Backfill(
+            table="users",
+            values={"display_name": "first_name || ' ' || last_name"},
+            where="display_name IS NULL",
+            batch_size=5000,
+            throttle=0.05,
+        )
+    """
+
+    table: str
+    values: Dict[str, str] = field(default_factory=dict)
+    where: Optional[str] = None
+    key: str = "id"
+    batch_size: int = 1000
+    throttle: float = 0.0
+
+    atomic = False
+
+    def chunk_sql(self, *, first: bool = False) -> str:
+        """UPDATE for one key range; params are ``[hi]`` or ``[lo, hi]``."""
+        sets = ", ".join(f'"{col}" = {expr}' for col, expr in self.values.items())
+        key = f'"{self.key}"'
+        cond = f"{key} <= ?" if first else f"{key} > ? AND {key} <= ?"
+        if self.where:
+            cond += f" AND ({self.where})"
+        return f'UPDATE "{self.table}" SET {sets} WHERE {cond};'
+
+    def to_sql(self, dialect: str = "sqlite") -> List[str]:
+        return [
+            f"-- Backfill in batches of {self.batch_size} by \"{self.key}\": "
+            + self.chunk_sql()
+        ]
+
+    def reverse_sql(self, dialect: str = "sqlite") -> List[str]:
+        return []
+
+    def describe(self) -> str:
+        return f"Backfill({self.table}: {', '.join(self.values)}, batch={self.batch_size})"
+
+
 # ── RunSQL ──────────────────────────────────────────────────────────────────
 
 
@@ -722,6 +908,7 @@ class Migration:
     models: List[str] = field(default_factory=list)
     dependencies: List[str] = field(default_factory=list)
     operations: List[Operation] = field(default_factory=list)
+    atomic: bool = True  # False: commit after every operation
 
     def compile_upgrade(self, dialect: str = "sqlite") -> List[str]:
         """Compile all operations to forward SQL."""
@@ -8,6 +8,13 @@ Features:
 - DSL migration support (operations list)
 - Legacy raw-SQL migration support (upgrade/downgrade functions)
 - Transactional execution (per-migration)
+- Online steps: non-atomic operations run outside the migration
+  transaction, with progress recorded in ``aquilia_migration_progress``
+  so interrupted migrations resume
+- SQLite copy-and-swap table rebuilds for ALTER COLUMN
+- Compiled plans cached by file checksum (``.aquilia/migration_plans.json``)
+- Head hash of applied revisions (``aquilia_migration_head``) for a
+  constant-cost startup check
 - --fake flag (mark as applied without running)
 - --plan flag (dry-run SQL preview)
 - Safe SQLite probing (no WAL/SHM creation)
@@ -15,6 +22,7 @@ Features:
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import hashlib
 import importlib.util
@@ -28,11 +36,25 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from ..db.engine import AquiliaDatabase
 from ..faults.domains import MigrationFault, MigrationConflictFault, SchemaFault
-from .migration_dsl import Migration, Operation, RunPython, RunSQL
+from .migration_dsl import (
+    _SENTINEL,
+    _format_default,
+    AddNotNull,
+    AlterField,
+    Backfill,
+    Migration,
+    Operation,
+    RunPython,
+    RunSQL,
+)
 
 logger = logging.getLogger("aquilia.models.migration_runner")
 
 MIGRATION_TABLE = "aquilia_migrations"
+PROGRESS_TABLE = "aquilia_migration_progress"
+HEAD_TABLE = "aquilia_migration_head"
+PLAN_CACHE_FILE = "migration_plans.json"
+PLAN_CACHE_VERSION = 1
 
 
 @dataclass
@@ -69,6 +91,9 @@ class MigrationRunner:
         self.db = db
         self.migrations_dir = Path(migrations_dir)
         self.dialect = dialect
+        self._plan_cache = _PlanCache(
+            self.migrations_dir.parent / ".aquilia" / PLAN_CACHE_FILE, self.migrations_dir,
+        )
 
     async def ensure_tracking_table(self) -> None:
         """Create the aquilia_migrations tracking table if it doesn't exist."""
@@ -83,6 +108,31 @@ class MigrationRunner:
         """
         await self.db.execute(sql)
 
+    async def ensure_progress_table(self) -> None:
+        """Create the table recording steps of partially applied migrations."""
+        sql = f"""
+        CREATE TABLE IF NOT EXISTS "{PROGRESS_TABLE}" (
+            "revision" VARCHAR(50) NOT NULL,
+            "step" VARCHAR(100) NOT NULL,
+            "completed" INTEGER NOT NULL DEFAULT 0,
+            "position" TEXT,
+            "rows_done" BIGINT NOT NULL DEFAULT 0,
+            "updated_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY ("revision", "step")
+        );
+        """
+        await self.db.execute(sql)
+
+    async def get_progress(self, revision: str) -> Dict[str, Dict[str, Any]]:
+        """Recorded steps of a partially applied migration, keyed by step."""
+        await self.ensure_progress_table()
+        rows = await self.db.fetch_all(
+            f'SELECT "step", "completed", "position", "rows_done" '
+            f'FROM "{PROGRESS_TABLE}" WHERE "revision" = ?',
+            [revision],
+        )
+        return {r["step"]: r for r in rows}
+
     async def get_applied(self) -> List[str]:
         """Get list of applied revision IDs, ordered by application time."""
         await self.ensure_tracking_table()
@@ -150,16 +200,9 @@ class MigrationRunner:
         for path in pending:
             rev = _extract_revision(path) or path.stem
             statements.append(f"-- Migration: {rev} ({path.name})")
-            module = _load_migration_module(path, rev)
-
-            # Check for DSL migration
-            if hasattr(module, "operations"):
-                migration_obj = _build_migration_from_module(module)
-                for sql in migration_obj.compile_upgrade(self.dialect):
-                    statements.append(sql)
-            elif hasattr(module, "upgrade"):
-                statements.append(f"-- (Legacy: runs upgrade() from {path.name})")
+            statements.extend(self._compiled(path, rev, "plan"))
 
+        self._plan_cache.save()
         return statements
 
     async def sqlmigrate(self, revision: str) -> List[str]:
@@ -173,14 +216,36 @@ class MigrationRunner:
                 reason=f"Migration file not found for revision '{revision}'",
             )
 
-        module = _load_migration_module(path, revision)
+        stmts = self._compiled(path, revision, "sql")
+        self._plan_cache.save()
+        return stmts
+
+    def _compiled(self, path: Path, rev: str, kind: str) -> List[str]:
+        """
+        Compiled SQL of one migration file, served from the plan cache
+        when the file's checksum is unchanged.
+
+        ``kind`` is ``"plan"`` (DSL SQL, or a note for legacy files) or
+        ``"sql"`` (DSL SQL, or SQL scraped from a legacy file's source).
+        """
+        key = f"{kind}:{self.dialect}"
+        cached = self._plan_cache.get(path, key)
+        if cached is not None:
+            return cached
 
+        module = _load_migration_module(path, rev)
         if hasattr(module, "operations"):
-            migration_obj = _build_migration_from_module(module)
-            return migration_obj.compile_upgrade(self.dialect)
-        else:
+            stmts = _build_migration_from_module(module).compile_upgrade(self.dialect)
+        elif kind == "sql":
             # Legacy — try to extract SQL from source
-            return _extract_sql_from_source(path)
+            stmts = _extract_sql_from_source(path)
+        elif hasattr(module, "upgrade"):
+            stmts = [f"-- (Legacy: runs upgrade() from {path.name})"]
+        else:
+            stmts = []
+
+        self._plan_cache.put(path, key, stmts)
+        return stmts
 
     async def migrate(
         self,
@@ -218,6 +283,9 @@ class MigrationRunner:
             rev = _extract_revision(path) or path.stem
             applied.append(rev)
 
+        await self.update_head()
+        self._plan_cache.save()
+
         # Signal: post_migrate
         await post_migrate.send(sender=self.__class__, db=self.db)
 
@@ -227,7 +295,7 @@ class MigrationRunner:
         """Apply a single migration file."""
         rev = _extract_revision(path) or path.stem
         slug = _extract_slug(path)
-        checksum = _file_checksum(path)
+        checksum = self._plan_cache.checksum(path)
 
         module = _load_migration_module(path, rev)
 
@@ -254,40 +322,306 @@ class MigrationRunner:
             else:
                 logger.warning(f"Migration {rev} has no operations or upgrade(): skipping execution")
 
-        # Record migration
-        await self.db.execute(
-            f'INSERT INTO "{MIGRATION_TABLE}" ("revision", "slug", "checksum") VALUES (?, ?, ?)',
-            [rev, slug, checksum],
-        )
+        # Record migration (and drop any step progress in the same commit)
+        await self.ensure_progress_table()
+        async with self.db.transaction():
+            await self.db.execute(
+                f'INSERT INTO "{MIGRATION_TABLE}" ("revision", "slug", "checksum") VALUES (?, ?, ?)',
+                [rev, slug, checksum],
+            )
+            await self.db.execute(
+                f'DELETE FROM "{PROGRESS_TABLE}" WHERE "revision" = ?', [rev],
+            )
         action = "Faked" if fake else "Applied"
         logger.info(f"{action} migration: {rev} ({slug})")
 
     async def _execute_dsl_migration(self, migration: Migration) -> None:
-        """Execute a DSL migration transactionally."""
-        stmts = migration.compile_upgrade(self.dialect)
-        python_ops = migration.get_python_ops()
+        """
+        Execute a DSL migration.
+
+        A migration whose operations are all atomic runs in a single
+        transaction.  Otherwise it runs as a sequence of steps: each run
+        of consecutive atomic operations shares a transaction (one per
+        operation when ``Meta.atomic = False``) and every non-atomic
+        operation runs on its own.  Completed steps are recorded in
+        ``aquilia_migration_progress`` and skipped when an interrupted
+        migration is applied again.
+        """
+        rev = migration.revision
+        steps = self._plan_steps(migration)
 
         try:
-            async with self.db.transaction():
-                for sql in stmts:
-                    if sql.startswith("--"):
-                        continue  # Skip comments
-                    await self.db.execute(sql)
-
-                for py_op in python_ops:
-                    if py_op.forward:
-                        if inspect.iscoroutinefunction(py_op.forward):
-                            await py_op.forward(self.db)
-                        else:
-                            py_op.forward(self.db)
+            if len(steps) <= 1 and all(atomic for atomic, _ in steps):
+                async with self.db.transaction():
+                    for atomic, ops in steps:
+                        for op in ops:
+                            await self._run_op(rev, "step:0", op, {})
+                return
+
+            progress = await self.get_progress(rev)
+            for index, (atomic, ops) in enumerate(steps):
+                step = f"step:{index}"
+                if progress.get(step, {}).get("completed"):
+                    logger.info(f"{rev}: skipping completed {step}")
+                    continue
+                if atomic:
+                    async with self.db.transaction():
+                        for op in ops:
+                            await self._run_op(rev, step, op, progress)
+                        await self._save_progress(rev, step, completed=True)
+                else:
+                    await self._run_op(rev, step, ops[0], progress)
+                    async with self.db.transaction():
+                        await self._save_progress(rev, step, completed=True)
         except MigrationFault:
             raise
         except Exception as exc:
             raise MigrationFault(
-                migration=migration.revision,
+                migration=rev,
                 reason=f"DSL migration failed: {exc}",
             ) from exc
 
+    def _plan_steps(self, migration: Migration) -> List[Tuple[bool, List[Operation]]]:
+        """Group operations into ``(atomic, ops)`` execution steps."""
+        steps: List[Tuple[bool, List[Operation]]] = []
+        for op in migration.operations:
+            atomic = op.is_atomic(self.dialect)
+            if atomic and migration.atomic and steps and steps[-1][0]:
+                steps[-1][1].append(op)
+            else:
+                steps.append((atomic, [op]))
+        return steps
+
+    async def _run_op(
+        self,
+        rev: str,
+        step: str,
+        op: Operation,
+        progress: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Execute one operation (inside or outside a transaction)."""
+        if isinstance(op, RunPython):
+            if op.forward:
+                if inspect.iscoroutinefunction(op.forward):
+                    await op.forward(self.db)
+                else:
+                    op.forward(self.db)
+            return
+        if isinstance(op, Backfill):
+            await self._run_backfill(rev, step, op, progress.get(step))
+            return
+        if self.dialect == "sqlite" and isinstance(op, AddNotNull):
+            await self._sqlite_rebuild(op.table, op.column_name, nullable=False)
+            return
+        if self.dialect == "sqlite" and isinstance(op, AlterField):
+            await self._sqlite_rebuild(
+                op.table, op.column_name,
+                new_type=op.new_type,
+                nullable=op.nullable,
+                new_default=op.new_default,
+                drop_default=op.drop_default,
+            )
+            return
+
+        stmts = [sql for sql in op.to_sql(self.dialect) if not sql.startswith("--")]
+        if op.is_atomic(self.dialect) or len(stmts) < 2:
+            for sql in stmts:
+                await self.db.execute(sql)
+            return
+
+        # Multi-statement online operation: every statement commits on
+        # its own and is recorded, so a retry resumes after the last one.
+        for index, sql in enumerate(stmts):
+            sub = f"{step}.{index}"
+            if progress.get(sub, {}).get("completed"):
+                continue
+            await self.db.execute(sql)
+            async with self.db.transaction():
+                await self._save_progress(rev, sub, completed=True)
+
+    async def _save_progress(
+        self,
+        rev: str,
+        step: str,
+        *,
+        completed: bool = False,
+        position: Any = None,
+        rows_done: int = 0,
+    ) -> None:
+        """Record a step; the caller provides the surrounding transaction."""
+        await self.db.execute(
+            f'DELETE FROM "{PROGRESS_TABLE}" WHERE "revision" = ? AND "step" = ?',
+            [rev, step],
+        )
+        await self.db.execute(
+            f'INSERT INTO "{PROGRESS_TABLE}" '
+            f'("revision", "step", "completed", "position", "rows_done") '
+            f"VALUES (?, ?, ?, ?, ?)",
+            [rev, step, int(completed), json.dumps(position), rows_done],
+        )
+
+    async def _run_backfill(
+        self,
+        rev: str,
+        step: str,
+        op: Backfill,
+        saved: Optional[Dict[str, Any]],
+    ) -> None:
+        """
+        Run a ``Backfill`` in key ranges of ``op.batch_size`` rows.
+
+        Each chunk's UPDATE and its progress row commit together, so the
+        recorded position is always the last key actually updated.
+        Other writers only wait for one chunk at a time.
+        """
+        table = f'"{op.table}"'
+        key = f'"{op.key}"'
+        lo = json.loads(saved["position"]) if saved and saved.get("position") else None
+        rows_done = saved["rows_done"] if saved else 0
+        if lo is not None:
+            logger.info(f"{rev}: resuming backfill of {op.table} after {op.key}={lo!r}")
+
+        offset = max(int(op.batch_size), 1) - 1
+        while True:
+            after = f"WHERE {key} > ? " if lo is not None else ""
+            params: List[Any] = [lo] if lo is not None else []
+            hi = await self.db.fetch_val(
+                f"SELECT {key} FROM {table} {after}ORDER BY {key} LIMIT 1 OFFSET {offset}",
+                params,
+            )
+            last = hi is None
+            if last:
+                hi = await self.db.fetch_val(f"SELECT MAX({key}) FROM {table} {after}", params)
+                if hi is None:
+                    break
+
+            async with self.db.transaction():
+                cursor = await self.db.execute(op.chunk_sql(first=lo is None), params + [hi])
+                rows_done += max(getattr(cursor, "rowcount", 0) or 0, 0)
+                await self._save_progress(rev, step, position=hi, rows_done=rows_done)
+            lo = hi
+
+            if last:
+                break
+            if op.throttle > 0:
+                await asyncio.sleep(op.throttle)
+
+        logger.info(f"{rev}: backfilled {rows_done} rows of {op.table}")
+
+    async def _sqlite_rebuild(
+        self,
+        table: str,
+        column: str,
+        *,
+        new_type: Optional[str] = None,
+        nullable: Optional[bool] = None,
+        new_default: Any = _SENTINEL,
+        drop_default: bool = False,
+    ) -> None:
+        """
+        Alter a SQLite column with a copy-and-swap table rebuild.
+
+        Follows SQLite's documented procedure: with foreign keys off,
+        create the new table, copy the rows, drop the old table, rename
+        the new one into place and recreate indexes and triggers, then
+        run ``foreign_key_check`` before committing.  The primary key,
+        AUTOINCREMENT, UNIQUE and FOREIGN KEY constraints are carried
+        over; CHECK constraints, collations and generated columns are
+        not.  Writers are blocked for the duration of the copy.
+        """
+        info = await self.db.fetch_all(f'PRAGMA table_info("{table}")')
+        if not info:
+            raise SchemaFault(table=table, reason=f"Cannot rebuild missing table '{table}'")
+        if column not in {c["name"] for c in info}:
+            raise SchemaFault(table=table, reason=f"Column '{column}' not found on '{table}'")
+
+        create_sql = await self.db.fetch_val(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name=?", [table],
+        ) or ""
+        for lost in ("CHECK", "COLLATE", "GENERATED"):
+            if lost in create_sql.upper():
+                logger.warning(f"Rebuild of {table}: {lost} clauses are not preserved")
+
+        pk_cols = [c["name"] for c in sorted(info, key=lambda c: c["pk"]) if c["pk"]]
+        autoincrement = "AUTOINCREMENT" in create_sql.upper()
+
+        col_defs: List[str] = []
+        for c in info:
+            col_type = c["type"]
+            notnull = bool(c["notnull"])
+            default = f"({c['dflt_value']})" if c["dflt_value"] is not None else None
+            if c["name"] == column:
+                col_type = new_type or col_type
+                if nullable is not None:
+                    notnull = not nullable
+                if drop_default:
+                    default = None
+                elif new_default is not _SENTINEL:
+                    default = _format_default(new_default, "sqlite")
+            parts = [f'"{c["name"]}"', col_type]
+            if pk_cols == [c["name"]]:
+                parts.append("PRIMARY KEY")
+                if autoincrement:
+                    parts.append("AUTOINCREMENT")
+            if notnull:
+                parts.append("NOT NULL")
+            if default is not None:
+                parts.append(f"DEFAULT {default}")
+            col_defs.append(" ".join(p for p in parts if p))
+
+        if len(pk_cols) > 1:
+            col_defs.append("PRIMARY KEY ({})".format(", ".join(f'"{c}"' for c in pk_cols)))
+        for idx in await self.db.fetch_all(f'PRAGMA index_list("{table}")'):
+            if idx.get("origin") == "u":
+                cols = await self.db.fetch_all(f'PRAGMA index_info("{idx["name"]}")')
+                col_defs.append("UNIQUE ({})".format(", ".join(f'"{i["name"]}"' for i in cols)))
+        fks: Dict[int, List[Dict[str, Any]]] = {}
+        for fk in await self.db.fetch_all(f'PRAGMA foreign_key_list("{table}")'):
+            fks.setdefault(fk["id"], []).append(fk)
+        for refs in fks.values():
+            refs.sort(key=lambda r: r["seq"])
+            src = ", ".join(f'"{r["from"]}"' for r in refs)
+            dst = ", ".join(f'"{r["to"]}"' for r in refs if r["to"])
+            col_defs.append(
+                f'FOREIGN KEY ({src}) REFERENCES "{refs[0]["table"]}"'
+                + (f" ({dst})" if dst else "")
+                + f' ON DELETE {refs[0]["on_delete"]} ON UPDATE {refs[0]["on_update"]}'
+            )
+
+        extras = await self.db.fetch_all(
+            "SELECT sql FROM sqlite_master WHERE type IN ('index', 'trigger') "
+            "AND tbl_name=? AND sql IS NOT NULL",
+            [table],
+        )
+        tmp = f"__aq_rebuild_{table}"
+        names = ", ".join(f'"{c["name"]}"' for c in info)
+        body = ",\n  ".join(col_defs)
+
+        fk_enabled = await self.db.fetch_val("PRAGMA foreign_keys")
+        if fk_enabled:
+            await self.db.execute("PRAGMA foreign_keys=OFF")
+        try:
+            async with self.db.transaction():
+                await self.db.execute(f'DROP TABLE IF EXISTS "{tmp}"')
+                await self.db.execute(f'CREATE TABLE "{tmp}" (\n  {body}\n)')
+                await self.db.execute(
+                    f'INSERT INTO "{tmp}" ({names}) SELECT {names} FROM "{table}"'
+                )
+                await self.db.execute(f'DROP TABLE "{table}"')
+                await self.db.execute(f'ALTER TABLE "{tmp}" RENAME TO "{table}"')
+                for row in extras:
+                    await self.db.execute(row["sql"])
+                if fk_enabled:
+                    violations = await self.db.fetch_all(f'PRAGMA foreign_key_check("{table}")')
+                    if violations:
+                        raise SchemaFault(
+                            table=table,
+                            reason=f"Rebuild would violate {len(violations)} foreign key(s)",
+                        )
+        finally:
+            if fk_enabled:
+                await self.db.execute("PRAGMA foreign_keys=ON")
+
     async def _rollback_to(self, target: str, *, fake: bool = False) -> List[str]:
         """Rollback to a specific revision."""
         applied = await self.get_applied()
@@ -335,8 +669,44 @@ class MigrationRunner:
             action = "Faked rollback" if fake else "Rolled back"
             logger.info(f"{action} migration: {rev}")
 
+        await self.update_head()
         return rolled_back
 
+    async def update_head(self) -> str:
+        """
+        Store the hash of the applied revision set in ``aquilia_migration_head``.
+
+        ``check_migrations_applied`` compares it with the hash of the
+        revisions on disk and only falls back to a per-revision check
+        when they differ.  The row count and last id of
+        ``aquilia_migrations`` are stored alongside, so writers that do
+        not update the head (the legacy runner, manual rollbacks)
+        invalidate it.
+        """
+        applied = await self.get_applied()
+        head = _head_hash(applied)
+        stamp = await self.db.fetch_one(
+            f'SELECT COUNT(*) AS "count", MAX("id") AS "last_id" FROM "{MIGRATION_TABLE}"'
+        )
+        await self.db.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS "{HEAD_TABLE}" (
+                "id" INTEGER PRIMARY KEY,
+                "head" VARCHAR(64) NOT NULL,
+                "count" INTEGER NOT NULL,
+                "last_id" INTEGER,
+                "updated_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            );
+            """
+        )
+        async with self.db.transaction():
+            await self.db.execute(f'DELETE FROM "{HEAD_TABLE}"')
+            await self.db.execute(
+                f'INSERT INTO "{HEAD_TABLE}" ("id", "head", "count", "last_id") VALUES (1, ?, ?, ?)',
+                [head, stamp["count"], stamp["last_id"]],
+            )
+        return head
+
     def _find_migration_file(self, revision: str) -> Optional[Path]:
         """Find migration file by revision prefix."""
         if not self.migrations_dir.exists():
@@ -426,6 +796,21 @@ def check_migrations_applied(db_url: str, migrations_dir: str | Path = "migratio
                 conn.close()
                 return False  # No migration table → not migrated
 
+            # Fast path: one row holding the hash of the applied set,
+            # valid while aquilia_migrations is as it was when written
+            revisions = [r for r in map(_extract_revision, migration_files) if r]
+            try:
+                row = conn.execute(
+                    f'SELECT "head", "count" = (SELECT COUNT(*) FROM "{MIGRATION_TABLE}") '
+                    f'AND "last_id" IS (SELECT MAX("id") FROM "{MIGRATION_TABLE}") AS "current" '
+                    f'FROM "{HEAD_TABLE}" WHERE "id" = 1'
+                ).fetchone()
+            except sqlite3.OperationalError:
+                row = None  # Migrated before head tracking existed
+            if row and row["current"] and row["head"] == _head_hash(revisions):
+                conn.close()
+                return True
+
             cursor = conn.execute(
                 f'SELECT "revision" FROM "{MIGRATION_TABLE}" ORDER BY "id"'
             )
@@ -478,6 +863,83 @@ def _file_checksum(path: Path) -> str:
     return hashlib.sha256(content).hexdigest()[:16]
 
 
+def _head_hash(revisions: Sequence[str]) -> str:
+    """Order-independent hash of a set of revision IDs."""
+    raw = "\n".join(sorted(set(revisions)))
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+class _PlanCache:
+    """
+    Compiled migration SQL keyed by file checksum, persisted as JSON
+    in the ``.aquilia/`` artifact directory beside ``migrations_dir``.
+
+    Checksums are memoized by ``(mtime_ns, size)`` so unchanged files
+    are neither imported nor re-read.  Entries for a checksum stay valid
+    for as long as the file content is the same; the cache is dropped
+    when the Aquilia version or cache format changes.
+    """
+
+    def __init__(self, path: Path, migrations_dir: Path):
+        self.path = path
+        self.migrations_dir = migrations_dir
+        self._data: Optional[Dict[str, Any]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            from .. import __version__
+
+            stamp = f"{PLAN_CACHE_VERSION}:{__version__}"
+            data: Dict[str, Any] = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                pass
+            if not isinstance(data, dict) or data.get("version") != stamp:
+                data = {"version": stamp, "files": {}, "plans": {}}
+            self._data = data
+        return self._data
+
+    def checksum(self, path: Path) -> str:
+        files = self._load()["files"]
+        st = path.stat()
+        entry = files.get(path.name)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        checksum = _file_checksum(path)
+        files[path.name] = [st.st_mtime_ns, st.st_size, checksum]
+        self._dirty = True
+        return checksum
+
+    def get(self, path: Path, key: str) -> Optional[List[str]]:
+        return self._load()["plans"].get(self.checksum(path), {}).get(key)
+
+    def put(self, path: Path, key: str, stmts: List[str]) -> None:
+        self._load()["plans"].setdefault(self.checksum(path), {})[key] = list(stmts)
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty or self._data is None:
+            return
+        files = {
+            name: entry for name, entry in self._data["files"].items()
+            if (self.migrations_dir / name).exists()
+        }
+        live = {entry[2] for entry in files.values()}
+        self._data["files"] = files
+        self._data["plans"] = {k: v for k, v in self._data["plans"].items() if k in live}
+        try:
+            from ..trace.core import AquiliaTrace
+
+            # Creates .aquilia/ with its .gitignore on first use
+            AquiliaTrace(self.path.parent.parent).ensure_dir()
+            self.path.write_text(json.dumps(self._data, sort_keys=True), encoding="utf-8")
+            self._dirty = False
+        except OSError as exc:
+            logger.debug(f"Plan cache not saved ({self.path}): {exc}")
+
+
 def _load_migration_module(path: Path, rev: str) -> Any:
     """Load a migration Python module from file path."""
     spec = importlib.util.spec_from_file_location(f"migration_{rev}", path)
@@ -504,6 +966,7 @@ def _build_migration_from_module(module: Any) -> Migration:
     slug = getattr(meta, "slug", "") if meta else getattr(module, "slug", "")
     models = getattr(meta, "models", []) if meta else getattr(module, "models", [])
     deps = getattr(meta, "dependencies", []) if meta else []
+    atomic = getattr(meta, "atomic", True) if meta else getattr(module, "atomic", True)
     operations = getattr(module, "operations", [])
 
     return Migration(
@@ -512,6 +975,7 @@ def _build_migration_from_module(module: Any) -> Migration:
         models=models,
         dependencies=deps,
         operations=operations,
+        atomic=atomic,
     )
 
 
@@ -219,11 +219,18 @@ class MigrationOps:
         columns: List[str],
         unique: bool = False,
         condition: Optional[str] = None,
+        concurrently: bool = False,
     ) -> None:
-        """Generate CREATE INDEX (with optional partial index condition)."""
+        """
+        Generate CREATE INDEX (with optional partial index condition).
+
+        ``concurrently`` builds the index without blocking writes on
+        PostgreSQL; the statement must then run outside a transaction.
+        """
         u = "UNIQUE " if unique else ""
+        conc = "CONCURRENTLY " if concurrently and self._dialect == "postgresql" else ""
         cols = ", ".join(f'"{c}"' for c in columns)
-        sql = f'CREATE {u}INDEX IF NOT EXISTS "{name}" ON "{table}" ({cols})'
+        sql = f'CREATE {u}INDEX {conc}IF NOT EXISTS "{name}" ON "{table}" ({cols})'
         if condition and self._dialect != "mysql":
             sql += f" WHERE ({condition})"
         self._statements.append(sql + ";")
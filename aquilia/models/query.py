@@ -24,6 +24,9 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple, Type, TYPE_CHECKING
 
 from .fields.lookups import resolve_lookup, lookup_registry
+from ..db.routing import db_for_write, route_read
+from .loader import current_loader, peek_loader
+from .query_cache import cached_read, invalidate_model
 
 # Module-level cached lookup registry — avoid calling lookup_registry()
 # on every filter clause.
@@ -239,6 +242,7 @@ class Q:
         exclude(**kwargs)         — Negated filter
         where(clause, *args)     — Raw parameterized WHERE (Aquilia-only)
         order(*fields)           — ORDER BY ("-field" for DESC, "?" for RANDOM)
+        reverse()                — Flip ORDER BY directions
         limit(n)                 — LIMIT
         offset(n)                — OFFSET
         distinct()               — SELECT DISTINCT
@@ -251,6 +255,7 @@ class Q:
         prefetch_related(*fields)— Separate-query prefetching
         apply_q(QNode)           — Apply composable QNode filter
         using(db_alias)          — Target specific database
+        cache(ttl)               — Cache results, invalidated on writes
         select_for_update()      — SELECT ... FOR UPDATE (locking)
         none()                   — Return empty queryset
 
@@ -294,6 +299,7 @@ class Q:
         "_select_for_update",
         "_is_none",
         "_set_operations",
+        "_cache_ttl",
     )
 
     def __init__(self, table: str, model_cls: Type[Model], db: AquiliaDatabase):
@@ -318,6 +324,7 @@ class Q:
         self._select_for_update: bool = False
         self._is_none: bool = False
         self._set_operations: List[Tuple[str, Q]] = []
+        self._cache_ttl: Optional[int] = None
 
     # ── Dialect helper ───────────────────────────────────────────────
 
@@ -333,6 +340,23 @@ class Q:
                 return 'mysql'
         return 'sqlite'
 
+    # ── Database routing ─────────────────────────────────────────────
+
+    def _write_db(self) -> AquiliaDatabase:
+        """Database for writes (``using()`` alias, router, or default)."""
+        loader = peek_loader()
+        if loader is not None:
+            loader.forget(self._model_cls)
+        return db_for_write(self._model_cls, self._db_alias, self._db)
+
+    async def _read(self, method: str, sql: str, params: List[Any]) -> Any:
+        """Run a read on the routed database (replica-aware)."""
+        if self._select_for_update:
+            return await getattr(self._write_db(), method)(sql, params)
+        if self._cache_ttl is not None:
+            return await cached_read(self, method, sql, params, self._cache_ttl)
+        return await route_read(self._model_cls, method, sql, params, self._db_alias, self._db)
+
     # ── Chain methods (return new Q) ─────────────────────────────────
 
     def where(self, clause: str, *args: Any, **kwargs: Any) -> Q:
@@ -458,6 +482,27 @@ class Q:
     # Django-style alias
     order_by = order
 
+    def reverse(self) -> Q:
+        """
+        Flip the direction of every ORDER BY clause (Django-style).
+
+        Clauses that are neither ASC nor DESC (e.g. RANDOM()) are kept as-is.
+
+        Usage:
+            newest_last = Post.objects.order("-created_at").reverse()
+        """
+        new = self._clone()
+        reversed_order = []
+        for clause in new._order_clauses:
+            if clause.endswith(" ASC"):
+                reversed_order.append(clause[:-4] + " DESC")
+            elif clause.endswith(" DESC"):
+                reversed_order.append(clause[:-5] + " ASC")
+            else:
+                reversed_order.append(clause)
+        new._order_clauses = reversed_order
+        return new
+
     # ── Set Operations (Django-style) ────────────────────────────────
 
     def union(self, *querysets: Q, all: bool = False) -> Q:
@@ -632,6 +677,9 @@ class Q:
         """
         Target a specific database for this query (Django-style).
 
+        The alias bypasses any configured ``DatabaseRouter`` and replica
+        balancing (see ``aquilia.db.routing``).
+
         Usage:
             users = await User.objects.using("replica").filter(active=True).all()
         """
@@ -639,6 +687,21 @@ class Q:
         new._db_alias = db_alias
         return new
 
+    def cache(self, ttl: int = 300) -> Q:
+        """
+        Cache this query's results for ``ttl`` seconds (Aquilia-only).
+
+        Entries are keyed on the compiled SQL and parameters and dropped
+        automatically when any table the query reads is written through
+        the ORM (see ``aquilia.models.query_cache``).
+
+        Usage:
+            tags = await Tag.objects.order("name").cache(ttl=600).all()
+        """
+        new = self._clone()
+        new._cache_ttl = ttl
+        return new
+
     def apply_q(self, q_node: QNode) -> Q:
         """
         Apply a QNode filter to this queryset (Aquilia-only).
@@ -720,6 +783,7 @@ class Q:
         c._select_for_update = self._select_for_update
         c._is_none = self._is_none
         c._set_operations = self._set_operations[:] if self._set_operations else []
+        c._cache_ttl = self._cache_ttl
         return c
 
     def _build_select(self, count: bool = False) -> Tuple[str, List[Any]]:
@@ -842,8 +906,13 @@ class Q:
                 sql = f"({sql}) {op} ({other_sql})"
                 params.extend(other_params)
 
-        rows = await self._db.fetch_all(sql, params)
+        rows = await self._read("fetch_all", sql, params)
         instances = [self._model_cls.from_row(row) for row in rows]
+        if len(instances) > 1:
+            # Lets related() on any of them batch-load for all of them
+            loader = current_loader()
+            if loader is not None:
+                loader.track(instances)
 
         # ── prefetch_related: execute separate queries for related objects ──
         if self._prefetch_related and instances:
@@ -941,7 +1010,7 @@ class Q:
                     f'SELECT "{src_col}", "{tgt_col}" FROM "{jt}" '
                     f'WHERE "{src_col}" IN ({placeholders})'
                 )
-                junction_rows = await self._db.fetch_all(junction_sql, pk_values)
+                junction_rows = await self._read("fetch_all", junction_sql, pk_values)
 
                 # Collect target IDs
                 target_ids = set()
@@ -992,7 +1061,7 @@ class Q:
         from ..faults.domains import ModelNotFoundFault, QueryFault
         sql, params = self._build_select()
         sql += " LIMIT 2"
-        rows = await self._db.fetch_all(sql, params)
+        rows = await self._read("fetch_all", sql, params)
         if len(rows) == 0:
             raise ModelNotFoundFault(model_name=self._model_cls.__name__)
         if len(rows) > 1:
@@ -1009,7 +1078,7 @@ class Q:
             return None
         sql, params = self._build_select()
         sql += " LIMIT 1"
-        rows = await self._db.fetch_all(sql, params)
+        rows = await self._read("fetch_all", sql, params)
         if not rows:
             return None
         return self._model_cls.from_row(rows[0])
@@ -1018,18 +1087,10 @@ class Q:
         """Return last matching row or None (reverses ordering)."""
         if self._is_none:
             return None
-        new = self._clone()
-        if new._order_clauses:
-            reversed_order = []
-            for clause in new._order_clauses:
-                if clause.endswith(" ASC"):
-                    reversed_order.append(clause.replace(" ASC", " DESC"))
-                elif clause.endswith(" DESC"):
-                    reversed_order.append(clause.replace(" DESC", " ASC"))
-                else:
-                    reversed_order.append(clause)
-            new._order_clauses = reversed_order
+        if self._order_clauses:
+            new = self.reverse()
         else:
+            new = self._clone()
             pk = self._model_cls._pk_name
             new._order_clauses = [f'"{pk}" DESC']
         return await new.first()
@@ -1073,7 +1134,7 @@ class Q:
         if self._is_none:
             return 0
         sql, params = self._build_select(count=True)
-        val = await self._db.fetch_val(sql, params)
+        val = await self._read("fetch_val", sql, params)
         return int(val) if val else 0
 
     async def exists(self) -> bool:
@@ -1123,7 +1184,8 @@ class Q:
             sql += " WHERE " + " AND ".join(f"({w})" for w in self._wheres)
             params.extend(self._params)
 
-        cursor = await self._db.execute(sql, params)
+        cursor = await self._write_db().execute(sql, params)
+        await invalidate_model(self._model_cls)
         return cursor.rowcount
 
     async def delete(self) -> int:
@@ -1136,7 +1198,8 @@ class Q:
         if self._wheres:
             sql += " WHERE " + " AND ".join(f"({w})" for w in self._wheres)
 
-        cursor = await self._db.execute(sql, params)
+        cursor = await self._write_db().execute(sql, params)
+        await invalidate_model(self._model_cls)
         return cursor.rowcount
 
     async def values(self, *fields: str) -> List[Dict[str, Any]]:
@@ -1204,7 +1267,7 @@ class Q:
                 sql = f"({sql}) {op} ({other_sql})"
                 params.extend(other_params)
 
-        rows = await self._db.fetch_all(sql, params)
+        rows = await self._read("fetch_all", sql, params)
         return rows
 
     async def values_list(self, *fields: str, flat: bool = False) -> List[Any]:
@@ -1233,7 +1296,7 @@ class Q:
         pk_name = self._model_cls._pk_name
         placeholders = ", ".join("?" for _ in id_list)
         sql = f'SELECT * FROM "{self._table}" WHERE "{pk_name}" IN ({placeholders})'
-        rows = await self._db.fetch_all(sql, list(id_list))
+        rows = await self._read("fetch_all", sql, list(id_list))
         result = {}
         pk_attr = self._model_cls._pk_attr
         for row in rows:
@@ -1274,7 +1337,7 @@ class Q:
             sql += " WHERE " + " AND ".join(f"({w})" for w in self._wheres)
             params.extend(self._params)
 
-        row = await self._db.fetch_one(sql, params)
+        row = await self._read("fetch_one", sql, params)
         return dict(row) if row else {alias: None for alias in expressions}
 
     async def create(self, **data: Any) -> Model:
@@ -1318,7 +1381,7 @@ class Q:
         """
         sql, params = self._build_select()
         explain_sql = f"EXPLAIN QUERY PLAN {sql}"
-        rows = await self._db.fetch_all(explain_sql, params)
+        rows = await self._read("fetch_all", explain_sql, params)
         return "\n".join(str(row) for row in rows)
 
     # ── Iteration support ────────────────────────────────────────────
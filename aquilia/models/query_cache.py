@@ -0,0 +1,217 @@
+"""
+Aquilia Query Cache — opt-in result caching for ``Q`` with table-level
+invalidation.
+
+``Q.cache(ttl=...)`` stores the raw rows of a read in a ``CacheService``,
+keyed on the compiled SQL, its parameters and the target database, and
+tagged with every table the statement reads.  Writes invalidate by table:
+
+- ``Q.update()`` / ``Q.delete()`` / ``bulk_create`` / ``bulk_update`` and
+  M2M ``attach`` / ``detach`` invalidate once the statement has run;
+- ``post_save`` / ``post_delete`` cover ``create``, ``save`` and ``delete``;
+- inside ``atomic()`` invalidation is deferred until the outermost commit
+  (and dropped on rollback), and cached reads are bypassed, so a
+  transaction always sees its own writes.
+
+The cache service is the one registered with
+``aquilia.cache.set_default_cache_service`` (done by the server when the
+cache integration is enabled), falling back to a process-local memory cache.
+
+Usage:
+    users = await User.objects.filter(active=True).cache(ttl=60).all()
+    query_cache_stats()["User"]   # {"hits": 9, "misses": 1, "hit_rate": 0.9, ...}
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from ..db.routing import route_read
+from .signals import post_delete, post_save
+
+logger = logging.getLogger("aquilia.models.query_cache")
+
+__all__ = [
+    "query_cache_stats",
+    "reset_query_cache_stats",
+    "invalidate_tables",
+]
+
+NAMESPACE = "orm"
+
+_TABLE_RE = re.compile(r'\b(?:FROM|JOIN)\s+"?([A-Za-z_][\w]*)"?', re.IGNORECASE)
+
+# model name → [hits, misses, invalidations]
+_stats: Dict[str, List[int]] = {}
+
+# Tables with entries cached by this process — lets writes to uncached
+# tables skip the backend round trip (distributed backends always go).
+_cached_tables: Set[str] = set()
+
+# Tables written inside the current atomic() block, flushed on commit
+_deferred: contextvars.ContextVar[Optional[Set[str]]] = contextvars.ContextVar(
+    "aquilia_query_cache_deferred", default=None,
+)
+
+_fallback_service: Any = None
+
+
+async def _service() -> Any:
+    global _fallback_service
+    from ..cache.decorators import get_default_cache_service
+
+    service = get_default_cache_service()
+    if service is not None:
+        return service
+    if _fallback_service is None:
+        from ..cache.backends.memory import MemoryBackend
+        from ..cache.service import CacheService
+
+        _fallback_service = CacheService(MemoryBackend(max_size=5000))
+        await _fallback_service.initialize()
+    return _fallback_service
+
+
+def _counters(model_cls: Any) -> List[int]:
+    name = model_cls.__name__
+    counters = _stats.get(name)
+    if counters is None:
+        counters = _stats[name] = [0, 0, 0]
+    return counters
+
+
+def tables_read(sql: str) -> Set[str]:
+    """Tables a SELECT statement reads (FROM and JOIN targets)."""
+    return set(_TABLE_RE.findall(sql))
+
+
+async def cached_read(query: Any, method: str, sql: str, params: List[Any], ttl: Optional[int]) -> Any:
+    """``Q._read`` for a query marked with ``.cache()``."""
+    model_cls = query._model_cls
+    if _deferred.get() is not None:
+        # Inside atomic(): the cache cannot see uncommitted writes
+        return await route_read(model_cls, method, sql, params, query._db_alias, query._db)
+
+    service = await _service()
+    digest = hashlib.blake2b(
+        repr((query._db_alias, method, sql, params)).encode(), digest_size=16,
+    ).hexdigest()
+    key = f"q:{digest}"
+    counters = _counters(model_cls)
+
+    hit = await service.get(key, namespace=NAMESPACE, default=_MISS)
+    if hit is not _MISS:
+        counters[0] += 1
+        return _copy_rows(method, hit)
+
+    counters[1] += 1
+    result = await route_read(model_cls, method, sql, params, query._db_alias, query._db)
+    tables = tables_read(sql)
+    _cached_tables.update(tables)
+    await service.set(
+        key, result, ttl=ttl, namespace=NAMESPACE,
+        tags=tuple(f"table:{t}" for t in tables),
+    )
+    # In-memory backends keep a reference to the stored value
+    return _copy_rows(method, result)
+
+
+def _copy_rows(method: str, value: Any) -> Any:
+    """Hand out copies: callers may mutate ``values()`` rows."""
+    if method == "fetch_all":
+        return [dict(row) for row in value]
+    if method == "fetch_one" and value is not None:
+        return dict(value)
+    return value
+
+
+async def invalidate_tables(tables: Iterable[str], model_cls: Any = None) -> None:
+    """
+    Drop every cached query that read one of ``tables``.
+
+    Inside ``atomic()`` the tables are remembered and invalidated when
+    the outermost block commits.
+    """
+    deferred = _deferred.get()
+    if deferred is not None:
+        deferred.update(tables)
+        return
+
+    from ..cache.decorators import get_default_cache_service
+
+    service = get_default_cache_service() or _fallback_service
+    if service is None:
+        return
+    if not service.is_distributed:
+        tables = [t for t in tables if t in _cached_tables]
+        if not tables:
+            return
+    if model_cls is not None:
+        _counters(model_cls)[2] += 1
+    try:
+        await service.invalidate_tags(*(f"table:{t}" for t in tables))
+    except Exception as exc:
+        logger.warning(f"Query cache invalidation failed for {tables}: {exc}")
+
+
+async def invalidate_model(model_cls: Any) -> None:
+    await invalidate_tables((model_cls._table_name,), model_cls)
+
+
+# ── atomic() integration ─────────────────────────────────────────────
+
+
+def begin_deferral() -> contextvars.Token:
+    """Start collecting invalidations (outermost ``atomic()`` entry)."""
+    return _deferred.set(set())
+
+
+async def end_deferral(token: contextvars.Token, committed: bool) -> None:
+    """Stop collecting and, if the transaction committed, invalidate."""
+    tables = _deferred.get()
+    _deferred.reset(token)
+    if committed and tables:
+        await invalidate_tables(tables)
+
+
+# ── Signals ──────────────────────────────────────────────────────────
+
+
+async def _on_model_write(sender: Any, **kwargs: Any) -> None:
+    await invalidate_model(sender)
+
+
+post_save.connect(_on_model_write)
+post_delete.connect(_on_model_write)
+
+
+# ── Stats ────────────────────────────────────────────────────────────
+
+
+def query_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-model hit/miss counts and hit rates since the last reset."""
+    report = {}
+    for name, (hits, misses, invalidations) in sorted(_stats.items()):
+        total = hits + misses
+        report[name] = {
+            "hits": hits,
+            "misses": misses,
+            "invalidations": invalidations,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+        }
+    return report
+
+
+def reset_query_cache_stats() -> None:
+    _stats.clear()
+
+
+class _Miss:
+    __slots__ = ()
+
+
+_MISS = _Miss()
@@ -8,7 +8,7 @@ creates tables, and manages the global database connection.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Type, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..db.engine import AquiliaDatabase
@@ -31,6 +31,8 @@ class ModelRegistry:
     _models: Dict[str, Type[Model]] = {}
     _db: Optional[AquiliaDatabase] = None
     _app_models: Dict[str, Dict[str, Type[Model]]] = {}  # app_label → {name → cls}
+    # target model name → {related_name → (model with the FK, FK attr name)}
+    _reverse: Dict[str, Dict[str, Tuple[Type[Model], str]]] = {}
 
     @classmethod
     def register(cls, model_cls: Type[Model]) -> None:
@@ -44,6 +46,13 @@ class ModelRegistry:
             cls._app_models[app] = {}
         cls._app_models[app][name] = model_cls
 
+        # Index reverse FK accessors so related() needs no registry scan
+        from .fields_module import ForeignKey
+        for attr_name, field in model_cls._fields.items():
+            if isinstance(field, ForeignKey) and field.related_name:
+                target = field.to if isinstance(field.to, str) else field.to.__name__
+                cls._reverse.setdefault(target, {})[field.related_name] = (model_cls, attr_name)
+
         # Resolve any pending forward FK references
         cls._resolve_relations()
 
@@ -52,6 +61,11 @@ class ModelRegistry:
         """Get model class by name."""
         return cls._models.get(name)
 
+    @classmethod
+    def reverse_relation(cls, model_name: str, related_name: str) -> Optional[Tuple[Type[Model], str]]:
+        """Model and FK attribute behind ``related_name`` on ``model_name``."""
+        return cls._reverse.get(model_name, {}).get(related_name)
+
     @classmethod
     def all_models(cls) -> Dict[str, Type[Model]]:
         """Get all registered models."""
@@ -204,6 +218,7 @@ class ModelRegistry:
         """Clear registry (for testing)."""
         cls._models.clear()
         cls._app_models.clear()
+        cls._reverse.clear()
         cls._db = None
 
     @classmethod
@@ -8,7 +8,8 @@ Provides:
 - DSL operation generation from diffs
 
 The snapshot is a JSON-serializable dict describing every model, field,
-index, and constraint in the current codebase.
+index, and constraint in the current codebase.  Each model carries a
+fingerprint of its own schema, so diffing skips unchanged models.
 """
 
 from __future__ import annotations
@@ -69,7 +70,8 @@ def create_snapshot(model_classes: list) -> Dict[str, Any]:
                         "ordering": ["-created_at"],
                         "abstract": false,
                         "managed": true,
-                    }
+                    },
+                    "fingerprint": "<sha256 of the model entry>",
                 }
             }
         }
@@ -135,12 +137,14 @@ def create_snapshot(model_classes: list) -> Dict[str, Any]:
             "managed": meta.managed,
         }
 
-        models_data[name] = {
+        model_data = {
             "table": table,
             "fields": fields_data,
             "indexes": indexes_data,
             "meta": meta_data,
         }
+        model_data["fingerprint"] = _model_fingerprint(model_data)
+        models_data[name] = model_data
 
     snapshot = {
         "version": SNAPSHOT_VERSION,
@@ -282,6 +286,13 @@ def _compute_checksum(snapshot: Dict[str, Any]) -> str:
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
+def _model_fingerprint(model_data: Dict[str, Any]) -> str:
+    """Stable hash of one model entry (excluding its fingerprint)."""
+    data = {k: v for k, v in model_data.items() if k != "fingerprint"}
+    raw = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
 def save_snapshot(snapshot: Dict[str, Any], path: Path) -> None:
     """Write snapshot to JSON file."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -353,8 +364,15 @@ def compute_diff(old_snapshot: Dict[str, Any], new_snapshot: Dict[str, Any]) ->
     Compute the diff between two schema snapshots.
 
     Includes heuristics for detecting renames (models and fields)
-    to avoid data-loss migrations.
+    to avoid data-loss migrations.  Identical snapshot checksums short
+    circuit the whole diff, and models whose fingerprints match are not
+    compared field by field.  Snapshots saved before fingerprints were
+    recorded are fingerprinted on the fly.
     """
+    checksum = old_snapshot.get("checksum")
+    if checksum and checksum == new_snapshot.get("checksum"):
+        return SchemaDiff()
+
     old_models = old_snapshot.get("models", {})
     new_models = new_snapshot.get("models", {})
 
@@ -386,7 +404,12 @@ def compute_diff(old_snapshot: Dict[str, Any], new_snapshot: Dict[str, Any]) ->
         common_pairs.append((old_name, new_name))
 
     for old_name, new_name in common_pairs:
-        model_diff = _diff_model(old_models[old_name], new_models[new_name])
+        old_model, new_model = old_models[old_name], new_models[new_name]
+        if old_name == new_name and (
+            old_model.get("fingerprint") or _model_fingerprint(old_model)
+        ) == (new_model.get("fingerprint") or _model_fingerprint(new_model)):
+            continue
+        model_diff = _diff_model(old_model, new_model)
         if model_diff.has_changes:
             diff.altered_models[new_name] = model_diff
 
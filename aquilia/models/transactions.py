@@ -40,6 +40,9 @@ import weakref
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator, Callable, List, Optional, TYPE_CHECKING
 
+from ..db.routing import enter_atomic, exit_atomic
+from .query_cache import begin_deferral, end_deferral
+
 if TYPE_CHECKING:
     from ..db.engine import AquiliaDatabase
 
@@ -59,7 +62,7 @@ _task_depths: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
 class _DepthHolder:
     """Weak-referenceable holder for an integer depth counter."""
-    __slots__ = ("value",)
+    __slots__ = ("value", "__weakref__")
 
     def __init__(self, value: int = 0):
         self.value = value
@@ -130,6 +133,8 @@ class Atomic:
         self._depth_holder: Optional[_DepthHolder] = None
         self._commit_hooks: List[Callable] = []
         self._rollback_hooks: List[Callable] = []
+        self._route_token = None
+        self._cache_token = None
 
     def _get_db(self) -> AquiliaDatabase:
         if self._db is not None:
@@ -190,8 +195,10 @@ class Atomic:
             if self._isolation and db.driver != "sqlite":
                 await db.execute(f"SET TRANSACTION ISOLATION LEVEL {self._isolation}")
 
-            await db.execute("BEGIN")
+            await db.begin()
             self._depth_holder.value = 1
+            # Query cache invalidations wait for the commit
+            self._cache_token = begin_deferral()
         else:
             if self._durable:
                 raise RuntimeError(
@@ -203,6 +210,8 @@ class Atomic:
                 await db.execute(f"SAVEPOINT {self._savepoint_id}")
             self._depth_holder.value = depth + 1
 
+        # Reads inside the block must see its writes — keep them off replicas
+        self._route_token = enter_atomic()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -215,7 +224,7 @@ class Atomic:
                     await db.execute(f"ROLLBACK TO SAVEPOINT {self._savepoint_id}")
                     logger.debug(f"Rolled back savepoint {self._savepoint_id}")
                 elif self._is_outermost:
-                    await db.execute("ROLLBACK")
+                    await db.rollback()
                     logger.debug("Rolled back transaction")
 
                 # Fire rollback hooks
@@ -226,12 +235,20 @@ class Atomic:
                     await db.execute(f"RELEASE SAVEPOINT {self._savepoint_id}")
                     logger.debug(f"Released savepoint {self._savepoint_id}")
                 elif self._is_outermost:
-                    await db.execute("COMMIT")
+                    await db.commit()
                     logger.debug("Committed transaction")
+                    token, self._cache_token = self._cache_token, None
+                    await end_deferral(token, committed=True)
 
                     # Fire on_commit hooks only at outermost level
                     await self._fire_hooks(self._commit_hooks)
         finally:
+            if self._cache_token is not None:
+                token, self._cache_token = self._cache_token, None
+                await end_deferral(token, committed=False)
+            if self._route_token is not None:
+                exit_atomic(self._route_token)
+                self._route_token = None
             # Decrement depth
             if self._depth_holder is not None:
                 new_depth = self._depth_holder.value - 1
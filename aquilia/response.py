@@ -1343,19 +1343,39 @@ class Response:
 
         # ── Async iterator (streaming) ──
         if hasattr(content, "__aiter__"):
-            async for chunk in content:
-                chunk_bytes = self._ensure_bytes(chunk)
-                self._bytes_sent += len(chunk_bytes)
-                await send({
-                    "type": "http.response.body",
-                    "body": chunk_bytes,
-                    "more_body": True,
-                })
-            await send({
-                "type": "http.response.body",
-                "body": b"",
-                "more_body": False,
-            })
+            receive = getattr(request, "_receive", None)
+            if receive is None:
+                await self._stream_body(send, content)
+            else:
+                # Watch for http.disconnect while streaming: nothing else
+                # calls receive() once the handler has returned, and
+                # servers may silently drop sends to a closed socket.
+                # The watcher is then the only caller of receive(), so
+                # request-body messages are handed on to the request for
+                # bodies that read it lazily (echo, proxy, upload).
+                feed: asyncio.Queue = asyncio.Queue(maxsize=1)
+                request._receive = feed.get
+                pump = asyncio.ensure_future(self._stream_body(send, content))
+                watcher = asyncio.ensure_future(
+                    self._watch_disconnect(request, receive, feed)
+                )
+                try:
+                    await asyncio.wait((pump, watcher), return_when=asyncio.FIRST_COMPLETED)
+                except BaseException:
+                    pump.cancel()
+                    raise
+                finally:
+                    watcher.cancel()
+                    request._receive = receive
+                if pump.done():
+                    pump.result()
+                else:
+                    # Client gone: stop the producer mid-render
+                    pump.cancel()
+                    try:
+                        await pump
+                    except asyncio.CancelledError:
+                        pass
             return
 
         # ── Sync iterator ──
@@ -1416,6 +1436,56 @@ class Response:
             "more_body": False,
         })
     
+    async def _stream_body(self, send: Callable[[dict], Awaitable[None]], content: Any) -> None:
+        """Send an async iterator's chunks, closing it on any failure."""
+        try:
+            async for chunk in content:
+                chunk_bytes = self._ensure_bytes(chunk)
+                self._bytes_sent += len(chunk_bytes)
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk_bytes,
+                    "more_body": True,
+                })
+        finally:
+            # Stop the producer (e.g. a template render) as soon as a
+            # send fails instead of leaving it to the garbage collector
+            aclose = getattr(content, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await send({
+            "type": "http.response.body",
+            "body": b"",
+            "more_body": False,
+        })
+
+    @staticmethod
+    async def _watch_disconnect(
+        request: Any,
+        receive: Callable[[], Awaitable[dict]],
+        feed: "asyncio.Queue[dict]",
+    ) -> None:
+        """Return once the client disconnects, marking the request.
+
+        Request-body messages still pending are passed to *feed* one at a
+        time, so the body reader keeps its backpressure.
+        """
+        body_pending = not (
+            getattr(request, "_body_consumed", True)
+            or getattr(request, "_body", None) is not None
+        )
+        try:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    break
+                if body_pending and message["type"] == "http.request":
+                    await feed.put(message)
+                    body_pending = message.get("more_body", False)
+        except Exception:
+            pass
+        request._disconnected = True
+
     def _ensure_bytes(self, chunk: Any) -> bytes:
         """Ensure chunk is bytes."""
         if isinstance(chunk, bytes):
@@ -15,7 +15,14 @@ from .controller.router import ControllerRouter
 from .aquilary import Aquilary, RuntimeRegistry, RegistryMode, AquilaryRegistry
 from .lifecycle import LifecycleCoordinator, LifecycleManager, LifecycleError
 from .middleware_ext.session_middleware import SessionMiddleware
-from .controller.openapi import OpenAPIGenerator, OpenAPIConfig, generate_swagger_html, generate_redoc_html
+from .controller.openapi import (
+    OpenAPIGenerator,
+    OpenAPIConfig,
+    OpenAPIDocument,
+    OpenAPIDocumentCache,
+    generate_swagger_html,
+    generate_redoc_html,
+)
 from .faults.engine import FaultEngine, FaultMiddleware
 from .response import Response
 # Template Integration
@@ -243,8 +250,23 @@ class AquiliaServer:
             name="request_id",
         )
         
+        # Access log: synchronous by default; Integration.logging(async_=True)
+        # moves formatting and handler I/O off the event loop.
+        self._access_log = None
+        log_config = self.config.get("integrations.logging", {}) or {}
+        if log_config.get("async"):
+            from .middleware_ext.access_log import (
+                AccessLogPipeline, LoggerSink, RequestLineFormatter,
+            )
+            self._access_log = AccessLogPipeline(
+                RequestLineFormatter(),
+                [LoggerSink(logging.getLogger("aquilia.requests"))],
+                capacity=log_config.get("buffer_size", 8192),
+                sample_rate=log_config.get("sample_rate", 1.0),
+            )
+
         self.middleware_stack.add(
-            LoggingMiddleware(),
+            LoggingMiddleware(pipeline=self._access_log),
             scope="global",
             priority=20,
             name="logging",
@@ -492,12 +514,19 @@ class AquiliaServer:
             for ctx in self.aquilary.app_contexts:
                 for mw_config in ctx.middlewares:
                     try:
-                        self._register_app_middleware(mw_config)
+                        self._register_app_middleware(mw_config, app_name=ctx.name)
                     except Exception as e:
                         self.logger.error(f"Failed to register middleware from app {ctx.name}: {e}")
 
-    def _register_app_middleware(self, mw_config: Any):
-        """Register application middleware from config."""
+    def _register_app_middleware(self, mw_config: Any, app_name: Optional[str] = None):
+        """
+        Register application middleware from config.
+
+        Scoped middleware is registered as ``"<scope>:<target>"``: the
+        target is ``scope_target``, or for a bare ``"app"`` scope the
+        owning app (``app_name``).  A bare ``"controller"``/``"route"``
+        scope without a target also falls back to the owning app.
+        """
         import importlib
         
         # Extract config details
@@ -505,12 +534,14 @@ class AquiliaServer:
         if isinstance(mw_config, dict):
             class_path = mw_config.get("class_path") or mw_config.get("path")
             scope = mw_config.get("scope", "global")
+            scope_target = mw_config.get("scope_target")
             priority = mw_config.get("priority", 50)
             config = mw_config.get("config", {})
             name = mw_config.get("name")
         else:
             class_path = getattr(mw_config, "class_path", None)
             scope = getattr(mw_config, "scope", "global")
+            scope_target = getattr(mw_config, "scope_target", None)
             priority = getattr(mw_config, "priority", 50)
             config = getattr(mw_config, "config", {})
             name = getattr(mw_config, "name", None)
@@ -518,6 +549,13 @@ class AquiliaServer:
         if not class_path:
             return
 
+        scope = scope or "global"
+        if scope in ("app", "controller", "route"):
+            if scope_target:
+                scope = f"{scope}:{scope_target}"
+            elif app_name:
+                scope = f"app:{app_name}"
+
         # Import class
         if ":" in class_path:
             module_path, class_name = class_path.split(":", 1)
@@ -827,9 +865,22 @@ class AquiliaServer:
             else:
                 rules.append(RateLimitRule(limit=100, window=60))
                 exempt = None
+            backend = None
+            if rl_config and rl_config.get("shared"):
+                # One limit across workers: GCRA in the cache backend
+                cache_service = getattr(self, "_cache_service", None)
+                if cache_service is not None:
+                    backend = cache_service.backend
+                else:
+                    self.logger.warning(
+                        "rate_limit.shared needs the cache integration; "
+                        "falling back to per-process limits"
+                    )
             mw = RateLimitMiddleware(
                 rules=rules,
                 exempt_paths=exempt,
+                backend=backend,
+                lease=rl_config.get("lease", 0) if rl_config else 0,
             )
             self.middleware_stack.add(mw, scope="global", priority=12, name="rate_limit")
             self.logger.info("⏱️ Rate limiting middleware enabled")
@@ -944,6 +995,10 @@ class AquiliaServer:
 
             self._cache_service = svc
 
+            # Decorators on plain functions and Q.cache() resolve it here
+            from .cache.decorators import set_default_cache_service
+            set_default_cache_service(svc)
+
             # Optionally add HTTP response-cache middleware
             mw_cfg = cache_config.get("middleware", {})
             if mw_cfg.get("enabled", False):
@@ -1439,10 +1494,26 @@ class AquiliaServer:
 
         generator = OpenAPIGenerator(config=openapi_config)
 
+        prebuilt = None
+        if openapi_config.prebuilt_path:
+            try:
+                prebuilt = OpenAPIDocument.load(openapi_config.prebuilt_path)
+                self.logger.info(
+                    f"📡 Serving prebuilt OpenAPI spec from {openapi_config.prebuilt_path}"
+                )
+            except OSError as e:
+                self.logger.warning(
+                    f"Prebuilt OpenAPI spec unavailable ({e}); generating at runtime"
+                )
+        self.openapi_documents = OpenAPIDocumentCache(
+            generator, self.controller_router, prebuilt=prebuilt,
+        )
+
         # ── Handler: /openapi.json ───────────────────────────────────────
+        # Generated once per route-table version; served pre-encoded with
+        # ETag / If-None-Match and gzip/br variants.
         async def openapi_handler(request, ctx):
-            spec = generator.generate(self.controller_router)
-            return Response.json(spec)
+            return self.openapi_documents.get().to_response(request)
 
         # ── Handler: /docs (Swagger UI) ──────────────────────────────────
         swagger_html = generate_swagger_html(openapi_config)
@@ -1525,6 +1596,13 @@ class AquiliaServer:
         self.controller_router._initialized = False
         self.controller_router.initialize()
 
+        if openapi_config.precompute and not self.openapi_documents.is_prebuilt:
+            try:
+                self.openapi_documents.get()
+            except Exception as e:
+                # Don't block startup on doc generation; the handler retries.
+                self.logger.warning(f"OpenAPI spec precomputation failed: {e}")
+
         self.logger.info(
             f"📡 Registered documentation routes: "
             f"{openapi_config.docs_path} (Swagger UI) | "
@@ -1801,6 +1879,37 @@ class AquiliaServer:
                 except Exception as e:
                     self.logger.error(f"Failed to register fault handler {handler_cfg.handler_path} for app {app_ctx.name}: {e}")
     
+    async def _setup_database_routing(self) -> None:
+        """
+        Configure the extra databases and read-replica routing declared
+        under ``database.databases`` / ``database.routers``.
+
+        See ``aquilia.db.routing.build_router`` for the accepted keys.
+        """
+        from .db.engine import configure_database
+        from .db.routing import build_router, database_specs, set_router
+
+        section = None
+        if hasattr(self.config, 'get'):
+            section = self.config.get("database", None)
+        if not isinstance(section, dict) and hasattr(self.config, 'to_dict'):
+            section = self.config.to_dict().get("database")
+        if not isinstance(section, dict):
+            return
+
+        self._routed_databases = {}
+        for alias, url, options in database_specs(section):
+            extra_db = configure_database(url, alias=alias, **options)
+            await extra_db.connect()
+            self._routed_databases[alias] = extra_db
+
+        router = build_router(section)
+        set_router(router)
+        if router is not None:
+            self.logger.info(
+                f"Database routing enabled ({len(self._routed_databases)} extra database(s))"
+            )
+
     async def _register_amdl_models(self) -> None:
         """
         Register models discovered by the Aquilary pipeline.
@@ -2022,6 +2131,7 @@ class AquiliaServer:
             db = configure_database(db_url)
             await db.connect()
             self._amdl_database = db
+            await self._setup_database_routing()
 
             # Wire database to both registries
             if legacy_registry._models:
@@ -2214,7 +2324,17 @@ class AquiliaServer:
             
             if effect_registry is None:
                 effect_registry = EffectRegistry()
-            
+
+            # QueueEffect is backed by the job queue; share the mail queue
+            # when mail is enabled so one worker pool serves both.
+            if not effect_registry.has_effect("Queue"):
+                from .effects import QueueProvider
+                mail_service = getattr(self, '_mail_service', None)
+                effect_registry.register(
+                    "Queue",
+                    QueueProvider(mail_service.job_queue if mail_service else None),
+                )
+
             await effect_registry.initialize_all()
             self._effect_registry = effect_registry
             self.logger.info(f"Effect providers initialized ({len(effect_registry.providers)} registered)")
@@ -2329,6 +2449,19 @@ class AquiliaServer:
                     duration_ms=(_time.monotonic() - _t0) * 1000,
                 )
 
+        # Deliver queued fault events and report open aggregation windows
+        try:
+            await self.fault_engine.drain()
+        except Exception as e:
+            self.logger.warning(f"Error draining fault engine: {e}")
+
+        # Drain queued access-log records
+        if getattr(self, '_access_log', None) is not None:
+            try:
+                await self._access_log.aclose()
+            except Exception as e:
+                self.logger.warning(f"Error draining access log: {e}")
+
         # Shutdown cache subsystem
         if hasattr(self, '_cache_service') and self._cache_service is not None:
             _t0 = _time.monotonic()
@@ -2400,6 +2533,17 @@ class AquiliaServer:
                     duration_ms=(_time.monotonic() - _t0) * 1000,
                 )
 
+        # Disconnect extra (replica / routed) databases
+        for alias, extra_db in getattr(self, '_routed_databases', {}).items():
+            try:
+                await extra_db.disconnect()
+            except Exception as e:
+                self.logger.warning(f"Error disconnecting database '{alias}': {e}")
+        if hasattr(self, '_routed_databases'):
+            from .db.routing import set_router
+            set_router(None)
+            self._routed_databases = {}
+
         # Disconnect AMDL database if connected
         if hasattr(self, '_amdl_database') and self._amdl_database:
             _t0 = _time.monotonic()
@@ -34,6 +34,7 @@ from .policy import (
 from .store import (
     MemoryStore,
     FileStore,
+    SessionIndex,
 )
 
 from .transport import (
@@ -96,6 +97,7 @@ __all__ = [
     "SessionStore",
     "MemoryStore",
     "FileStore",
+    "SessionIndex",
     # Transport
     "SessionTransport",
     "CookieTransport",
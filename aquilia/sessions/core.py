@@ -257,7 +257,11 @@ class Session:
         version: Optimistic concurrency control counter
     
     Internal attributes (prefixed with _):
-        _dirty: Has data been modified?
+        _dirty: Has data (or principal/flags) been modified?
+        _access_dirty: Has only last_accessed_at/expires_at moved?
+        _changed_keys: Data keys set or deleted since the last save
+        _structural: Was a change made that a per-key delta cannot express?
+        _persisted: Does the store already hold this session?
         _policy_name: Which policy governs this session
     
     Example:
@@ -288,14 +292,29 @@ class Session:
     # Internal tracking (not serialized)
     _dirty: bool = field(default=False, repr=False)
     _policy_name: str = field(default="", repr=False)
+    _access_dirty: bool = field(default=False, repr=False)
+    _changed_keys: set[str] = field(default_factory=set, repr=False)
+    _structural: bool = field(default=False, repr=False)
+    _persisted: bool = field(default=False, repr=False)
+    _persisted_access_at: datetime | None = field(default=None, repr=False)
     
     def __setattr__(self, name: str, value: Any) -> None:
         """Override setattr to track data mutations."""
         super().__setattr__(name, value)
         
-        # Mark dirty if data is modified (but not during __init__)
+        # Mark dirty if data is modified (fields set later in __init__
+        # reset these flags)
         if hasattr(self, "_dirty") and name == "data":
             object.__setattr__(self, "_dirty", True)
+            object.__setattr__(self, "_structural", True)
+    
+    def _mark_key(self, key: str) -> None:
+        self._dirty = True
+        self._changed_keys.add(key)
+    
+    def _mark_structural(self) -> None:
+        self._dirty = True
+        self._structural = True
     
     def __getitem__(self, key: str) -> Any:
         """Allow dict-like access to data."""
@@ -304,7 +323,7 @@ class Session:
     def __setitem__(self, key: str, value: Any) -> None:
         """Allow dict-like access to data (marks dirty)."""
         self.data[key] = value
-        self._dirty = True
+        self._mark_key(key)
     
     def __contains__(self, key: str) -> bool:
         """Check if key exists in data."""
@@ -317,18 +336,18 @@ class Session:
     def set(self, key: str, value: Any) -> None:
         """Set data value (explicit, marks dirty)."""
         self.data[key] = value
-        self._dirty = True
+        self._mark_key(key)
     
     def delete(self, key: str) -> None:
         """Delete data key (marks dirty)."""
         if key in self.data:
             del self.data[key]
-            self._dirty = True
+            self._mark_key(key)
     
     def clear_data(self) -> None:
         """Clear all session data (marks dirty)."""
         self.data.clear()
-        self._dirty = True
+        self._mark_structural()
     
     # ========================================================================
     # Lifecycle Methods
@@ -371,6 +390,9 @@ class Session:
         """
         Mark session as accessed (updates last_accessed_at).
         
+        Only access-dirty: the engine persists access times at most once
+        per ``PersistencePolicy.touch_interval``, not on every request.
+        
         Args:
             now: Current time (defaults to utcnow)
         """
@@ -378,7 +400,7 @@ class Session:
             now = datetime.now(timezone.utc)
         
         self.last_accessed_at = now
-        self._dirty = True
+        self._access_dirty = True
     
     def extend_expiry(self, ttl: timedelta, now: datetime | None = None) -> None:
         """
@@ -392,7 +414,9 @@ class Session:
             now = datetime.utcnow()
         
         self.expires_at = now + ttl
-        self._dirty = True
+        # Persisted by the next commit (a TTL bump when the store can)
+        self._access_dirty = True
+        self._persisted_access_at = None
     
     # ========================================================================
     # Authentication Methods
@@ -408,14 +432,14 @@ class Session:
         self.principal = principal
         self.flags.add(SessionFlag.AUTHENTICATED)
         self.flags.add(SessionFlag.ROTATABLE)  # Should rotate on privilege change
-        self._dirty = True
+        self._mark_structural()
     
     def clear_authentication(self) -> None:
         """Remove authentication and principal."""
         self.principal = None
         self.flags.discard(SessionFlag.AUTHENTICATED)
         self.flags.discard(SessionFlag.ROTATABLE)
-        self._dirty = True
+        self._mark_structural()
     
     @property
     def is_authenticated(self) -> bool:
@@ -433,16 +457,36 @@ class Session:
     
     @property
     def is_dirty(self) -> bool:
-        """Check if session needs persistence."""
+        """Check if session data needs persistence."""
         return self._dirty
     
+    @property
+    def is_access_dirty(self) -> bool:
+        """Check if only access time / expiry changed since the last save."""
+        return self._access_dirty and not self._dirty
+    
+    @property
+    def dirty_keys(self) -> set[str] | None:
+        """
+        Data keys changed since the last save, or None when the change
+        needs a full write (new session, cleared data, principal/flags).
+        """
+        if self._structural or not self._persisted:
+            return None
+        return self._changed_keys
+    
     def mark_clean(self) -> None:
         """Mark session as clean (after persistence)."""
         self._dirty = False
+        self._access_dirty = False
+        self._structural = False
+        self._changed_keys = set()
+        self._persisted = True
+        self._persisted_access_at = self.last_accessed_at
     
     def mark_dirty(self) -> None:
         """Explicitly mark session as dirty."""
-        self._dirty = True
+        self._mark_structural()
     
     @property
     def is_ephemeral(self) -> bool:
@@ -544,6 +588,6 @@ class Session:
         )
         
         session._policy_name = data.get("_policy_name", "")
-        session._dirty = False  # Just loaded, not dirty
+        session.mark_clean()  # Just loaded, not dirty
         
         return session
@@ -94,6 +94,15 @@ class SessionEngine:
         
         # Event callbacks (for observability)
         self._event_handlers: list = []
+        
+        # Store write accounting (see get_stats)
+        self._counters = {
+            "loads": 0,
+            "full_saves": 0,
+            "delta_saves": 0,
+            "touches": 0,
+            "skipped_writes": 0,
+        }
     
     # ========================================================================
     # Phase 1 & 2: Detection + Resolution
@@ -187,6 +196,7 @@ class SessionEngine:
         
         if not session:
             return None
+        self._counters["loads"] += 1
         
         # Phase 3: Validation - Check policy constraints
         is_valid, reason = self.policy.is_valid(session, now)
@@ -289,10 +299,10 @@ class SessionEngine:
             await self.check_concurrency(session)
         
         # Persist if needed
-        if self.policy.should_persist(session) and session.is_dirty:
+        if self.policy.should_persist(session) and (session.is_dirty or session.is_access_dirty):
             try:
-                await self.store.save(session)
-                self._emit_event("session_committed", session, None)
+                if await self._persist(session, now):
+                    self._emit_event("session_committed", session, None)
             except SessionStoreUnavailableFault as e:
                 self.logger.error(f"Failed to persist session: {e}")
                 # Don't fail request, but log error
@@ -300,6 +310,73 @@ class SessionEngine:
         # Phase 7: Emission - Inject into response
         self.transport.inject(response, session)
     
+    async def _persist(self, session: Session, now: datetime) -> bool:
+        """
+        Write the cheapest store operation that captures the changes.
+        
+        Data changes go through ``save_delta`` when only known keys of a
+        stored session changed, else ``save``.  Access-only changes are
+        written at most once per ``touch_interval`` (via ``touch`` when
+        the store has it).
+        
+        Returns:
+            True if anything was written
+        """
+        store = self.store
+        counters = self._counters
+        
+        if session.is_dirty or not session._persisted:
+            keys = session.dirty_keys
+            if keys is not None and hasattr(store, "save_delta"):
+                await store.save_delta(session, keys)
+                counters["delta_saves"] += 1
+            else:
+                await store.save(session)
+                counters["full_saves"] += 1
+            return True
+        
+        # Access-only: last_accessed_at moved (and maybe expires_at)
+        expiry_changed = session._persisted_access_at is None
+        if not expiry_changed and not self._touch_due(session, now):
+            counters["skipped_writes"] += 1
+            return False
+        if hasattr(store, "touch") and (
+            not expiry_changed or getattr(store, "touch_updates_expiry", True)
+        ):
+            await store.touch(session.id, session.last_accessed_at, session.expires_at)
+            session.mark_clean()
+            counters["touches"] += 1
+        else:
+            await store.save(session)
+            counters["full_saves"] += 1
+        return True
+    
+    def _touch_due(self, session: Session, now: datetime) -> bool:
+        """Has the persisted access time aged past the touch interval?"""
+        interval = self.policy.persistence.touch_interval
+        if interval is None:
+            return True
+        idle = self.policy.idle_timeout
+        if idle is not None and interval > idle / 2:
+            # Never let a stale stored access time trip the idle timeout
+            interval = idle / 2
+        return now - session._persisted_access_at >= interval
+    
+    def get_stats(self) -> dict:
+        """
+        Store write accounting since start.
+        
+        ``write_amplification`` is store writes per loaded session; for
+        read-only traffic it stays near zero.
+        """
+        counters = self._counters
+        writes = counters["full_saves"] + counters["delta_saves"] + counters["touches"]
+        return {
+            **counters,
+            "writes": writes,
+            "write_amplification": round(writes / counters["loads"], 4) if counters["loads"] else 0.0,
+        }
+    
     async def _rotate_session(self, session: Session, now: datetime) -> Session:
         """
         Rotate session ID (create new ID, keep data).
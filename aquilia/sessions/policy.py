@@ -32,6 +32,9 @@ class PersistencePolicy:
         store_name: Which SessionStore to use
         write_through: Immediate vs eventual consistency
         compress: Compress session data before storage
+        touch_interval: Persist last-access time at most this often for
+            requests that do not change session data (None = every request).
+            Kept below half the idle timeout by the engine.
     
     Example:
         >>> policy = PersistencePolicy(
@@ -46,6 +49,7 @@ class PersistencePolicy:
     store_name: str = "default"
     write_through: bool = True  # vs write-behind (eventual)
     compress: bool = False
+    touch_interval: timedelta | None = timedelta(seconds=60)
 
 
 @dataclass
@@ -10,11 +10,14 @@ Defines SessionStore protocol and concrete implementations:
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
+import os
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Protocol, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 from .core import Session, SessionID
 from .faults import (
@@ -36,6 +39,17 @@ class SessionStore(Protocol):
     Policy enforcement happens in SessionEngine.
     
     All methods must be async and cancellation-safe.
+    
+    Optional write-saving operations (detected with ``hasattr``):
+    
+    - ``touch(session_id, last_accessed_at, expires_at)``: persist only
+      access time / expiry (e.g. Redis ``EXPIRE`` + ``HSET`` of one field)
+      for requests that read but did not change the session.
+    - ``save_delta(session, keys)``: write only the changed data keys
+      (removed keys are those in ``keys`` missing from ``session.data``)
+      of a session the store already holds.
+    
+    Stores without them get a full ``save``.
     """
     
     async def load(self, session_id: SessionID) -> Session | None:
@@ -130,6 +144,137 @@ class SessionStore(Protocol):
         ...
 
 
+# ============================================================================
+# SessionIndex - Principal and Expiry Indexes
+# ============================================================================
+
+def _epoch(moment: datetime | None) -> float | None:
+    """POSIX timestamp of a datetime (naive values are taken as UTC)."""
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class SessionIndex:
+    """
+    Principal → session IDs and an expiry-ordered heap, maintained by
+    stores on every write.
+    
+    ``count`` is O(1) and ``pop_expired`` touches only entries whose
+    recorded expiry has passed; heap entries superseded by a later
+    write are discarded lazily when they surface.
+    
+    Example:
+        >>> index = SessionIndex()
+        >>> index.add("sess_a", "user-1", expires_at=time.time() - 1)
+        >>> index.count("user-1")
+        1
+        >>> index.pop_expired(time.time())
+        ['sess_a']
+    """
+    
+    def __init__(self):
+        self._entries: dict[str, tuple[str | None, float | None]] = {}
+        self._principals: dict[str, set[str]] = {}
+        self._heap: list[tuple[float, str]] = []
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._entries
+    
+    @property
+    def principal_count(self) -> int:
+        return len(self._principals)
+    
+    def add(self, session_id: str, principal_id: str | None, expires_at: float | None) -> None:
+        """Record (or update) a session's principal and expiry timestamp."""
+        previous = self._entries.get(session_id)
+        if previous is not None and previous[0] != principal_id:
+            self._unlink_principal(session_id, previous[0])
+        self._entries[session_id] = (principal_id, expires_at)
+        if principal_id is not None:
+            self._principals.setdefault(principal_id, set()).add(session_id)
+        if expires_at is not None and (previous is None or previous[1] != expires_at):
+            heapq.heappush(self._heap, (expires_at, session_id))
+            if len(self._heap) > 2 * len(self._entries) + 64:
+                self._compact()
+    
+    def set_expiry(self, session_id: str, expires_at: float | None) -> None:
+        """Update the expiry of an indexed session."""
+        entry = self._entries.get(session_id)
+        if entry is not None:
+            self.add(session_id, entry[0], expires_at)
+    
+    def remove(self, session_id: str) -> bool:
+        """Drop a session from the index."""
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return False
+        self._unlink_principal(session_id, entry[0])
+        return True
+    
+    def ids(self) -> set[str]:
+        """All indexed session IDs."""
+        return set(self._entries)
+    
+    def ids_for(self, principal_id: str) -> set[str]:
+        """Session IDs of a principal (a copy)."""
+        return set(self._principals.get(principal_id, ()))
+    
+    def count(self, principal_id: str) -> int:
+        """Number of sessions of a principal."""
+        return len(self._principals.get(principal_id, ()))
+    
+    def pop_expired(self, now: float) -> list[str]:
+        """Remove and return sessions whose recorded expiry is ``<= now``."""
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expires_at, session_id = heapq.heappop(heap)
+            entry = self._entries.get(session_id)
+            if entry is None or entry[1] != expires_at:
+                continue  # Deleted or re-indexed since this entry was pushed
+            self.remove(session_id)
+            expired.append(session_id)
+        return expired
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self._principals.clear()
+        self._heap.clear()
+    
+    def to_dict(self) -> dict[str, Any]:
+        return {sid: list(entry) for sid, entry in self._entries.items()}
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'SessionIndex':
+        index = cls()
+        for session_id, (principal_id, expires_at) in data.items():
+            index.add(session_id, principal_id, expires_at)
+        return index
+    
+    def _unlink_principal(self, session_id: str, principal_id: str | None) -> None:
+        if principal_id is None:
+            return
+        ids = self._principals.get(principal_id)
+        if ids is not None:
+            ids.discard(session_id)
+            if not ids:
+                del self._principals[principal_id]
+    
+    def _compact(self) -> None:
+        self._heap = [
+            (expires_at, sid)
+            for sid, (_, expires_at) in self._entries.items()
+            if expires_at is not None
+        ]
+        heapq.heapify(self._heap)
+
+
 # ============================================================================
 # MemoryStore - In-Memory Storage
 # ============================================================================
@@ -140,8 +285,8 @@ class MemoryStore:
     
     Features:
     - Fast in-memory dict storage
-    - Automatic cleanup of expired sessions
-    - Principal index for fast lookup
+    - Incremental cleanup of expired sessions (expiry heap)
+    - Principal index for O(1) counting
     - Max session limit (LRU eviction)
     
     NOT suitable for production (no persistence across restarts).
@@ -162,7 +307,7 @@ class MemoryStore:
         """
         self.max_sessions = max_sessions
         self._sessions: dict[str, Session] = {}
-        self._principal_index: dict[str, set[str]] = {}  # principal_id -> session_ids
+        self._index = SessionIndex()  # principal -> session_ids, expiry heap
         self._access_order: list[str] = []  # For LRU eviction
         self._lock = asyncio.Lock()
     
@@ -189,12 +334,12 @@ class MemoryStore:
             # Store session
             self._sessions[session_id_str] = session
             
-            # Update principal index
-            if session.principal:
-                principal_id = session.principal.id
-                if principal_id not in self._principal_index:
-                    self._principal_index[principal_id] = set()
-                self._principal_index[principal_id].add(session_id_str)
+            # Update principal and expiry indexes
+            self._index.add(
+                session_id_str,
+                session.principal.id if session.principal else None,
+                _epoch(session.expires_at),
+            )
             
             # Update access order
             self._touch_access(session_id_str)
@@ -202,19 +347,42 @@ class MemoryStore:
             # Mark session as clean after save
             session.mark_clean()
     
+    async def touch(
+        self,
+        session_id: SessionID,
+        last_accessed_at: datetime,
+        expires_at: datetime | None,
+    ) -> None:
+        """Update access time and expiry of a stored session."""
+        session = self._sessions.get(str(session_id))
+        if session is not None:
+            session.last_accessed_at = last_accessed_at
+            session.expires_at = expires_at
+            self._index.set_expiry(str(session_id), _epoch(expires_at))
+    
+    async def save_delta(self, session: Session, keys: set[str]) -> None:
+        """Write changed data keys of a stored session."""
+        stored = self._sessions.get(str(session.id))
+        if stored is None:
+            await self.save(session)
+            return
+        if stored is not session:
+            for key in keys:
+                if key in session.data:
+                    stored.data[key] = session.data[key]
+                else:
+                    stored.data.pop(key, None)
+            stored.last_accessed_at = session.last_accessed_at
+            stored.expires_at = session.expires_at
+        self._index.set_expiry(str(session.id), _epoch(session.expires_at))
+        session.mark_clean()
+    
     async def delete(self, session_id: SessionID) -> None:
         """Delete session from memory."""
         async with self._lock:
             session_id_str = str(session_id)
-            session = self._sessions.pop(session_id_str, None)
-            
-            if session and session.principal:
-                # Remove from principal index
-                principal_id = session.principal.id
-                if principal_id in self._principal_index:
-                    self._principal_index[principal_id].discard(session_id_str)
-                    if not self._principal_index[principal_id]:
-                        del self._principal_index[principal_id]
+            self._sessions.pop(session_id_str, None)
+            self._index.remove(session_id_str)
             
             # Remove from access order
             if session_id_str in self._access_order:
@@ -227,44 +395,45 @@ class MemoryStore:
     async def list_by_principal(self, principal_id: str) -> list[Session]:
         """List all sessions for principal."""
         async with self._lock:
-            session_ids = self._principal_index.get(principal_id, set())
+            session_ids = self._index.ids_for(principal_id)
             return [self._sessions[sid] for sid in session_ids if sid in self._sessions]
     
     async def count_by_principal(self, principal_id: str) -> int:
-        """Count sessions for principal."""
-        async with self._lock:
-            session_ids = self._principal_index.get(principal_id, set())
-            # Count only sessions that still exist
-            return sum(1 for sid in session_ids if sid in self._sessions)
+        """Count sessions for principal (O(1), from the principal index)."""
+        return self._index.count(principal_id)
     
     async def cleanup_expired(self) -> int:
-        """Remove expired sessions."""
-        now = datetime.utcnow()
-        expired_ids = []
+        """Remove expired sessions (only those due on the expiry heap)."""
+        now = time.time()
+        removed = 0
         
         async with self._lock:
-            for session_id, session in list(self._sessions.items()):
-                if session.is_expired(now):
-                    expired_ids.append(session_id)
-            
-            # Delete expired sessions
-            for session_id in expired_ids:
-                session = self._sessions.pop(session_id, None)
-                if session and session.principal:
-                    principal_id = session.principal.id
-                    if principal_id in self._principal_index:
-                        self._principal_index[principal_id].discard(session_id)
-                
+            for session_id in self._index.pop_expired(now):
+                session = self._sessions.get(session_id)
+                if session is None:
+                    continue
+                # Stored sessions are shared objects; their expiry may have
+                # been extended in place without going through the store.
+                actual = _epoch(session.expires_at)
+                if actual is not None and actual > now:
+                    self._index.add(
+                        session_id,
+                        session.principal.id if session.principal else None,
+                        actual,
+                    )
+                    continue
+                del self._sessions[session_id]
                 if session_id in self._access_order:
                     self._access_order.remove(session_id)
+                removed += 1
         
-        return len(expired_ids)
+        return removed
     
     async def shutdown(self) -> None:
         """Shutdown store (clear memory)."""
         async with self._lock:
             self._sessions.clear()
-            self._principal_index.clear()
+            self._index.clear()
             self._access_order.clear()
     
     def _touch_access(self, session_id: str) -> None:
@@ -280,12 +449,8 @@ class MemoryStore:
         
         # Evict oldest
         oldest_id = self._access_order[0]
-        session = self._sessions.pop(oldest_id, None)
-        
-        if session and session.principal:
-            principal_id = session.principal.id
-            if principal_id in self._principal_index:
-                self._principal_index[principal_id].discard(oldest_id)
+        self._sessions.pop(oldest_id, None)
+        self._index.remove(oldest_id)
         
         self._access_order.pop(0)
     
@@ -295,7 +460,7 @@ class MemoryStore:
         return {
             "total_sessions": len(self._sessions),
             "max_sessions": self.max_sessions,
-            "total_principals": len(self._principal_index),
+            "total_principals": self._index.principal_count,
             "utilization": len(self._sessions) / self.max_sessions if self.max_sessions > 0 else 0,
         }
     
@@ -386,6 +551,10 @@ class FileStore:
     - One file per session (JSON)
     - Human-readable format
     - Simple filesystem-based storage
+    - Sidecar index (``_index.json``) of principals and expiries, so
+      counting and cleanup don't parse every session file; it is
+      re-reconciled with the directory listing when the directory
+      changes, so several processes can share one directory
     
     NOT suitable for production (slow, no locking, file system limits).
     
@@ -395,21 +564,118 @@ class FileStore:
         >>> loaded = await store.load(session.id)
     """
     
-    def __init__(self, directory: str | Path):
+    # touch() only moves the file mtime; expiry changes need a full save
+    touch_updates_expiry = False
+    
+    INDEX_FILE = "_index.json"
+    
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        index_flush_interval: float = 1.0,
+        reconcile_interval: float = 5.0,
+    ):
         """
         Initialize file store.
         
         Args:
             directory: Directory to store session files
+            index_flush_interval: Minimum seconds between sidecar index
+                writes (always written on cleanup and shutdown)
+            reconcile_interval: Maximum seconds between directory
+                listings even when its mtime looks unchanged (coarse
+                filesystem timestamps)
         """
         self.directory = Path(directory)
         self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_flush_interval = index_flush_interval
+        self.reconcile_interval = reconcile_interval
         self._lock = asyncio.Lock()
+        self._index: SessionIndex | None = None
+        self._dir_mtime: int | None = None
+        self._reconciled_at = 0.0
+        self._index_dirty = False
+        self._index_flushed_at = 0.0
     
     def _get_path(self, session_id: SessionID) -> Path:
         """Get file path for session."""
         return self.directory / f"{session_id}.json"
     
+    def _session_index(self) -> SessionIndex:
+        """
+        Load the sidecar index on first use, and reconcile it whenever
+        the directory has changed since (or ``reconcile_interval`` passed).
+        
+        The index is reconciled against a listing of file names (no
+        parsing): entries without a file are dropped, and only files
+        missing from the index — written by another process, or before
+        the index was flushed — are read.
+        """
+        mtime = os.stat(self.directory).st_mtime_ns
+        now = time.monotonic()
+        index = self._index
+        if (
+            index is not None
+            and mtime == self._dir_mtime
+            and now - self._reconciled_at < self.reconcile_interval
+        ):
+            return index
+        
+        if index is None:
+            entries: dict[str, Any] = {}
+            try:
+                data = json.loads((self.directory / self.INDEX_FILE).read_text())
+                if data.get("version") == 1:
+                    entries = data["sessions"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+            index = SessionIndex.from_dict(entries)
+        known = index.ids()
+        
+        on_disk = {
+            name[:-5] for name in os.listdir(self.directory)
+            if name.startswith("sess_") and name.endswith(".json")
+        }
+        for session_id in known - on_disk:
+            index.remove(session_id)
+        for session_id in on_disk - known:
+            try:
+                session_dict = json.loads(self._get_path(session_id).read_text())
+            except Exception:
+                continue  # Skip corrupted files
+            self._index_dict(index, session_id, session_dict)
+        
+        self._index = index
+        self._index_dirty = self._index_dirty or known != on_disk
+        self._dir_mtime = mtime
+        self._reconciled_at = now
+        return index
+    
+    @staticmethod
+    def _index_dict(index: SessionIndex, session_id: str, session_dict: dict[str, Any]) -> None:
+        principal = session_dict.get("principal")
+        expires_at = session_dict.get("expires_at")
+        index.add(
+            session_id,
+            principal["id"] if principal else None,
+            _epoch(datetime.fromisoformat(expires_at)) if expires_at else None,
+        )
+    
+    def _flush_index(self, force: bool = False) -> None:
+        """Write the sidecar index if dirty (at most once per flush interval)."""
+        if not self._index_dirty or self._index is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._index_flushed_at < self.index_flush_interval:
+            return
+        path = self.directory / self.INDEX_FILE
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"version": 1, "sessions": self._index.to_dict()}))
+        os.replace(temp_path, path)
+        self._index_dirty = False
+        self._index_flushed_at = now
+    
     async def load(self, session_id: SessionID) -> Session | None:
         """Load session from file."""
         path = self._get_path(session_id)
@@ -425,6 +691,12 @@ class FileStore:
                 
                 # Deserialize
                 session = Session.from_dict(session_dict)
+                
+                # touch() records access time as the file's mtime
+                touched = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+                if touched > session.last_accessed_at:
+                    session.last_accessed_at = touched
+                    session.mark_clean()
                 return session
         
         except json.JSONDecodeError as e:
@@ -453,6 +725,14 @@ class FileStore:
                 temp_path.write_text(data)
                 temp_path.rename(path)
                 
+                self._session_index().add(
+                    str(session.id),
+                    session.principal.id if session.principal else None,
+                    _epoch(session.expires_at),
+                )
+                self._index_dirty = True
+                self._flush_index()
+                
                 # Mark clean
                 session.mark_clean()
         
@@ -462,6 +742,25 @@ class FileStore:
                 cause=str(e)
             )
     
+    async def touch(
+        self,
+        session_id: SessionID,
+        last_accessed_at: datetime,
+        expires_at: datetime | None,
+    ) -> None:
+        """Record access time as the file mtime instead of rewriting it."""
+        path = self._get_path(session_id)
+        stamp = last_accessed_at.timestamp()
+        try:
+            os.utime(path, (stamp, stamp))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            raise SessionStoreUnavailableFault(
+                store_name="file",
+                cause=str(e)
+            )
+    
     async def delete(self, session_id: SessionID) -> None:
         """Delete session file."""
         path = self._get_path(session_id)
@@ -469,6 +768,9 @@ class FileStore:
         try:
             if path.exists():
                 path.unlink()
+            if self._session_index().remove(str(session_id)):
+                self._index_dirty = True
+                self._flush_index()
         except Exception as e:
             raise SessionStoreUnavailableFault(
                 store_name="file",
@@ -480,56 +782,55 @@ class FileStore:
         return self._get_path(session_id).exists()
     
     async def list_by_principal(self, principal_id: str) -> list[Session]:
-        """List sessions for principal (slow - scans all files)."""
+        """List sessions for principal (reads only that principal's files)."""
         sessions = []
         
         async with self._lock:
-            for path in self.directory.glob("sess_*.json"):
+            for session_id in self._session_index().ids_for(principal_id):
                 try:
-                    data = path.read_text()
-                    session_dict = json.loads(data)
-                    
-                    # Check if principal matches
-                    if session_dict.get("principal") and session_dict["principal"]["id"] == principal_id:
-                        session = Session.from_dict(session_dict)
-                        sessions.append(session)
-                
+                    data = self._get_path(session_id).read_text()
+                    sessions.append(Session.from_dict(json.loads(data)))
                 except Exception:
-                    # Skip corrupted files
+                    # Skip corrupted or concurrently removed files
                     continue
         
         return sessions
     
     async def count_by_principal(self, principal_id: str) -> int:
-        """Count sessions for principal."""
-        sessions = await self.list_by_principal(principal_id)
-        return len(sessions)
+        """Count sessions for principal (O(1), from the sidecar index)."""
+        async with self._lock:
+            return self._session_index().count(principal_id)
     
     async def cleanup_expired(self) -> int:
-        """Remove expired session files."""
-        now = datetime.utcnow()
+        """Remove expired session files (only those due on the expiry heap)."""
+        now = time.time()
         removed = 0
         
         async with self._lock:
-            for path in self.directory.glob("sess_*.json"):
+            index = self._session_index()
+            for session_id in index.pop_expired(now):
+                self._index_dirty = True
+                path = self._get_path(session_id)
                 try:
-                    data = path.read_text()
-                    session_dict = json.loads(data)
-                    session = Session.from_dict(session_dict)
-                    
-                    if session.is_expired(now):
-                        path.unlink()
-                        removed += 1
-                
+                    session_dict = json.loads(path.read_text())
+                    expires_at = session_dict.get("expires_at")
+                    # Another process may have extended it since indexing
+                    if expires_at and _epoch(datetime.fromisoformat(expires_at)) > now:
+                        self._index_dict(index, session_id, session_dict)
+                        continue
+                    path.unlink()
+                    removed += 1
                 except Exception:
-                    # Skip corrupted files
+                    # Skip corrupted or already removed files
                     continue
+            self._flush_index(force=True)
         
         return removed
     
     async def shutdown(self) -> None:
-        """Shutdown store (no-op for files)."""
-        pass
+        """Shutdown store (writes the sidecar index)."""
+        async with self._lock:
+            self._flush_index(force=True)
     
     def get_stats(self) -> dict[str, Any]:
         """Get store statistics."""
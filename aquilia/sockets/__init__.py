@@ -61,6 +61,8 @@ from .adapters import (
     RedisAdapter,
 )
 
+from .outbound import OutboundQueue, SlowConsumerPolicy
+
 from .guards import (
     SocketGuard,
     HandshakeAuthGuard,
@@ -111,6 +113,8 @@ __all__ = [
     # Connection
     "ConnectionState",
     "ConnectionScope",
+    "OutboundQueue",
+    "SlowConsumerPolicy",
     
     # Runtime
     "AquilaSockets",
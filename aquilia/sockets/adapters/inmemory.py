@@ -11,12 +11,15 @@ from typing import Dict, Set, Optional
 from collections import defaultdict
 import logging
 import asyncio
+import inspect
 
 from .base import Adapter, RoomInfo
-from ..envelope import MessageEnvelope
+from ..envelope import MessageEnvelope, JSONCodec
 
 logger = logging.getLogger("aquilia.sockets.adapters.inmemory")
 
+_codec = JSONCodec()
+
 
 class InMemoryAdapter(Adapter):
     """
@@ -71,7 +74,8 @@ class InMemoryAdapter(Adapter):
         Args:
             namespace: Socket namespace
             connection_id: Connection identifier
-            callback: Async callable(data: bytes)
+            callback: Callable(data: bytes); non-blocking (e.g.
+                ``Connection.enqueue``) or a legacy coroutine function
         """
         self._send_callbacks[namespace][connection_id] = callback
     
@@ -98,24 +102,25 @@ class InMemoryAdapter(Adapter):
             logger.debug(f"No members in room {namespace}/{room}")
             return
         
-        # Encode message once
-        from ..envelope import JSONCodec
-        codec = JSONCodec()
-        data = codec.encode(envelope)
-        
-        # Send to all members (optionally excluding one)
-        tasks = []
+        data = _codec.encode(envelope)
+        callbacks = self._send_callbacks[namespace]
+        pending = []
+        sent = 0
         for connection_id in room_members:
             if exclude_connection and connection_id == exclude_connection:
                 continue
-            callback = self._send_callbacks[namespace].get(connection_id)
+            callback = callbacks.get(connection_id)
             if callback:
-                tasks.append(callback(data))
+                sent += 1
+                result = callback(data)
+                if inspect.isawaitable(result):
+                    pending.append(result)
         
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        if pending:
+            # Legacy async callbacks (connections enqueue synchronously)
+            await asyncio.gather(*pending, return_exceptions=True)
         
-        logger.debug(f"Published to {len(tasks)} members in {namespace}/{room}")
+        logger.debug(f"Published to {sent} members in {namespace}/{room}")
     
     async def broadcast(
         self,
@@ -132,20 +137,18 @@ class InMemoryAdapter(Adapter):
         if not connections:
             return
         
-        # Encode message once
-        from ..envelope import JSONCodec
-        codec = JSONCodec()
-        data = codec.encode(envelope)
-        
-        # Send to all connections
-        tasks = []
+        data = _codec.encode(envelope)
+        callbacks = self._send_callbacks[namespace]
+        pending = []
         for connection_id in connections:
-            callback = self._send_callbacks[namespace].get(connection_id)
+            callback = callbacks.get(connection_id)
             if callback:
-                tasks.append(callback(data))
+                result = callback(data)
+                if inspect.isawaitable(result):
+                    pending.append(result)
         
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
         
         logger.debug(f"Broadcast to {len(connections)} connections in {namespace}")
     
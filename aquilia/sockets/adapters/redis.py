@@ -3,11 +3,17 @@ Redis Adapter - Production-ready WebSocket adapter using Redis
 
 Uses Redis pub/sub for message fanout and sorted sets for presence.
 Supports horizontal scaling across multiple workers.
+
+Each worker keeps a local room → connection index, subscribes to a
+room's channel only while it has members of that room, and forwards the
+publisher's encoded bytes verbatim onto its connections' outbound
+queues (no decode/re-encode, no Redis lookup per message, no task per
+recipient).
 """
 
 from __future__ import annotations
 
-from typing import Dict, Set, Optional
+from typing import Dict, Set, Optional, Tuple
 import logging
 import asyncio
 import json
@@ -19,6 +25,53 @@ from ..envelope import MessageEnvelope, JSONCodec
 logger = logging.getLogger("aquilia.sockets.adapters.redis")
 
 
+class _Direct:
+    """Delivery to a connection that queues frames itself."""
+
+    __slots__ = ("put",)
+    dropped = 0
+
+    def __init__(self, callback: callable):
+        self.put = callback
+
+    def close(self) -> None:
+        pass
+
+
+class _Outbox:
+    """Bounded send queue for an async send callback, drained by one task."""
+
+    __slots__ = ("callback", "queue", "task", "dropped")
+
+    def __init__(self, callback: callable, size: int):
+        self.callback = callback
+        self.queue: asyncio.Queue = asyncio.Queue(size)
+        self.task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    def put(self, data: bytes) -> None:
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        queue = self.queue
+        while True:
+            data = await queue.get()
+            try:
+                await self.callback(data)
+            except Exception as e:
+                logger.debug(f"Send to connection failed: {e}")
+
+    def close(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+
+
 class RedisAdapter(Adapter):
     """
     Redis-backed adapter for multi-worker deployments.
@@ -42,6 +95,7 @@ class RedisAdapter(Adapter):
         prefix: str = "aquilia:ws:",
         worker_id: Optional[str] = None,
         connection_ttl: int = 300,  # 5 minutes
+        outbox_size: int = 256,
     ):
         """
         Initialize Redis adapter.
@@ -51,6 +105,8 @@ class RedisAdapter(Adapter):
             prefix: Key prefix for Redis keys
             worker_id: Worker identifier (default: hostname + PID)
             connection_ttl: Connection TTL in seconds
+            outbox_size: Messages queued per local connection before new
+                ones are dropped
         """
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
         self.prefix = prefix
@@ -62,6 +118,17 @@ class RedisAdapter(Adapter):
         self._subscriber_task = None
         self._send_callbacks: Dict[str, Dict[str, callable]] = {}
         self._codec = JSONCodec()
+        self._outbox_size = outbox_size
+        
+        # Worker-local state: {namespace: {connection_id: _Outbox}},
+        # {(namespace, room): {connection_id}}, {(namespace, connection_id): {room}}
+        self._outboxes: Dict[str, Dict[str, _Outbox]] = {}
+        self._local_rooms: Dict[Tuple[str, str], Set[str]] = {}
+        self._connection_rooms: Dict[Tuple[str, str], Set[str]] = {}
+        # Subscribed room channel (bytes, as delivered) → (namespace, room)
+        self._channels: Dict[bytes, Tuple[str, str]] = {}
+        self._broadcast_channel = f"{prefix}broadcast".encode()
+        self.messages_dropped = 0
         
     async def initialize(self) -> None:
         """Initialize Redis connection and subscriber."""
@@ -103,6 +170,10 @@ class RedisAdapter(Adapter):
             except asyncio.CancelledError:
                 pass
         
+        for outboxes in self._outboxes.values():
+            for outbox in outboxes.values():
+                outbox.close()
+        
         if self._pubsub:
             await self._pubsub.unsubscribe()
             await self._pubsub.close()
@@ -121,7 +192,13 @@ class RedisAdapter(Adapter):
         """Register send callback for connection."""
         if namespace not in self._send_callbacks:
             self._send_callbacks[namespace] = {}
+            self._outboxes[namespace] = {}
         self._send_callbacks[namespace][connection_id] = callback
+        if asyncio.iscoroutinefunction(callback):
+            self._outboxes[namespace][connection_id] = _Outbox(callback, self._outbox_size)
+        else:
+            # Already non-blocking (Connection.enqueue): call it directly
+            self._outboxes[namespace][connection_id] = _Direct(callback)
     
     def unregister_send_callback(
         self,
@@ -131,54 +208,61 @@ class RedisAdapter(Adapter):
         """Unregister send callback."""
         if namespace in self._send_callbacks:
             self._send_callbacks[namespace].pop(connection_id, None)
+            outbox = self._outboxes[namespace].pop(connection_id, None)
+            if outbox is not None:
+                outbox.close()
+                self.messages_dropped += outbox.dropped
     
     async def _subscriber_loop(self):
         """Listen for Redis pub/sub messages."""
         try:
             async for message in self._pubsub.listen():
                 if message["type"] == "message":
-                    await self._handle_pubsub_message(message)
+                    self._handle_pubsub_message(message)
         except asyncio.CancelledError:
             pass
         except Exception as e:
             logger.error(f"Subscriber loop error: {e}", exc_info=True)
     
-    async def _handle_pubsub_message(self, message: dict):
-        """Handle incoming pub/sub message."""
+    def _handle_pubsub_message(self, message: dict):
+        """
+        Hand an incoming pub/sub message to local connections.
+        
+        Frames are ``<exclude>\\n<payload>`` on room channels and
+        ``<namespace>\\n<exclude>\\n<payload>`` on the broadcast channel;
+        the payload is the publisher's encoded envelope, forwarded as is.
+        """
         try:
-            # Decode message
-            data = json.loads(message["data"])
-            
-            namespace = data["namespace"]
-            room = data.get("room")
-            envelope_data = data["envelope"]
-            exclude_connection = data.get("exclude_connection")
+            channel = message["channel"]
+            if isinstance(channel, str):
+                channel = channel.encode()
+            data = message["data"]
+            if isinstance(data, str):
+                data = data.encode("utf-8")
             
-            # Reconstruct envelope
-            envelope = MessageEnvelope.from_dict(envelope_data)
-            
-            # Determine recipients
-            if room:
-                # Room message - send to room members
-                recipients = await self.get_room_members(namespace, room)
+            if channel == self._broadcast_channel:
+                namespace, _, data = data.partition(b"\n")
+                outboxes = self._outboxes.get(namespace.decode("utf-8"))
+                if not outboxes:
+                    return
+                recipients = outboxes.keys()
             else:
-                # Broadcast - send to all connections
-                recipients = set(self._send_callbacks.get(namespace, {}).keys())
-            
-            if exclude_connection:
-                recipients.discard(exclude_connection)
+                target = self._channels.get(channel)
+                if target is None:
+                    return
+                outboxes = self._outboxes.get(target[0])
+                recipients = self._local_rooms.get(target)
+                if not outboxes or not recipients:
+                    return
             
-            # Send to local connections
-            encoded = self._codec.encode(envelope)
-            tasks = []
-            
-            for connection_id in recipients:
-                callback = self._send_callbacks.get(namespace, {}).get(connection_id)
-                if callback:
-                    tasks.append(callback(encoded))
-            
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+            exclude, _, payload = data.partition(b"\n")
+            exclude = exclude.decode("utf-8") if exclude else None
+            for connection_id in tuple(recipients):
+                if connection_id == exclude:
+                    continue
+                outbox = outboxes.get(connection_id)
+                if outbox is not None:
+                    outbox.put(payload)
         
         except Exception as e:
             logger.error(f"Error handling pub/sub message: {e}", exc_info=True)
@@ -192,20 +276,8 @@ class RedisAdapter(Adapter):
     ) -> None:
         """Publish message to room via Redis pub/sub."""
         channel = f"{self.prefix}room:{namespace}:{room}"
-        
-        # Publish message
-        message = json.dumps({
-            "namespace": namespace,
-            "room": room,
-            "envelope": envelope.to_dict(),
-            "exclude_connection": exclude_connection,
-        })
-        
+        message = (exclude_connection or "").encode() + b"\n" + self._codec.encode(envelope)
         await self._redis.publish(channel, message)
-        
-        # Also subscribe this worker to the room channel if not subscribed
-        if self._pubsub:
-            await self._pubsub.subscribe(channel)
     
     async def broadcast(
         self,
@@ -214,15 +286,11 @@ class RedisAdapter(Adapter):
         exclude_connection: Optional[str] = None,
     ) -> None:
         """Broadcast message to all connections in namespace."""
-        channel = f"{self.prefix}broadcast"
-        
-        message = json.dumps({
-            "namespace": namespace,
-            "envelope": envelope.to_dict(),
-            "exclude_connection": exclude_connection,
-        })
-        
-        await self._redis.publish(channel, message)
+        message = (
+            f"{namespace}\n{exclude_connection or ''}\n".encode()
+            + self._codec.encode(envelope)
+        )
+        await self._redis.publish(self._broadcast_channel, message)
     
     async def join_room(
         self,
@@ -240,6 +308,18 @@ class RedisAdapter(Adapter):
         # Set TTL on room key
         await self._redis.expire(key, self.connection_ttl * 2)
         
+        # Local index; subscribe on this worker's first member
+        members = self._local_rooms.get((namespace, room))
+        if members is None:
+            members = self._local_rooms[(namespace, room)] = set()
+        members.add(connection_id)
+        self._connection_rooms.setdefault((namespace, connection_id), set()).add(room)
+        if len(members) == 1:
+            channel = f"{self.prefix}room:{namespace}:{room}"
+            self._channels[channel.encode()] = (namespace, room)
+            if self._pubsub:
+                await self._pubsub.subscribe(channel)
+        
         logger.debug(f"Connection {connection_id} joined {namespace}/{room}")
     
     async def leave_room(
@@ -253,6 +333,22 @@ class RedisAdapter(Adapter):
         
         await self._redis.zrem(key, connection_id)
         
+        rooms = self._connection_rooms.get((namespace, connection_id))
+        if rooms is not None:
+            rooms.discard(room)
+            if not rooms:
+                del self._connection_rooms[(namespace, connection_id)]
+        members = self._local_rooms.get((namespace, room))
+        if members is not None:
+            members.discard(connection_id)
+            if not members:
+                # Last local member: stop receiving this room's traffic
+                del self._local_rooms[(namespace, room)]
+                channel = f"{self.prefix}room:{namespace}:{room}"
+                self._channels.pop(channel.encode(), None)
+                if self._pubsub:
+                    await self._pubsub.unsubscribe(channel)
+        
         logger.debug(f"Connection {connection_id} left {namespace}/{room}")
     
     async def get_room_members(
@@ -333,9 +429,9 @@ class RedisAdapter(Adapter):
         
         await self._redis.hdel(key, connection_id)
         
-        # Remove from all rooms
-        rooms = await self.list_rooms(namespace)
-        for room in rooms:
+        # Remove from the rooms it joined on this worker
+        rooms = self._connection_rooms.get((namespace, connection_id), ())
+        for room in list(rooms):
             await self.leave_room(namespace, room, connection_id)
         
         logger.debug(f"Unregistered connection {connection_id} from {namespace}")
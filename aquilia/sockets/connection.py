@@ -9,6 +9,7 @@ Each WebSocket connection has:
 - Room subscriptions
 - State dictionary
 - Send/receive capabilities
+- Bounded outbound queue (see ``outbound.py``)
 """
 
 from __future__ import annotations
@@ -17,9 +18,13 @@ from typing import Any, Dict, Optional, Set, TYPE_CHECKING
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+import asyncio
 import uuid
 import logging
 
+from .envelope import JSONCodec
+from .outbound import OutboundQueue, SlowConsumerPolicy
+
 if TYPE_CHECKING:
     from aquilia.di import Container
     from aquilia.auth.core import Identity
@@ -29,6 +34,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("aquilia.sockets.connection")
 
+_codec = JSONCodec()
+
 
 class ConnectionState(str, Enum):
     """Connection lifecycle state."""
@@ -70,6 +77,11 @@ class Connection:
         send_func: callable,
         identity: Optional[Identity] = None,
         session: Optional[Session] = None,
+        *,
+        close_func: Optional[callable] = None,
+        queue_size: int = 256,
+        slow_consumer_policy: SlowConsumerPolicy | str = SlowConsumerPolicy.DROP_OLDEST,
+        coalesce_bytes: int = 0,
     ):
         """
         Initialize connection.
@@ -83,6 +95,11 @@ class Connection:
             send_func: Low-level send function
             identity: Authenticated identity
             session: Session object
+            close_func: Async callable(code, reason) sending the close frame
+            queue_size: Outbound frames buffered before the slow-consumer
+                policy applies
+            slow_consumer_policy: "drop_oldest", "drop_newest" or "disconnect"
+            coalesce_bytes: Join queued small frames up to this size
         """
         self.connection_id = connection_id
         self.namespace = namespace
@@ -90,6 +107,14 @@ class Connection:
         self.container = container
         self.adapter = adapter
         self._send_func = send_func
+        self._close_func = close_func
+        self.outbound = OutboundQueue(
+            send_func,
+            max_messages=queue_size,
+            policy=slow_consumer_policy,
+            coalesce_bytes=coalesce_bytes,
+            on_overflow=self._on_slow_consumer,
+        )
         self.identity = identity
         self.session = session
         
@@ -165,16 +190,7 @@ class Connection:
     
     async def send_envelope(self, envelope: MessageEnvelope):
         """Send message envelope to client."""
-        from .envelope import JSONCodec
-        
-        codec = JSONCodec()
-        data = codec.encode(envelope)
-        
-        await self._send_func(data)
-        
-        self.messages_sent += 1
-        self.bytes_sent += len(data)
-        self.last_activity = datetime.now(timezone.utc)
+        await self._send_queued(_codec.encode(envelope))
 
     async def send_json(self, data: Dict[str, Any]):
         """
@@ -187,13 +203,41 @@ class Connection:
         Args:
             data: JSON-serialisable dictionary.
         """
-        import json as _json
-        encoded = _json.dumps(data).encode("utf-8")
-        await self._send_func(encoded)
+        await self._send_queued(_codec.dumps(data))
+
+    async def _send_queued(self, data: bytes):
+        """Queue a frame, waiting for room (no slow-consumer drops)."""
+        await self.outbound.send(data)
         self.messages_sent += 1
-        self.bytes_sent += len(encoded)
+        self.bytes_sent += len(data)
         self.last_activity = datetime.now(timezone.utc)
 
+    def enqueue(self, data: bytes) -> bool:
+        """
+        Queue an encoded frame for the writer task without waiting.
+
+        This is the adapters' fan-out entry point: one encode per
+        publish, then a non-blocking enqueue per member.  Only this path
+        applies the slow-consumer policy; ``send_*`` wait for room.
+
+        Returns:
+            False if the frame was dropped by the slow-consumer policy
+        """
+        if not self.outbound.put(data):
+            return False
+        self.messages_sent += 1
+        self.bytes_sent += len(data)
+        self.last_activity = datetime.now(timezone.utc)
+        return True
+
+    def _on_slow_consumer(self):
+        logger.warning(
+            f"Connection {self.connection_id} is not reading fast enough; disconnecting"
+        )
+        asyncio.get_running_loop().create_task(
+            self.disconnect("slow consumer", code=1008)
+        )
+
     # ── Room convenience aliases ─────────────────────────────────────────
 
     async def join_room(self, room: str) -> bool:
@@ -206,11 +250,7 @@ class Connection:
     
     async def send_raw(self, data: bytes):
         """Send raw bytes to client."""
-        await self._send_func(data)
-        
-        self.messages_sent += 1
-        self.bytes_sent += len(data)
-        self.last_activity = datetime.now(timezone.utc)
+        await self._send_queued(data)
     
     async def send_ack(
         self,
@@ -315,6 +355,13 @@ class Connection:
         
         # Send close frame (implementation depends on ASGI adapter)
         logger.info(f"Connection {self.connection_id} disconnecting: {reason}")
+        if self._close_func is not None:
+            await self.outbound.flush()
+            self.outbound.close()
+            try:
+                await self._close_func(code, (reason or "")[:123])
+            except Exception as e:
+                logger.debug(f"Close frame not sent: {e}")
     
     def record_received(self, size: int):
         """Record received message stats."""
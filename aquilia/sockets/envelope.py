@@ -17,6 +17,11 @@ from enum import Enum
 import json
 import uuid
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 class MessageType(str, Enum):
     """Message type discriminator."""
@@ -228,16 +233,29 @@ class MessageCodec(Protocol):
 
 
 class JSONCodec:
-    """JSON message codec."""
+    """JSON message codec (orjson when installed)."""
     
     def encode(self, envelope: MessageEnvelope) -> bytes:
         """Encode envelope to JSON bytes."""
-        return json.dumps(envelope.to_dict()).encode("utf-8")
+        return self.dumps(envelope.to_dict())
     
     def decode(self, data: bytes) -> MessageEnvelope:
         """Decode JSON bytes to envelope."""
-        obj = json.loads(data.decode("utf-8"))
+        if orjson is not None:
+            obj = orjson.loads(data)
+        else:
+            obj = json.loads(data.decode("utf-8"))
         return MessageEnvelope.from_dict(obj)
+    
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        """Encode any JSON-serialisable object to bytes."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj)
+            except TypeError:
+                pass  # e.g. non-str keys or big ints; stdlib handles them
+        return json.dumps(obj).encode("utf-8")
 
 
 class MsgPackCodec:
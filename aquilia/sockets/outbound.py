@@ -0,0 +1,226 @@
+"""
+Outbound Queue - Per-connection send buffering with backpressure
+
+Every connection owns a bounded queue of encoded frames drained by one
+writer task, so producers (handlers, room publishes, broadcasts) never
+await a client's socket.  When a client reads slower than it is sent
+to, the queue fills and the slow-consumer policy decides what gives:
+
+- ``drop_oldest``  discard the oldest queued frame (default; freshest
+                   state wins, e.g. presence/tickers)
+- ``drop_newest``  discard the frame being queued
+- ``disconnect``   close the connection (1008) and stop queueing
+
+The policy applies only to non-blocking ``put()`` (fan-out).  Awaited
+sends go through ``send()``, which waits for room in the queue instead,
+so a handler sending in a loop is paced by the client and loses nothing.
+
+The writer sends everything queued per wake-up.  With ``coalesce_bytes``
+set, consecutive small text frames are joined with ``\\n`` into one
+frame of up to that many bytes (newline-delimited JSON; clients must
+split on newlines), cutting per-frame ASGI overhead for chatty rooms.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("aquilia.sockets.outbound")
+
+
+class SlowConsumerPolicy(str, Enum):
+    """What to do when a connection's outbound queue is full."""
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    DISCONNECT = "disconnect"
+
+
+class OutboundQueue:
+    """
+    Bounded frame queue with a single writer task.
+
+    Args:
+        send: Async callable writing one frame (bytes) to the client
+        max_messages: Queue capacity
+        policy: Slow-consumer policy applied when full
+        coalesce_bytes: Join small frames up to this size (0 = never)
+        on_overflow: Called once when ``policy`` is ``disconnect`` and
+            the queue overflows
+    """
+
+    __slots__ = (
+        "_send", "_queue", "_max", "_policy", "_coalesce", "_on_overflow",
+        "_wakeup", "_space", "_idle", "_task", "_closed", "_error",
+        "enqueued", "dropped", "frames_sent", "max_depth",
+    )
+
+    def __init__(
+        self,
+        send: Callable[[bytes], Any],
+        *,
+        max_messages: int = 256,
+        policy: SlowConsumerPolicy | str = SlowConsumerPolicy.DROP_OLDEST,
+        coalesce_bytes: int = 0,
+        on_overflow: Optional[Callable[[], Any]] = None,
+    ):
+        self._send = send
+        self._queue: deque[bytes] = deque()
+        self._max = max_messages
+        self._policy = SlowConsumerPolicy(policy)
+        self._coalesce = coalesce_bytes
+        self._on_overflow = on_overflow
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._error: Optional[BaseException] = None
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.frames_sent = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        """Frames waiting to be written."""
+        return len(self._queue)
+
+    def put(self, data: bytes) -> bool:
+        """
+        Queue a frame without waiting.
+
+        Returns:
+            False if the frame was not queued (dropped or closed)
+        """
+        if self._closed:
+            return False
+        queue = self._queue
+        if len(queue) >= self._max:
+            if self._policy is SlowConsumerPolicy.DROP_OLDEST:
+                queue.popleft()
+                self.dropped += 1
+            elif self._policy is SlowConsumerPolicy.DROP_NEWEST:
+                self.dropped += 1
+                return False
+            else:
+                self.dropped += 1 + len(queue)
+                queue.clear()
+                self._closed = True
+                if self._on_overflow is not None:
+                    self._on_overflow()
+                return False
+
+        queue.append(data)
+        self.enqueued += 1
+        if len(queue) > self.max_depth:
+            self.max_depth = len(queue)
+
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._writer())
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    async def send(self, data: bytes) -> None:
+        """
+        Queue a frame, waiting for room instead of applying the policy.
+
+        Raises:
+            The writer's error if an earlier write to the client failed,
+            or ``ConnectionError`` if the queue is closed
+        """
+        while True:
+            if self._error is not None:
+                raise self._error
+            if self._closed:
+                raise ConnectionError("Outbound queue is closed")
+            if len(self._queue) < self._max:
+                break
+            if self._space is None:
+                self._space = asyncio.Event()
+            self._space.clear()
+            await self._space.wait()
+        self.put(data)
+
+    def _notify_space(self):
+        if self._space is not None:
+            self._space.set()
+
+    async def _writer(self):
+        queue = self._queue
+        wakeup = self._wakeup
+        idle = self._idle
+        while True:
+            if not queue:
+                # Nothing queued and the last frame taken is written
+                idle.set()
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+            frame = self._next_frame()
+            self._notify_space()
+            try:
+                await self._send(frame)
+                self.frames_sent += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Client gone; the receive loop will clean up.  Awaited
+                # senders see the error on their next send().
+                logger.debug(f"Outbound write failed: {e}")
+                queue.clear()
+                self._closed = True
+                self._error = e
+                self._notify_space()
+                idle.set()
+                return
+
+    def _next_frame(self) -> bytes:
+        queue = self._queue
+        frame = queue.popleft()
+        limit = self._coalesce
+        if not limit or not queue or len(frame) + 1 + len(queue[0]) > limit:
+            return frame
+        parts = [frame]
+        size = len(frame)
+        while queue and size + 1 + len(queue[0]) <= limit:
+            nxt = queue.popleft()
+            parts.append(nxt)
+            size += 1 + len(nxt)
+        return b"\n".join(parts)
+
+    async def flush(self, timeout: float = 5.0):
+        """Wait (bounded) until queued frames, and any frame being sent, are written."""
+        if self._task is None or self._task.done():
+            return
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def close(self):
+        """Stop the writer; frames still queued are discarded."""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+        self._queue.clear()
+        self._notify_space()
+        if self._idle is not None:
+            self._idle.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "frames_sent": self.frames_sent,
+            "policy": self._policy.value,
+        }
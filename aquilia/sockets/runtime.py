@@ -170,6 +170,10 @@ class AquilaSockets:
         container_factory: Optional[Callable] = None,
         auth_manager: Optional[Any] = None,
         session_engine: Optional[Any] = None,
+        *,
+        outbound_queue_size: int = 256,
+        slow_consumer_policy: str = "drop_oldest",
+        coalesce_bytes: int = 0,
     ):
         """
         Initialize WebSocket runtime.
@@ -180,12 +184,18 @@ class AquilaSockets:
             container_factory: Factory for creating DI containers
             auth_manager: Auth manager for handshake auth
             session_engine: Session engine for session support
+            outbound_queue_size: Frames buffered per connection
+            slow_consumer_policy: "drop_oldest", "drop_newest" or "disconnect"
+            coalesce_bytes: Join queued small frames up to this size (0 = off)
         """
         self.router = router
         self.adapter = adapter or InMemoryAdapter()
         self.container_factory = container_factory
         self.auth_manager = auth_manager
         self.session_engine = session_engine
+        self.outbound_queue_size = outbound_queue_size
+        self.slow_consumer_policy = slow_consumer_policy
+        self.coalesce_bytes = coalesce_bytes
         
         self.connections: Dict[str, Connection] = {}
         self.controller_instances: Dict[str, SocketController] = {}
@@ -209,6 +219,17 @@ class AquilaSockets:
         self._initialized = False
         logger.info("AquilaSockets shut down")
     
+    def outbound_stats(self) -> Dict[str, Any]:
+        """Aggregate outbound queue metrics across live connections."""
+        depths = [c.outbound.depth for c in self.connections.values()]
+        return {
+            "connections": len(depths),
+            "queued": sum(depths),
+            "max_depth": max((c.outbound.max_depth for c in self.connections.values()), default=0),
+            "dropped": sum(c.outbound.dropped for c in self.connections.values()),
+            "slow_consumers": sum(1 for d in depths if d >= self.outbound_queue_size),
+        }
+    
     async def handle_websocket(self, scope: dict, receive: callable, send: callable):
         """
         Handle WebSocket connection (ASGI entry point).
@@ -339,6 +360,9 @@ class AquilaSockets:
                 "text": data.decode("utf-8") if isinstance(data, bytes) else data,
             })
         
+        async def close_func(code: int, reason: str):
+            await send({"type": "websocket.close", "code": code, "reason": reason})
+        
         conn = Connection(
             connection_id=connection_id,
             namespace=namespace,
@@ -348,6 +372,10 @@ class AquilaSockets:
             send_func=send_func,
             identity=identity,
             session=session,
+            close_func=close_func,
+            queue_size=self.outbound_queue_size,
+            slow_consumer_policy=self.slow_consumer_policy,
+            coalesce_bytes=self.coalesce_bytes,
         )
         
         # Register connection
@@ -362,9 +390,10 @@ class AquilaSockets:
             worker_id=worker_id,
         )
         
-        # Register send callback with adapter (for InMemoryAdapter)
+        # Adapters fan out by enqueueing onto the connection's outbound
+        # queue (non-blocking), never by awaiting the socket
         if hasattr(self.adapter, "register_send_callback"):
-            self.adapter.register_send_callback(namespace, connection_id, send_func)
+            self.adapter.register_send_callback(namespace, connection_id, conn.enqueue)
         
         logger.info(f"Handshake successful: {connection_id} ({namespace})")
         
@@ -560,6 +589,7 @@ class AquilaSockets:
         
         await self.adapter.unregister_connection(conn.namespace, conn.connection_id)
         
+        conn.outbound.close()
         del self.connections[conn.connection_id]
         
         conn.mark_closed()
@@ -36,6 +36,8 @@ from .bytecode_cache import (
     InMemoryBytecodeCache,
     CrousBytecodeCache,
 )
+from .fragment_cache import FragmentCache, FragmentCacheExtension
+from .streaming import StreamFlushExtension, buffered_stream
 from .manager import TemplateManager, TemplateLintIssue
 from .middleware import TemplateMiddleware
 from .context import TemplateContext, create_template_context
@@ -71,6 +73,12 @@ __all__ = [
     "BytecodeCache",
     "InMemoryBytecodeCache",
     "CrousBytecodeCache",
+    "FragmentCache",
+    "FragmentCacheExtension",
+    
+    # Streaming
+    "StreamFlushExtension",
+    "buffered_stream",
     
     # Manager
     "TemplateManager",
@@ -9,7 +9,7 @@ Provides:
 - Response integration
 """
 
-from typing import Any, AsyncIterator, Callable, Dict, Mapping, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Mapping, Optional, TYPE_CHECKING
 import asyncio
 from jinja2 import Environment, Template
 from jinja2.ext import Extension
@@ -18,6 +18,8 @@ from .loader import TemplateLoader
 from .bytecode_cache import BytecodeCache, InMemoryBytecodeCache
 from .security import TemplateSandbox, SandboxPolicy, create_safe_filters, create_safe_globals
 from .context import TemplateContext, create_template_context
+from .fragment_cache import FragmentCache, FragmentCacheExtension, source_digest
+from .streaming import STREAM_FLAG, StreamFlushExtension, buffered_stream
 
 if TYPE_CHECKING:
     from aquilia.response import Response
@@ -45,6 +47,8 @@ class TemplateEngine:
         filters: Custom filters
         tests: Custom tests
         extensions: Jinja2 extensions to enable
+        fragment_cache: Cache for ``{% cache %}`` blocks and render_fragment()
+        stream_buffer_size: Default stream() buffer in characters (0 = unbuffered)
     
     Example:
         loader = TemplateLoader(["/path/to/templates"])
@@ -66,10 +70,14 @@ class TemplateEngine:
         filters: Optional[Dict[str, Callable]] = None,
         tests: Optional[Dict[str, Callable]] = None,
         extensions: Optional[list] = None,
+        fragment_cache: Optional[FragmentCache] = None,
+        stream_buffer_size: int = 16384,
     ):
         self.loader = loader
         self.bytecode_cache = bytecode_cache or InMemoryBytecodeCache()
         self.sandbox = sandbox
+        self.stream_buffer_size = stream_buffer_size
+        extensions = [*(extensions or []), FragmentCacheExtension, StreamFlushExtension]
         
         # Create sandbox if enabled
         if sandbox:
@@ -104,7 +112,7 @@ class TemplateEngine:
             self.env = self._sandbox.create_environment(
                 loader=self.loader,
                 bytecode_cache=self.bytecode_cache,
-                extensions=extensions or [],
+                extensions=extensions,
                 enable_async=True,
             )
         else:
@@ -119,7 +127,7 @@ class TemplateEngine:
                     enabled_extensions=["html", "htm", "xml"],
                     default_for_string=True,
                 ) if autoescape else False,
-                extensions=extensions or [],
+                extensions=extensions,
                 enable_async=True,
             )
             
@@ -135,8 +143,13 @@ class TemplateEngine:
             if globals:
                 self.env.globals.update(globals)
         
+        if fragment_cache is not None:
+            self.env.fragment_cache = fragment_cache
+        self.fragments: FragmentCache = self.env.fragment_cache
+        
         # Template cache (in addition to bytecode cache)
         self._template_cache: Dict[str, Template] = {}
+        self._fragment_scopes: Dict[str, str] = {}
         self._cache_enabled = True
     
     async def render(
@@ -174,6 +187,45 @@ class TemplateEngine:
         
         return rendered
     
+    async def render_fragment(
+        self,
+        template_name: str,
+        context: Optional[Mapping[str, Any]] = None,
+        *,
+        key: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+        request_ctx: Optional["RequestCtx"] = None,
+    ) -> str:
+        """
+        Render a partial through the fragment cache.
+        
+        Args:
+            template_name: Partial template name
+            context: Template variables
+            key: Everything the output depends on besides the template
+            ttl: Cache TTL in seconds (default: the cache's default_ttl)
+            tags: Invalidation tags, e.g. ``["model:Product:42"]``
+            request_ctx: Request context
+        
+        Returns:
+            Rendered HTML string (cached or fresh)
+        """
+        scope = self._fragment_scopes.get(template_name)
+        if scope is None:
+            source, _, _ = self.env.loader.get_source(self.env, template_name)
+            scope = source_digest(source)
+            if self._cache_enabled:
+                self._fragment_scopes[template_name] = scope
+        return await self.fragments.get_or_render(
+            template_name,
+            key,
+            lambda: self.render(template_name, context, request_ctx),
+            ttl=ttl,
+            tags=tags,
+            scope=scope,
+        )
+    
     def render_sync(
         self,
         template_name: str,
@@ -201,17 +253,25 @@ class TemplateEngine:
         self,
         template_name: str,
         context: Optional[Mapping[str, Any]] = None,
-        request_ctx: Optional["RequestCtx"] = None
+        request_ctx: Optional["RequestCtx"] = None,
+        *,
+        buffer_size: Optional[int] = None,
     ) -> AsyncIterator[bytes]:
         """
         Stream template rendering.
         
         Yields chunks of rendered content as bytes for streaming responses.
+        Output is buffered up to ``buffer_size`` characters and encoded once
+        per chunk; ``{% flush %}`` in the template sends what has been
+        rendered so far immediately.  Rendering stops once the request
+        reports a client disconnect.
         
         Args:
             template_name: Template name
             context: Template variables
             request_ctx: Request context
+            buffer_size: Flush threshold (default: ``stream_buffer_size``;
+                0 yields every template node separately)
         
         Yields:
             Chunks of rendered content as bytes
@@ -225,9 +285,24 @@ class TemplateEngine:
         # Get template
         template = self.get_template(template_name)
         
-        # Generate async
-        async for chunk in template.generate_async(**template_context.to_dict()):
-            yield chunk.encode("utf-8")
+        if buffer_size is None:
+            buffer_size = self.stream_buffer_size
+        
+        if buffer_size <= 0:
+            async for chunk in template.generate_async(**template_context.to_dict()):
+                yield chunk.encode("utf-8")
+            return
+        
+        variables = template_context.to_dict()
+        variables[STREAM_FLAG] = True
+        request = getattr(request_ctx, "request", None)
+        
+        async for chunk in buffered_stream(
+            template.generate_async(**variables),
+            buffer_size=buffer_size,
+            is_disconnected=getattr(request, "is_disconnected", None),
+        ):
+            yield chunk
     
     async def render_to_response(
         self,
@@ -277,7 +352,8 @@ class TemplateEngine:
         status: int = 200,
         headers: Optional[Dict[str, str]] = None,
         content_type: str = "text/html; charset=utf-8",
-        request_ctx: Optional["RequestCtx"] = None
+        request_ctx: Optional["RequestCtx"] = None,
+        buffer_size: Optional[int] = None,
     ) -> "Response":
         """
         Render template as streaming response.
@@ -289,6 +365,7 @@ class TemplateEngine:
             headers: Additional headers
             content_type: Content-Type header
             request_ctx: Request context
+            buffer_size: Stream buffer size (see stream())
         
         Returns:
             Response object with streaming content
@@ -296,8 +373,10 @@ class TemplateEngine:
         from aquilia.response import Response
         
         return Response.stream(
-            self.stream(template_name, context, request_ctx),
-            media_type=content_type
+            self.stream(template_name, context, request_ctx, buffer_size=buffer_size),
+            status=status,
+            headers=headers,
+            media_type=content_type,
         )
     
     def get_template(self, name: str) -> Template:
@@ -331,12 +410,14 @@ class TemplateEngine:
         """
         if template_name:
             self._template_cache.pop(template_name, None)
+            self._fragment_scopes.pop(template_name, None)
             
             # Also invalidate bytecode cache
             if hasattr(self.bytecode_cache, "invalidate"):
                 self.bytecode_cache.invalidate(template_name)
         else:
             self._template_cache.clear()
+            self._fragment_scopes.clear()
             self.bytecode_cache.clear()
     
     def list_templates(self) -> list[str]:
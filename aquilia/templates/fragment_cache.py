@@ -0,0 +1,282 @@
+"""
+Template Fragment Cache - cache rendered partials in ``CacheService``.
+
+Provides:
+- ``{% cache key[, ttl][, tags=[...]][, name=...] %}...{% endcache %}``
+  for caching part of a template
+- ``TemplateEngine.render_fragment()`` for caching a whole partial
+- Tag-based invalidation, with model ``post_save`` / ``post_delete``
+  evicting fragments tagged ``model:<Model>`` or ``model:<Model>:<pk>``
+- Per-fragment hit/miss metrics
+
+The key must capture everything the fragment's output depends on
+(e.g. ``("card", product.id, lang)``); it is hashed together with the
+fragment name and a checksum of the template source, so engines with
+different loaders sharing one cache service never serve each other's
+fragments.  Keys must have a stable ``repr()`` (no default
+``<object at 0x...>``).  Concurrent misses on one key render once (the
+cache service's stampede protection).
+
+Example:
+    {% cache ("nav", user.role), 600, tags=["model:Category"] %}
+        {% for c in await categories() %}<a href="{{ c.url }}">{{ c.name }}</a>{% endfor %}
+    {% endcache %}
+
+    html = await engine.render_fragment(
+        "partials/card.html", {"product": p},
+        key=p.id, ttl=300, tags=[f"model:Product:{p.id}"],
+    )
+"""
+
+import hashlib
+import logging
+import re
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from .streaming import FLUSH_MARKER
+
+logger = logging.getLogger("aquilia.templates.fragment_cache")
+
+NAMESPACE = "tpl"
+
+# Default object reprs differ per process and per object
+_ADDRESS_RE = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def source_digest(source: str) -> str:
+    """Checksum of a template's source, scoping its fragments' keys."""
+    return hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+
+
+class FragmentCache:
+    """
+    Rendered-fragment cache backed by ``aquilia.cache.CacheService``.
+
+    Uses the given service, else the one registered with
+    ``aquilia.cache.set_default_cache_service``, else a process-local
+    memory cache.
+
+    Args:
+        service: Cache service (resolved lazily when omitted)
+        default_ttl: TTL in seconds when a fragment gives none
+        namespace: Cache namespace for fragments
+
+    Example:
+        fragments = FragmentCache(default_ttl=300)
+        html = await fragments.get_or_render("sidebar", user.id, render)
+        await fragments.invalidate("model:Category")
+    """
+
+    def __init__(
+        self,
+        service: Any = None,
+        *,
+        default_ttl: int = 300,
+        namespace: str = NAMESPACE,
+    ):
+        self._service = service
+        self.default_ttl = default_ttl
+        self.namespace = namespace
+        # fragment name -> [hits, misses]
+        self._stats: Dict[str, List[int]] = {}
+        # Tags used by fragments cached in this process: lets model
+        # writes skip the backend when nothing depends on them
+        self._known_tags: Set[str] = set()
+        _instances.add(self)
+
+    async def service(self) -> Any:
+        """Resolve the cache service."""
+        if self._service is not None:
+            return self._service
+        from aquilia.cache.decorators import get_default_cache_service
+
+        service = get_default_cache_service()
+        if service is not None:
+            return service
+        global _fallback_service
+        if _fallback_service is None:
+            from aquilia.cache.backends.memory import MemoryBackend
+            from aquilia.cache.service import CacheService
+
+            _fallback_service = CacheService(MemoryBackend(max_size=5000))
+            await _fallback_service.initialize()
+        return _fallback_service
+
+    async def get_or_render(
+        self,
+        name: str,
+        key: Any,
+        render: Callable[[], Awaitable[str]],
+        *,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+        scope: str = "",
+    ) -> str:
+        """
+        Return the cached output of fragment ``name`` for ``key``,
+        rendering and storing it on a miss.
+
+        ``scope`` (the template's ``source_digest``) is part of the key.
+
+        Raises:
+            TypeError: If ``key``'s repr contains an object address
+        """
+        raw = repr((scope, name, key))
+        if _ADDRESS_RE.search(raw):
+            raise TypeError(
+                f"Fragment key for {name!r} has no stable repr: {key!r}; "
+                f"use ids or other plain values"
+            )
+        service = await self.service()
+        digest = hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+        tags = tuple(tags)
+        counters = self._stats.setdefault(name, [0, 0])
+        rendered = False
+
+        async def loader() -> str:
+            nonlocal rendered
+            rendered = True
+            return str(await render())
+
+        html = await service.get_or_set(
+            f"frag:{digest}",
+            loader,
+            ttl=self.default_ttl if ttl is None else ttl,
+            namespace=self.namespace,
+            tags=tags,
+        )
+        if rendered:
+            counters[1] += 1
+            self._known_tags.update(tags)
+        else:
+            counters[0] += 1
+        return html
+
+    async def invalidate(self, *tags: str) -> int:
+        """Evict every fragment carrying one of ``tags``."""
+        if not tags:
+            return 0
+        service = await self.service()
+        try:
+            return await service.invalidate_tags(*tags)
+        except Exception as exc:
+            logger.warning(f"Fragment invalidation failed for {tags}: {exc}")
+            return 0
+
+    async def invalidate_model(self, model_cls: Any, instance: Any = None) -> int:
+        """Evict fragments tagged ``model:<Model>`` (and ``model:<Model>:<pk>``)."""
+        tags = [f"model:{model_cls.__name__}"]
+        pk = getattr(instance, "pk", None) if instance is not None else None
+        if pk is not None:
+            tags.append(f"model:{model_cls.__name__}:{pk}")
+        service = await self.service()
+        if not service.is_distributed:
+            tags = [t for t in tags if t in self._known_tags]
+        return await self.invalidate(*tags)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-fragment hit/miss counts and hit rates."""
+        report = {}
+        for name, (hits, misses) in sorted(self._stats.items()):
+            total = hits + misses
+            report[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / total, 4) if total else 0.0,
+            }
+        return report
+
+    def reset_stats(self) -> None:
+        self._stats.clear()
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Jinja2 ``{% cache %}`` tag.
+
+    Syntax:
+        {% cache key %}...{% endcache %}
+        {% cache key, ttl %}...{% endcache %}
+        {% cache key, ttl, tags=["model:Product"], name="cards" %}...{% endcache %}
+
+    ``name`` (for metrics and as part of the key) defaults to
+    ``<template>:<line>``; the key is also scoped by the template's
+    ``source_digest``.  Requires an async environment.
+    """
+
+    tags = {"cache"}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=FragmentCache())
+        # template name -> source digest, recorded just before parsing
+        self._digests: Dict[Optional[str], str] = {}
+
+    def preprocess(self, source, name, filename=None):
+        self._digests[name] = source_digest(source)
+        return source
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        key = parser.parse_expression()
+        ttl: nodes.Expr = nodes.Const(None)
+        tags: nodes.Expr = nodes.List([])
+        name: nodes.Expr = nodes.Const(f"{parser.name or '<string>'}:{lineno}")
+
+        while parser.stream.skip_if("comma"):
+            if parser.stream.current.type == "name" and parser.stream.look().type == "assign":
+                kw = parser.stream.expect("name").value
+                parser.stream.expect("assign")
+                value = parser.parse_expression()
+                if kw == "tags":
+                    tags = value
+                elif kw == "ttl":
+                    ttl = value
+                elif kw == "name":
+                    name = value
+                else:
+                    parser.fail(f"Unknown cache option '{kw}'", lineno)
+            else:
+                ttl = parser.parse_expression()
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        scope = nodes.Const(self._digests.get(parser.name, ""))
+        return nodes.CallBlock(
+            self.call_method("_cache", [name, key, ttl, tags, scope]), [], [], body,
+        ).set_lineno(lineno)
+
+    async def _cache(self, name, key, ttl, tags, scope, caller) -> Markup:
+        html = await self.environment.fragment_cache.get_or_render(
+            str(name), key, caller, ttl=ttl, tags=tags or (), scope=scope,
+        )
+        # Autoescaping already happened when the fragment was rendered;
+        # flush points are not replayed from the cache
+        return Markup(html.replace(FLUSH_MARKER, ""))
+
+
+# ── Model signal hooks ───────────────────────────────────────────────
+
+_instances: "weakref.WeakSet[FragmentCache]" = weakref.WeakSet()
+_fallback_service: Any = None
+
+
+async def _on_model_write(sender: Any, instance: Any = None, **kwargs: Any) -> None:
+    for cache in list(_instances):
+        await cache.invalidate_model(sender, instance)
+
+
+def _connect_model_signals() -> None:
+    try:
+        from aquilia.models.signals import post_delete, post_save
+    except Exception:  # pragma: no cover - models layer unavailable
+        return
+    post_save.connect(_on_model_write)
+    post_delete.connect(_on_model_write)
+
+
+_connect_model_signals()
@@ -0,0 +1,119 @@
+"""
+Template Streaming - buffered, flow-controlled output for TemplateEngine.stream().
+
+Jinja2's ``generate_async()`` yields one small string per template node;
+sending each as its own ``http.response.body`` costs one encode and one
+ASGI send per node.  ``buffered_stream()`` coalesces them:
+
+- Output accumulates until ``buffer_size`` characters, then is joined
+  and encoded once and yielded as one chunk (chunks are never split)
+- ``{% flush %}`` sends everything rendered so far immediately, e.g.
+  right after ``</head>`` so the browser can start fetching assets
+- Rendering stops at the next flush once the client has disconnected
+
+Example:
+    <head>...</head>
+    {% flush %}
+    <body>{% for row in await rows() %}...{% endfor %}</body>
+"""
+
+from typing import Any, AsyncIterator, Callable, Optional
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+FLUSH_MARKER = "\x00aquilia:flush\x00"
+
+# Context variable set by TemplateEngine.stream(); outside a buffered
+# stream ``{% flush %}`` renders nothing
+STREAM_FLAG = "_aquilia_streaming"
+
+
+class StreamFlushExtension(Extension):
+    """
+    Jinja2 ``{% flush %}`` tag: early-flush point for buffered streaming.
+
+    Takes effect where output is yielded directly (top level, loops,
+    blocks); inside macros and call blocks it flushes when the
+    enclosing output is emitted.
+    """
+
+    tags = {"flush"}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        return nodes.Output(
+            [self.call_method("_flush", [nodes.ContextReference()])]
+        ).set_lineno(lineno)
+
+    def _flush(self, context) -> str:
+        return Markup(FLUSH_MARKER) if context.get(STREAM_FLAG) else ""
+
+
+async def buffered_stream(
+    chunks: AsyncIterator[str],
+    *,
+    buffer_size: int,
+    encoding: str = "utf-8",
+    is_disconnected: Optional[Callable[[], Any]] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Coalesce rendered template output into encoded chunks.
+
+    Args:
+        chunks: Output of ``Template.generate_async()``
+        buffer_size: Flush threshold in characters
+        encoding: Output encoding
+        is_disconnected: Checked after each flush; a truthy result stops
+            rendering (may be sync or async)
+
+    Yields:
+        Encoded chunks of at least ``buffer_size`` characters, except at
+        ``{% flush %}`` points and the end of the template
+    """
+    buffer: list = []
+    size = 0
+
+    async def gone() -> bool:
+        if is_disconnected is None:
+            return False
+        result = is_disconnected()
+        if hasattr(result, "__await__"):
+            result = await result
+        return bool(result)
+
+    try:
+        async for chunk in chunks:
+            if FLUSH_MARKER in chunk:
+                *flushed, chunk = chunk.split(FLUSH_MARKER)
+                for part in flushed:
+                    buffer.append(part)
+                    data = "".join(buffer).encode(encoding)
+                    buffer = []
+                    size = 0
+                    if data:
+                        yield data
+                        if await gone():
+                            return
+                if not chunk:
+                    continue
+
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= buffer_size:
+                data = "".join(buffer).encode(encoding)
+                buffer = []
+                size = 0
+                yield data
+                if await gone():
+                    return
+
+        if buffer:
+            data = "".join(buffer).encode(encoding)
+            if data:
+                yield data
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -346,8 +346,16 @@ class TestClient:
             client=client,
         )
 
-        # Receive callable
-        receive = make_test_receive(body)
+        # Receive callable: like a real client, stay connected (no
+        # http.disconnect) until the response is complete
+        body_receive = make_test_receive(body)
+        response_complete = asyncio.Event()
+
+        async def receive():
+            message = await body_receive()
+            if message["type"] == "http.disconnect":
+                await response_complete.wait()
+            return message
 
         # Capture response events
         response_started = False
@@ -380,6 +388,8 @@ class TestClient:
                         resp_headers[name_lower] = val
             elif event["type"] == "http.response.body":
                 body_parts.append(event.get("body", b""))
+                if not event.get("more_body", False):
+                    response_complete.set()
 
         # Execute ASGI app with timing
         start_time = _time.monotonic()
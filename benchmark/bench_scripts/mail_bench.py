@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Mail Throughput Benchmark
+=========================
+Measures SMTP delivery throughput against a local aiosmtpd stand-in server.
+
+Scenarios:
+  sequential   one connection, one message at a time (pool_size=1)
+  pooled       SMTPProvider.send_batch spread over --pool pooled connections
+  dispatcher   MailService → job queue → MailDispatcher → SMTPProvider,
+               i.e. the full enqueue-and-drain path
+
+--latency-ms adds a per-message delay inside the server's DATA handler to
+stand in for a remote MTA's round trip; with zero latency the numbers are
+dominated by MIME construction and local socket overhead.
+
+Usage:
+    python benchmark/bench_scripts/mail_bench.py --messages 2000 --pool 8 \
+                                                 --latency-ms 5
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+try:
+    from aiosmtpd.controller import Controller
+except ImportError:
+    print("ERROR: pip install aiosmtpd aiosmtplib")
+    sys.exit(1)
+
+from aquilia.mail import EmailMessage, MailConfig
+from aquilia.mail.envelope import MailEnvelope
+from aquilia.mail.providers.smtp import SMTPProvider
+from aquilia.mail.service import MailService
+
+
+class CountingHandler:
+    """aiosmtpd handler that accepts everything and counts messages."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.received += 1
+        return "250 OK"
+
+
+def _envelopes(n: int, domains: int):
+    return [
+        MailEnvelope(
+            from_email="bench@aquilia.local",
+            to=[f"user{i}@d{i % domains}.example"],
+            subject=f"Benchmark {i}",
+            body_text="Hello from the Aquilia mail benchmark.\n" * 10,
+        )
+        for i in range(n)
+    ]
+
+
+def _provider(port: int, pool: int) -> SMTPProvider:
+    return SMTPProvider(
+        name="bench", host="127.0.0.1", port=port,
+        use_tls=False, pool_size=pool, timeout=30.0,
+    )
+
+
+async def bench_provider(port: int, messages: int, pool: int, domains: int) -> float:
+    provider = _provider(port, pool)
+    await provider.initialize()
+    envelopes = _envelopes(messages, domains)
+    t0 = time.perf_counter()
+    results = []
+    for start in range(0, messages, provider.max_batch_size):
+        results.extend(await provider.send_batch(envelopes[start:start + provider.max_batch_size]))
+    elapsed = time.perf_counter() - t0
+    await provider.shutdown()
+    failed = sum(not r.is_success for r in results)
+    if failed:
+        print(f"  ! {failed} failed sends")
+    return elapsed
+
+
+async def bench_dispatcher(port: int, messages: int, pool: int, domains: int) -> tuple:
+    config = MailConfig(
+        default_from="bench@aquilia.local",
+        providers=[{
+            "name": "bench", "type": "smtp", "host": "127.0.0.1", "port": port,
+            "use_tls": False, "rate_limit_per_min": 0, "max_concurrency": 2,
+            "config": {"pool_size": pool},
+        }],
+        rate_limit={"global_per_minute": 0, "per_domain_per_minute": 0},
+        queue={"batch_size": 200, "concurrency": 2, "poll_interval": 0.1},
+    )
+    svc = MailService(config)
+    await svc.on_startup()
+    t0 = time.perf_counter()
+    for i in range(messages):
+        await svc.send_message(EmailMessage(
+            subject=f"Benchmark {i}",
+            body="Hello from the Aquilia mail benchmark.\n" * 10,
+            to=[f"user{i}@d{i % domains}.example"],
+        ))
+    enqueued = time.perf_counter() - t0
+    await svc.job_queue.join()
+    elapsed = time.perf_counter() - t0
+    await svc.on_shutdown()
+    return enqueued, elapsed
+
+
+def _report(label: str, messages: int, elapsed: float) -> None:
+    print(f"  {label:<28} {elapsed:8.3f}s  {messages / elapsed:10.1f} msg/s")
+
+
+async def main(args) -> None:
+    handler = CountingHandler(args.latency_ms / 1000)
+    controller = Controller(handler, hostname="127.0.0.1", port=args.port)
+    controller.start()
+    try:
+        print(
+            f"Mail benchmark: {args.messages} messages, pool={args.pool}, "
+            f"latency={args.latency_ms}ms, domains={args.domains}"
+        )
+        seq = await bench_provider(args.port, args.messages, 1, args.domains)
+        _report("sequential (1 connection)", args.messages, seq)
+        pooled = await bench_provider(args.port, args.messages, args.pool, args.domains)
+        _report(f"pooled ({args.pool} connections)", args.messages, pooled)
+        enqueued, total = await bench_dispatcher(args.port, args.messages, args.pool, args.domains)
+        _report("dispatcher: enqueue only", args.messages, enqueued)
+        _report("dispatcher: end to end", args.messages, total)
+        print(f"  speed-up pooled vs sequential: {seq / pooled:.2f}x")
+        print(f"  server received: {handler.received}")
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--pool", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--domains", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8025)
+    asyncio.run(main(parser.parse_args()))
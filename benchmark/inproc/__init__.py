@@ -0,0 +1 @@
+# In-process benchmark harness
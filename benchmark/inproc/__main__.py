@@ -0,0 +1,147 @@
+"""
+In-process benchmark runner.
+
+Usage:
+    python -m benchmark.inproc                          # run, compare to baseline
+    python -m benchmark.inproc --save-baseline          # record a new baseline
+    python -m benchmark.inproc --scenarios ping,json,db-read --iterations 5000
+    python -m benchmark.inproc --threshold 5 --latency-threshold 15
+
+Exit status is 1 when any metric regresses past its threshold against the
+baseline (default ``benchmark/results/inproc/baseline.json``), 0 otherwise.
+Baselines are only comparable on the same machine and Python build.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+from .harness import (
+    DEFAULT_THRESHOLDS,
+    HarnessError,
+    build_scenarios,
+    compare,
+    environment,
+    load_baseline,
+    measure,
+    save_baseline,
+)
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), "..", "results", "inproc", "baseline.json"
+)
+
+
+async def run(args) -> dict:
+    from .app import close_db, create_server
+    from .micro import run_micro
+
+    results = {"environment": environment(), "scenarios": {}, "micro": {}, "failed": {}}
+    scenarios = build_scenarios(upload_size=args.upload_size)
+    if args.scenarios:
+        wanted = set(args.scenarios.split(","))
+        unknown = wanted - {s.name for s in scenarios}
+        if unknown:
+            raise SystemExit(f"Unknown scenario(s): {', '.join(sorted(unknown))}")
+        scenarios = [s for s in scenarios if s.name in wanted]
+
+    if scenarios:
+        server = await create_server()
+        try:
+            for scenario in scenarios:
+                # Upload bodies are 10 MB; scale iterations so the suite
+                # finishes in comparable time per scenario.
+                iterations = args.iterations if scenario.name != "upload" else max(20, args.iterations // 50)
+                try:
+                    metrics = await measure(
+                        server.app, scenario,
+                        iterations=iterations,
+                        warmup=min(args.warmup, iterations),
+                        concurrency=args.concurrency,
+                        alloc_samples=min(args.alloc_samples, iterations),
+                    )
+                except HarnessError as exc:
+                    # e.g. upload without python-multipart installed
+                    print(f"  {scenario.name:<12} FAILED: {exc}")
+                    results["failed"][scenario.name] = str(exc)
+                    continue
+                results["scenarios"][scenario.name] = metrics
+                print(
+                    f"  {scenario.name:<12} {metrics['rps']:>10,.0f} req/s  "
+                    f"p50 {metrics['p50_us']:>9,.1f}µs  p99 {metrics['p99_us']:>9,.1f}µs  "
+                    f"alloc {metrics['alloc_kib']:>9,.1f} KiB/req"
+                )
+        finally:
+            await server.shutdown()
+            await close_db()
+
+    if not args.no_micro:
+        results["micro"] = await run_micro(min_time=args.micro_time)
+        for name, r in results["micro"].items():
+            print(f"  {name:<24} {r['ns_per_op']:>12,.1f} ns/op")
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Aquilia in-process ASGI benchmark")
+    parser.add_argument("--scenarios", help="Comma-separated scenario names (default: all 14)")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Concurrent in-flight requests per scenario")
+    parser.add_argument("--alloc-samples", type=int, default=50)
+    parser.add_argument("--upload-size", type=int, default=10 * 1024 * 1024)
+    parser.add_argument("--no-micro", action="store_true", help="Skip microbenchmarks")
+    parser.add_argument("--micro-time", type=float, default=0.2,
+                        help="Minimum seconds per microbenchmark")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write this run as the new baseline instead of comparing")
+    parser.add_argument("--output", help="Also write this run's results to a JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLDS["throughput"],
+                        help="Max %% drop in req/s (and rise in micro ns/op)")
+    parser.add_argument("--latency-threshold", type=float, default=DEFAULT_THRESHOLDS["latency"],
+                        help="Max %% rise in p50/p99 latency")
+    parser.add_argument("--alloc-threshold", type=float, default=DEFAULT_THRESHOLDS["alloc"],
+                        help="Max %% rise in allocated KiB per request")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    print("Aquilia in-process benchmark")
+    results = asyncio.run(run(args))
+
+    if results["failed"] and args.save_baseline:
+        print("Refusing to save a baseline with failed scenarios")
+        return 1
+    if args.output:
+        save_baseline(args.output, results)
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"Baseline written to {os.path.relpath(args.baseline)}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {os.path.relpath(args.baseline)}; run with --save-baseline")
+        return 0
+
+    regressions = compare(results, baseline, {
+        "throughput": args.threshold,
+        "latency": args.latency_threshold,
+        "alloc": args.alloc_threshold,
+    })
+    if not regressions:
+        print("No regressions against baseline")
+        return 0
+    print(f"{len(regressions)} regression(s) against baseline:")
+    for r in regressions:
+        print(
+            f"  {r['benchmark']:<24} {r['metric']:<10} {r['baseline']} → {r['current']} "
+            f"({r['change_pct']:+.1f}%, limit {r['threshold_pct']:.0f}%)"
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
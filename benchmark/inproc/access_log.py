@@ -0,0 +1,122 @@
+"""
+Access-log benchmark
+====================
+Before/after for the access-log pipeline: the core ``LoggingMiddleware``
+logging synchronously vs. recording into an ``AccessLogPipeline``, with
+requests offered at a fixed rate (default 20k req/s) and a log handler
+that costs ``--sink-us`` microseconds per line (a slow pipe or syslog).
+
+Reported per mode: achieved req/s, per-request middleware overhead
+(p50/p99) and worst event-loop lag, plus the pipeline's counters.
+
+    python -m benchmark.inproc.access_log --rate 20000 --seconds 3
+"""
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+
+from aquilia.middleware import LoggingMiddleware
+from aquilia.middleware_ext.access_log import (
+    AccessLogPipeline, LoggerSink, RequestLineFormatter,
+)
+
+
+class SlowHandler(logging.Handler):
+    """Discards lines after spinning for ``cost`` seconds each."""
+
+    def __init__(self, cost: float):
+        super().__init__()
+        self.cost = cost
+        self.lines = 0
+
+    def emit(self, record):
+        self.format(record)
+        end = time.perf_counter() + self.cost
+        while time.perf_counter() < end:
+            pass
+        self.lines += 1
+
+
+class _Request:
+    __slots__ = ("method", "path")
+
+    def __init__(self, i: int):
+        self.method = "GET"
+        self.path = f"/items/{i}"
+
+
+class _Response:
+    __slots__ = ("status",)
+
+    def __init__(self):
+        self.status = 200
+
+
+async def _handler(request, ctx):
+    return _Response()
+
+
+async def _drive(mw, rate: int, seconds: float) -> dict:
+    tick = 0.005
+    per_tick = max(1, int(rate * tick))
+    overhead = []
+    lag = 0.0
+    sent = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    next_tick = start
+    while time.perf_counter() < deadline:
+        now = time.perf_counter()
+        lag = max(lag, now - next_tick)
+        for _ in range(per_tick):
+            t0 = time.perf_counter()
+            await mw(_Request(sent), None, _handler)
+            overhead.append(time.perf_counter() - t0)
+            sent += 1
+        next_tick += tick
+        await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+    elapsed = time.perf_counter() - start
+    overhead.sort()
+    return {
+        "offered_rps": rate,
+        "achieved_rps": round(sent / elapsed),
+        "overhead_p50_us": round(statistics.median(overhead) * 1e6, 2),
+        "overhead_p99_us": round(overhead[int(len(overhead) * 0.99)] * 1e6, 2),
+        "max_loop_lag_ms": round(lag * 1000, 2),
+    }
+
+
+async def run(rate: int, seconds: float, sink_us: float) -> dict:
+    logger = logging.getLogger("aquilia.requests")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = SlowHandler(sink_us / 1e6)
+    logger.addHandler(handler)
+    try:
+        results = {"sync": await _drive(LoggingMiddleware(), rate, seconds)}
+
+        pipeline = AccessLogPipeline(RequestLineFormatter(), [LoggerSink(logger)])
+        results["pipeline"] = await _drive(LoggingMiddleware(pipeline=pipeline), rate, seconds)
+        await pipeline.aclose()
+        results["pipeline"]["counters"] = pipeline.stats()
+    finally:
+        logger.removeHandler(handler)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rate", type=int, default=20_000, help="Offered requests per second")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration per mode")
+    parser.add_argument("--sink-us", type=float, default=40.0,
+                        help="Simulated handler cost per line (microseconds)")
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args.rate, args.seconds, args.sink_us)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,216 @@
+"""
+In-process Benchmark Application
+================================
+The same 14 parity endpoints as ``benchmark/apps/aquilia_app`` but with
+no external services: the db-read / db-write scenarios run against an
+in-memory SQLite database through ``AquiliaDatabase`` instead of the
+PostgreSQL pool, so the harness can boot the whole app inside one
+process and drive ``ASGIAdapter.__call__`` directly.
+"""
+import asyncio
+import json
+import os
+import time
+
+from aquilia import Controller, GET, POST, Integration, RequestCtx, Response
+from aquilia.config import ConfigLoader
+from aquilia.db import AquiliaDatabase
+from aquilia.manifest import AppManifest
+from aquilia.response import CallableBackgroundTask, ServerSentEvent
+from aquilia.server import AquiliaServer
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "..", "static")
+SEED_ROWS = 1000
+
+LARGE_PAYLOAD = {
+    "data": [
+        {"id": i, "name": f"item-{i}", "value": "x" * 200, "tags": ["a", "b", "c"]}
+        for i in range(2000)
+    ]
+}
+
+TEMPLATE_HTML = """<!DOCTYPE html>
+<html>
+<head><title>Benchmark</title></head>
+<body>
+<h1>Hello, {{ name }}!</h1>
+<p>Items: {{ count }}</p>
+<ul>
+{% for item in items %}
+<li>{{ item.id }}: {{ item.name }}</li>
+{% endfor %}
+</ul>
+</body>
+</html>"""
+
+TEMPLATE_ITEMS = [{"id": i, "name": f"item-{i}"} for i in range(50)]
+
+_db = None
+_template = None
+
+
+async def get_db() -> AquiliaDatabase:
+    global _db
+    if _db is None:
+        db = AquiliaDatabase("sqlite:///:memory:")
+        await db.connect()
+        await db.execute(
+            "CREATE TABLE bench_users ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, email TEXT, bio TEXT)"
+        )
+        await db.execute_many(
+            "INSERT INTO bench_users (name, email, bio) VALUES (?, ?, ?)",
+            [(f"user-{i}", f"user{i}@bench.local", "A benchmark user") for i in range(SEED_ROWS)],
+        )
+        _db = db
+    return _db
+
+
+async def close_db() -> None:
+    global _db
+    if _db is not None:
+        await _db.disconnect()
+        _db = None
+
+
+class InProcBenchController(Controller):
+    prefix = ""
+    tags = ["benchmark"]
+
+    @GET("/ping")
+    async def ping(self, ctx: RequestCtx):
+        return Response.text("pong")
+
+    @GET("/json")
+    async def json_small(self, ctx: RequestCtx):
+        return Response.json({"hello": "world"})
+
+    @GET("/json-large")
+    async def json_large(self, ctx: RequestCtx):
+        return Response.json(LARGE_PAYLOAD)
+
+    @GET("/html")
+    async def html_template(self, ctx: RequestCtx):
+        global _template
+        if _template is None:
+            from jinja2 import Template
+            _template = Template(TEMPLATE_HTML)
+        return Response.html(_template.render(name="World", count=50, items=TEMPLATE_ITEMS))
+
+    @GET("/user/<id:int>")
+    async def path_param(self, ctx: RequestCtx, id: int):
+        return Response.json({"id": id, "name": f"user-{id}"})
+
+    @GET("/search")
+    async def query_params(self, ctx: RequestCtx):
+        qp = ctx.query_params
+        return Response.json({key: qp.get(key, "") for key in QUERY_KEYS})
+
+    @GET("/db/<id:int>")
+    async def db_read(self, ctx: RequestCtx, id: int):
+        db = await get_db()
+        row = await db.fetch_one(
+            "SELECT id, name, email, bio FROM bench_users WHERE id = ?", [id],
+        )
+        if row:
+            return Response.json(dict(row))
+        return Response.json({"error": "not found"}, status=404)
+
+    @POST("/db")
+    async def db_write(self, ctx: RequestCtx):
+        body = await ctx.request.json()
+        db = await get_db()
+        cursor = await db.execute(
+            "INSERT INTO bench_users (name, email, bio) VALUES (?, ?, ?)",
+            [body.get("name", "test"), body.get("email", "test@example.com"),
+             body.get("bio", "A benchmark user")],
+        )
+        return Response.json(
+            {"id": getattr(cursor, "lastrowid", None), **body}, status=201,
+        )
+
+    @POST("/upload")
+    async def upload(self, ctx: RequestCtx):
+        total_size = 0
+        form = await ctx.request.multipart()
+        for upload in form.files.values():
+            for f in upload if isinstance(upload, list) else [upload]:
+                total_size += getattr(f, "size", 0) or 0
+        return Response.json({"size": total_size, "status": "ok"})
+
+    @GET("/stream")
+    async def stream(self, ctx: RequestCtx):
+        async def generate():
+            chunk = b"x" * 10240
+            for _ in range(100):
+                yield chunk
+                await asyncio.sleep(0)
+        return Response.stream(generate(), media_type="application/octet-stream")
+
+    @GET("/sse")
+    async def sse(self, ctx: RequestCtx):
+        async def events():
+            for i in range(50):
+                yield ServerSentEvent(
+                    data=json.dumps({"seq": i, "ts": time.time()}),
+                    event="tick",
+                    id=str(i),
+                )
+                await asyncio.sleep(0)
+        return Response.sse(events())
+
+    @GET("/background")
+    async def background(self, ctx: RequestCtx):
+        async def bg_work():
+            await asyncio.sleep(0)
+
+        return Response(
+            b'{"status":"accepted"}',
+            media_type="application/json",
+            background=CallableBackgroundTask(bg_work),
+        )
+
+
+QUERY_KEYS = [
+    "q", "page", "limit", "sort", "order", "category", "min_price", "max_price",
+    "brand", "color", "size", "material", "rating", "in_stock", "free_shipping",
+    "new_arrival", "on_sale", "featured", "tag", "lang",
+]
+
+
+def build_manifest() -> AppManifest:
+    return AppManifest(
+        name="bench",
+        version="1.0.0",
+        description="Benchmark endpoints",
+        controllers=["benchmark.inproc.app:InProcBenchController"],
+        socket_controllers=["benchmark.apps.aquilia_app.ws_controller:BenchSocketController"],
+        route_prefix="",
+        tags=["benchmark"],
+    )
+
+
+def build_config() -> ConfigLoader:
+    loader = ConfigLoader()
+    loader.config_data = {
+        "debug": False,
+        "docs_enabled": False,
+        "integrations": {
+            "routing": Integration.routing(strict_matching=False, compression=False),
+            "static_files": Integration.static_files(
+                directories={"/static": os.path.abspath(STATIC_DIR)},
+                gzip=False, brotli=False,
+            ),
+            "mail": {"enabled": False},
+            "templates": {"enabled": False},
+        },
+    }
+    return loader
+
+
+async def create_server() -> AquiliaServer:
+    """Build and start the benchmark server; callers own ``shutdown()``."""
+    server = AquiliaServer(manifests=[build_manifest()], config=build_config())
+    await server.startup()
+    await get_db()
+    return server
@@ -0,0 +1,353 @@
+"""
+In-process ASGI Harness
+=======================
+Drives ``ASGIAdapter.__call__`` directly with synthetic ASGI scopes, so the
+numbers measure Aquilia alone — no sockets, HTTP parser or load generator
+in the loop.  Each of the 14 README scenarios is timed request by request
+(``perf_counter_ns``) and then replayed under ``tracemalloc`` to measure
+memory allocated per request.
+
+Metrics per scenario:
+
+- ``rps``         completed requests per second of wall time
+- ``p50_us``      median latency in microseconds
+- ``p99_us``      99th percentile latency in microseconds
+- ``alloc_kib``   mean tracemalloc peak per request (KiB allocated while
+                  the request was in flight, including freed temporaries)
+- ``retained_kib`` mean memory still live after a request returns — should
+                  stay near zero; steady growth here means a leak
+
+The websocket scenario counts one connect → 10 echoes → disconnect session
+as a request.
+"""
+import asyncio
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+UPLOAD_SIZE = 10 * 1024 * 1024
+UPLOAD_CHUNK = 64 * 1024
+WS_MESSAGES = 10
+BOUNDARY = "aquiliabenchboundary"
+
+# Metric name → (direction, threshold key).  ``higher`` means bigger is
+# better, so a drop beyond the threshold is a regression.
+METRICS = {
+    "rps": ("higher", "throughput"),
+    "p50_us": ("lower", "latency"),
+    "p99_us": ("lower", "latency"),
+    "alloc_kib": ("lower", "alloc"),
+}
+
+DEFAULT_THRESHOLDS = {"throughput": 10.0, "latency": 25.0, "alloc": 10.0}
+
+
+@dataclass
+class Scenario:
+    """One benchmarked request shape."""
+
+    name: str
+    path: str
+    method: str = "GET"
+    query: str = ""
+    headers: List[Tuple[bytes, bytes]] = field(default_factory=list)
+    body: bytes = b""
+    kind: str = "http"
+    expect_status: int = 200
+
+
+def _multipart_body(size: int) -> Tuple[bytes, bytes]:
+    """A single-file form whose total body is ``size`` bytes (the default
+    10 MiB is exactly ``Request.max_body_size``)."""
+    head = (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="bench.bin"\r\n'
+        f"Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{BOUNDARY}--\r\n".encode()
+    return head + b"\0" * (size - len(head) - len(tail)) + tail, f"multipart/form-data; boundary={BOUNDARY}".encode()
+
+
+def build_scenarios(upload_size: int = UPLOAD_SIZE) -> List[Scenario]:
+    upload, upload_type = _multipart_body(upload_size)
+    search = "&".join(
+        f"{k}=v{i}" for i, k in enumerate([
+            "q", "page", "limit", "sort", "order", "category", "min_price",
+            "max_price", "brand", "color", "size", "material", "rating",
+            "in_stock", "free_shipping", "new_arrival", "on_sale", "featured",
+            "tag", "lang",
+        ])
+    )
+    write_body = json.dumps(
+        {"name": "bench", "email": "bench@aquilia.local", "bio": "A benchmark user"}
+    ).encode()
+    return [
+        Scenario("ping", "/ping"),
+        Scenario("json", "/json"),
+        Scenario("json-large", "/json-large"),
+        Scenario("html", "/html"),
+        Scenario("path", "/user/42"),
+        Scenario("query", "/search", query=search),
+        Scenario("db-read", "/db/42"),
+        Scenario(
+            "db-write", "/db", method="POST", body=write_body, expect_status=201,
+            headers=[(b"content-type", b"application/json")],
+        ),
+        Scenario(
+            "upload", "/upload", method="POST", body=upload,
+            headers=[(b"content-type", upload_type)],
+        ),
+        Scenario("stream", "/stream"),
+        Scenario("sse", "/sse", headers=[(b"accept", b"text/event-stream")]),
+        Scenario("websocket", "/ws", kind="websocket"),
+        Scenario("static", "/static/bench.bin"),
+        Scenario("background", "/background"),
+    ]
+
+
+class HarnessError(RuntimeError):
+    """A scenario returned an unexpected response."""
+
+
+def _http_scope(s: Scenario) -> Dict[str, Any]:
+    headers = [(b"host", b"bench.local")] + list(s.headers)
+    if s.body:
+        headers.append((b"content-length", str(len(s.body)).encode()))
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": s.method,
+        "scheme": "http",
+        "path": s.path,
+        "raw_path": s.path.encode(),
+        "query_string": s.query.encode(),
+        "root_path": "",
+        "headers": headers,
+        "server": ("bench.local", 80),
+        "client": ("127.0.0.1", 50000),
+    }
+
+
+async def _call_http(app: Callable, s: Scenario) -> int:
+    scope = _http_scope(s)
+    body = s.body
+    chunks = [body[i:i + UPLOAD_CHUNK] for i in range(0, len(body), UPLOAD_CHUNK)] or [b""]
+    index = 0
+    status = 0
+    size = 0
+
+    async def receive():
+        nonlocal index
+        if index < len(chunks):
+            chunk = chunks[index]
+            index += 1
+            return {"type": "http.request", "body": chunk, "more_body": index < len(chunks)}
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status, size
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    if status != s.expect_status:
+        raise HarnessError(f"{s.name}: expected {s.expect_status}, got {status}")
+    return size
+
+
+async def _call_websocket(app: Callable, s: Scenario) -> int:
+    scope = {
+        "type": "websocket",
+        "asgi": {"version": "3.0"},
+        "scheme": "ws",
+        "path": s.path,
+        "raw_path": s.path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench.local")],
+        "server": ("bench.local", 80),
+        "client": ("127.0.0.1", 50000),
+        "subprotocols": [],
+    }
+    inbox: asyncio.Queue = asyncio.Queue()
+    replies = 0
+    inbox.put_nowait({"type": "websocket.connect"})
+
+    async def receive():
+        return await inbox.get()
+
+    async def send(message):
+        nonlocal replies
+        kind = message["type"]
+        if kind == "websocket.accept":
+            for seq in range(WS_MESSAGES):
+                inbox.put_nowait({
+                    "type": "websocket.receive",
+                    "text": json.dumps({"event": "echo", "data": {"seq": seq}}),
+                })
+        elif kind == "websocket.send":
+            replies += 1
+            if replies == WS_MESSAGES + 1:  # "connected" greeting + echoes
+                inbox.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+    await app(scope, receive, send)
+    if replies != WS_MESSAGES + 1:
+        raise HarnessError(f"{s.name}: expected {WS_MESSAGES + 1} messages, got {replies}")
+    return replies
+
+
+def _caller(s: Scenario) -> Callable:
+    return _call_websocket if s.kind == "websocket" else _call_http
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+async def measure(
+    app: Callable,
+    scenario: Scenario,
+    iterations: int = 1000,
+    warmup: int = 50,
+    concurrency: int = 1,
+    alloc_samples: int = 50,
+) -> Dict[str, float]:
+    """Time ``iterations`` requests, then sample allocations per request."""
+    call = _caller(scenario)
+    for _ in range(warmup):
+        await call(app, scenario)
+
+    latencies: List[int] = []
+    per_worker = max(1, iterations // concurrency)
+
+    async def worker():
+        for _ in range(per_worker):
+            t0 = time.perf_counter_ns()
+            await call(app, scenario)
+            latencies.append(time.perf_counter_ns() - t0)
+
+    gc.collect()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    peaks: List[int] = []
+    retained: List[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_samples):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            await call(app, scenario)
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(current - before)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_us": round(_percentile(latencies, 50) / 1000, 1),
+        "p99_us": round(_percentile(latencies, 99) / 1000, 1),
+        "mean_us": round(statistics.fmean(latencies) / 1000, 1),
+        "alloc_kib": round(statistics.fmean(peaks) / 1024, 2) if peaks else 0.0,
+        "retained_kib": round(statistics.fmean(retained) / 1024, 2) if retained else 0.0,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        from aquilia import __version__ as aquilia_version
+    except ImportError:
+        aquilia_version = "unknown"
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "aquilia": aquilia_version,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+# ─── Baselines ─────────────────────────────────────────────────────────────
+
+
+def save_baseline(path: str, results: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _change_pct(current: float, baseline: float) -> float:
+    if not baseline:
+        return 0.0
+    return (current - baseline) / baseline * 100.0
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    thresholds: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Compare a run against a baseline.
+
+    Returns one entry per metric that moved in the wrong direction by more
+    than its threshold (percent).  Scenarios or microbenchmarks missing from
+    either side are ignored so baselines survive adding new ones.
+    """
+    limits = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    regressions = []
+
+    for name, metrics in current.get("scenarios", {}).items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for metric, (direction, key) in METRICS.items():
+            if metric not in metrics or metric not in base:
+                continue
+            change = _change_pct(metrics[metric], base[metric])
+            worse = -change if direction == "higher" else change
+            if worse > limits[key]:
+                regressions.append({
+                    "benchmark": name, "metric": metric,
+                    "baseline": base[metric], "current": metrics[metric],
+                    "change_pct": round(change, 1), "threshold_pct": limits[key],
+                })
+
+    for name, metrics in current.get("micro", {}).items():
+        base = baseline.get("micro", {}).get(name)
+        if not base:
+            continue
+        change = _change_pct(metrics["ns_per_op"], base["ns_per_op"])
+        if change > limits["throughput"]:
+            regressions.append({
+                "benchmark": f"micro:{name}", "metric": "ns_per_op",
+                "baseline": base["ns_per_op"], "current": metrics["ns_per_op"],
+                "change_pct": round(change, 1), "threshold_pct": limits["throughput"],
+            })
+    return regressions
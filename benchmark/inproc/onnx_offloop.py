@@ -0,0 +1,151 @@
+"""
+ONNX off-loop benchmark
+=======================
+Measures latency of a trivial non-ML route while the model is saturated
+by concurrent inference callers.  Compares:
+
+- ``inline``   ``session.run`` called in the coroutine (previous
+               behaviour: every batch freezes the event loop)
+- ``offloop``  ``ONNXRuntimeAdapter`` running batches on its session pool
+
+The "route" is a coroutine scheduled at a fixed rate (default every
+2 ms); its latency is scheduled-time → completion, so it includes any
+time the loop was blocked.  Without ``--model`` the session is simulated
+with a GIL-releasing sleep of ``--compute-ms`` (as ORT does); with
+``--model`` a real ``onnxruntime`` session is used and fed random inputs.
+
+    python -m benchmark.inproc.onnx_offloop --seconds 3 --callers 8
+    python -m benchmark.inproc.onnx_offloop --model model.onnx --pool-size 2
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import numpy as np
+
+from aquilia.mlops._types import BatchRequest, InferenceRequest
+from aquilia.mlops.runtime.onnx_runtime import ONNXRuntimeAdapter
+
+
+class _Meta:
+    def __init__(self, name, type_, shape):
+        self.name = name
+        self.type = type_
+        self.shape = shape
+
+
+class SimulatedSession:
+    """Stands in for ``InferenceSession``; ``run`` releases the GIL."""
+
+    def __init__(self, compute_s: float):
+        self.compute_s = compute_s
+
+    def get_inputs(self):
+        return [_Meta("x", "tensor(float)", [1, 16])]
+
+    def get_outputs(self):
+        return [_Meta("y", "tensor(float)", [1, 16])]
+
+    def run(self, output_names, feed):
+        time.sleep(self.compute_s)
+        return [feed["x"]]
+
+
+def _sessions(args):
+    if not args.model:
+        return [SimulatedSession(args.compute_ms / 1000) for _ in range(args.pool_size)]
+    import onnxruntime as ort
+    return [ort.InferenceSession(args.model) for _ in range(args.pool_size)]
+
+
+def _batch(session, size: int) -> BatchRequest:
+    inputs = {}
+    for meta in session.get_inputs():
+        shape = [d if isinstance(d, int) else 1 for d in meta.shape]
+        inputs[meta.name] = np.random.rand(*shape).astype(np.float32)
+    return BatchRequest(requests=[
+        InferenceRequest(request_id=str(i), inputs=inputs) for i in range(size)
+    ])
+
+
+async def _route():
+    # A non-ML handler: a little Python work, no I/O
+    return {"status": "ok", "n": sum(range(50))}
+
+
+async def _drive(infer, batch: BatchRequest, seconds: float, callers: int, interval: float) -> dict:
+    stop = time.perf_counter() + seconds
+    batches = 0
+
+    async def caller():
+        nonlocal batches
+        while time.perf_counter() < stop:
+            await infer(batch)
+            batches += 1
+
+    async def probe():
+        latencies = []
+        next_at = time.perf_counter()
+        while next_at < stop:
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+            await _route()
+            latencies.append(time.perf_counter() - next_at)
+            next_at += interval
+        return latencies
+
+    tasks = [asyncio.create_task(caller()) for _ in range(callers)]
+    latencies = await probe()
+    await asyncio.gather(*tasks)
+    latencies.sort()
+    return {
+        "route_p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "route_p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 3),
+        "route_max_ms": round(latencies[-1] * 1000, 3),
+        "batches_per_s": round(batches / seconds, 1),
+    }
+
+
+async def run(args) -> dict:
+    sessions = _sessions(args)
+    batch = _batch(sessions[0], args.batch_size)
+    interval = args.probe_ms / 1000
+
+    idle = await _drive(None, batch, min(args.seconds, 1.0), 0, interval)
+
+    inline_session = sessions[0]
+    output_names = [o.name for o in inline_session.get_outputs()]
+
+    async def inline(b):
+        for req in b.requests:
+            inline_session.run(output_names, req.inputs)
+
+    results = {"idle": idle, "inline": await _drive(inline, batch, args.seconds, args.callers, interval)}
+
+    adapter = ONNXRuntimeAdapter(pool_size=args.pool_size)
+    adapter._init_pool(sessions)
+    results["offloop"] = await _drive(adapter.infer, batch, args.seconds, args.callers, interval)
+    metrics = await adapter.metrics()
+    results["offloop"]["avg_queue_wait_ms"] = round(metrics["avg_queue_wait_ms"], 3)
+    results["offloop"]["avg_compute_ms"] = round(metrics["avg_compute_ms"], 3)
+    await adapter.unload()
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--model", help="Path to a real .onnx model (default: simulated)")
+    parser.add_argument("--compute-ms", type=float, default=30.0, help="Simulated inference time")
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--callers", type=int, default=8, help="Concurrent inference callers")
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--probe-ms", type=float, default=2.0, help="Route request interval")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration per mode")
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+"""
+Socket fan-out benchmark
+========================
+Broadcasts to N simulated connections (default 10k) through the
+InMemoryAdapter, a fraction of which are slow readers (each send takes
+``--slow-ms``).  Compares:
+
+- ``awaited``  send callbacks awaited per member via gather (previous
+               behaviour: the broadcast completes only when the slowest
+               socket has been written)
+- ``queued``   ``Connection.enqueue`` onto per-connection outbound
+               queues drained by writer tasks
+
+Reported: time for ``broadcast()`` to return, time until every fast
+connection received every message, and queue-depth/drop metrics.
+
+    python -m benchmark.inproc.sockets_fanout --connections 10000 --messages 20
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from aquilia.sockets.adapters.inmemory import InMemoryAdapter
+from aquilia.sockets.connection import Connection, ConnectionScope
+from aquilia.sockets.envelope import MessageEnvelope, MessageType
+
+NS = "/bench"
+
+
+class Client:
+    __slots__ = ("received", "delay")
+
+    def __init__(self, delay: float):
+        self.received = 0
+        self.delay = delay
+
+    async def send(self, data: bytes):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received += 1
+
+
+async def _setup(n: int, slow_every: int, slow_s: float, queued: bool, queue_size: int):
+    adapter = InMemoryAdapter()
+    await adapter.initialize()
+    scope = ConnectionScope(namespace=NS, path=NS, path_params={}, query_params={}, headers={})
+    clients, conns = [], []
+    for i in range(n):
+        client = Client(slow_s if slow_every and i % slow_every == 0 else 0.0)
+        cid = f"c{i}"
+        await adapter.register_connection(NS, cid, "bench")
+        if queued:
+            conn = Connection(cid, NS, scope, None, adapter, client.send, queue_size=queue_size)
+            adapter.register_send_callback(NS, cid, conn.enqueue)
+            conns.append(conn)
+        else:
+            adapter.register_send_callback(NS, cid, client.send)
+        clients.append(client)
+    return adapter, clients, conns
+
+
+async def run_mode(queued: bool, n: int, messages: int, slow_every: int, slow_s: float,
+                   queue_size: int) -> dict:
+    adapter, clients, conns = await _setup(n, slow_every, slow_s, queued, queue_size)
+    fast = [c for c in clients if not c.delay]
+    envelope = MessageEnvelope(type=MessageType.EVENT, event="tick", payload={"v": 1})
+
+    start = time.perf_counter()
+    broadcast_s = 0.0
+    for _ in range(messages):
+        t0 = time.perf_counter()
+        await adapter.broadcast(NS, envelope)
+        broadcast_s += time.perf_counter() - t0
+    while any(c.received < messages for c in fast):
+        await asyncio.sleep(0.001)
+    fast_done = time.perf_counter() - start
+
+    result = {
+        "broadcast_avg_ms": round(broadcast_s / messages * 1000, 2),
+        "fast_clients_done_ms": round(fast_done * 1000, 1),
+    }
+    if conns:
+        result["max_queue_depth"] = max(c.outbound.max_depth for c in conns)
+        result["dropped"] = sum(c.outbound.dropped for c in conns)
+        for conn in conns:
+            conn.outbound.close()
+    await adapter.shutdown()
+    return result
+
+
+async def run(args) -> dict:
+    slow_s = args.slow_ms / 1000
+    common = (args.connections, args.messages, args.slow_every, slow_s, args.queue_size)
+    return {
+        "connections": args.connections,
+        "messages": args.messages,
+        "awaited": await run_mode(False, *common),
+        "queued": await run_mode(True, *common),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--connections", type=int, default=10_000)
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--slow-every", type=int, default=100,
+                        help="Every Nth connection is a slow reader (0 = none)")
+    parser.add_argument("--slow-ms", type=float, default=50.0,
+                        help="Per-send delay of slow readers")
+    parser.add_argument("--queue-size", type=int, default=256)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+"""
+Template fragment cache benchmark
+=================================
+Renders a page of ``--cards`` product cards, each a partial with a
+loop over its attributes and a few filters, and reports per-page render
+time for:
+
+- ``uncached``     every card rendered on every request
+- ``cached``       cards wrapped in ``{% cache p.id, tags=[...] %}`` and warm
+- ``one_evicted``  warm cache with one card's tag invalidated per request
+                   (a ``post_save`` on one product between page views)
+
+    python -m benchmark.inproc.template_fragments --cards 50 --requests 500
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from jinja2 import DictLoader
+
+from aquilia.cache import CacheService
+from aquilia.cache.backends.memory import MemoryBackend
+from aquilia.templates import FragmentCache, TemplateEngine
+
+CARD = """
+<article class="card" id="p-{{ p.id }}">
+  <h3>{{ p.name | title }}</h3>
+  <p>{{ p.description | truncate(80) }}</p>
+  <dl>{% for k, v in p.attrs | dictsort %}<dt>{{ k }}</dt><dd>{{ v }}</dd>{% endfor %}</dl>
+  <span>{{ "%.2f" | format(p.price) }} USD</span>
+</article>
+"""
+
+TEMPLATES = {
+    "card.html": CARD,
+    "uncached.html": "{% for p in products %}{% include 'card.html' %}{% endfor %}",
+    "cached.html": (
+        "{% for p in products %}"
+        "{% cache p.id, 300, tags=['model:Product:' ~ p.id], name='card' %}"
+        "{% include 'card.html' %}"
+        "{% endcache %}"
+        "{% endfor %}"
+    ),
+}
+
+
+def _products(n: int) -> list:
+    return [
+        {
+            "id": i,
+            "name": f"product number {i}",
+            "description": "A long description of the product. " * 6,
+            "attrs": {f"attr{j}": f"value {i}-{j}" for j in range(8)},
+            "price": i * 1.25,
+        }
+        for i in range(n)
+    ]
+
+
+async def _time(engine, template, products, requests, before=None) -> dict:
+    samples = []
+    for i in range(requests):
+        if before is not None:
+            await before(i)
+        start = time.perf_counter()
+        await engine.render(template, {"products": products})
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+        "p99_ms": round(samples[int(len(samples) * 0.99)] * 1000, 3),
+    }
+
+
+async def run(args) -> dict:
+    service = CacheService(MemoryBackend(max_size=10_000))
+    await service.initialize()
+    engine = TemplateEngine(DictLoader(TEMPLATES), fragment_cache=FragmentCache(service))
+    products = _products(args.cards)
+
+    uncached = await engine.render("uncached.html", {"products": products})
+    cached = await engine.render("cached.html", {"products": products})
+    assert uncached == cached
+
+    async def evict_one(i):
+        await engine.fragments.invalidate(f"model:Product:{i % args.cards}")
+
+    results = {"cards": args.cards, "requests": args.requests}
+    results["uncached"] = await _time(engine, "uncached.html", products, args.requests)
+    engine.fragments.reset_stats()
+    results["cached"] = await _time(engine, "cached.html", products, args.requests)
+    results["one_evicted"] = await _time(engine, "cached.html", products, args.requests, evict_one)
+    results["fragment_stats"] = engine.fragments.stats()
+    results["speedup"] = round(results["uncached"]["mean_ms"] / results["cached"]["mean_ms"], 2)
+    await service.shutdown()
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--cards", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""
+Template streaming benchmark
+============================
+Streams a large page (``--rows`` table rows) through
+``Response.send_asgi`` into an in-process ASGI ``send`` and reports, per
+buffer size, the number of ``http.response.body`` messages, total time
+and time to the first body byte.  ``--send-us`` adds a per-message cost
+standing in for the server's write path.
+
+``buffer_size=0`` is the previous behaviour (one message per template
+node); the page has a ``{% flush %}`` after ``</head>``, so buffered
+modes still send the head first.
+
+    python -m benchmark.inproc.template_streaming --rows 5000
+    python -m benchmark.inproc.template_streaming --buffers 0,4096,16384,65536 --send-us 5
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from jinja2 import DictLoader
+
+from aquilia.templates import TemplateEngine
+
+PAGE = """<!doctype html>
+<html><head><title>{{ title }}</title><link rel="stylesheet" href="/app.css"></head>
+{% flush %}
+<body><table>
+{% for r in rows %}<tr class="{{ loop.cycle('odd', 'even') }}"><td>{{ r.id }}</td><td>{{ r.name }}</td><td>{{ r.email }}</td><td>{{ "%.2f" | format(r.total) }}</td></tr>
+{% endfor %}</table></body></html>
+"""
+
+
+async def _run_once(engine, ctx, buffer_size, send_cost) -> dict:
+    messages = 0
+    first_body = None
+    start = time.perf_counter()
+
+    async def send(message):
+        nonlocal messages, first_body
+        if message["type"] == "http.response.body":
+            messages += 1
+            if first_body is None and message["body"]:
+                first_body = time.perf_counter() - start
+            if send_cost:
+                deadline = time.perf_counter() + send_cost
+                while time.perf_counter() < deadline:
+                    pass
+
+    response = engine.template_stream_response("page.html", ctx, buffer_size=buffer_size)
+    await response.send_asgi(send)
+    return {
+        "total": time.perf_counter() - start,
+        "first_body": first_body,
+        "messages": messages,
+    }
+
+
+async def run(args) -> dict:
+    engine = TemplateEngine(DictLoader({"page.html": PAGE}))
+    ctx = {
+        "title": "Orders",
+        "rows": [
+            {"id": i, "name": f"Customer {i}", "email": f"c{i}@example.com", "total": i * 3.5}
+            for i in range(args.rows)
+        ],
+    }
+    results = {"rows": args.rows, "send_us": args.send_us}
+    for buffer_size in (int(b) for b in args.buffers.split(",")):
+        runs = [
+            await _run_once(engine, ctx, buffer_size, args.send_us / 1e6)
+            for _ in range(args.repeat)
+        ]
+        results[f"buffer_{buffer_size}"] = {
+            "messages": runs[0]["messages"],
+            "total_ms": round(statistics.median(r["total"] for r in runs) * 1000, 3),
+            "first_byte_ms": round(statistics.median(r["first_body"] for r in runs) * 1000, 3),
+        }
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--buffers", default="0,4096,16384,65536", help="Comma-separated buffer sizes")
+    parser.add_argument("--send-us", type=float, default=2.0, help="Simulated cost per ASGI message")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+"""
+Access-log pipeline: batched off-loop writes, drop counting when the
+ring is full, sampling that always keeps errors, and record formatting.
+"""
+import asyncio
+import json
+import logging
+
+from aquilia.middleware import LoggingMiddleware
+from aquilia.middleware_ext import (
+    AccessLogPipeline,
+    AccessLogSink,
+    AccessRecord,
+    CombinedLogFormatter,
+    RequestLineFormatter,
+    StructuredLogFormatter,
+)
+
+
+class ListSink(AccessLogSink):
+    def __init__(self):
+        self.batches = []
+
+    def write(self, lines):
+        self.batches.append(list(lines))
+
+
+def _record(i, status=200, **kw):
+    return AccessRecord("GET", f"/r/{i}", status, 1.5, **kw)
+
+
+class TestAccessLogPipeline:
+    async def test_batches_flush_off_loop(self):
+        sink = ListSink()
+        pipeline = AccessLogPipeline(RequestLineFormatter(), [sink], batch_size=10, flush_interval=0.01)
+        for i in range(25):
+            pipeline.record(_record(i, 500 if i == 3 else 200, level=logging.ERROR if i == 3 else logging.INFO))
+        await asyncio.sleep(0.1)
+
+        lines = [line for batch in sink.batches for line in batch]
+        assert len(lines) == 25 and all(len(b) <= 10 for b in sink.batches)
+        assert lines[0] == (logging.INFO, "GET /r/0 - 200 (1.5ms)")
+        assert lines[3][0] == logging.ERROR
+        await pipeline.aclose()
+        assert pipeline.stats()["written"] == 25
+
+    async def test_full_ring_drops_and_sampling_keeps_errors(self):
+        sink = ListSink()
+        pipeline = AccessLogPipeline(RequestLineFormatter(), [sink], capacity=4)
+        for i in range(6):
+            pipeline.record(_record(i))
+        assert pipeline.stats()["dropped"] == 2
+        await pipeline.aclose()
+        assert sum(len(b) for b in sink.batches) == 4
+
+        sampled = AccessLogPipeline(RequestLineFormatter(), [ListSink()], sample_rate=0.0)
+        sampled.record(_record(0))
+        sampled.record(_record(1, 503))
+        sampled.record(_record(2, slow=True))
+        assert sampled.stats()["sampled_out"] == 1 and sampled.stats()["recorded"] == 2
+        await sampled.aclose()
+
+    async def test_core_middleware_records_into_pipeline(self):
+        sink = ListSink()
+        pipeline = AccessLogPipeline(RequestLineFormatter(), [sink])
+        mw = LoggingMiddleware(pipeline=pipeline)
+        mw.logger.setLevel(logging.INFO)
+
+        class Req:
+            method, path = "POST", "/things"
+
+        class Resp:
+            status = 201
+
+        async def handler(request, ctx):
+            return Resp()
+
+        try:
+            await mw(Req(), None, handler)
+            await pipeline.aclose()
+        finally:
+            mw.logger.setLevel(logging.NOTSET)
+        assert sink.batches[0][0][1].startswith("POST /things - 201 (")
+
+    def test_formatters_use_record_timestamp(self):
+        record = _record(7, 404, request_id="abc", slow=True)
+        record.timestamp = 0.0
+        data = json.loads(StructuredLogFormatter().format_record(record)[len("SLOW "):])
+        assert data["timestamp"].startswith("1970-01-01T00:00:00")
+        assert data["status"] == 404 and data["request_id"] == "abc"
+        assert "[01/Jan/1970:00:00:00 +0000]" in CombinedLogFormatter().format_record(record)
@@ -0,0 +1,89 @@
+"""
+Precompiled RBAC closures, decision caches and pure ABAC memoization.
+"""
+from aquilia.auth.authz import (
+    ABACEngine,
+    AuthzContext,
+    AuthzResult,
+    Decision,
+    RBACEngine,
+    ScopeChecker,
+)
+from aquilia.auth.core import Identity, IdentityStatus, IdentityType
+
+
+def _ctx(**attributes):
+    identity = Identity(id="u1", type=IdentityType.USER, attributes={})
+    return AuthzContext(identity=identity, resource="doc:1", action="read", attributes=attributes)
+
+
+class TestRBACClosure:
+    def test_closure_tracks_hierarchy_changes(self):
+        rbac = RBACEngine()
+        rbac.define_role("admin", ["users:delete"], inherits=["editor"])
+        assert not rbac.check_permission(["admin"], "docs:write")
+
+        # Parent defined after the child: closure and role-set cache refresh
+        rbac.define_role("editor", ["docs:write"])
+        assert rbac.check_permission(["admin"], "docs:write")
+
+        rbac.define_role("viewer", ["docs:read"])
+        rbac.add_inheritance("editor", "viewer")
+        assert rbac.check_permission(["guest", "admin"], "docs:read")
+        assert rbac.get_permissions("admin") == {"users:delete", "docs:write", "docs:read"}
+        assert not rbac.check_permission(["viewer"], "unknown")
+
+    def test_cycles_terminate(self):
+        rbac = RBACEngine()
+        rbac.define_role("a", ["p:a"], inherits=["b"])
+        rbac.define_role("b", ["p:b"], inherits=["a"])
+        assert rbac.get_permissions("a") == {"p:a", "p:b"}
+
+
+class TestDecisionCaches:
+    def test_scope_decisions(self):
+        assert ScopeChecker.check_scopes(["read", "write"], ["read"])
+        assert not ScopeChecker.check_scopes(["read"], ["read", "write"])
+        assert ScopeChecker.check_scopes(["read", "write"], ["read"])
+
+    def test_pure_policy_memoized_until_ttl(self):
+        calls = []
+
+        def policy(ctx):
+            calls.append(ctx.attributes)
+            return AuthzResult(decision=Decision.ALLOW)
+
+        abac = ABACEngine()
+        abac.register_policy("owner", policy, pure=True, ttl=60)
+        abac.register_policy("impure", policy)
+
+        for _ in range(3):
+            assert abac.evaluate(_ctx(owner_id="u1"), "owner").decision is Decision.ALLOW
+        abac.evaluate(_ctx(owner_id="u2"), "owner")
+        abac.evaluate(_ctx(tags=["x"]), "owner")
+        abac.evaluate(_ctx(tags=["x"]), "owner")  # lists are frozen into the key
+        abac.evaluate(_ctx(owner_id="u1"), "impure")
+        abac.evaluate(_ctx(owner_id="u1"), "impure")
+        assert len(calls) == 5
+
+        abac.register_policy("short", policy, pure=True, ttl=0)
+        abac.evaluate(_ctx(), "short")
+        abac.evaluate(_ctx(), "short")
+        assert len(calls) == 7
+
+    def test_identity_status_and_attributes_are_part_of_the_key(self):
+        def active(ctx):
+            allowed = ctx.identity.is_active() and "editor" in ctx.identity.attributes["roles"]
+            return AuthzResult(decision=Decision.ALLOW if allowed else Decision.DENY)
+
+        def ctx_for(status=IdentityStatus.ACTIVE, roles=("editor",)):
+            identity = Identity(
+                id="u1", type=IdentityType.USER, attributes={"roles": list(roles)}, status=status,
+            )
+            return AuthzContext(identity=identity, resource="doc:1", action="read")
+
+        abac = ABACEngine()
+        abac.register_policy("active", active, pure=True, ttl=60)
+        assert abac.evaluate(ctx_for(), "active").decision is Decision.ALLOW
+        assert abac.evaluate(ctx_for(IdentityStatus.SUSPENDED), "active").decision is Decision.DENY
+        assert abac.evaluate(ctx_for(roles=["viewer"]), "active").decision is Decision.DENY
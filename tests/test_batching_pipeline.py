@@ -0,0 +1,58 @@
+"""
+DynamicBatcher pipelining: batches execute concurrently up to
+``max_in_flight`` and requests pile up into larger batches while every
+slot is busy.
+"""
+import asyncio
+
+from aquilia.mlops._types import InferenceRequest, InferenceResult
+from aquilia.mlops.serving.batching import DynamicBatcher
+
+
+class SlowModel:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.sizes = []
+
+    async def __call__(self, batch):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.sizes.append(batch.size)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return [InferenceResult(request_id=r.request_id, outputs={"id": r.request_id}) for r in batch.requests]
+
+
+def _requests(n):
+    return [InferenceRequest(request_id=str(i), inputs={}) for i in range(n)]
+
+
+class TestBatchingPipeline:
+    async def test_batches_overlap_up_to_max_in_flight(self):
+        model = SlowModel()
+        batcher = DynamicBatcher(model, max_batch_size=4, max_latency_ms=5, max_in_flight=2)
+        await batcher.start()
+        results = await asyncio.gather(*(batcher.submit(r) for r in _requests(16)))
+        await batcher.stop()
+
+        assert [r.outputs["id"] for r in results] == [str(i) for i in range(16)]
+        assert model.peak == 2
+        assert batcher.metrics()["backpressure_waits"] >= 1
+
+    async def test_fills_batch_without_waiting_for_deadline(self):
+        model = SlowModel(delay=0)
+        batcher = DynamicBatcher(model, max_batch_size=8, max_latency_ms=10_000, max_in_flight=1)
+        await batcher.start()
+        await asyncio.wait_for(asyncio.gather(*(batcher.submit(r) for r in _requests(8))), 1)
+        await batcher.stop()
+        assert model.sizes == [8]
+
+    async def test_stop_fails_partial_batch(self):
+        batcher = DynamicBatcher(SlowModel(), max_batch_size=8, max_latency_ms=10_000)
+        await batcher.start()
+        pending = asyncio.ensure_future(batcher.submit(_requests(1)[0]))
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+        assert isinstance(pending.exception(), RuntimeError)
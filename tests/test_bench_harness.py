@@ -0,0 +1,48 @@
+"""
+In-process benchmark harness: scenarios drive the ASGI app directly and
+baseline comparison flags regressions past the configured thresholds.
+"""
+from benchmark.inproc.harness import build_scenarios, compare, measure
+
+
+def _run(rps, p99, alloc, build_ns):
+    return {
+        "scenarios": {"ping": {"rps": rps, "p50_us": 20.0, "p99_us": p99, "alloc_kib": alloc}},
+        "micro": {"orm.build_select": {"ops": 1000, "ns_per_op": build_ns}},
+    }
+
+
+class TestCompare:
+    def test_within_thresholds_passes(self):
+        base = _run(40000, 40.0, 8.0, 25000)
+        assert compare(_run(37000, 48.0, 8.5, 26000), base) == []
+
+    def test_regressions_are_reported_per_metric(self):
+        base = _run(40000, 40.0, 8.0, 25000)
+        found = compare(_run(30000, 60.0, 10.0, 30000), base, {"latency": 60.0})
+        assert {(r["benchmark"], r["metric"]) for r in found} == {
+            ("ping", "rps"), ("ping", "alloc_kib"), ("micro:orm.build_select", "ns_per_op"),
+        }
+        rps = next(r for r in found if r["metric"] == "rps")
+        assert rps["change_pct"] == -25.0
+
+    def test_unknown_benchmarks_are_ignored(self):
+        assert compare(_run(1, 1e6, 1e6, 1e9), {"scenarios": {}, "micro": {}}) == []
+
+
+class TestScenarios:
+    def test_covers_readme_scenarios(self):
+        names = [s.name for s in build_scenarios(upload_size=1024)]
+        assert len(names) == 14
+        assert {"db-read", "upload", "websocket", "static"} <= set(names)
+
+    async def test_measure_against_plain_asgi_app(self):
+        async def app(scope, receive, send):
+            await receive()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"pong"})
+
+        ping = build_scenarios(upload_size=1024)[0]
+        metrics = await measure(app, ping, iterations=20, warmup=2, alloc_samples=5)
+        assert metrics["requests"] == 20
+        assert metrics["rps"] > 0 and metrics["p99_us"] >= metrics["p50_us"]
@@ -0,0 +1,99 @@
+"""
+Database routing: replica load balancing, read-your-writes stickiness,
+replica ejection and pluggable routers, against SQLite files.
+"""
+import pytest
+
+from aquilia.db.engine import AquiliaDatabase
+from aquilia.db.routing import ConnectionRouter, DatabaseRouter, set_router
+from aquilia.models import Model
+from aquilia.models.fields_module import AutoField, CharField
+from aquilia.models.transactions import atomic
+
+
+class RoutedItem(Model):
+    table = "routed_items"
+    id = AutoField(primary_key=True)
+    name = CharField(max_length=20)
+
+
+async def _open(path, name):
+    db = AquiliaDatabase(f"sqlite:///{path}")
+    await db.connect()
+    await db.execute(RoutedItem.generate_create_table_sql())
+    await db.execute('INSERT INTO "routed_items" ("name") VALUES (?)', [name])
+    return db
+
+
+async def _source():
+    rows = await RoutedItem.objects.order("id").all()
+    return rows[0].name
+
+
+@pytest.fixture
+async def dbs(tmp_path):
+    databases = {
+        name: await _open(tmp_path / f"{name}.db", name)
+        for name in ("primary", "replica1", "replica2", "analytics")
+    }
+    databases["default"] = databases["primary"]
+    RoutedItem._db = databases["primary"]
+    yield databases
+    set_router(None)
+    RoutedItem._db = None
+    for name in ("primary", "replica1", "replica2", "analytics"):
+        await databases[name].disconnect()
+
+
+class TestReplicaRouting:
+    async def test_reads_balance_across_replicas_writes_hit_primary(self, dbs):
+        set_router(ConnectionRouter(
+            replicas={"default": {"replica1": 3, "replica2": 1}}, databases=dbs,
+        ))
+        seen = [await _source() for _ in range(200)]
+        assert set(seen) == {"replica1", "replica2"}
+        assert seen.count("replica1") > seen.count("replica2")
+
+        await RoutedItem.create(name="written")
+        assert await dbs["primary"].fetch_val('SELECT COUNT(*) FROM "routed_items"') == 2
+        assert await dbs["replica1"].fetch_val('SELECT COUNT(*) FROM "routed_items"') == 1
+
+    async def test_read_your_writes(self, dbs):
+        set_router(ConnectionRouter(replicas={"default": ["replica1"]}, sticky_ms=60_000, databases=dbs))
+        assert await _source() == "replica1"
+        await RoutedItem.create(name="written")
+        assert await _source() == "primary"
+
+    async def test_atomic_pins_reads_to_primary(self, dbs):
+        set_router(ConnectionRouter(replicas={"default": ["replica1"]}, databases=dbs))
+        async with atomic(db=dbs["primary"]):
+            assert await _source() == "primary"
+        assert await _source() == "replica1"
+
+    async def test_failed_replica_is_ejected(self, dbs, tmp_path):
+        broken = AquiliaDatabase(f"sqlite:///{tmp_path}/missing/dir.db", connect_retries=1)
+        router = ConnectionRouter(
+            replicas={"default": ["broken"]}, databases={**dbs, "broken": broken},
+        )
+        set_router(router)
+        assert await _source() == "primary"
+        assert not router.is_healthy("broken")
+        assert await _source() == "primary"
+
+
+class AnalyticsRouter(DatabaseRouter):
+    def db_for_read(self, model, **hints):
+        return "analytics" if model is RoutedItem else None
+
+    db_for_write = db_for_read
+
+
+class TestPluggableRouters:
+    async def test_router_and_using(self, dbs):
+        set_router(ConnectionRouter([AnalyticsRouter], databases=dbs))
+        assert await _source() == "analytics"
+        await RoutedItem.create(name="event")
+        assert await dbs["analytics"].fetch_val('SELECT COUNT(*) FROM "routed_items"') == 2
+
+        rows = await RoutedItem.objects.using("replica2").all()
+        assert [r.name for r in rows] == ["replica2"]
@@ -0,0 +1,78 @@
+"""
+DI container under concurrent startup traffic: cacheable providers are
+built once, independent dependencies resolve concurrently, and
+``prewarm()`` instantiates singletons in topological waves.
+"""
+import asyncio
+import time
+
+from aquilia.di import Container
+from aquilia.di.providers import ClassProvider, FactoryProvider
+
+BUILT = []
+
+
+class Pool:
+    async def async_init(self):
+        BUILT.append("pool")
+        await asyncio.sleep(0.02)
+
+
+async def make_client() -> "Client":
+    await asyncio.sleep(0.05)
+    return Client()
+
+
+async def make_cache() -> "Cache":
+    await asyncio.sleep(0.05)
+    return Cache()
+
+
+class Client:
+    pass
+
+
+class Cache:
+    pass
+
+
+class Service:
+    def __init__(self, client: Client, cache: Cache, pool: Pool):
+        self.client = client
+        self.cache = cache
+        self.pool = pool
+
+
+def _container():
+    container = Container()
+    container.register(ClassProvider(Pool, scope="singleton"))
+    container.register(FactoryProvider(make_client, scope="singleton", name=f"{__name__}.Client"))
+    container.register(FactoryProvider(make_cache, scope="singleton", name=f"{__name__}.Cache"))
+    container.register(ClassProvider(Service, scope="singleton"))
+    return container
+
+
+class TestSingleFlight:
+    async def test_concurrent_resolves_build_once(self):
+        BUILT.clear()
+        container = _container()
+        pools = await asyncio.gather(*(container.resolve_async(Pool) for _ in range(200)))
+        assert BUILT == ["pool"]
+        assert all(p is pools[0] for p in pools)
+        assert container._inflight == {}
+
+    async def test_independent_dependencies_resolve_concurrently(self):
+        container = _container()
+        start = time.perf_counter()
+        service = await container.resolve_async(Service)
+        assert time.perf_counter() - start < 0.09  # two 50ms factories overlap
+        assert isinstance(service.client, Client) and isinstance(service.cache, Cache)
+
+    async def test_prewarm_waves(self):
+        container = _container()
+        waves = await container.prewarm()
+        assert set(waves[0]) == {
+            f"{__name__}.Pool", f"{__name__}.Client", f"{__name__}.Cache",
+        }
+        assert waves[1] == [f"{__name__}.Service"]
+        assert container._cached_instance(Service) is not None
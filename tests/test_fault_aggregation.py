@@ -0,0 +1,80 @@
+"""
+FaultEngine emission under error storms: per-fingerprint aggregation
+windows, per-domain listener sampling and queued listener dispatch.
+"""
+import asyncio
+import logging
+
+from aquilia.faults import engine as fault_engine
+from aquilia.faults.engine import FaultEngine
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _engine(**kwargs):
+    logger = logging.getLogger("test.faults.aggregation")
+    logger.propagate = False
+    handler = ListHandler()
+    logger.handlers = [handler]
+    return FaultEngine(logger=logger, **kwargs), handler
+
+
+class TestFaultAggregation:
+    async def test_repeats_are_counted_then_summarized(self):
+        engine, handler = _engine(aggregation_window=60)
+        for _ in range(50):
+            try:
+                raise ConnectionError("db down")
+            except ConnectionError as e:
+                await engine.process(e, app="shop", route="/orders")
+        await engine.process(KeyError("other"), app="shop", route="/orders")
+
+        errors = [r for r in handler.records if r.levelno == logging.ERROR]
+        assert len(errors) == 2
+        assert errors[0].exc_info[1].args == ("db down",)
+
+        await engine.drain()
+        summary = handler.records[-1]
+        assert "repeated 49 more time(s)" in summary.getMessage()
+        stats = engine.get_stats()["emission"]
+        assert stats["faults"] == 51 and stats["logged"] == 2
+        assert stats["suppressed"] == 49 and stats["summaries"] == 1
+        assert engine.get_stats()["last_trace_id"]
+
+    async def test_windows_still_sweep_after_drain(self, monkeypatch):
+        engine, handler = _engine(aggregation_window=60)
+        await engine.drain()
+
+        now = fault_engine.time.monotonic()
+        for _ in range(3):
+            await engine.process(ConnectionError("db down"))
+        monkeypatch.setattr(fault_engine.time, "monotonic", lambda: now + 120)
+        await engine.process(KeyError("other"))
+
+        assert any("repeated 2 more time(s)" in r.getMessage() for r in handler.records)
+
+    async def test_listeners_are_queued_and_sampled(self):
+        engine, _ = _engine(sample_rates={"system": 0.0})
+        seen = []
+
+        async def listener(ctx):
+            await asyncio.sleep(0)
+            seen.append(ctx.fault.code)
+
+        engine.on_fault(listener)
+        for _ in range(5):
+            await engine.process(RuntimeError("boom"))
+        assert seen == []  # delivered off the request path
+
+        await asyncio.sleep(0.01)
+        # First occurrence always delivered; sampled repeats are not
+        assert seen == ["UNHANDLED_EXCEPTION"]
+        assert engine.get_stats()["emission"]["sampled_out"] == 4
+        await engine.drain()
@@ -0,0 +1,385 @@
+"""
+Background job queue: worker pool, retries, dead letters, SQLite recovery,
+and MailService delivery through the queue.
+"""
+import asyncio
+import time
+
+from aquilia.effects import QueueHandle, QueueProvider
+from aquilia.jobs import (
+    Job,
+    JobQueue,
+    JobRetryFault,
+    MemoryJobBackend,
+    RetryPolicy,
+    SQLiteJobBackend,
+)
+from aquilia.mail import EmailMessage, MailConfig, ProviderResult, ProviderResultStatus
+from aquilia.mail.service import MailService
+from aquilia.mail.faults import MailSendFault
+
+FAST = RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.05, jitter=False)
+
+
+def _queue(backend=None):
+    return JobQueue(backend or MemoryJobBackend(), retry=FAST, poll_interval=0.01)
+
+
+class TestJobQueue:
+    async def test_retries_then_succeeds(self):
+        queue = _queue()
+        calls = []
+
+        @queue.handler("flaky")
+        async def flaky(job):
+            calls.append(job.attempts)
+            if job.attempts < 2:
+                raise RuntimeError("boom")
+
+        await queue.start()
+        await queue.enqueue("flaky", {"n": 1})
+        assert await queue.join(timeout=2)
+        await asyncio.sleep(0.05)
+        assert await queue.join(timeout=2)
+        await queue.stop()
+        assert calls == [1, 2]
+        stats = queue.get_stats()
+        assert stats["succeeded"] == 1 and stats["retried"] == 1
+        assert await queue.dead_letters() == []
+
+    async def test_exhausted_and_non_retryable_jobs_are_dead_lettered(self):
+        queue = _queue()
+
+        @queue.handler("always-fails")
+        async def fails(job):
+            if job.payload == "fatal":
+                raise MailSendFault("bounced", transient=False)
+            raise RuntimeError("still down")
+
+        await queue.start()
+        await queue.enqueue("always-fails", "transient")
+        fatal = await queue.enqueue("always-fails", "fatal")
+        for _ in range(50):
+            if len(await queue.dead_letters()) == 2:
+                break
+            await asyncio.sleep(0.02)
+        await queue.stop()
+
+        dead = {job.payload: job for job in await queue.dead_letters()}
+        assert dead["transient"].attempts == FAST.max_attempts
+        assert dead["fatal"].attempts == 1
+        assert "bounced" in dead["fatal"].last_error
+        assert await queue.replay(fatal.id)
+        assert len(await queue.dead_letters()) == 1
+
+    async def test_concurrency_limit_and_batching(self):
+        queue = _queue()
+        active, peak, batches = 0, 0, []
+
+        async def handle(jobs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            batches.append(len(jobs))
+            await asyncio.sleep(0.02)
+            active -= 1
+
+        queue.register("bulk", handle, batch=True, batch_size=10, concurrency=2)
+        for i in range(40):
+            await queue.enqueue("bulk", i)
+        await queue.start()
+        assert await queue.join(timeout=2)
+        await queue.stop()
+        assert peak == 2
+        assert sum(batches) == 40 and max(batches) == 10
+
+    async def test_batch_handler_outcomes_and_retry_after(self):
+        queue = _queue()
+        seen = []
+
+        async def handle(jobs):
+            seen.extend((j.payload, j.attempts) for j in jobs)
+            return [
+                JobRetryFault(retry_after=0.0) if j.payload == "later" and j.attempts == 1 else None
+                for j in jobs
+            ]
+
+        queue.register("mixed", handle, batch=True, batch_size=5)
+        await queue.enqueue("mixed", "now")
+        await queue.enqueue("mixed", "later")
+        await queue.start()
+        for _ in range(50):
+            if queue.get_stats()["succeeded"] == 2:
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+        assert ("later", 2) in seen
+        assert queue.get_stats()["retried"] == 1
+
+    async def test_batch_jobs_without_outcome_are_retried(self):
+        queue = _queue()
+        seen = []
+
+        async def handle(jobs):
+            seen.extend(j.payload for j in jobs)
+            return [None]
+
+        queue.register("short", handle, batch=True, batch_size=3)
+        for i in range(3):
+            await queue.enqueue("short", i)
+        await queue.start()
+        for _ in range(100):
+            if queue.get_stats()["succeeded"] == 3:
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+        assert queue.get_stats()["succeeded"] == 3
+        assert queue.get_stats()["retried"] >= 2
+        assert sorted(set(seen)) == [0, 1, 2]
+
+    async def test_batch_handler_error_retries_every_job(self):
+        queue = _queue()
+        calls = []
+
+        async def handle(jobs):
+            calls.append(sorted(j.payload for j in jobs))
+            if len(calls) == 1:
+                raise RuntimeError("provider down")
+
+        queue.register("bulk", handle, batch=True, batch_size=2)
+        await queue.enqueue("bulk", "a")
+        await queue.enqueue("bulk", "b")
+        await queue.start()
+        for _ in range(100):
+            if queue.get_stats()["succeeded"] == 2:
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+        assert calls[0] == ["a", "b"]
+        stats = queue.get_stats()
+        assert stats["succeeded"] == 2 and stats["retried"] == 2
+
+    async def test_worker_survives_failed_ack(self):
+        class FlakyAck(MemoryJobBackend):
+            failed = False
+
+            async def ack(self, jobs):
+                if not self.failed:
+                    self.failed = True
+                    raise ConnectionError("backend down")
+                await super().ack(jobs)
+
+        queue = _queue(FlakyAck())
+        got = []
+
+        @queue.handler("t")
+        async def handle(job):
+            got.append(job.payload)
+
+        await queue.start()
+        await queue.enqueue("t", 1)
+        await asyncio.sleep(0.05)
+        await queue.enqueue("t", 2)
+        for _ in range(100):
+            if sorted(got) == [1, 1, 2]:
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+        # The unacknowledged first delivery is retried rather than lost
+        assert sorted(got) == [1, 1, 2]
+        assert queue.get_stats()["succeeded"] == 2
+
+
+class TestSQLiteJobBackend:
+    async def test_persists_and_recovers_running_jobs(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'jobs.sqlite3'}"
+        backend = SQLiteJobBackend(url)
+        await backend.initialize()
+        await backend.push(Job(topic="t", payload={"a": 1}))
+        await backend.push(Job(topic="t", payload={"a": 2}))
+        claimed = await backend.claim("t", 1)
+        assert claimed[0].attempts == 1
+        await backend.close()  # simulated crash: one job left RUNNING
+
+        backend = SQLiteJobBackend(url)
+        await backend.initialize()
+        assert await backend.pending_count("t") == 2
+        jobs = await backend.claim("t", 10)
+        assert sorted(j.payload["a"] for j in jobs) == [1, 2]
+        await backend.bury(jobs[0], "nope")
+        await backend.ack(jobs[1:])
+        assert [j.id for j in await backend.dead_letters("t")] == [jobs[0].id]
+        assert await backend.replay(jobs[0].id)
+        assert await backend.pending_count() == 1
+        await backend.close()
+
+
+class TestBackendOrdering:
+    async def test_due_jobs_claimed_by_priority_on_both_backends(self, tmp_path):
+        now = time.time()
+        for backend in (MemoryJobBackend(), SQLiteJobBackend(f"sqlite:///{tmp_path / 'o.sqlite3'}")):
+            await backend.initialize()
+            for name, priority, age in (("old-low", 90, 30), ("new-high", 10, 1), ("mid", 50, 20)):
+                await backend.push(Job(topic="t", payload=name, priority=priority, run_at=now - age))
+            await backend.push(Job(topic="t", payload="later", priority=0, run_at=now + 60))
+            claimed = [j.payload for j in await backend.claim("t", 10, now=now)]
+            assert claimed == ["new-high", "mid", "old-low"], backend.name
+            assert await backend.pending_count("t") == 1
+            assert await backend.next_run_at("t") == now + 60
+            await backend.close()
+
+
+class TestQueueProvider:
+    async def test_publish_through_effect_handle(self):
+        queue = _queue()
+        got = []
+
+        @queue.handler("events")
+        async def on_event(job):
+            got.append(job.payload)
+
+        provider = QueueProvider(queue)
+        await provider.initialize()
+        handle = await provider.acquire("events")
+        assert isinstance(handle, QueueHandle)
+        await handle.publish({"kind": "signup"})
+        await provider.finalize()
+        assert got == [{"kind": "signup"}]
+
+    async def test_handle_without_topic_targets_a_handled_topic(self):
+        queue = _queue()
+        provider = QueueProvider(queue)
+        try:
+            await provider.acquire()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("no topic has a worker")
+
+        got = []
+
+        async def on_event(job):
+            got.append(job.payload)
+
+        queue.register("events", on_event)
+        await provider.initialize()
+        await (await provider.acquire()).publish("ping")
+        assert await queue.join(timeout=1)
+        assert got == ["ping"]
+
+        queue.register("audit", on_event)
+        try:
+            await provider.acquire()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("ambiguous topic must fail")
+        await provider.finalize()
+
+    async def test_handlers_attach_to_running_shared_queue(self):
+        queue = _queue()  # e.g. the mail queue, started before effects
+        await queue.start()
+        provider = QueueProvider(queue)
+        await provider.initialize()
+        got = []
+
+        async def on_event(job):
+            got.append(job.payload)
+
+        queue.register("events", on_event)
+        await (await provider.acquire("events")).publish("late")
+        assert await queue.join(timeout=1)
+        assert got == ["late"]
+        try:
+            queue.register("events", on_event)
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("re-registering a running topic must fail")
+        await provider.finalize()
+
+
+class _BatchProvider:
+    name = "batchy"
+    priority = 1
+    supports_batching = True
+    max_batch_size = 3
+
+    def __init__(self, fail_first=()):
+        self.batches = []
+        self.fail_first = set(fail_first)
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def send(self, envelope):
+        return (await self.send_batch([envelope]))[0]
+
+    async def send_batch(self, envelopes):
+        self.batches.append([e.subject for e in envelopes])
+        results = []
+        for e in envelopes:
+            if e.subject in self.fail_first:
+                self.fail_first.discard(e.subject)
+                results.append(ProviderResult(ProviderResultStatus.TRANSIENT_FAILURE, error_message="4xx"))
+            elif e.subject == "bad":
+                results.append(ProviderResult(ProviderResultStatus.PERMANENT_FAILURE, error_message="550"))
+            else:
+                results.append(ProviderResult(ProviderResultStatus.SUCCESS, provider_message_id=e.id))
+        return results
+
+
+class TestMailQueueDispatch:
+    async def _service(self, provider):
+        svc = MailService(MailConfig(
+            retry={"max_attempts": 3, "base_delay": 0.0, "jitter": False},
+            queue={"batch_size": 5, "poll_interval": 0.1},
+        ))
+        svc._providers["batchy"] = provider
+        await svc.on_startup()
+        return svc
+
+    async def test_send_enqueues_and_dispatcher_batches(self):
+        provider = _BatchProvider()
+        svc = await self._service(provider)
+        assert svc.job_queue.running
+
+        ids = [
+            await svc.send_message(EmailMessage(subject=f"s{i}", body="b", to=["a@x.io"]))
+            for i in range(7)
+        ]
+        assert provider.batches == []  # send_message returned before delivery
+        assert await svc.job_queue.join(timeout=2)
+        await svc.on_shutdown()
+
+        assert len(ids) == 7
+        assert sorted(sum(provider.batches, [])) == sorted(f"s{i}" for i in range(7))
+        assert max(len(b) for b in provider.batches) == 3  # chunked by max_batch_size
+
+    async def test_transient_retried_permanent_dead_lettered(self):
+        provider = _BatchProvider(fail_first={"flaky"})
+        svc = await self._service(provider)
+        await svc.send_message(EmailMessage(subject="flaky", body="b", to=["a@x.io"]))
+        await svc.send_message(EmailMessage(subject="bad", body="b", to=["a@x.io"]))
+        for _ in range(100):
+            if svc.get_queue_stats()["dispatcher"]["sent"] == 1:
+                break
+            await asyncio.sleep(0.01)
+        dead = await svc.job_queue.dead_letters()
+        await svc.on_shutdown()
+
+        assert [d.payload["envelope"]["subject"] for d in dead] == ["bad"]
+        assert sum(provider.batches, []).count("flaky") == 2
+
+    async def test_queue_disabled_sends_inline(self):
+        provider = _BatchProvider()
+        svc = MailService(MailConfig(queue={"enabled": False}))
+        svc._providers["batchy"] = provider
+        await svc.on_startup()
+        await svc.send_message(EmailMessage(subject="now", body="b", to=["a@x.io"]))
+        assert provider.batches == [["now"]]
+        assert svc.job_queue is None
+        await svc.on_shutdown()
@@ -0,0 +1,209 @@
+"""
+Provider batch sending: pooled SMTP lanes, SES/SendGrid bulk requests,
+and dispatcher rate limits / domain grouping.
+"""
+import asyncio
+
+from aquilia.mail import MailConfig, ProviderResult, ProviderResultStatus
+from aquilia.mail.dispatcher import MailDispatcher
+from aquilia.mail.envelope import MailEnvelope
+from aquilia.mail.providers.sendgrid import SendGridProvider
+from aquilia.mail.providers.ses import SESProvider
+from aquilia.mail.providers.smtp import SMTPProvider
+from aquilia.mail.service import MailService
+
+
+def _env(i, domain="x.io", subject="Hi", **kw):
+    return MailEnvelope(
+        from_email="app@aquilia.dev", to=[f"u{i}@{domain}"], subject=subject,
+        body_text="body", **kw,
+    )
+
+
+class _FakeSMTP:
+    active = 0
+    peak = 0
+
+    async def send_message(self, msg, sender, recipients):
+        type(self).active += 1
+        type(self).peak = max(type(self).peak, type(self).active)
+        await asyncio.sleep(0.001)
+        type(self).active -= 1
+        return {}, "250 OK"
+
+    async def noop(self):
+        pass
+
+    async def quit(self):
+        pass
+
+
+class TestSMTPPooledBatch:
+    async def test_batch_spreads_across_pool(self):
+        provider = SMTPProvider(host="127.0.0.1", use_tls=False, pool_size=4)
+        created = []
+
+        async def create():
+            conn = _FakeSMTP()
+            created.append(conn)
+            return conn
+
+        provider._create_connection = create
+        _FakeSMTP.peak = 0
+        results = await provider.send_batch([_env(i) for i in range(20)])
+        assert all(r.is_success for r in results) and len(results) == 20
+        assert len(created) == 4
+        assert _FakeSMTP.peak == 4
+
+        # Connections are capped by pool_size even across concurrent batches
+        _FakeSMTP.peak = 0
+        await asyncio.gather(*(provider.send_batch([_env(i) for i in range(8)]) for _ in range(3)))
+        assert _FakeSMTP.peak <= 4
+        assert len(provider._pool) <= 4
+
+
+class _FakeResponse:
+    status_code = 202
+    headers = {"X-Message-Id": "sg-batch"}
+
+
+class _FakeHTTP:
+    def __init__(self):
+        self.payloads = []
+
+    async def post(self, url, json):
+        self.payloads.append(json)
+        return _FakeResponse()
+
+
+class TestBulkAPIs:
+    async def test_sendgrid_groups_identical_content(self):
+        provider = SendGridProvider(api_key="k")
+        provider._client = _FakeHTTP()
+        envelopes = [_env(i) for i in range(5)] + [_env(9, subject="Other")]
+        results = await provider.send_batch(envelopes)
+
+        assert all(r.is_success for r in results)
+        assert len(provider._client.payloads) == 2
+        bulk = max(provider._client.payloads, key=lambda p: len(p["personalizations"]))
+        assert [p["to"][0]["email"] for p in bulk["personalizations"]] == [f"u{i}@x.io" for i in range(5)]
+        assert bulk["personalizations"][2]["custom_args"]["aquilia_envelope_id"] == envelopes[2].id
+
+    async def test_ses_uses_send_bulk_email(self):
+        provider = SESProvider()
+        calls = []
+
+        async def call(method, **kwargs):
+            calls.append((method, kwargs))
+            if method == "send_bulk_email":
+                return {"BulkEmailEntryResults": [
+                    {"Status": "SUCCESS", "MessageId": "m0"},
+                    {"Status": "ACCOUNT_THROTTLED", "Error": "slow down"},
+                    {"Status": "MESSAGE_REJECTED", "Error": "nope"},
+                ]}
+            return {"MessageId": "single"}
+
+        provider._call_ses = call
+        envelopes = [_env(i) for i in range(3)] + [_env(7, headers={"X-Custom": "1"})]
+        results = await provider.send_batch(envelopes)
+
+        assert sorted(m for m, _ in calls) == ["send_bulk_email", "send_email"]
+        assert [r.status for r in results] == [
+            ProviderResultStatus.SUCCESS,
+            ProviderResultStatus.RATE_LIMITED,
+            ProviderResultStatus.PERMANENT_FAILURE,
+            ProviderResultStatus.SUCCESS,
+        ]
+
+
+class _RecordingProvider:
+    supports_batching = True
+    max_batch_size = 10
+
+    def __init__(self, name, priority):
+        self.name = name
+        self.priority = priority
+        self.batches = []
+
+    async def send_batch(self, envelopes):
+        self.batches.append([e.to[0] for e in envelopes])
+        return [ProviderResult(ProviderResultStatus.SUCCESS, provider_message_id=e.id) for e in envelopes]
+
+
+class _ShortProvider(_RecordingProvider):
+    async def send_batch(self, envelopes):
+        return (await super().send_batch(envelopes))[:1]
+
+
+class _Job:
+    def __init__(self, payload):
+        self.payload = payload
+        self.attempts = 1
+
+
+class TestDispatcherLimits:
+    def _service(self, **rate_limit):
+        svc = MailService(MailConfig(
+            providers=[
+                {"name": "primary", "type": "console", "rate_limit_per_min": 3},
+                {"name": "backup", "type": "console", "rate_limit_per_min": 0},
+            ],
+            rate_limit={"global_per_minute": 0, "per_domain_per_minute": 0, **rate_limit},
+        ))
+        svc._providers = {
+            "primary": _RecordingProvider("primary", 1),
+            "backup": _RecordingProvider("backup", 2),
+        }
+        return svc
+
+    async def test_groups_by_domain_and_spills_over_rate_limit(self):
+        from aquilia.mail.dispatcher import encode_envelope
+
+        svc = self._service()
+        dispatcher = MailDispatcher(svc)
+        envelopes = [_env(i, domain="a.io" if i % 2 else "b.io") for i in range(6)]
+        outcomes = await dispatcher.dispatch_batch([_Job(encode_envelope(e)) for e in envelopes])
+
+        assert outcomes == [None] * 6
+        primary, backup = svc._providers["primary"], svc._providers["backup"]
+        assert sum(len(b) for b in primary.batches) == 3
+        assert sum(len(b) for b in backup.batches) == 3
+        for batch in primary.batches + backup.batches:
+            assert len({addr.split("@")[1] for addr in batch}) == 1
+        assert dispatcher.get_stats()["rate_limited"] == 3
+
+    async def test_domain_limit_defers_with_retry_after(self):
+        from aquilia.mail.dispatcher import encode_envelope
+
+        svc = self._service(per_domain_per_minute=2)
+        dispatcher = MailDispatcher(svc)
+        envelopes = [_env(i) for i in range(4)]
+        outcomes = await dispatcher.dispatch_batch([_Job(encode_envelope(e)) for e in envelopes])
+
+        deferred = [o for o in outcomes if o is not None]
+        assert len(deferred) == 2
+        assert all(o.retryable and o.retry_after > 0 for o in deferred)
+
+    async def test_missing_batch_results_are_retried_elsewhere(self):
+        from aquilia.mail.dispatcher import encode_envelope
+
+        svc = self._service()
+        svc._providers["primary"] = _ShortProvider("primary", 1)
+        dispatcher = MailDispatcher(svc)
+        envelopes = [_env(i) for i in range(3)]
+        outcomes = await dispatcher.dispatch_batch([_Job(encode_envelope(e)) for e in envelopes])
+
+        assert outcomes == [None] * 3
+        assert sum(len(b) for b in svc._providers["backup"].batches) == 2
+
+    async def test_no_providers_retries_instead_of_acking(self):
+        from aquilia.mail.dispatcher import encode_envelope
+        from aquilia.mail.faults import MailSendFault
+
+        svc = self._service()
+        svc._providers = {}
+        dispatcher = MailDispatcher(svc)
+        outcomes = await dispatcher.dispatch_batch([_Job(encode_envelope(_env(i))) for i in range(2)])
+
+        assert all(isinstance(o, MailSendFault) and o.transient for o in outcomes)
+        assert dispatcher.get_stats()["sent"] == 0
@@ -0,0 +1,174 @@
+"""
+Per-route middleware chains: scope filtering, the 404 chain and
+recompilation when the stack or route table changes.
+"""
+from aquilia import Controller, GET, Response
+from aquilia.asgi import ASGIAdapter
+from aquilia.controller.compiler import ControllerCompiler
+from aquilia.controller.engine import ControllerEngine
+from aquilia.controller.factory import ControllerFactory
+from aquilia.controller.router import ControllerRouter
+from aquilia.di import Container
+from aquilia.middleware import MiddlewareStack
+
+
+class OrdersController(Controller):
+    prefix = "/orders"
+
+    @GET("/")
+    async def list_orders(self, ctx):
+        return Response.text("orders")
+
+    @GET("/export")
+    async def export(self, ctx):
+        return Response.text("csv")
+
+
+class HealthController(Controller):
+    prefix = "/health"
+
+    @GET("/")
+    async def health(self, ctx):
+        return Response.text("ok")
+
+
+def _tracer(name, seen):
+    async def mw(request, ctx, next_handler):
+        seen.append(name)
+        return await next_handler(request, ctx)
+    return mw
+
+
+def _app(stack):
+    router = ControllerRouter()
+    compiler = ControllerCompiler()
+    for ctrl, app_name in ((OrdersController, "shop"), (HealthController, "ops")):
+        compiled = compiler.compile_controller(ctrl)
+        for route in compiled.routes:
+            route.app_name = app_name
+        router.add_controller(compiled)
+    router.initialize()
+    engine = ControllerEngine(ControllerFactory(Container(scope="app")), enable_lifecycle=False)
+    return ASGIAdapter(router, engine, stack), router
+
+
+async def _get(app, path):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    await app({"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []},
+              receive, send)
+    return sent[0]["status"]
+
+
+class TestScopeApplies:
+    def test_scope_kinds(self):
+        route = ControllerCompiler().compile_controller(OrdersController).routes[0]
+        route.app_name = "shop"
+        applies = MiddlewareStack.scope_applies
+        assert applies("global", route) and applies("global", None)
+        assert applies("app:shop", route) and not applies("app:ops", route)
+        assert applies("controller:OrdersController", route)
+        assert applies(f"controller:{__name__}:OrdersController", route)
+        assert not applies("controller:HealthController", route)
+        assert applies(f"route:{route.full_path}", route)
+        assert applies(f"route:GET {route.full_path}", route)
+        assert not applies(f"route:POST {route.full_path}", route)
+        assert not applies("app:shop", None)
+
+
+class TestRouteChains:
+    async def test_only_applicable_middleware_runs(self):
+        seen = []
+        stack = MiddlewareStack()
+        stack.add(_tracer("global", seen), scope="global", priority=1)
+        stack.add(_tracer("shop", seen), scope="app:shop", priority=1)
+        stack.add(_tracer("ops", seen), scope="app:ops", priority=1)
+        stack.add(_tracer("orders", seen), scope="controller:OrdersController", priority=1)
+        stack.add(_tracer("export", seen), scope="route:/orders/export", priority=1)
+        app, _ = _app(stack)
+
+        assert await _get(app, "/orders") == 200
+        assert seen == ["global", "shop", "orders"]
+        seen.clear()
+        assert await _get(app, "/orders/export") == 200
+        assert seen == ["global", "shop", "orders", "export"]
+        seen.clear()
+        assert await _get(app, "/health") == 200
+        assert seen == ["global", "ops"]
+        seen.clear()
+        assert await _get(app, "/missing") == 404
+        assert seen == ["global"]
+
+    async def test_chains_recompile_when_stack_or_routes_change(self):
+        seen = []
+        stack = MiddlewareStack()
+        app, router = _app(stack)
+        assert await _get(app, "/health") == 200
+        assert seen == []
+
+        stack.add(_tracer("late", seen), scope="app:ops")
+        assert await _get(app, "/health") == 200
+        assert seen == ["late"]
+
+        class AuditController(Controller):
+            prefix = "/audit"
+
+            @GET("/")
+            async def audit(self, ctx):
+                return Response.text("audit")
+
+        compiled = ControllerCompiler().compile_controller(AuditController)
+        compiled.routes[0].app_name = "ops"
+        router.add_controller(compiled)
+        router.initialize()
+        assert compiled.routes[0].middleware_chain is not None
+        seen.clear()
+        assert await _get(app, "/audit") == 200
+        assert seen == ["late"]
+
+
+MANIFEST_SEEN = []
+
+
+class ManifestTracer:
+    def __init__(self, label="manifest"):
+        self.label = label
+
+    async def __call__(self, request, ctx, next_handler):
+        MANIFEST_SEEN.append(self.label)
+        return await next_handler(request, ctx)
+
+
+class TestManifestMiddleware:
+    async def test_app_scoped_middleware_from_manifest(self):
+        from aquilia.manifest import AppManifest, MiddlewareConfig
+        from aquilia.testing import TestClient, TestServer
+
+        tracer = f"{__name__}:ManifestTracer"
+        manifests = [
+            AppManifest(
+                name="shop", version="1.0.0",
+                controllers=[f"{__name__}:OrdersController"],
+                middleware=[
+                    MiddlewareConfig(class_path=tracer, scope="app", config={"label": "shop"}),
+                    MiddlewareConfig(class_path=tracer, scope="route", scope_target="/orders/export",
+                                     config={"label": "export"}),
+                ],
+            ),
+            AppManifest(name="ops", version="1.0.0", controllers=[f"{__name__}:HealthController"]),
+        ]
+        MANIFEST_SEEN.clear()
+        async with TestServer(manifests=manifests) as server:
+            client = TestClient(server)
+            assert (await client.get("/orders")).status_code == 200
+            assert MANIFEST_SEEN == ["shop"]
+            assert (await client.get("/orders/export")).status_code == 200
+            assert MANIFEST_SEEN == ["shop", "shop", "export"]
+            assert (await client.get("/health")).status_code == 200
+            assert MANIFEST_SEEN == ["shop", "shop", "export"]
@@ -0,0 +1,103 @@
+"""
+Online migration steps on SQLite: chunked, resumable backfills, steps
+committed outside the migration transaction, and copy-and-swap table
+rebuilds for ALTER COLUMN.
+"""
+import sqlite3
+import textwrap
+
+import pytest
+
+from aquilia.db.engine import AquiliaDatabase
+from aquilia.faults.domains import MigrationFault, QueryFault
+from aquilia.models.migration_runner import PROGRESS_TABLE, MigrationRunner
+
+ROWS = 20_000
+
+MIGRATION = '''
+from aquilia.models.migration_dsl import AddField, AddNotNull, Backfill, CreateIndex, C
+
+class Meta:
+    revision = "20260101_000000"
+    slug = "score"
+
+operations = [
+    AddField("Item", "items", C.integer("score", null=True)),
+    Backfill("items", {"score": "id * 2"}, where="score IS NULL", batch_size=1000),
+    AddNotNull("Item", "items", "score"),
+    CreateIndex("idx_items_score", "items", ["score"], concurrently=True),
+]
+'''
+
+
+@pytest.fixture
+async def db(tmp_path):
+    db = AquiliaDatabase(f"sqlite:///{tmp_path}/online.db")
+    await db.connect()
+    await db.execute('CREATE TABLE "owners" ("id" INTEGER PRIMARY KEY)')
+    await db.execute('INSERT INTO "owners" ("id") VALUES (1)')
+    await db.execute(
+        'CREATE TABLE "items" ('
+        '"id" INTEGER PRIMARY KEY AUTOINCREMENT, '
+        '"sku" VARCHAR(20) NOT NULL UNIQUE, '
+        '"owner_id" INTEGER REFERENCES "owners"("id") ON DELETE CASCADE)'
+    )
+    await db.execute_many(
+        'INSERT INTO "items" ("sku", "owner_id") VALUES (?, 1)',
+        [(f"sku-{i}",) for i in range(ROWS)],
+    )
+    await db.execute('CREATE TABLE "halt" ("at" INTEGER)')
+    await db.execute(
+        'CREATE TRIGGER "items_halt" BEFORE UPDATE ON "items" '
+        'WHEN NEW."id" IN (SELECT "at" FROM "halt") '
+        "BEGIN SELECT RAISE(ABORT, 'interrupted'); END"
+    )
+    yield db
+    await db.disconnect()
+
+
+@pytest.fixture
+def runner(db, tmp_path):
+    migrations = tmp_path / "migrations"
+    migrations.mkdir()
+    (migrations / "20260101_000000_score.py").write_text(textwrap.dedent(MIGRATION))
+    return MigrationRunner(db, migrations)
+
+
+class TestOnlineMigration:
+    async def test_interrupted_backfill_resumes(self, db, runner):
+        await db.execute('INSERT INTO "halt" ("at") VALUES (5500)')
+        with pytest.raises(MigrationFault):
+            await runner.migrate()
+
+        progress = await runner.get_progress("20260101_000000")
+        assert progress["step:0"]["completed"]  # AddField committed
+        assert progress["step:1"]["position"] == "5000"
+        assert progress["step:1"]["rows_done"] == 5000
+        assert await db.fetch_val('SELECT COUNT(*) FROM "items" WHERE "score" IS NULL') == ROWS - 5000
+
+        await db.execute('DELETE FROM "halt"')
+        assert await runner.migrate() == ["20260101_000000"]
+        assert await db.fetch_val('SELECT COUNT(*) FROM "items" WHERE "score" = "id" * 2') == ROWS
+        assert await db.fetch_val(f'SELECT COUNT(*) FROM "{PROGRESS_TABLE}"') == 0
+
+    async def test_not_null_rebuild_preserves_table(self, db, runner):
+        await runner.migrate()
+
+        columns = {c.name: c for c in await db.get_columns("items")}
+        assert columns["score"].nullable is False
+        assert columns["owner_id"].nullable is True
+        indexes = {i["name"]: i for i in await db._adapter.get_indexes("items")}
+        assert indexes["idx_items_score"]["columns"] == ["score"]
+        assert any(i["unique"] and i["columns"] == ["sku"] for i in indexes.values())
+        fks = await db._adapter.get_foreign_keys("items")
+        assert fks[0]["to_table"] == "owners" and fks[0]["on_delete"] == "CASCADE"
+        assert await db.fetch_val("SELECT COUNT(*) FROM sqlite_master WHERE name='items_halt'") == 1
+        assert await db.fetch_val("SELECT COUNT(*) FROM sqlite_master WHERE name LIKE '__aq_rebuild%'") == 0
+
+        await db.execute('INSERT INTO "items" ("sku", "score") VALUES (?, ?)', ["new", 1])
+        assert await db.fetch_val('SELECT MAX("id") FROM "items"') == ROWS + 1
+        with pytest.raises(QueryFault, match="NOT NULL") as exc:
+            await db.execute('INSERT INTO "items" ("sku") VALUES (?)', ["null-score"])
+        assert isinstance(exc.value.__cause__, sqlite3.IntegrityError)
+        assert await db.fetch_val("PRAGMA foreign_keys") == 1
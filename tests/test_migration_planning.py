@@ -0,0 +1,122 @@
+"""
+Incremental migration planning: fingerprinted snapshot diffs, compiled
+plans cached by file checksum and the head-hash startup check.
+"""
+import pytest
+
+from aquilia.db.engine import AquiliaDatabase
+from aquilia.models import migration_runner, schema_snapshot
+from aquilia.models.migration_runner import MigrationRunner, check_migrations_applied
+from aquilia.models.schema_snapshot import _compute_checksum, _model_fingerprint, compute_diff
+
+MIGRATION = '''
+from aquilia.models.migration_dsl import CreateModel, C
+
+class Meta:
+    revision = "{rev}"
+    slug = "{slug}"
+
+operations = [CreateModel("{model}", "{table}", [C.auto("id"), C.varchar("name", 50)])]
+'''
+
+
+def _snapshot(tables, *, fingerprints=True):
+    models = {}
+    for name, columns in tables.items():
+        model = {
+            "table": name.lower(),
+            "fields": {c: {"type": "INTEGER"} for c in columns},
+            "indexes": [],
+            "meta": {},
+        }
+        if fingerprints:
+            model["fingerprint"] = _model_fingerprint(model)
+        models[name] = model
+    snapshot = {"version": 1, "models": models}
+    snapshot["checksum"] = _compute_checksum(snapshot)
+    return snapshot
+
+
+def _write(mdir, rev, model):
+    slug = model.lower()
+    (mdir / f"{rev}_{slug}.py").write_text(
+        MIGRATION.format(rev=rev, slug=slug, model=model, table=slug)
+    )
+
+
+class TestSnapshotFingerprints:
+    def test_only_changed_models_are_diffed(self, monkeypatch):
+        calls = []
+        original = schema_snapshot._diff_model
+        monkeypatch.setattr(
+            schema_snapshot, "_diff_model",
+            lambda old, new: calls.append(new["table"]) or original(old, new),
+        )
+        tables = {f"M{i}": ["id", "a"] for i in range(200)}
+        old = _snapshot(tables)
+        assert not compute_diff(old, _snapshot(tables)).has_changes
+        assert calls == []
+
+        changed = dict(tables, M7=["id", "a", "b"])
+        diff = compute_diff(_snapshot(tables, fingerprints=False), _snapshot(changed))
+        assert list(diff.altered_models) == ["M7"]
+        assert diff.altered_models["M7"].added_fields == ["b"]
+        assert calls == ["m7"]
+
+
+@pytest.fixture
+async def db(tmp_path):
+    db = AquiliaDatabase(f"sqlite:///{tmp_path}/plan.db")
+    await db.connect()
+    yield db
+    await db.disconnect()
+
+
+class TestPlanCacheAndHead:
+    async def test_plans_cached_by_checksum(self, db, tmp_path, monkeypatch):
+        mdir = tmp_path / "migrations"
+        mdir.mkdir()
+        _write(mdir, "20260101_000000", "Alpha")
+        _write(mdir, "20260102_000000", "Beta")
+
+        loads = []
+        original = migration_runner._load_migration_module
+        monkeypatch.setattr(
+            migration_runner, "_load_migration_module",
+            lambda path, rev: loads.append(rev) or original(path, rev),
+        )
+        first = await MigrationRunner(db, mdir).plan()
+        assert len(loads) == 2
+        assert await MigrationRunner(db, mdir).plan() == first
+        assert len(loads) == 2  # served from .aquilia/migration_plans.json
+        assert sorted(p.name for p in mdir.iterdir()) == [
+            "20260101_000000_alpha.py", "20260102_000000_beta.py",
+        ]
+        assert (tmp_path / ".aquilia" / "migration_plans.json").exists()
+        assert (tmp_path / ".aquilia" / ".gitignore").exists()
+
+        _write(mdir, "20260102_000000", "Gamma")
+        plan = await MigrationRunner(db, mdir).plan()
+        assert loads[2:] == ["20260102_000000"]
+        assert any('"gamma"' in sql for sql in plan)
+
+    async def test_startup_check_uses_head_hash(self, db, tmp_path):
+        mdir = tmp_path / "migrations"
+        mdir.mkdir()
+        _write(mdir, "20260101_000000", "Alpha")
+        url = f"sqlite:///{tmp_path}/plan.db"
+        runner = MigrationRunner(db, mdir)
+        await runner.migrate()
+        assert check_migrations_applied(url, mdir)
+
+        # Writers that bypass update_head() invalidate the head row
+        await db.execute('DELETE FROM "aquilia_migrations"')
+        assert not check_migrations_applied(url, mdir)
+        await runner.migrate()
+        assert check_migrations_applied(url, mdir)
+
+        # ...as do files on disk that no longer match it
+        _write(mdir, "20260102_000000", "Beta")
+        assert not check_migrations_applied(url, mdir)
+        await runner.migrate()
+        assert check_migrations_applied(url, mdir)
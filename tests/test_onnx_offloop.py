@@ -0,0 +1,77 @@
+"""
+ONNXRuntimeAdapter runs inference on its session pool, off the event
+loop, with IO metadata read once at load.
+"""
+import asyncio
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aquilia.mlops._types import BatchRequest, InferenceRequest
+from aquilia.mlops.runtime.onnx_runtime import ONNXRuntimeAdapter
+
+
+class Meta:
+    def __init__(self, name, type_):
+        self.name = name
+        self.type = type_
+        self.shape = ["batch", 2]
+
+
+class BlockingSession:
+    def __init__(self):
+        self.metadata_reads = 0
+        self.feeds = []
+
+    def get_inputs(self):
+        self.metadata_reads += 1
+        return [Meta("x", "tensor(float)")]
+
+    def get_outputs(self):
+        self.metadata_reads += 1
+        return [Meta("y", "tensor(float)")]
+
+    def run(self, output_names, feed):
+        time.sleep(0.05)
+        self.feeds.append(feed)
+        return [feed["x"] * 2]
+
+
+def _batch(n):
+    return BatchRequest(requests=[
+        InferenceRequest(request_id=str(i), inputs={"x": [[1.0, 2.0]]}) for i in range(n)
+    ])
+
+
+class TestONNXOffLoop:
+    async def test_inference_does_not_block_loop(self):
+        sessions = [BlockingSession(), BlockingSession()]
+        adapter = ONNXRuntimeAdapter(pool_size=2)
+        adapter._init_pool(sessions)
+        reads = sum(s.metadata_reads for s in sessions)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        results = await asyncio.gather(adapter.infer(_batch(2)), adapter.infer(_batch(2)))
+        task.cancel()
+
+        assert ticks >= 10
+        assert results[0][0].outputs == {"y": [[2.0, 4.0]]}
+        assert all(s.feeds for s in sessions)  # both pooled sessions used
+        assert sessions[0].feeds[0]["x"].dtype == np.float32
+        assert sum(s.metadata_reads for s in sessions) == reads
+
+        metrics = await adapter.metrics()
+        assert metrics["inference_count"] == 4.0
+        assert metrics["avg_compute_ms"] >= 90
+        assert metrics["pending_batches"] == 0.0
+        await adapter.unload()
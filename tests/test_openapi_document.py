@@ -0,0 +1,135 @@
+"""
+Precomputed OpenAPI document: generate-once caching, ETag / 304 and
+pre-compressed variants.
+"""
+import gzip
+import json
+
+from aquilia import Controller, GET
+from aquilia.controller.compiler import ControllerCompiler
+from aquilia.controller.openapi import (
+    OpenAPIConfig,
+    OpenAPIDocument,
+    OpenAPIDocumentCache,
+    OpenAPIGenerator,
+)
+from aquilia.controller.router import ControllerRouter
+from aquilia.request import Request
+
+
+class WidgetsController(Controller):
+    prefix = "/widgets"
+
+    @GET("/")
+    async def list_widgets(self, ctx):
+        return []
+
+
+class GadgetsController(Controller):
+    prefix = "/gadgets"
+
+    @GET("/")
+    async def list_gadgets(self, ctx):
+        return []
+
+
+def _request(**headers):
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/openapi.json",
+        "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+    }
+    return Request(scope, receive)
+
+
+class _CountingGenerator(OpenAPIGenerator):
+    calls = 0
+
+    def generate(self, router):
+        type(self).calls += 1
+        return super().generate(router)
+
+
+def _router(*controllers):
+    router = ControllerRouter()
+    compiler = ControllerCompiler()
+    for ctrl in controllers:
+        router.add_controller(compiler.compile_controller(ctrl))
+    router.initialize()
+    return router
+
+
+class TestOpenAPIDocumentCache:
+    def test_generates_once_until_routes_change(self):
+        router = _router(WidgetsController)
+        _CountingGenerator.calls = 0
+        cache = OpenAPIDocumentCache(_CountingGenerator(config=OpenAPIConfig()), router)
+
+        first = cache.get()
+        assert cache.get() is first
+        assert _CountingGenerator.calls == 1
+
+        router.add_controller(ControllerCompiler().compile_controller(GadgetsController))
+        router.initialize()
+        second = cache.get()
+        assert _CountingGenerator.calls == 2
+        assert "/gadgets" in second.spec["paths"]
+        assert second.etag != first.etag
+
+    def test_prebuilt_document_skips_generator(self, tmp_path):
+        router = _router(WidgetsController)
+        doc = OpenAPIDocument.from_spec(OpenAPIGenerator().generate(router))
+        written = doc.write(tmp_path / "openapi.json")
+        assert (tmp_path / "openapi.json.gz") in written
+
+        _CountingGenerator.calls = 0
+        loaded = OpenAPIDocument.load(tmp_path / "openapi.json")
+        cache = OpenAPIDocumentCache(_CountingGenerator(), router, prebuilt=loaded)
+        assert cache.get().etag == doc.etag
+        assert _CountingGenerator.calls == 0
+
+    def test_load_reuses_variants_only_for_matching_etag(self, tmp_path):
+        path = tmp_path / "openapi.json"
+        OpenAPIDocument.from_spec({"openapi": "3.1.0", "paths": {}}).write(path)
+        marker = b"stored-gzip"
+        (tmp_path / "openapi.json.gz").write_bytes(marker)
+        assert OpenAPIDocument.load(path).variants["gzip"] == marker
+
+        path.write_bytes(b'{"openapi":"3.1.0","paths":{"/new":{}}}')
+        reloaded = OpenAPIDocument.load(path)
+        assert gzip.decompress(reloaded.variants["gzip"]) == path.read_bytes()
+
+
+class TestOpenAPIDocumentResponse:
+    def setup_method(self):
+        self.doc = OpenAPIDocument.from_spec({"openapi": "3.1.0", "paths": {"/x": {}}})
+
+    def test_plain_response_has_strong_etag(self):
+        resp = self.doc.to_response(_request())
+        assert resp.status == 200
+        assert resp.headers["etag"] == self.doc.etag
+        assert not resp.headers["etag"].startswith("W/")
+        assert json.loads(resp._content)["paths"] == {"/x": {}}
+
+    def test_if_none_match_returns_304(self):
+        resp = self.doc.to_response(_request(if_none_match=self.doc.etag))
+        assert resp.status == 304
+        assert resp._content == b""
+
+        gz_etag = self.doc.to_response(_request(accept_encoding="gzip")).headers["etag"]
+        assert self.doc.to_response(_request(if_none_match=gz_etag)).status == 304
+        assert self.doc.to_response(_request(if_none_match='"stale"')).status == 200
+
+    def test_gzip_variant(self):
+        resp = self.doc.to_response(_request(accept_encoding="gzip, deflate"))
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert gzip.decompress(resp._content) == self.doc.body
+
+    def test_refused_encoding_is_not_used(self):
+        resp = self.doc.to_response(_request(accept_encoding="gzip;q=0"))
+        assert "content-encoding" not in resp.headers
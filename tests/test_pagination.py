@@ -0,0 +1,188 @@
+"""
+Keyset / estimated-count pagination against an in-memory SQLite table.
+"""
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from aquilia.controller.pagination import (
+    CursorPagination,
+    PageNumberPagination,
+    clear_count_cache,
+    estimate_count,
+)
+from aquilia.db.engine import AquiliaDatabase
+from aquilia.models import Model
+from aquilia.models.fields_module import AutoField, CharField, IntegerField
+
+
+class PaginatedItem(Model):
+    table = "paginated_items"
+    id = AutoField(primary_key=True)
+    name = CharField(max_length=20)
+    score = IntegerField()
+
+
+class RenamedPkItem(Model):
+    table = "renamed_pk_items"
+    item_id = AutoField(primary_key=True, db_column="item_pk")
+    score = IntegerField()
+
+
+class _Req:
+    path = "/items"
+
+    def __init__(self, **params):
+        self.query_params = params
+
+
+def _follow(url):
+    return _Req(**{k: v[0] for k, v in parse_qs(urlparse(url).query).items()})
+
+
+@pytest.fixture
+async def db():
+    database = AquiliaDatabase("sqlite:///:memory:")
+    await database.connect()
+    PaginatedItem._db = database
+    await database.execute(PaginatedItem.generate_create_table_sql())
+    for i in range(53):
+        # score repeats every 5 rows — only the PK tie-breaker makes it total
+        await PaginatedItem.create(name=f"n{i % 3}", score=i % 5)
+    clear_count_cache()
+    yield database
+    PaginatedItem._db = None
+    await database.disconnect()
+
+
+async def _walk(paginator, qs_factory):
+    seen, pages, req = [], [], _Req()
+    while True:
+        page = await paginator.paginate_queryset(qs_factory(), req)
+        ids = [row["id"] for row in page["results"]]
+        seen.extend(ids)
+        pages.append((req, ids, page))
+        if not page["next"]:
+            return seen, pages
+        req = _follow(page["next"])
+
+
+class TestCursorPagination:
+    @pytest.mark.parametrize("ordering", ["-score", ("score", "-name"), ("-score", "name")])
+    async def test_duplicate_ordering_values_never_skip_or_repeat(self, db, ordering):
+        paginator = CursorPagination(page_size=7, ordering=ordering)
+        seen, _ = await _walk(paginator, PaginatedItem.query)
+        assert sorted(seen) == list(range(1, 54))
+        assert len(seen) == len(set(seen))
+
+    async def test_previous_link_returns_prior_page(self, db):
+        paginator = CursorPagination(page_size=7, ordering="-score")
+        _, pages = await _walk(paginator, PaginatedItem.query)
+        third = pages[2][2]
+        back = await paginator.paginate_queryset(
+            PaginatedItem.query(), _follow(third["previous"]),
+        )
+        assert [r["id"] for r in back["results"]] == pages[1][1]
+
+    async def test_list_matches_queryset(self, db):
+        paginator = CursorPagination(page_size=6, ordering=("score", "-name"))
+        data = [item.to_dict() for item in await PaginatedItem.query().all()]
+        qs_seen, _ = await _walk(paginator, PaginatedItem.query)
+
+        list_seen, req = [], _Req()
+        while True:
+            page = paginator.paginate_list(data, req)
+            list_seen.extend(r["id"] for r in page["results"])
+            if not page["next"]:
+                break
+            req = _follow(page["next"])
+        assert list_seen == qs_seen
+
+    async def test_pk_with_db_column(self, db):
+        RenamedPkItem._db = db
+        try:
+            await db.execute(RenamedPkItem.generate_create_table_sql())
+            for i in range(12):
+                await RenamedPkItem.create(score=i % 3)
+
+            for paginator, factory in (
+                (CursorPagination(page_size=5, ordering="-score"), RenamedPkItem.query),
+                (
+                    PageNumberPagination(page_size=5, seek_threshold=2),
+                    lambda: RenamedPkItem.query().order("score"),
+                ),
+            ):
+                seen, req = [], _Req()
+                while True:
+                    page = await paginator.paginate_queryset(factory(), req)
+                    seen.extend(row["item_id"] for row in page["results"])
+                    if not page["next"]:
+                        break
+                    req = _follow(page["next"])
+                assert sorted(seen) == list(range(1, 13))
+        finally:
+            RenamedPkItem._db = None
+
+    async def test_legacy_scalar_cursor_is_accepted(self, db):
+        paginator = CursorPagination(page_size=5, ordering="id")
+        cursor = paginator._encode_cursor({"v": 10, "d": "next"})
+        page = await paginator.paginate_queryset(PaginatedItem.query(), _Req(cursor=cursor))
+        assert [r["id"] for r in page["results"]] == [11, 12, 13, 14, 15]
+
+
+class TestPageNumberSeek:
+    async def test_seek_links_cover_all_rows(self, db):
+        paginator = PageNumberPagination(page_size=5, seek_threshold=2)
+        seen, pages = await _walk(paginator, lambda: PaginatedItem.query().order("score"))
+        assert sorted(seen) == list(range(1, 54))
+        assert "seek" in pages[-1][0].query_params
+
+    async def test_seek_page_equals_offset_page(self, db):
+        paginator = PageNumberPagination(page_size=5, seek_threshold=2)
+        _, pages = await _walk(paginator, lambda: PaginatedItem.query().order("score"))
+        for req, ids, _ in pages[1:]:
+            plain = await paginator.paginate_queryset(
+                PaginatedItem.query().order("score"),
+                _Req(page=req.query_params["page"], page_size=5),
+            )
+            assert [r["id"] for r in plain["results"]] == ids
+
+        last = pages[-1][2]
+        back = await paginator.paginate_queryset(
+            PaginatedItem.query().order("score"), _follow(last["previous"]),
+        )
+        assert [r["id"] for r in back["results"]] == pages[-2][1]
+
+
+class TestCountModes:
+    async def test_sqlite_stat1_estimate(self, db):
+        assert await estimate_count(PaginatedItem.query()) is None
+        await db.execute("ANALYZE")
+        assert await estimate_count(PaginatedItem.query()) == 53
+        # Filtered querysets have no table-level estimate on SQLite
+        assert await estimate_count(PaginatedItem.query().filter(score=1)) is None
+
+    async def test_estimated_mode_falls_back_below_threshold(self, db):
+        await db.execute("ANALYZE")
+        paginator = PageNumberPagination(count_mode="estimated")
+        page = await paginator.paginate_queryset(PaginatedItem.query(), _Req())
+        assert page["count"] == 53 and page["count_exact"] is True
+
+        paginator.estimate_threshold = 10
+        page = await paginator.paginate_queryset(PaginatedItem.query(), _Req())
+        assert page["count"] == 53 and page["count_exact"] is False
+
+    async def test_cached_mode_reuses_count(self, db):
+        paginator = PageNumberPagination(count_mode="cached")
+        first = await paginator.paginate_queryset(PaginatedItem.query(), _Req())
+        await PaginatedItem.create(name="late", score=0)
+        second = await paginator.paginate_queryset(PaginatedItem.query(), _Req())
+        assert first["count"] == second["count"] == 53
+
+        clear_count_cache()
+        third = await paginator.paginate_queryset(PaginatedItem.query(), _Req())
+        assert third["count"] == 54
+
+    def test_invalid_count_mode(self):
+        with pytest.raises(ValueError):
+            PageNumberPagination(count_mode="bogus")
@@ -0,0 +1,113 @@
+"""
+Q.cache(): SQL-keyed result caching, table-tag invalidation from ORM
+writes, deferral inside atomic() and per-model hit rates.
+"""
+import pytest
+
+from aquilia.cache import CacheService, set_default_cache_service
+from aquilia.cache.backends.memory import MemoryBackend
+from aquilia.db.engine import AquiliaDatabase
+from aquilia.models import Model, query_cache_stats, reset_query_cache_stats
+from aquilia.models.fields_module import AutoField, CharField, ForeignKey, IntegerField
+from aquilia.models.transactions import atomic
+
+
+class CachedProduct(Model):
+    table = "cached_products"
+    id = AutoField(primary_key=True)
+    name = CharField(max_length=20)
+    stock = IntegerField(default=0)
+
+
+class CAuthor(Model):
+    table = "c_authors"
+    id = AutoField(primary_key=True)
+    name = CharField(max_length=20)
+
+
+class CPost(Model):
+    table = "c_posts"
+    id = AutoField(primary_key=True)
+    author = ForeignKey("CAuthor", related_name="posts", on_delete="CASCADE")
+
+
+@pytest.fixture
+async def db(tmp_path):
+    db = AquiliaDatabase(f"sqlite:///{tmp_path}/cache.db")
+    await db.connect()
+    CachedProduct._db = db
+    await db.execute(CachedProduct.generate_create_table_sql())
+    await CachedProduct.create(name="apple", stock=3)
+    service = CacheService(MemoryBackend())
+    await service.initialize()
+    set_default_cache_service(service)
+    reset_query_cache_stats()
+    yield db
+    set_default_cache_service(None)
+    await service.shutdown()
+    CachedProduct._db = None
+    await db.disconnect()
+
+
+async def _names():
+    return [p.name for p in await CachedProduct.objects.order("id").cache(ttl=60).all()]
+
+
+class TestQueryCache:
+    async def test_hits_and_invalidation_on_every_write_path(self, db):
+        assert await _names() == ["apple"]
+        await db.execute('INSERT INTO "cached_products" ("name", "stock") VALUES (?, ?)', ["raw", 0])
+        assert await _names() == ["apple"]  # served from cache
+
+        await CachedProduct.create(name="pear")
+        assert await _names() == ["apple", "raw", "pear"]
+
+        await CachedProduct.objects.filter(name="raw").update(name="plum")
+        assert await _names() == ["apple", "plum", "pear"]
+
+        await CachedProduct.objects.filter(name="plum").delete()
+        assert await _names() == ["apple", "pear"]
+
+        await CachedProduct.bulk_create([{"name": "kiwi"}])
+        assert await _names() == ["apple", "pear", "kiwi"]
+
+        stats = query_cache_stats()["CachedProduct"]
+        assert stats["hits"] == 1 and stats["misses"] == 5
+        assert stats["hit_rate"] == round(1 / 6, 4)
+
+    async def test_returned_rows_are_copies(self, db):
+        rows = await CachedProduct.objects.cache(ttl=60).values("name")
+        rows[0]["name"] = "MUTATED"
+        again = await CachedProduct.objects.cache(ttl=60).values("name")
+        again[0]["name"] = "MUTATED"
+        assert await CachedProduct.objects.cache(ttl=60).values("name") == [{"name": "apple"}]
+        assert query_cache_stats()["CachedProduct"]["hits"] == 2
+
+    async def test_atomic_defers_invalidation_until_commit(self, db):
+        assert await _names() == ["apple"]
+        async with atomic(db=db):
+            await CachedProduct.create(name="fig")
+            assert await _names() == ["apple", "fig"]  # bypasses the cache
+        assert await _names() == ["apple", "fig"]
+
+        with pytest.raises(RuntimeError):
+            async with atomic(db=db):
+                await CachedProduct.create(name="lime")
+                raise RuntimeError("rollback")
+        assert await _names() == ["apple", "fig"]
+        assert query_cache_stats()["CachedProduct"]["hits"] == 1
+
+    async def test_on_delete_writes_invalidate_child_tables(self, db):
+        for model in (CAuthor, CPost):
+            model._db = db
+            await db.execute(model.generate_create_table_sql())
+        try:
+            author = await CAuthor.create(name="ann")
+            await CPost.create(author=author.id)
+            assert await CPost.objects.cache(ttl=60).count() == 1
+
+            await author.delete_instance()
+            assert await db.fetch_val('SELECT COUNT(*) FROM "c_posts"') == 0
+            assert await CPost.objects.cache(ttl=60).count() == 0
+        finally:
+            CAuthor._db = CPost._db = None
@@ -0,0 +1,103 @@
+"""
+Shared-state rate limiting: GCRA over a common store, local token
+leasing and timing-wheel expiry of idle buckets.
+"""
+import json
+
+from aquilia.cache.backends.composite import CompositeBackend
+from aquilia.cache.backends.memory import MemoryBackend
+from aquilia.cache.backends.redis import RedisBackend
+from aquilia.middleware_ext import rate_limit
+from aquilia.middleware_ext.rate_limit import (
+    LeasedGCRAStore,
+    MemoryGCRAStore,
+    RateLimitMiddleware,
+    RateLimitRule,
+    RedisGCRAStore,
+    _BucketStore,
+    _TimingWheel,
+    gcra_store_for,
+)
+from aquilia.request import Request
+from aquilia.response import Response
+
+
+def _request(path="/api"):
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": b"",
+             "headers": [], "client": ("10.0.0.1", 1234)}
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    return Request(scope, receive)
+
+
+async def _ok(request, ctx):
+    return Response.json({"ok": True})
+
+
+class CountingStore(MemoryGCRAStore):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def acquire(self, key, interval, tolerance, want=1):
+        self.calls += 1
+        return await super().acquire(key, interval, tolerance, want)
+
+
+class TestSharedRateLimit:
+    async def test_workers_share_one_limit(self):
+        store = MemoryGCRAStore()
+        rule = RateLimitRule(limit=5, window=60)
+        workers = [RateLimitMiddleware(rules=[rule], backend=store) for _ in range(4)]
+
+        statuses = [(await workers[i % 4](_request(), None, _ok)).status for i in range(12)]
+        assert statuses == [200] * 5 + [429] * 7
+
+        denied = await workers[0](_request(), None, _ok)
+        assert json.loads(denied._content)["retry_after"] == 12
+        assert denied.headers["retry-after"] == "12"
+
+    async def test_exactly_limit_requests_pass(self, monkeypatch):
+        # A large clock reading is where float arithmetic lost a cell
+        monkeypatch.setattr(rate_limit.time, "monotonic", lambda: 1234567.891)
+        for limit, window in [(10, 1), (5, 1), (3, 2), (7, 0.7), (1000, 3600)]:
+            store = MemoryGCRAStore()
+            mw = RateLimitMiddleware(rules=[RateLimitRule(limit=limit, window=window)], backend=store)
+            statuses = [(await mw(_request(), None, _ok)).status for _ in range(limit + 1)]
+            assert statuses == [200] * limit + [429], (limit, window)
+
+    def test_composite_backend_uses_its_distributed_tier(self):
+        redis = RedisBackend()
+        store = gcra_store_for(CompositeBackend(MemoryBackend(), redis))
+        assert isinstance(store, RedisGCRAStore) and store._backend is redis
+        assert isinstance(gcra_store_for(MemoryBackend()), MemoryGCRAStore)
+
+    async def test_leasing_keeps_most_checks_local(self):
+        store = CountingStore()
+        rule = RateLimitRule(limit=100, window=1)
+        mw = RateLimitMiddleware(rules=[rule], backend=LeasedGCRAStore(store, lease=10))
+
+        statuses = [(await mw(_request(), None, _ok)).status for _ in range(100)]
+        assert statuses.count(200) == 100
+        assert store.calls == 10
+        assert (await mw(_request(), None, _ok)).status == 429
+
+    def test_timing_wheel_evicts_idle_buckets(self):
+        evicted = []
+        wheel = _TimingWheel(10.0, evicted.append, tick=1.0)
+        t0 = wheel._cursor * 1.0
+        for i in range(100):
+            wheel.touch(f"k{i}", t0 + 5)
+        wheel.touch("k0", t0 + 9)  # used again since
+
+        wheel.advance(t0 + 6)
+        assert len(evicted) == 99 and "k0" not in evicted
+        wheel.advance(t0 + 9.5)
+        assert evicted[-1] == "k0" and len(wheel) == 0
+
+        store = _BucketStore(cleanup_interval=60)
+        store.get_or_create("idle", dict)
+        store._wheel.advance(store._wheel._cursor * store._wheel._tick + 2 * store._idle_ttl)
+        assert store._buckets == {}
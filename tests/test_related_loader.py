@@ -0,0 +1,140 @@
+"""
+Request-scoped related() loading: same-tick coalescing, batching across
+instances from one query, the identity map and the reverse FK index.
+"""
+import asyncio
+
+import pytest
+
+from aquilia.db.engine import AquiliaDatabase
+from aquilia.di import Container
+from aquilia.models import Model, ModelRegistry, RelatedLoader
+from aquilia.models.fields_module import AutoField, CharField, ForeignKey, ManyToManyField
+from aquilia.models.loader import enter_request, exit_request
+
+
+class LoaderAuthor(Model):
+    table = "loader_authors"
+    id = AutoField(primary_key=True)
+    name = CharField(max_length=20)
+
+
+class LoaderPost(Model):
+    table = "loader_posts"
+    id = AutoField(primary_key=True)
+    title = CharField(max_length=20)
+    author = ForeignKey("LoaderAuthor", related_name="loader_posts")
+
+
+class LoaderTag(Model):
+    table = "loader_tags"
+    id = AutoField(primary_key=True)
+    name = CharField(max_length=20)
+
+
+class LoaderArticle(Model):
+    table = "loader_articles"
+    id = AutoField(primary_key=True)
+    title = CharField(max_length=20)
+    tags = ManyToManyField("LoaderTag")
+
+
+class CountingDatabase(AquiliaDatabase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statements = []
+
+    async def fetch_all(self, sql, params=None):
+        self.statements.append(sql)
+        return await super().fetch_all(sql, params)
+
+    async def fetch_one(self, sql, params=None):
+        self.statements.append(sql)
+        return await super().fetch_one(sql, params)
+
+
+@pytest.fixture
+async def db(tmp_path):
+    db = CountingDatabase(f"sqlite:///{tmp_path}/loader.db")
+    await db.connect()
+    for model in (LoaderAuthor, LoaderPost, LoaderTag, LoaderArticle):
+        model._db = db
+        await db.execute(model.generate_create_table_sql())
+        for sql in model.generate_m2m_sql():
+            await db.execute(sql)
+    for i in range(3):
+        author = await LoaderAuthor.create(name=f"a{i}")
+        for j in range(4):
+            await LoaderPost.create(title=f"p{i}{j}", author=author.id)
+
+    db.statements.clear()
+    yield db
+    for model in (LoaderAuthor, LoaderPost, LoaderTag, LoaderArticle):
+        model._db = None
+    await db.disconnect()
+
+
+@pytest.fixture
+def request_scope():
+    container = Container(scope="request")
+    token = enter_request(container)
+    yield container
+    exit_request(token)
+
+
+class TestRelatedLoader:
+    def test_reverse_index_built_at_registration(self):
+        assert ModelRegistry.reverse_relation("LoaderAuthor", "loader_posts") == (LoaderPost, "author")
+
+    async def test_loop_over_query_results_issues_one_query(self, db, request_scope):
+        posts = await LoaderPost.objects.order("id").all()
+        db.statements.clear()
+
+        authors = [await post.related("author") for post in posts]
+        assert [a.name for a in authors] == ["a0"] * 4 + ["a1"] * 4 + ["a2"] * 4
+        assert len(db.statements) == 1 and " IN (" in db.statements[0]
+        # Identity map: one instance per row
+        assert authors[0] is authors[3]
+
+        assert (await posts[0].related("author")) is authors[0]
+        assert len(db.statements) == 1
+
+    async def test_same_tick_calls_coalesce(self, db, request_scope):
+        posts = [await LoaderPost.get(pk=pk) for pk in (1, 5, 9)]
+        db.statements.clear()
+
+        authors = await asyncio.gather(*(p.related("author") for p in posts))
+        assert [a.name for a in authors] == ["a0", "a1", "a2"]
+        assert len(db.statements) == 1
+
+        children = await asyncio.gather(*(a.related("loader_posts") for a in authors))
+        assert [len(c) for c in children] == [4, 4, 4]
+        assert len(db.statements) == 2
+        assert RelatedLoader.for_container(request_scope).queries == 2
+
+    async def test_writes_invalidate_and_no_scope_is_unbatched(self, db, request_scope):
+        author = await LoaderAuthor.get(pk=1)
+        assert len(await author.related("loader_posts")) == 4
+        await LoaderPost.create(title="new", author=author.id)
+        assert len(await author.related("loader_posts")) == 5
+
+        token = enter_request(None)
+        try:
+            posts = await LoaderPost.objects.all()
+            db.statements.clear()
+            for post in posts[:3]:
+                await post.related("author")
+            assert len(db.statements) == 3
+        finally:
+            exit_request(token)
+
+    async def test_attach_and_detach_invalidate_m2m_lookups(self, db, request_scope):
+        article = await LoaderArticle.create(title="t")
+        tag = await LoaderTag.create(name="x")
+        assert await article.related("tags") == []
+
+        await article.attach("tags", tag)
+        assert [t.id for t in await article.related("tags")] == [tag.id]
+
+        await article.detach("tags", tag)
+        assert await article.related("tags") == []
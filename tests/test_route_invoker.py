@@ -0,0 +1,125 @@
+"""
+Compiled route invokers: cached singleton controllers, precomputed
+parameter binding and single on_request / on_startup calls.
+"""
+import json
+
+from aquilia import Controller, GET
+from aquilia.controller.compiler import ControllerCompiler
+from aquilia.controller.engine import ControllerEngine
+from aquilia.controller.factory import ControllerFactory
+from aquilia.controller.invoker import RouteInvoker
+from aquilia.di import Container
+from aquilia.di.providers import ValueProvider
+from aquilia.request import Request
+
+
+class Greeter:
+    def greet(self, name):
+        return f"hello {name}"
+
+
+class CounterController(Controller):
+    prefix = "/count"
+    instantiation_mode = "singleton"
+
+    def __init__(self):
+        self.startups = 0
+        self.requests = 0
+        self.hits = 0
+
+    async def on_startup(self, ctx):
+        self.startups += 1
+
+    async def on_request(self, ctx):
+        self.requests += 1
+
+    @GET("/")
+    async def hit(self, ctx):
+        self.hits += 1
+        return {"id": id(self), "hits": self.hits}
+
+
+class BrokenStartupController(Controller):
+    prefix = "/broken"
+    instantiation_mode = "singleton"
+
+    async def on_startup(self, ctx):
+        raise RuntimeError("warm-up failed")
+
+    @GET("/")
+    async def ok(self, ctx):
+        return {"ok": True}
+
+
+class ItemsController(Controller):
+    prefix = "/items"
+    on_request_calls = 0
+
+    def __init__(self, greeter: Greeter):
+        self.greeter = greeter
+
+    async def on_request(self, ctx):
+        type(self).on_request_calls += 1
+
+    @GET("/<item_id:int>")
+    async def show(self, ctx, item_id: int, limit: int = 10):
+        return {"item": item_id, "limit": limit, "msg": self.greeter.greet("ada")}
+
+
+def _routes(controller):
+    return {r.route_metadata.handler_name: r for r in ControllerCompiler().compile_controller(controller).routes}
+
+
+def _request(path, query=b""):
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": query, "headers": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    return Request(scope, receive)
+
+
+def _engine():
+    container = Container(scope="app")
+    container.register(ValueProvider(Greeter(), token=Greeter))
+    return ControllerEngine(ControllerFactory(container)), container
+
+
+class TestRouteInvoker:
+    async def test_singleton_controller_is_cached(self):
+        engine, container = _engine()
+        route = _routes(CounterController)["hit"]
+        invoker = engine.invoker_for(route)
+        assert isinstance(invoker, RouteInvoker) and route.invoker is invoker
+
+        bodies = [
+            json.loads((await engine.execute(route, _request("/count"), {}, container))._content)
+            for _ in range(3)
+        ]
+        assert len({b["id"] for b in bodies}) == 1
+        assert [b["hits"] for b in bodies] == [1, 2, 3]
+
+        instance = invoker._instance
+        assert instance.hits == 3
+        assert instance.startups == 1
+        assert instance.requests == 3
+
+    async def test_binds_path_query_and_di(self):
+        engine, container = _engine()
+        route = _routes(ItemsController)["show"]
+        ItemsController.on_request_calls = 0
+
+        response = await engine.execute(
+            route, _request("/items/7", b"limit=3"), {"item_id": 7}, container,
+        )
+        assert response.status == 200
+        assert json.loads(response._content) == {"item": 7, "limit": 3, "msg": "hello ada"}
+        assert ItemsController.on_request_calls == 1
+
+    async def test_failing_on_startup_is_logged_not_raised(self, caplog):
+        engine, container = _engine()
+        route = _routes(BrokenStartupController)["ok"]
+        response = await engine.execute(route, _request("/broken"), {}, container)
+        assert response.status == 200
+        assert "Error in on_startup for BrokenStartupController" in caplog.text
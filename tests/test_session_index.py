@@ -0,0 +1,110 @@
+"""
+Principal-indexed session counting and heap-ordered expiry: counts come
+from the index, cleanup touches only due sessions, and FileStore keeps a
+sidecar index instead of rescanning its directory.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+from aquilia.sessions.core import Session, SessionID, SessionPrincipal
+from aquilia.sessions.store import FileStore, MemoryStore, SessionIndex
+
+
+def _session(principal="u1", ttl=timedelta(hours=1)):
+    now = datetime.now(timezone.utc)
+    return Session(
+        id=SessionID(),
+        created_at=now,
+        last_accessed_at=now,
+        expires_at=now + ttl,
+        principal=SessionPrincipal(kind="user", id=principal) if principal else None,
+    )
+
+
+class TestSessionIndex:
+    def test_superseded_expiries_are_skipped(self):
+        index = SessionIndex()
+        index.add("a", "u1", 10.0)
+        index.add("b", "u1", 20.0)
+        index.set_expiry("a", 30.0)
+        index.add("b", "u2", 20.0)
+        assert index.count("u1") == 1 and index.count("u2") == 1
+        assert index.pop_expired(25.0) == ["b"]
+        assert index.count("u2") == 0 and index.principal_count == 1
+        index.remove("a")
+        assert index.pop_expired(100.0) == []
+
+
+class TestMemoryStoreIndex:
+    async def test_count_and_incremental_cleanup(self):
+        store = MemoryStore()
+        live = [_session() for _ in range(3)]
+        expired = _session(ttl=timedelta(seconds=-1))
+        extended = _session(ttl=timedelta(seconds=-1))
+        for s in live + [expired, extended, _session("u2")]:
+            await store.save(s)
+        assert await store.count_by_principal("u1") == 5
+
+        extended.expires_at = datetime.now(timezone.utc) + timedelta(hours=1)  # in place
+        assert await store.cleanup_expired() == 1
+        assert await store.count_by_principal("u1") == 4
+        assert not await store.exists(expired.id)
+        assert await store.cleanup_expired() == 0
+
+        await store.delete(live[0].id)
+        assert await store.count_by_principal("u1") == 3
+        assert store.get_stats()["total_principals"] == 2
+
+
+class TestFileStoreIndex:
+    async def test_sidecar_index_replaces_directory_scans(self, tmp_path, monkeypatch):
+        store = FileStore(tmp_path, index_flush_interval=0)
+        sessions = [_session() for _ in range(3)] + [_session("u2")]
+        expired = _session(ttl=timedelta(seconds=-1))
+        for s in sessions + [expired]:
+            await store.save(s)
+        await store.shutdown()
+
+        sidecar = json.loads((tmp_path / FileStore.INDEX_FILE).read_text())
+        assert len(sidecar["sessions"]) == 5
+
+        # A fresh store reads the sidecar, not the session files
+        reopened = FileStore(tmp_path)
+        reads = []
+        original = type(tmp_path).read_text
+        monkeypatch.setattr(
+            type(tmp_path), "read_text",
+            lambda self, *a, **k: reads.append(self.name) or original(self, *a, **k),
+        )
+        assert await reopened.count_by_principal("u1") == 4
+        assert reads == [FileStore.INDEX_FILE]
+
+        assert await reopened.cleanup_expired() == 1
+        assert reads[1:] == [f"{expired.id}.json"]
+        assert await reopened.count_by_principal("u1") == 3
+        assert {s.id for s in await reopened.list_by_principal("u2")} == {sessions[3].id}
+
+    async def test_files_missing_from_sidecar_are_indexed(self, tmp_path):
+        writer = FileStore(tmp_path, index_flush_interval=3600)
+        await writer.save(_session())
+        await writer.shutdown()
+        await writer.save(_session())  # not flushed: sidecar is stale
+
+        reader = FileStore(tmp_path)
+        assert await reader.count_by_principal("u1") == 2
+        (tmp_path / f"{(await reader.list_by_principal('u1'))[0].id}.json").unlink()
+        assert await FileStore(tmp_path).count_by_principal("u1") == 1
+
+    async def test_stores_sharing_a_directory_see_each_other(self, tmp_path):
+        a = FileStore(tmp_path, index_flush_interval=3600)
+        b = FileStore(tmp_path, index_flush_interval=3600)
+        assert await b.count_by_principal("u1") == 0
+
+        mine = _session()
+        await a.save(mine)
+        await a.save(_session(ttl=timedelta(seconds=-1)))
+        assert await b.count_by_principal("u1") == 2
+        assert await b.cleanup_expired() == 1
+
+        await a.delete(mine.id)
+        assert await b.count_by_principal("u1") == 0
@@ -0,0 +1,88 @@
+"""
+Session write coalescing: read-only requests skip the store until the
+touch interval elapses, key changes are saved as deltas, and FileStore
+records access time as the file mtime.
+"""
+from datetime import datetime, timedelta, timezone
+
+from aquilia.sessions.core import Session, SessionID
+from aquilia.sessions.engine import SessionEngine
+from aquilia.sessions.policy import PersistencePolicy, SessionPolicy
+from aquilia.sessions.store import FileStore, MemoryStore
+
+
+class NullTransport:
+    def inject(self, response, session):
+        pass
+
+
+def _engine(store, touch_interval=timedelta(seconds=60)):
+    policy = SessionPolicy(
+        name="test",
+        ttl=timedelta(days=1),
+        idle_timeout=timedelta(hours=1),
+        persistence=PersistencePolicy(enabled=True, touch_interval=touch_interval),
+    )
+    return SessionEngine(policy=policy, store=store, transport=NullTransport())
+
+
+async def _stored_session(store):
+    now = datetime.now(timezone.utc)
+    session = Session(id=SessionID(), created_at=now, last_accessed_at=now, expires_at=now + timedelta(days=1))
+    session["cart"] = [1]
+    await store.save(session)
+    return session
+
+
+class TestSessionWrites:
+    async def test_read_only_requests_are_coalesced(self):
+        store = MemoryStore()
+        engine = _engine(store)
+        session = await _stored_session(store)
+
+        for _ in range(20):
+            loaded = await engine._load_existing(session.id, datetime.now(timezone.utc))
+            await engine.commit(loaded, None)
+
+        stats = engine.get_stats()
+        assert stats["loads"] == 20 and stats["writes"] == 0
+        assert stats["skipped_writes"] == 20
+
+        # Once the persisted access time is older than the interval: one touch
+        loaded._persisted_access_at -= timedelta(minutes=5)
+        loaded.touch()
+        await engine.commit(loaded, None)
+        assert engine.get_stats()["touches"] == 1
+
+    async def test_changed_keys_are_saved_as_delta(self):
+        store = MemoryStore()
+        engine = _engine(store)
+        session = await _stored_session(store)
+
+        loaded = await engine._load_existing(session.id, datetime.now(timezone.utc))
+        loaded["theme"] = "dark"
+        assert loaded.dirty_keys == {"theme"}
+        await engine.commit(loaded, None)
+        assert engine.get_stats()["delta_saves"] == 1
+
+        loaded.clear_data()
+        assert loaded.dirty_keys is None
+        await engine.commit(loaded, None)
+        assert engine.get_stats()["full_saves"] == 1
+
+    async def test_file_store_touch_uses_mtime(self, tmp_path):
+        store = FileStore(tmp_path)
+        engine = _engine(store, touch_interval=None)
+        session = await _stored_session(store)
+        path = store._get_path(session.id)
+        before = path.read_text()
+
+        later = datetime.now(timezone.utc) + timedelta(minutes=1)
+        loaded = await store.load(session.id)
+        loaded.touch(later)
+        await engine.commit(loaded, None)
+        assert engine.get_stats()["touches"] == 1
+
+        reloaded = await store.load(session.id)
+        assert abs((reloaded.last_accessed_at - later).total_seconds()) < 1
+        assert path.read_text() == before
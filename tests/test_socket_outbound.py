@@ -0,0 +1,126 @@
+"""
+Per-connection outbound queues: slow-consumer policies, frame coalescing
+and broadcasts that never wait on a slow socket.
+"""
+import asyncio
+import json
+
+import pytest
+
+from aquilia.sockets import InMemoryAdapter, OutboundQueue
+from aquilia.sockets.connection import Connection, ConnectionScope
+from aquilia.sockets.envelope import MessageEnvelope, MessageType
+
+
+class Socket:
+    def __init__(self):
+        self.frames = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.closed = None
+
+    async def send(self, data):
+        await self.gate.wait()
+        self.frames.append(data)
+
+    async def close(self, code, reason):
+        self.closed = (code, reason)
+
+
+def _conn(cid, adapter, sock, **kwargs):
+    scope = ConnectionScope(namespace="/ns", path="/ns", path_params={}, query_params={}, headers={})
+    return Connection(cid, "/ns", scope, None, adapter, sock.send, close_func=sock.close, **kwargs)
+
+
+class TestOutboundQueue:
+    async def test_policies_and_coalescing(self):
+        sock = Socket()
+        sock.gate.clear()
+        oldest = OutboundQueue(sock.send, max_messages=3)
+        for i in range(5):
+            oldest.put(b"%d" % i)
+        await asyncio.sleep(0)
+        assert oldest.dropped == 2
+
+        newest = OutboundQueue(Socket().send, max_messages=2, policy="drop_newest")
+        assert [newest.put(b"x") for _ in range(3)] == [True, True, False]
+
+        joined = Socket()
+        queue = OutboundQueue(joined.send, coalesce_bytes=8)
+        for part in (b"a1", b"b2", b"c3", b"d4"):
+            queue.put(part)
+        await asyncio.sleep(0.01)
+        assert joined.frames == [b"a1\nb2\nc3", b"d4"]
+        for q in (oldest, newest, queue):
+            q.close()
+
+    async def test_broadcast_does_not_wait_for_slow_socket(self):
+        adapter = InMemoryAdapter()
+        slow, fast = Socket(), Socket()
+        slow.gate.clear()
+        conns = []
+        for cid, sock in (("slow", slow), ("fast", fast)):
+            conn = _conn(cid, adapter, sock)
+            await adapter.register_connection("/ns", cid, "w")
+            adapter.register_send_callback("/ns", cid, conn.enqueue)
+            conns.append(conn)
+
+        envelope = MessageEnvelope(type=MessageType.EVENT, event="tick", payload={})
+        await asyncio.wait_for(adapter.broadcast("/ns", envelope), 1)
+        await asyncio.sleep(0.01)
+        assert len(fast.frames) == 1 and slow.frames == []
+        assert conns[0].outbound.depth in (0, 1)
+        for conn in conns:
+            conn.outbound.close()
+
+    async def test_disconnect_policy_closes_connection(self):
+        sock = Socket()
+        sock.gate.clear()
+        conn = _conn("c", InMemoryAdapter(), sock, queue_size=2, slow_consumer_policy="disconnect")
+        for _ in range(4):
+            conn.enqueue(b'{"n": 1}')
+        await asyncio.sleep(0.01)
+        assert sock.closed == (1008, "slow consumer")
+        assert not conn.enqueue(b"late")
+
+    async def test_awaited_sends_wait_for_room(self):
+        sock = Socket()
+        sock.gate.clear()
+        conn = _conn("c", InMemoryAdapter(), sock, queue_size=8)
+
+        async def handler():
+            for i in range(100):
+                await conn.send_json({"i": i})
+
+        task = asyncio.ensure_future(handler())
+        await asyncio.sleep(0.01)
+        assert not task.done() and conn.outbound.depth == 8
+        sock.gate.set()
+        await asyncio.wait_for(task, 1)
+        await conn.outbound.flush()
+        assert [json.loads(f)["i"] for f in sock.frames] == list(range(100))
+        assert conn.outbound.dropped == 0
+
+        async def reset(data):
+            raise OSError("connection reset")
+
+        conn.outbound._send = reset
+        await conn.send_json({"i": 100})
+        await asyncio.sleep(0.01)
+        with pytest.raises(OSError):
+            await conn.send_json({"i": 101})
+
+    async def test_disconnect_waits_for_frame_in_flight(self):
+        sock = Socket()
+        sock.gate.clear()
+        conn = _conn("c", InMemoryAdapter(), sock)
+        conn.enqueue(b"bye")
+        await asyncio.sleep(0)
+        assert conn.outbound.depth == 0  # taken by the writer, not yet sent
+
+        closing = asyncio.ensure_future(conn.disconnect("done"))
+        await asyncio.sleep(0.01)
+        assert sock.closed is None
+        sock.gate.set()
+        await asyncio.wait_for(closing, 1)
+        assert sock.frames == [b"bye"] and sock.closed == (1000, "done")
@@ -0,0 +1,92 @@
+"""
+RedisAdapter local fan-out: room channels are subscribed on a worker's
+first member only, and published bytes reach local connections verbatim
+through their outboxes.
+"""
+import asyncio
+
+from aquilia.sockets.adapters.redis import RedisAdapter
+from aquilia.sockets.envelope import JSONCodec, MessageEnvelope, MessageType
+
+
+class FakeRedis:
+    def __init__(self):
+        self.published = []
+
+    async def zadd(self, key, mapping):
+        pass
+
+    async def zrem(self, key, member):
+        pass
+
+    async def expire(self, key, ttl):
+        pass
+
+    async def hdel(self, key, field):
+        pass
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    async def close(self):
+        pass
+
+
+class FakePubSub:
+    def __init__(self):
+        self.calls = []
+
+    async def subscribe(self, channel):
+        self.calls.append(("subscribe", channel))
+
+    async def unsubscribe(self, channel=None):
+        self.calls.append(("unsubscribe", channel))
+
+    async def close(self):
+        pass
+
+
+def _adapter():
+    adapter = RedisAdapter("redis://unused", prefix="t:")
+    adapter._redis = FakeRedis()
+    adapter._pubsub = FakePubSub()
+    return adapter
+
+
+class TestRedisFanout:
+    async def test_subscribe_on_first_member_only(self):
+        adapter = _adapter()
+        for cid in ("c1", "c2"):
+            await adapter.join_room("/chat", "lobby", cid)
+        await adapter.publish("/chat", "lobby", MessageEnvelope(type=MessageType.EVENT, event="x", payload={}))
+        assert adapter._pubsub.calls == [("subscribe", "t:room:/chat:lobby")]
+
+        await adapter.leave_room("/chat", "lobby", "c1")
+        await adapter.unregister_connection("/chat", "c2")
+        assert adapter._pubsub.calls[-1] == ("unsubscribe", "t:room:/chat:lobby")
+        assert adapter._local_rooms == {} and adapter._connection_rooms == {}
+
+    async def test_payload_forwarded_verbatim(self):
+        adapter = _adapter()
+        received = {"c1": [], "c2": [], "c3": []}
+        for cid, inbox in received.items():
+            async def send(data, inbox=inbox):
+                inbox.append(data)
+            adapter.register_send_callback("/chat", cid, send)
+        for cid in ("c1", "c2"):
+            await adapter.join_room("/chat", "lobby", cid)
+
+        envelope = MessageEnvelope(type=MessageType.EVENT, event="msg", payload={"text": "hi"})
+        await adapter.publish("/chat", "lobby", envelope, exclude_connection="c2")
+        await adapter.broadcast("/chat", envelope)
+        for channel, data in adapter._redis.published:
+            adapter._handle_pubsub_message({
+                "type": "message",
+                "channel": channel.encode() if isinstance(channel, str) else channel,
+                "data": data,
+            })
+        await asyncio.sleep(0)
+
+        encoded = JSONCodec().encode(envelope)
+        assert received == {"c1": [encoded, encoded], "c2": [encoded], "c3": [encoded]}
+        await adapter.shutdown()
@@ -0,0 +1,98 @@
+"""
+Template fragment caching: the ``{% cache %}`` tag, render_fragment(),
+model-signal tag invalidation and per-fragment hit metrics.
+"""
+import asyncio
+
+import pytest
+from jinja2 import DictLoader
+
+from aquilia.cache import CacheService
+from aquilia.cache.backends.memory import MemoryBackend
+from aquilia.models.signals import post_save
+from aquilia.templates import FragmentCache, TemplateEngine
+
+TEMPLATES = {
+    "page.html": (
+        "{% for p in products %}"
+        "{% cache p.id, 60, tags=['model:Product:' ~ p.id], name='card' %}"
+        "<li>{{ p.name }}{{ count() }}</li>"
+        "{% endcache %}"
+        "{% endfor %}"
+    ),
+    "card.html": "<div>{{ p.name }}{{ count() }}</div>",
+}
+
+
+class Product:
+    def __init__(self, pk, name):
+        self.pk = self.id = pk
+        self.name = name
+
+
+@pytest.fixture
+async def engine():
+    service = CacheService(MemoryBackend())
+    await service.initialize()
+    renders = []
+    engine = TemplateEngine(
+        DictLoader(TEMPLATES),
+        fragment_cache=FragmentCache(service),
+        globals={"count": lambda: renders.append(1) or ""},
+    )
+    engine.renders = renders
+    yield engine
+    await service.shutdown()
+
+
+class TestFragmentCache:
+    async def test_cache_tag_and_model_invalidation(self, engine):
+        products = [Product(1, "<apple>"), Product(2, "pear")]
+        first = await engine.render("page.html", {"products": products})
+        assert first == "<li>&lt;apple&gt;</li><li>pear</li>"
+
+        products[1].name = "plum"
+        assert await engine.render("page.html", {"products": products}) == first
+        assert len(engine.renders) == 2
+
+        await post_save.send(sender=Product, instance=products[1], created=False)
+        html = await engine.render("page.html", {"products": products})
+        assert html == "<li>&lt;apple&gt;</li><li>plum</li>"
+        assert len(engine.renders) == 3
+        assert engine.fragments.stats()["card"] == {"hits": 3, "misses": 3, "hit_rate": 0.5}
+
+    async def test_render_fragment_renders_concurrent_misses_once(self, engine):
+        ctx = {"p": Product(7, "fig")}
+        results = await asyncio.gather(*(
+            engine.render_fragment("card.html", ctx, key=7, tags=["model:Product:7"])
+            for _ in range(10)
+        ))
+        assert set(results) == {"<div>fig</div>"}
+        assert len(engine.renders) == 1
+
+        await engine.render_fragment("card.html", {"p": Product(8, "kiwi")}, key=8)
+        assert len(engine.renders) == 2
+        assert engine.fragments.stats()["card.html"]["misses"] == 2
+
+    async def test_engines_sharing_a_service_keep_their_fragments(self, engine):
+        service = engine.fragments._service
+        other = TemplateEngine(
+            DictLoader({
+                "page.html": "{% for p in products %}{% cache p.id, name='card' %}"
+                             "<b>{{ p.name }}</b>{% endcache %}{% endfor %}",
+                "card.html": "<span>{{ p.name }}</span>",
+            }),
+            fragment_cache=FragmentCache(service),
+        )
+        products = [Product(1, "apple"), Product(2, "pear")]
+        assert await engine.render("page.html", {"products": products}) == "<li>apple</li><li>pear</li>"
+        assert await other.render("page.html", {"products": products}) == "<b>apple</b><b>pear</b>"
+        assert other.fragments.stats()["card"] == {"hits": 0, "misses": 2, "hit_rate": 0.0}
+
+        ctx = {"p": products[0]}
+        assert await engine.render_fragment("card.html", ctx, key=1) == "<div>apple</div>"
+        assert await other.render_fragment("card.html", ctx, key=1) == "<span>apple</span>"
+
+    async def test_keys_without_stable_repr_are_rejected(self, engine):
+        with pytest.raises(TypeError, match="stable repr"):
+            await engine.render_fragment("card.html", {"p": Product(1, "a")}, key=object())
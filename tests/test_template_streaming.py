@@ -0,0 +1,120 @@
+"""
+Buffered template streaming: size-threshold buffers, {% flush %} early
+flushes and prompt stop on client disconnect.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from jinja2 import DictLoader
+
+from aquilia.request import Request
+from aquilia.response import Response, ResponseStreamError
+from aquilia.templates import TemplateEngine
+
+TEMPLATES = {
+    "page.html": (
+        "<head><title>{{ title }}</title></head>{% flush %}"
+        "<body>{% for i in range(n) %}<p>{{ tick(i) }}</p>{% endfor %}</body>"
+    ),
+}
+
+
+@pytest.fixture
+def engine():
+    rendered = []
+    engine = TemplateEngine(
+        DictLoader(TEMPLATES),
+        globals={"tick": lambda i: rendered.append(i) or i},
+        stream_buffer_size=1024,
+    )
+    engine.rendered = rendered
+    return engine
+
+
+class TestTemplateStreaming:
+    async def test_buffers_and_early_flush(self, engine):
+        ctx = {"title": "<Home>", "n": 1000}
+        full = await engine.render("page.html", ctx)
+        assert "\x00" not in full
+
+        chunks = [c async for c in engine.stream("page.html", ctx)]
+        assert b"".join(chunks).decode() == full
+        assert chunks[0] == b"<head><title>&lt;Home&gt;</title></head>"
+        assert all(len(c) >= 1024 for c in chunks[1:-1])
+        assert len(chunks) < 20
+
+        unbuffered = [c async for c in engine.stream("page.html", ctx, buffer_size=0)]
+        assert b"".join(unbuffered).decode() == full
+        assert len(unbuffered) > 1000
+
+    async def test_rendering_stops_on_disconnect(self, engine):
+        sent = []
+        gone = asyncio.Event()
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await gone.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            # Like uvicorn after a disconnect: sends are silently dropped
+            await asyncio.sleep(0)
+            sent.append(message)
+            if len(sent) == 3:
+                gone.set()
+
+        scope = {"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": []}
+        request = Request(scope, receive, send)
+        request_ctx = SimpleNamespace(request=request, session=None, identity=None)
+        response = engine.template_stream_response(
+            "page.html", {"title": "t", "n": 100_000}, request_ctx=request_ctx,
+        )
+        await asyncio.wait_for(response.send_asgi(send, request), 5)
+        assert request.is_disconnected()
+        assert len(engine.rendered) < 2000
+        assert response._content.ag_frame is None  # generator closed
+
+    async def test_failed_send_closes_render(self, engine):
+        response = engine.template_stream_response("page.html", {"title": "t", "n": 100_000}, status=203)
+        assert response.status == 203
+        sent = []
+
+        async def send(message):
+            if message["type"] == "http.response.body" and sent:
+                raise OSError("connection reset")
+            sent.append(message)
+
+        with pytest.raises(ResponseStreamError, match="connection reset"):
+            await response.send_asgi(send)
+        assert len(engine.rendered) < 1000
+        assert response._content.ag_frame is None  # generator closed
+
+    async def test_streamed_echo_reads_request_body(self):
+        messages = [
+            {"type": "http.request", "body": f"c{i};".encode(), "more_body": i < 5}
+            for i in range(6)
+        ]
+        done = asyncio.Event()
+        sent = []
+
+        async def receive():
+            if messages:
+                await asyncio.sleep(0)
+                return messages.pop(0)
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if message["type"] == "http.response.body" and not message["more_body"]:
+                done.set()
+
+        scope = {"type": "http", "method": "POST", "path": "/", "query_string": b"", "headers": []}
+        request = Request(scope, receive, send)
+        response = Response.stream(request.iter_bytes())
+        await asyncio.wait_for(response.send_asgi(send, request), 5)
+        body = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+        assert body == b"c0;c1;c2;c3;c4;c5;"